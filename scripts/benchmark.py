@@ -9,6 +9,8 @@ Measures latency and throughput for critical paths:
 - Agent execution
 - LLM response time
 - TTS generation
+- Streaming sentence segmentation
+- Command dispatch (intent routing)
 - End-to-end response time
 
 Usage:
@@ -427,6 +429,217 @@ class PerformanceBenchmark:
             queries_per_iteration=len(queries),
         )
     
+    # =========================================================================
+    # Streaming Benchmarks
+    # =========================================================================
+    
+    # Recorded LLM answers, replayed as token streams
+    RECORDED_RESPONSES = {
+        "prose": (
+            "Sure. The meeting with Dr. Patel is at 3:30 p.m. tomorrow, and the "
+            "forecast says 12.5 degrees with light rain, so take an umbrella. "
+            "After that you have nothing scheduled until Friday! Would you like "
+            "me to draft the agenda, or should I remind you an hour before? "
+        ) * 20,
+        "code": (
+            "Here is the function you asked for:\n```python\n"
+            + "".join(
+                f"def handler_{i}(event, context):\n"
+                f"    value = event.get('key_{i}', 0) * 3.14\n"
+                f"    return {{'status': 200, 'body': str(value)}}\n"
+                for i in range(60)
+            )
+            + "```\n"
+        ),
+        "run_on": " ".join(f"item{i} and then" for i in range(1500)) + " done.",
+    }
+    
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Split text into LLM-sized tokens (a word plus trailing space)."""
+        import re
+        return re.findall(r"\S{1,6}\s*|\s+", text)
+    
+    async def benchmark_sentence_detection(self) -> List[BenchmarkResult]:
+        """Benchmark streaming sentence segmentation on recorded token streams."""
+        try:
+            from src.core.streaming import SentenceDetector
+        except ImportError as e:
+            return [BenchmarkResult(
+                name="sentence_detection",
+                category="streaming",
+                iterations=0,
+                errors=[f"Streaming not available: {e}"],
+            )]
+        
+        results = []
+        for label, text in self.RECORDED_RESPONSES.items():
+            tokens = self._tokenize(text)
+            
+            for clause in (0, 40):
+                def run(tokens=tokens, clause=clause):
+                    detector = SentenceDetector(min_sentence_length=10, clause_min_length=clause)
+                    for token in tokens:
+                        detector.add_text(token)
+                    detector.flush()
+                
+                name = f"sentence_detection_{label}" + ("_clauses" if clause else "")
+                results.append(await self._run_benchmark(
+                    name=name,
+                    category="streaming",
+                    func=run,
+                    iterations=max(self.iterations, 20),
+                    tokens=len(tokens),
+                    characters=len(text),
+                ))
+        
+        return results
+    
+    # =========================================================================
+    # Command Dispatch Benchmarks
+    # =========================================================================
+    
+    # Recorded voice commands; most fall through to the LLM
+    RECORDED_COMMANDS = [
+        "what's due this week",
+        "start a pomodoro session",
+        "play some lofi music",
+        "open chrome",
+        "play lo-fi beats on youtube",
+        "message mom on whatsapp that I'll be late",
+        "how is AAPL doing today",
+        "add 10 shares VTI at 220",
+        "write a research paper on transformer interpretability",
+        "find scholarships for computer science majors",
+        "log a mock interview for amazon",
+        "how much did I spend on food this month",
+        "explain gradient descent",
+        "what is the capital of australia",
+        "tell me a joke",
+        "summarize the last email from my professor",
+        "what's the weather like tomorrow",
+        "remind me to call the dentist at 5",
+        "how many calories are in a banana",
+        "translate good morning to spanish",
+        "who won the game last night",
+        "set the living room lights to 40 percent",
+        "draft a polite reply declining the meeting",
+        "what should I cook for dinner",
+        "convert 30 miles to kilometers",
+        "give me a motivational quote",
+    ]
+    
+    def _legacy_dispatch(self, routes: List[Tuple[str, Dict[str, Tuple[str, ...]], bool]], text: str) -> Optional[str]:
+        """Sequential dispatch as _process_command did it: try every handler in turn."""
+        import concurrent.futures
+        
+        text_lower = text.lower()
+        for name, triggers, is_async in routes:
+            if not is_async:
+                result = self._stub_handler(name, triggers, text_lower)
+            else:
+                # Per-call executor and event loop, as in the old _handle_* methods
+                async def handle(name=name, triggers=triggers):
+                    return self._stub_handler(name, triggers, text_lower)
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    result = executor.submit(asyncio.run, handle()).result(timeout=30)
+            if result:
+                return result
+        return None
+    
+    @staticmethod
+    def _stub_handler(name: str, triggers: Dict[str, Tuple[str, ...]], text_lower: str) -> Optional[str]:
+        """Walk a manager's _is_*_command chain without doing the work."""
+        for intent, phrases in triggers.items():
+            if any(p in text_lower for p in phrases):
+                return f"{name}:{intent}"
+        return None
+    
+    async def benchmark_command_dispatch(self) -> List[BenchmarkResult]:
+        """Benchmark routing 1k recorded commands: sequential handlers vs compiled index."""
+        try:
+            from src.core.async_runtime import AsyncRuntime
+            from src.core.intent_index import IntentDispatcher
+        except ImportError as e:
+            return [BenchmarkResult(
+                name="command_dispatch",
+                category="dispatch",
+                iterations=0,
+                errors=[f"Intent index not available: {e}"],
+            )]
+        
+        import importlib
+        
+        # (route, module, class, async handler) in _process_command order
+        sources = [
+            ("communication", "src.communication.whatsapp", "CommunicationRouter", False),
+            ("quick_launch", "src.system.quick_launch", "QuickLaunchManager", False),
+            ("academic", "src.academic.manager", "AcademicManager", True),
+            ("productivity", "src.productivity.manager", "ProductivityManager", True),
+            ("career", "src.career.manager", "CareerManager", True),
+            ("finance", "src.finance.manager", "FinanceManager", True),
+            ("research", "src.research.manager", "ResearchManager", True),
+            ("scholarship", "src.scholarship.manager", "ScholarshipManager", True),
+        ]
+        routes = []
+        for name, module, cls_name, is_async in sources:
+            try:
+                cls = getattr(importlib.import_module(module), cls_name)
+            except Exception as e:
+                self._log(f"    (skipping {name}: {e})")
+                continue
+            routes.append((name, dict(getattr(cls, "COMMAND_TRIGGERS", {})), is_async))
+        
+        runtime = AsyncRuntime(name="benchmark-dispatch")
+        dispatcher = IntentDispatcher(runtime=runtime)
+        for name, triggers, is_async in routes:
+            def handler(text_lower, text, name=name, triggers=triggers, is_async=is_async):
+                if not is_async:
+                    return self._stub_handler(name, triggers, text_lower)
+                async def handle():
+                    return self._stub_handler(name, triggers, text_lower)
+                return handle()
+            phrases = [p for values in triggers.values() for p in values]
+            dispatcher.register(name, handler, phrases=phrases)
+        
+        commands = [self.RECORDED_COMMANDS[i % len(self.RECORDED_COMMANDS)] for i in range(1000)]
+        mismatches = sum(
+            self._legacy_dispatch(routes, text) != dispatcher.dispatch(text)
+            for text in self.RECORDED_COMMANDS
+        )
+        
+        def run_legacy():
+            for text in commands:
+                self._legacy_dispatch(routes, text)
+        
+        def run_index():
+            for text in commands:
+                dispatcher.dispatch(text)
+        
+        results = []
+        try:
+            results.append(await self._run_benchmark(
+                name="command_dispatch_sequential",
+                category="dispatch",
+                func=run_legacy,
+                iterations=max(1, self.iterations // 3),
+                commands=len(commands),
+                routes=len(routes),
+            ))
+            results.append(await self._run_benchmark(
+                name="command_dispatch_index",
+                category="dispatch",
+                func=run_index,
+                commands=len(commands),
+                routes=len(routes),
+                phrases=dispatcher.get_stats()["phrases"],
+                routing_mismatches=mismatches,
+            ))
+        finally:
+            runtime.stop()
+        
+        return results
+    
     # =========================================================================
     # Memory Benchmarks
     # =========================================================================
@@ -577,6 +790,14 @@ class PerformanceBenchmark:
         self._log("\n[Agent Benchmarks]")
         self.suite.results.append(await self.benchmark_intent_classification())
         
+        # Streaming Benchmarks
+        self._log("\n[Streaming Benchmarks]")
+        self.suite.results.extend(await self.benchmark_sentence_detection())
+        
+        # Dispatch Benchmarks
+        self._log("\n[Dispatch Benchmarks]")
+        self.suite.results.extend(await self.benchmark_command_dispatch())
+        
         # Memory Benchmarks
         self._log("\n[Memory Benchmarks]")
         self.suite.results.append(await self.benchmark_memory_add())
@@ -10,6 +10,7 @@ Provides research paper discovery:
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
@@ -21,6 +22,8 @@ from urllib.parse import quote
 import httpx
 from loguru import logger
 
+from ..core.async_runtime import close_loop_bound
+
 
 @dataclass
 class Paper:
@@ -84,6 +87,7 @@ class ArxivClient:
         """
         self.db_path = Path(db_path)
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._init_db()
     
     def _init_db(self):
@@ -105,15 +109,19 @@ class ArxivClient:
             conn.commit()
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             self._client = httpx.AsyncClient(timeout=30.0)
+            self._client_loop = loop
         return self._client
     
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
             self._client = None
     
     def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
@@ -7,13 +7,25 @@ Provides comprehensive morning briefings and evening summaries:
 - Assignments due
 - Unread emails
 - Study statistics
+
+Sections are fetched concurrently, each with its own deadline. The last
+good value of every section is cached, so a slow or failing source
+renders its previous value instead of holding up the whole briefing, and
+a background job refreshes everything shortly before the user usually
+asks for the morning briefing.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import statistics
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import time as dt_time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -38,6 +50,16 @@ class BriefingData:
     motivational_quote: Optional[str] = None
 
 
+@dataclass
+class SectionEntry:
+    """Last good value of a briefing section."""
+    value: Any
+    fetched_at: float  # time.monotonic()
+    
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
 class DailyBriefing:
     """
     Daily briefing generator.
@@ -83,6 +105,23 @@ class DailyBriefing:
         "💰 Tip: The best time to start investing was yesterday. The second best is today.",
     ]
     
+    # Per-section deadlines (seconds); other sections use section_timeout
+    SECTION_TIMEOUTS = {
+        "weather": 3.0,
+        "calendar": 3.0,
+        "canvas": 5.0,
+        "emails": 3.0,
+    }
+    
+    MORNING_SECTIONS = [
+        "weather", "calendar", "canvas", "local_assignments", "emails",
+        "habits", "study_yesterday", "applications",
+    ]
+    
+    # Wake times learned from morning briefing requests
+    WAKE_HISTORY_SIZE = 14
+    MIN_WAKE_SAMPLES = 3
+    
     def __init__(
         self,
         canvas_client=None,
@@ -95,6 +134,11 @@ class DailyBriefing:
         habit_tracker=None,
         application_tracker=None,
         finance_manager=None,
+        section_timeout: float = 2.0,
+        cache_ttl: float = 900.0,
+        wake_time: Optional[str] = None,
+        precompute_lead_minutes: int = 10,
+        history_path: Optional[Path | str] = None,
     ):
         """
         Initialize daily briefing.
@@ -110,6 +154,11 @@ class DailyBriefing:
             habit_tracker: Habit tracker for streaks (optional)
             application_tracker: Job application tracker (optional)
             finance_manager: Finance manager for tips (optional)
+            section_timeout: Default deadline for one section, in seconds
+            cache_ttl: Seconds a section value is served without refetching
+            wake_time: Usual briefing time ("HH:MM") until one is learned
+            precompute_lead_minutes: Refresh sections this long before wake time
+            history_path: JSON file persisting observed wake times (optional)
         """
         self.canvas = canvas_client
         self.pomodoro = pomodoro_timer
@@ -121,6 +170,20 @@ class DailyBriefing:
         self.habits = habit_tracker
         self.applications = application_tracker
         self.finance = finance_manager
+        
+        self.section_timeout = section_timeout
+        self.cache_ttl = cache_ttl
+        self.precompute_lead = timedelta(minutes=precompute_lead_minutes)
+        self.configured_wake_time = self._parse_time(wake_time) if wake_time else None
+        
+        self._sections: Dict[str, SectionEntry] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.last_sources: Dict[str, str] = {}
+        self.stats = {"fresh": 0, "cached": 0, "stale": 0, "defaults": 0, "timeouts": 0, "errors": 0}
+        
+        self.history_path = Path(history_path) if history_path else None
+        self._wake_history: List[int] = self._load_wake_history()
+        self._precompute_running = False
     
     def _get_greeting(self) -> str:
         """Get time-appropriate greeting."""
@@ -138,179 +201,240 @@ class DailyBriefing:
         import random
         return random.choice(self.MOTIVATIONAL_QUOTES)
     
+    # =========================================================================
+    # Section Sources
+    # =========================================================================
+    # Fetchers raise on failure so a bad fetch never replaces the last good
+    # value; _section() logs the error and falls back to the cache.
+    
     async def _get_weather(self) -> Optional[str]:
         """Get weather information."""
-        if not self.weather:
+        if not self.weather or not hasattr(self.weather, 'get_current'):
             return None
         
-        try:
-            # Assuming weather service has a get_current method
-            if hasattr(self.weather, 'get_current'):
-                weather_data = await self.weather.get_current()
-                if weather_data:
-                    temp = weather_data.get('temperature', 'N/A')
-                    condition = weather_data.get('condition', 'Unknown')
-                    return f"{temp}°F, {condition}"
-        except Exception as e:
-            logger.error(f"Failed to get weather: {e}")
-        
+        weather_data = await self.weather.get_current()
+        if weather_data:
+            temp = weather_data.get('temperature', 'N/A')
+            condition = weather_data.get('condition', 'Unknown')
+            return f"{temp}°F, {condition}"
         return None
     
     async def _get_calendar_events(self) -> List[str]:
         """Get today's calendar events."""
-        if not self.calendar:
+        if not self.calendar or not hasattr(self.calendar, 'get_today_events'):
             return []
         
-        try:
-            if hasattr(self.calendar, 'get_today_events'):
-                events = await self.calendar.get_today_events()
-                return [f"{e.get('time', '')} - {e.get('title', 'Event')}" for e in events]
-        except Exception as e:
-            logger.error(f"Failed to get calendar events: {e}")
-        
-        return []
+        events = await self.calendar.get_today_events()
+        return [f"{e.get('time', '')} - {e.get('title', 'Event')}" for e in events]
     
     async def _get_canvas_assignments(self) -> tuple:
         """Get Canvas assignments."""
-        due_today = []
-        due_tomorrow = []
-        due_week = []
+        if not self.canvas or not self.canvas.is_configured:
+            return [], [], []
         
-        if not self.canvas:
-            return due_today, due_tomorrow, due_week
+        # The three listings are independent requests
+        today_assignments, tomorrow_assignments, week_assignments = await asyncio.gather(
+            self.canvas.get_assignments_due_today(),
+            self.canvas.get_assignments_due_tomorrow(),
+            self.canvas.get_upcoming_assignments(days=7),
+        )
         
-        try:
-            if self.canvas.is_configured:
-                # Due today
-                today_assignments = await self.canvas.get_assignments_due_today()
-                due_today = [f"{a.name} ({a.course_name}) - {a.due_at.strftime('%I:%M %p')}" 
-                            for a in today_assignments if a.due_at]
-                
-                # Due tomorrow
-                tomorrow_assignments = await self.canvas.get_assignments_due_tomorrow()
-                due_tomorrow = [f"{a.name} ({a.course_name})" for a in tomorrow_assignments]
-                
-                # Due this week (excluding today/tomorrow)
-                week_assignments = await self.canvas.get_upcoming_assignments(days=7)
-                for a in week_assignments:
-                    if a.due_at and not a.is_due_today and not a.is_due_tomorrow:
-                        due_week.append(f"{a.name} ({a.course_name}) - {a.due_at.strftime('%A')}")
-        except Exception as e:
-            logger.error(f"Failed to get Canvas assignments: {e}")
+        due_today = [f"{a.name} ({a.course_name}) - {a.due_at.strftime('%I:%M %p')}" 
+                    for a in today_assignments if a.due_at]
+        due_tomorrow = [f"{a.name} ({a.course_name})" for a in tomorrow_assignments]
+        
+        # Due this week (excluding today/tomorrow)
+        due_week = []
+        for a in week_assignments:
+            if a.due_at and not a.is_due_today and not a.is_due_tomorrow:
+                due_week.append(f"{a.name} ({a.course_name}) - {a.due_at.strftime('%A')}")
         
         return due_today, due_tomorrow, due_week
     
-    async def _get_local_assignments(self) -> tuple:
+    def _get_local_assignments(self) -> tuple:
         """Get local tracked assignments."""
-        due_today = []
-        due_tomorrow = []
-        due_week = []
-        
         if not self.assignments:
-            return due_today, due_tomorrow, due_week
+            return [], [], []
         
-        try:
-            # Due today
-            today = self.assignments.get_due_today()
-            due_today = [f"{a.name} ({a.course or 'No course'})" for a in today]
-            
-            # Due tomorrow
-            tomorrow = self.assignments.get_due_tomorrow()
-            due_tomorrow = [f"{a.name} ({a.course or 'No course'})" for a in tomorrow]
-            
-            # Due this week
-            week = self.assignments.get_upcoming(days=7)
-            for a in week:
-                if not a.is_due_today and not a.is_due_tomorrow and a.due_date:
-                    due_week.append(f"{a.name} - {a.due_date.strftime('%A')}")
-        except Exception as e:
-            logger.error(f"Failed to get local assignments: {e}")
+        today = self.assignments.get_due_today()
+        due_today = [f"{a.name} ({a.course or 'No course'})" for a in today]
+        
+        tomorrow = self.assignments.get_due_tomorrow()
+        due_tomorrow = [f"{a.name} ({a.course or 'No course'})" for a in tomorrow]
+        
+        due_week = []
+        for a in self.assignments.get_upcoming(days=7):
+            if not a.is_due_today and not a.is_due_tomorrow and a.due_date:
+                due_week.append(f"{a.name} - {a.due_date.strftime('%A')}")
         
         return due_today, due_tomorrow, due_week
     
     async def _get_unread_emails(self) -> int:
         """Get unread email count."""
-        if not self.email:
+        if not self.email or not hasattr(self.email, 'get_unread_count'):
             return 0
-        
-        try:
-            if hasattr(self.email, 'get_unread_count'):
-                return await self.email.get_unread_count()
-        except Exception as e:
-            logger.error(f"Failed to get unread emails: {e}")
-        
-        return 0
+        return await self.email.get_unread_count()
     
     def _get_study_stats(self) -> tuple:
         """Get today's study statistics."""
         if not self.pomodoro:
             return 0, 0
         
-        try:
-            stats = self.pomodoro.get_stats()
-            return stats.today_minutes, stats.today_sessions
-        except Exception as e:
-            logger.error(f"Failed to get study stats: {e}")
-        
-        return 0, 0
+        stats = self.pomodoro.get_stats()
+        return stats.today_minutes, stats.today_sessions
     
     def _get_yesterday_study_time(self) -> int:
         """Get yesterday's study time in minutes."""
-        if not self.pomodoro:
+        if not self.pomodoro or not hasattr(self.pomodoro, 'get_yesterday_stats'):
             return 0
         
-        try:
-            if hasattr(self.pomodoro, 'get_yesterday_stats'):
-                stats = self.pomodoro.get_yesterday_stats()
-                return stats.total_minutes if stats else 0
-        except Exception as e:
-            logger.debug(f"Failed to get yesterday stats: {e}")
-        
-        return 0
+        stats = self.pomodoro.get_yesterday_stats()
+        return stats.total_minutes if stats else 0
     
     def _get_habit_streaks(self) -> List[str]:
         """Get current habit streaks."""
-        if not self.habits:
+        if not self.habits or not hasattr(self.habits, 'get_active_habits'):
             return []
         
-        try:
-            if hasattr(self.habits, 'get_active_habits'):
-                habits = self.habits.get_active_habits()
-                streaks = []
-                for habit in habits:
-                    if hasattr(habit, 'current_streak') and habit.current_streak > 0:
-                        streaks.append(f"{habit.name}: {habit.current_streak} days 🔥")
-                return streaks
-        except Exception as e:
-            logger.debug(f"Failed to get habit streaks: {e}")
-        
-        return []
+        streaks = []
+        for habit in self.habits.get_active_habits():
+            if hasattr(habit, 'current_streak') and habit.current_streak > 0:
+                streaks.append(f"{habit.name}: {habit.current_streak} days 🔥")
+        return streaks
     
     def _get_application_updates(self) -> List[str]:
         """Get recent job application updates."""
         if not self.applications:
             return []
         
+        updates = []
+        
+        # Check for applications needing follow-up
+        if hasattr(self.applications, 'get_pending_followups'):
+            followups = self.applications.get_pending_followups()
+            for app in followups[:3]:
+                updates.append(f"📋 Follow up with {app.company}")
+        
+        # Check for upcoming deadlines
+        if hasattr(self.applications, 'get_upcoming_deadlines'):
+            deadlines = self.applications.get_upcoming_deadlines(days=7)
+            for app in deadlines[:2]:
+                updates.append(f"⏰ {app.company} deadline approaching")
+        
+        return updates
+    
+    def _get_notes_today(self) -> int:
+        """Count notes taken today."""
+        if not self.notes:
+            return 0
+        
+        today = datetime.now().date()
+        recent = self.notes.get_recent(limit=100)
+        return len([n for n in recent if n.created_at.date() == today])
+    
+    def _section_sources(self) -> Dict[str, Tuple[Callable[[], Awaitable[Any]], Any]]:
+        """Section name -> (fetcher, default). Blocking DB reads run in a thread."""
+        return {
+            "weather": (self._get_weather, None),
+            "calendar": (self._get_calendar_events, []),
+            "canvas": (self._get_canvas_assignments, ([], [], [])),
+            "local_assignments": (lambda: asyncio.to_thread(self._get_local_assignments), ([], [], [])),
+            "emails": (self._get_unread_emails, 0),
+            "habits": (lambda: asyncio.to_thread(self._get_habit_streaks), []),
+            "study_yesterday": (lambda: asyncio.to_thread(self._get_yesterday_study_time), 0),
+            "study_today": (lambda: asyncio.to_thread(self._get_study_stats), (0, 0)),
+            "applications": (lambda: asyncio.to_thread(self._get_application_updates), []),
+            "notes_today": (lambda: asyncio.to_thread(self._get_notes_today), 0),
+        }
+    
+    # =========================================================================
+    # Section Gathering
+    # =========================================================================
+    
+    def _section_timeout(self, name: str) -> float:
+        return self.SECTION_TIMEOUTS.get(name, self.section_timeout)
+    
+    def _refresh_section(self, name: str) -> asyncio.Future:
+        """Start (or join) a background fetch that updates the section cache."""
+        task = self._inflight.get(name)
+        if task is not None and not task.done():
+            return task
+        
+        fetch, _ = self._section_sources()[name]
+        
+        async def refresh() -> Any:
+            value = await fetch()
+            self._sections[name] = SectionEntry(value=value, fetched_at=time.monotonic())
+            return value
+        
+        def finished(t: asyncio.Future) -> None:
+            if self._inflight.get(name) is t:
+                del self._inflight[name]
+            # Retrieve the exception so late failures are logged once, not
+            # reported as "never retrieved" by asyncio
+            if not t.cancelled() and t.exception() is not None:
+                self.stats["errors"] += 1
+                logger.warning(f"Briefing section '{name}' failed: {t.exception()}")
+        
+        task = asyncio.ensure_future(refresh())
+        task.add_done_callback(finished)
+        self._inflight[name] = task
+        return task
+    
+    async def _section(self, name: str, force: bool = False) -> Any:
+        """
+        Get one section's value within its deadline.
+        
+        Fresh cached values are returned immediately. Otherwise the section
+        is refetched; if that misses the deadline or fails, the last good
+        value (or the default) is used and the fetch keeps running in the
+        background to refresh the cache.
+        """
+        _, default = self._section_sources()[name]
+        entry = self._sections.get(name)
+        
+        if entry is not None and not force and entry.age() < self.cache_ttl:
+            self.stats["cached"] += 1
+            self.last_sources[name] = "cached"
+            return entry.value
+        
+        task = self._refresh_section(name)
         try:
-            updates = []
-            
-            # Check for applications needing follow-up
-            if hasattr(self.applications, 'get_pending_followups'):
-                followups = self.applications.get_pending_followups()
-                for app in followups[:3]:
-                    updates.append(f"📋 Follow up with {app.company}")
-            
-            # Check for upcoming deadlines
-            if hasattr(self.applications, 'get_upcoming_deadlines'):
-                deadlines = self.applications.get_upcoming_deadlines(days=7)
-                for app in deadlines[:2]:
-                    updates.append(f"⏰ {app.company} deadline approaching")
-            
-            return updates
-        except Exception as e:
-            logger.debug(f"Failed to get application updates: {e}")
+            value = await asyncio.wait_for(asyncio.shield(task), self._section_timeout(name))
+            self.stats["fresh"] += 1
+            self.last_sources[name] = "fresh"
+            return value
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.debug(f"Briefing section '{name}' missed its {self._section_timeout(name)}s deadline")
+        except Exception:
+            pass  # Logged by the refresh task
+        
+        entry = self._sections.get(name)
+        if entry is not None:
+            self.stats["stale"] += 1
+            self.last_sources[name] = "stale"
+            return entry.value
+        
+        self.stats["defaults"] += 1
+        self.last_sources[name] = "default"
+        return default
+    
+    async def gather_sections(self, names: Optional[List[str]] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        Fetch several sections concurrently.
         
-        return []
+        Args:
+            names: Sections to fetch (default: all)
+            force: Refetch even if the cached value is fresh
+            
+        Returns:
+            Section name -> value
+        """
+        names = list(names or self._section_sources())
+        values = await asyncio.gather(*(self._section(name, force=force) for name in names))
+        return dict(zip(names, values))
+    
     
     def _get_financial_tip(self) -> str:
         """Get a random financial tip."""
@@ -335,17 +459,20 @@ class DailyBriefing:
         greeting = self._get_greeting()
         today = datetime.now()
         date_str = today.strftime("%A, %B %d")
+        self.record_wake(today)
+        
+        sections = await self.gather_sections(self.MORNING_SECTIONS)
         
         lines = [f"🌅 {greeting}! Here's your briefing for {date_str}:"]
         lines.append("")
         
         # Weather
-        weather = await self._get_weather()
+        weather = sections["weather"]
         if weather:
             lines.append(f"🌤️ **Weather:** {weather}")
         
         # Calendar
-        events = await self._get_calendar_events()
+        events = sections["calendar"]
         if events:
             lines.append("")
             lines.append(f"📅 **Today's Schedule:**")
@@ -353,8 +480,8 @@ class DailyBriefing:
                 lines.append(f"   • {event}")
         
         # Assignments
-        canvas_today, canvas_tomorrow, canvas_week = await self._get_canvas_assignments()
-        local_today, local_tomorrow, local_week = await self._get_local_assignments()
+        canvas_today, canvas_tomorrow, canvas_week = sections["canvas"]
+        local_today, local_tomorrow, local_week = sections["local_assignments"]
         
         # Combine and deduplicate
         all_today = list(set(canvas_today + local_today))
@@ -380,13 +507,13 @@ class DailyBriefing:
                 lines.append(f"   • {a}")
         
         # Emails
-        unread = await self._get_unread_emails()
+        unread = sections["emails"]
         if unread > 0:
             lines.append("")
             lines.append(f"📧 You have {unread} unread email{'s' if unread > 1 else ''}.")
         
         # Habit streaks
-        streaks = self._get_habit_streaks()
+        streaks = sections["habits"]
         if streaks:
             lines.append("")
             lines.append(f"🔥 **Habit Streaks:**")
@@ -394,7 +521,7 @@ class DailyBriefing:
                 lines.append(f"   • {streak}")
         
         # Yesterday's study time
-        yesterday_minutes = self._get_yesterday_study_time()
+        yesterday_minutes = sections["study_yesterday"]
         if yesterday_minutes > 0:
             hours = yesterday_minutes // 60
             mins = yesterday_minutes % 60
@@ -403,7 +530,7 @@ class DailyBriefing:
             lines.append(f"📚 Yesterday's study time: {time_str}")
         
         # Job application updates
-        app_updates = self._get_application_updates()
+        app_updates = sections["applications"]
         if app_updates:
             lines.append("")
             lines.append(f"💼 **Job Applications:**")
@@ -435,11 +562,15 @@ class DailyBriefing:
         today = datetime.now()
         date_str = today.strftime("%A, %B %d")
         
+        sections = await self.gather_sections(
+            ["study_today", "notes_today", "canvas", "local_assignments"]
+        )
+        
         lines = [f"📊 Day Summary for {date_str}:"]
         lines.append("")
         
         # Study stats
-        study_minutes, pomodoros = self._get_study_stats()
+        study_minutes, pomodoros = sections["study_today"]
         if study_minutes > 0:
             hours = study_minutes // 60
             mins = study_minutes % 60
@@ -450,14 +581,9 @@ class DailyBriefing:
             lines.append("📚 No study sessions recorded today.")
         
         # Notes taken
-        if self.notes:
-            try:
-                recent = self.notes.get_recent(limit=100)
-                today_notes = [n for n in recent if n.created_at.date() == today.date()]
-                if today_notes:
-                    lines.append(f"📝 Notes taken: {len(today_notes)}")
-            except Exception:
-                pass
+        notes_today = sections["notes_today"]
+        if notes_today:
+            lines.append(f"📝 Notes taken: {notes_today}")
         
         # Assignments completed (would need tracking)
         # TODO: Track completed assignments
@@ -466,8 +592,8 @@ class DailyBriefing:
         lines.append("")
         lines.append("📅 Tomorrow:")
         
-        canvas_today, canvas_tomorrow, _ = await self._get_canvas_assignments()
-        local_today, local_tomorrow, _ = await self._get_local_assignments()
+        _, canvas_tomorrow, _ = sections["canvas"]
+        _, local_tomorrow, _ = sections["local_assignments"]
         all_tomorrow = list(set(canvas_tomorrow + local_tomorrow))
         
         if all_tomorrow:
@@ -488,8 +614,9 @@ class DailyBriefing:
         Returns:
             Brief status message
         """
-        canvas_today, canvas_tomorrow, _ = await self._get_canvas_assignments()
-        local_today, local_tomorrow, _ = await self._get_local_assignments()
+        sections = await self.gather_sections(["canvas", "local_assignments"])
+        canvas_today, canvas_tomorrow, _ = sections["canvas"]
+        local_today, local_tomorrow, _ = sections["local_assignments"]
         
         all_today = list(set(canvas_today + local_today))
         all_tomorrow = list(set(canvas_tomorrow + local_tomorrow))
@@ -527,3 +654,115 @@ class DailyBriefing:
                 lines.append(f"You've completed {stats.today_sessions} pomodoros today.")
         
         return " ".join(lines)
+    
+    # =========================================================================
+    # Precompute
+    # =========================================================================
+    
+    @staticmethod
+    def _parse_time(value: str) -> Optional[dt_time]:
+        try:
+            return datetime.strptime(value, "%H:%M").time()
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid briefing time '{value}', expected HH:MM")
+            return None
+    
+    def _load_wake_history(self) -> List[int]:
+        if not self.history_path or not self.history_path.exists():
+            return []
+        try:
+            data = json.loads(self.history_path.read_text())
+            return [int(m) for m in data.get("wake_minutes", [])][-self.WAKE_HISTORY_SIZE:]
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.debug(f"Failed to load briefing history: {e}")
+            return []
+    
+    def _save_wake_history(self) -> None:
+        if not self.history_path:
+            return
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            self.history_path.write_text(json.dumps({"wake_minutes": self._wake_history}))
+        except OSError as e:
+            logger.debug(f"Failed to save briefing history: {e}")
+    
+    def record_wake(self, when: Optional[datetime] = None) -> None:
+        """Record that a morning briefing was requested at `when`."""
+        when = when or datetime.now()
+        if not 4 <= when.hour < 12:
+            return  # Not a wake-up briefing
+        self._wake_history.append(when.hour * 60 + when.minute)
+        self._wake_history = self._wake_history[-self.WAKE_HISTORY_SIZE:]
+        self._save_wake_history()
+    
+    @property
+    def usual_wake_time(self) -> Optional[dt_time]:
+        """Median of recent morning requests, or the configured time."""
+        if len(self._wake_history) >= self.MIN_WAKE_SAMPLES:
+            minutes = int(statistics.median(self._wake_history))
+            return dt_time(minutes // 60, minutes % 60)
+        return self.configured_wake_time
+    
+    def next_precompute_at(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """When the next precompute should run, or None without a wake time."""
+        wake = self.usual_wake_time
+        if wake is None:
+            return None
+        now = now or datetime.now()
+        run_at = datetime.combine(now.date(), wake) - self.precompute_lead
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        return run_at
+    
+    async def precompute(self) -> Dict[str, Any]:
+        """Refresh every morning section so the briefing renders from cache."""
+        started = time.perf_counter()
+        sections = await self.gather_sections(self.MORNING_SECTIONS, force=True)
+        logger.info(f"Morning briefing precomputed in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return sections
+    
+    async def start_precompute(self):
+        """
+        Background loop refreshing the morning sections shortly before
+        the usual wake time. The section cache TTL should cover the lead
+        time so the briefing is served from the precomputed values.
+        """
+        self._precompute_running = True
+        logger.info(f"Starting briefing precompute ({self.precompute_lead} before wake time)")
+        
+        while self._precompute_running:
+            run_at = self.next_precompute_at()
+            if run_at is None:
+                logger.info("No wake time known; briefing precompute idle")
+                await asyncio.sleep(3600)
+                continue
+            
+            # Re-plan at least hourly; the learned wake time may move
+            delay = (run_at - datetime.now()).total_seconds()
+            if delay > 3600:
+                await asyncio.sleep(3600)
+                continue
+            await asyncio.sleep(max(delay, 0))
+            
+            if not self._precompute_running:
+                break
+            try:
+                await self.precompute()
+            except Exception as e:
+                logger.error(f"Briefing precompute error: {e}")
+            await asyncio.sleep(60)
+    
+    def stop_precompute(self):
+        """Stop the precompute loop."""
+        self._precompute_running = False
+        logger.info("Briefing precompute stopped")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        wake = self.usual_wake_time
+        return {
+            **self.stats,
+            "cached_sections": len(self._sections),
+            "inflight": len(self._inflight),
+            "last_sources": dict(self.last_sources),
+            "wake_time": wake.strftime("%H:%M") if wake else None,
+        }
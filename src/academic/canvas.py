@@ -10,6 +10,7 @@ Provides access to UC Berkeley's Canvas (bCourses) for:
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -19,6 +20,8 @@ from enum import Enum
 import httpx
 from loguru import logger
 
+from ..core.async_runtime import close_loop_bound
+
 
 class SubmissionStatus(str, Enum):
     """Assignment submission status."""
@@ -150,6 +153,7 @@ class CanvasClient:
             logger.warning("Canvas API token not configured. Set CANVAS_API_TOKEN in .env")
         
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._courses_cache: Dict[int, Course] = {}
         self._cache_time: Optional[datetime] = None
         self._cache_duration = timedelta(minutes=30)
@@ -160,8 +164,11 @@ class CanvasClient:
         return bool(self.api_token)
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers={
@@ -170,12 +177,13 @@ class CanvasClient:
                 },
                 timeout=30.0,
             )
+            self._client_loop = loop
         return self._client
     
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
             self._client = None
     
     async def _request(
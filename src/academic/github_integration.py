@@ -10,6 +10,7 @@ Provides access to GitHub repositories:
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,6 +19,8 @@ from typing import Any, Dict, List, Optional
 import httpx
 from loguru import logger
 
+from ..core.async_runtime import close_loop_bound
+
 
 @dataclass
 class Repository:
@@ -95,6 +98,7 @@ class GitHubClient:
             logger.warning("GitHub token not configured. Set GITHUB_TOKEN in .env")
         
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._username: Optional[str] = None
     
     @property
@@ -103,8 +107,11 @@ class GitHubClient:
         return bool(self.token)
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             headers = {
                 "Accept": "application/vnd.github.v3+json",
             }
@@ -116,12 +123,13 @@ class GitHubClient:
                 headers=headers,
                 timeout=30.0,
             )
+            self._client_loop = loop
         return self._client
     
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
             self._client = None
     
     async def _request(
@@ -42,6 +42,63 @@ class AcademicManager:
         response = await manager.handle_command("What's due this week?")
     """
     
+    # Trigger phrases per command type; also registered with the
+    # assistant's intent index so this manager is only called on a match
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "briefing": (
+            "good morning", "daily briefing", "morning briefing",
+            "what's my day", "whats my day", "day summary",
+            "evening summary", "what did i accomplish",
+            "briefing", "my day",
+        ),
+        "canvas": (
+            "assignment", "due", "grade", "announcement",
+            "canvas", "homework", "what's due", "whats due",
+            "my courses", "course",
+        ),
+        "pomodoro": (
+            "pomodoro", "focus", "study session", "timer",
+            "start studying", "take a break", "how much time",
+            "time left", "stop studying", "pause", "resume",
+            "study stats", "how many pomodoros",
+        ),
+        "notes": (
+            "quick note", "note:", "take note", "save note",
+            "show notes", "my notes", "search notes", "recent notes",
+        ),
+        "assignment": (
+            "add assignment", "track assignment", "mark complete",
+            "urgent assignment", "my assignments", "assignment tracker",
+        ),
+        "github": (
+            "github", "repo", "repository", "commit",
+            "open issue", "pull request", "my repos",
+        ),
+        "arxiv": (
+            "arxiv", "paper", "research paper", "find paper",
+            "reading list", "academic paper",
+        ),
+        "drive": (
+            "google drive", "drive", "my documents", "recent documents",
+            "find document", "open document", "my doc", "google doc",
+            "starred files", "starred documents",
+        ),
+        "explain": (
+            "explain", "what is", "what's", "how does",
+            "how do", "tell me about", "define",
+        ),
+        "explain_terms": (
+            "gradient", "neural", "machine learning", "deep learning",
+            "regression", "classification", "clustering", "overfitting",
+            "backpropagation", "loss function", "activation", "optimizer",
+            "regularization", "cross-validation", "bias", "variance",
+            "random forest", "decision tree", "svm", "knn", "naive bayes",
+            "cnn", "rnn", "lstm", "transformer", "attention", "embedding",
+            "batch normalization", "dropout", "learning rate", "epoch",
+            "precision", "recall", "f1", "accuracy", "auc", "roc",
+        ),
+    }
+    
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
@@ -157,6 +214,7 @@ class AcademicManager:
     
     def _init_briefing(self):
         """Initialize daily briefing."""
+        briefing_config = self.config.get("briefing", {})
         self.briefing = DailyBriefing(
             canvas_client=self.canvas,
             pomodoro_timer=self.pomodoro,
@@ -168,6 +226,11 @@ class AcademicManager:
             habit_tracker=self.habit_tracker,
             application_tracker=self.application_tracker,
             finance_manager=self.finance_manager,
+            section_timeout=briefing_config.get("section_timeout", 2.0),
+            cache_ttl=briefing_config.get("cache_ttl", 900),
+            wake_time=briefing_config.get("morning_time"),
+            precompute_lead_minutes=briefing_config.get("precompute_lead_minutes", 10),
+            history_path=self.data_dir / "briefing_history.json",
         )
     
     def update_briefing_services(self, habit_tracker=None, application_tracker=None, finance_manager=None):
@@ -251,83 +314,41 @@ class AcademicManager:
     # =========================================================================
     
     def _is_briefing_command(self, text: str) -> bool:
-        patterns = [
-            "good morning", "daily briefing", "morning briefing",
-            "what's my day", "whats my day", "day summary",
-            "evening summary", "what did i accomplish",
-            "briefing", "my day",
-        ]
+        patterns = self.COMMAND_TRIGGERS["briefing"]
         return any(p in text for p in patterns)
     
     def _is_canvas_command(self, text: str) -> bool:
-        patterns = [
-            "assignment", "due", "grade", "announcement",
-            "canvas", "homework", "what's due", "whats due",
-            "my courses", "course",
-        ]
+        patterns = self.COMMAND_TRIGGERS["canvas"]
         return any(p in text for p in patterns)
     
     def _is_pomodoro_command(self, text: str) -> bool:
-        patterns = [
-            "pomodoro", "focus", "study session", "timer",
-            "start studying", "take a break", "how much time",
-            "time left", "stop studying", "pause", "resume",
-            "study stats", "how many pomodoros",
-        ]
+        patterns = self.COMMAND_TRIGGERS["pomodoro"]
         return any(p in text for p in patterns)
     
     def _is_notes_command(self, text: str) -> bool:
-        patterns = [
-            "quick note", "note:", "take note", "save note",
-            "show notes", "my notes", "search notes", "recent notes",
-        ]
+        patterns = self.COMMAND_TRIGGERS["notes"]
         return any(p in text for p in patterns)
     
     def _is_assignment_command(self, text: str) -> bool:
-        patterns = [
-            "add assignment", "track assignment", "mark complete",
-            "urgent assignment", "my assignments", "assignment tracker",
-        ]
+        patterns = self.COMMAND_TRIGGERS["assignment"]
         return any(p in text for p in patterns)
     
     def _is_github_command(self, text: str) -> bool:
-        patterns = [
-            "github", "repo", "repository", "commit",
-            "open issue", "pull request", "my repos",
-        ]
+        patterns = self.COMMAND_TRIGGERS["github"]
         return any(p in text for p in patterns)
     
     def _is_arxiv_command(self, text: str) -> bool:
-        patterns = [
-            "arxiv", "paper", "research paper", "find paper",
-            "reading list", "academic paper",
-        ]
+        patterns = self.COMMAND_TRIGGERS["arxiv"]
         return any(p in text for p in patterns)
     
     def _is_drive_command(self, text: str) -> bool:
-        patterns = [
-            "google drive", "drive", "my documents", "recent documents",
-            "find document", "open document", "my doc", "google doc",
-            "starred files", "starred documents",
-        ]
+        patterns = self.COMMAND_TRIGGERS["drive"]
         return any(p in text for p in patterns)
     
     def _is_explain_command(self, text: str) -> bool:
-        patterns = [
-            "explain", "what is", "what's", "how does",
-            "how do", "tell me about", "define",
-        ]
+        patterns = self.COMMAND_TRIGGERS["explain"]
         # Check for ML/DS concepts
-        ml_terms = [
-            "gradient", "neural", "machine learning", "deep learning",
-            "regression", "classification", "clustering", "overfitting",
-            "backpropagation", "loss function", "activation", "optimizer",
-            "regularization", "cross-validation", "bias", "variance",
-            "random forest", "decision tree", "svm", "knn", "naive bayes",
-            "cnn", "rnn", "lstm", "transformer", "attention", "embedding",
-            "batch normalization", "dropout", "learning rate", "epoch",
-            "precision", "recall", "f1", "accuracy", "auc", "roc",
-        ]
+        ml_terms = self.COMMAND_TRIGGERS["explain_terms"]
         
         has_pattern = any(p in text for p in patterns)
         has_ml_term = any(t in text for t in ml_terms)
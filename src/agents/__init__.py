@@ -28,6 +28,15 @@ except ImportError as e:
     ContextEngineer = None
     IntentType = None
 
+# Local fast-path routing
+try:
+    from .routing import EmbeddingRouter, RouteDecision, HashingEmbedder
+except ImportError as e:
+    logger.warning(f"Embedding router not available: {e}")
+    EmbeddingRouter = None
+    RouteDecision = None
+    HashingEmbedder = None
+
 # Enhanced tools (canonical) - with graceful fallback
 try:
     from .tools_enhanced import (
@@ -75,6 +84,10 @@ __all__ = [
     "IntentClassifier",
     "ContextEngineer",
     "IntentType",
+    # Routing
+    "EmbeddingRouter",
+    "RouteDecision",
+    "HashingEmbedder",
     # Enhanced tools (use these)
     "ToolRegistry",
     "ToolResult",
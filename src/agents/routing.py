@@ -0,0 +1,470 @@
+"""
+Local Fast-Path Routing for the JARVIS Supervisor.
+
+Choosing an agent with an LLM call costs a full round-trip before the
+agent even starts, and most tasks look like tasks that were routed
+before. The supervisor therefore asks a local k-nearest-neighbour router
+first:
+- Task embeddings (sentence-transformers, or hashed word and character
+  n-grams when it is not installed) searched in a VectorIndex
+- Labeled examples are the supervisor's own past LLM routing decisions,
+  persisted in SQLite, plus anything bulk-loaded with add_examples()
+- Confident votes route in milliseconds; everything else goes to the LLM
+- Each LLM decision is compared with the local prediction, and a sample
+  of fast routes is re-checked by the LLM in the background, so the
+  confidence threshold can be tuned from recorded agreement
+
+Usage:
+    router = EmbeddingRouter(db_path="data/routing.db", threshold=0.75)
+    decision = router.route("turn off the bedroom lights")
+    if decision.confident:
+        next_agent = decision.agent
+    else:
+        next_agent = ask_llm(...)
+        router.record(task, next_agent, decision)
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    SentenceTransformer = None
+
+from ..core.cache import VectorIndex
+from ..core.database import get_database
+
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_task(text: str) -> str:
+    """Key used to deduplicate examples."""
+    return " ".join(text.lower().split())
+
+
+class HashingEmbedder:
+    """
+    Feature-hashed bag of words, word bigrams and character trigrams.
+
+    Needs no model download, embeds in microseconds and still matches
+    paraphrases that share vocabulary ("lights off" / "turn the light off").
+    """
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str) -> Iterable[Tuple[str, float]]:
+        words = _WORD.findall(text.lower())
+        for word in words:
+            yield f"w:{word}", 1.0
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                yield f"c:{padded[i:i + 3]}", 0.3
+        for a, b in zip(words, words[1:]):
+            yield f"b:{a} {b}", 0.7
+
+    def __call__(self, texts: List[str]) -> "np.ndarray":
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                out[i, h % self.dim] += weight if h & 0x80000000 else -weight
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+
+class SentenceEmbedder:
+    """sentence-transformers model, loaded on first use."""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        self.model_name = model_name
+        self.name = f"st-{model_name}"
+        self._model = None
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: List[str]) -> "np.ndarray":
+        with self._lock:
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name)
+                logger.info(f"Routing embedder loaded: {self.model_name}")
+        return self._model.encode(
+            texts, convert_to_numpy=True, normalize_embeddings=True
+        ).astype(np.float32)
+
+
+def default_embedder() -> Callable[[List[str]], "np.ndarray"]:
+    """sentence-transformers when installed, otherwise feature hashing."""
+    if SENTENCE_TRANSFORMERS_AVAILABLE:
+        return SentenceEmbedder()
+    return HashingEmbedder()
+
+
+@dataclass
+class RouteDecision:
+    """Local routing prediction for one task."""
+    agent: Optional[str]
+    confidence: float
+    confident: bool
+    similarity: float = 0.0  # Best neighbour similarity for the chosen agent
+    votes: Dict[str, float] = field(default_factory=dict)
+    latency_ms: float = 0.0
+
+
+class EmbeddingRouter:
+    """
+    k-nearest-neighbour agent router over labeled past tasks.
+
+    The k most similar examples vote for their agent, weighted by cosine
+    similarity. Confidence is the winning agent's share of the vote times
+    its best similarity, so both a split vote and a far-away neighbourhood
+    lower it.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path | str] = None,
+        embedder: Optional[Callable[[List[str]], "np.ndarray"]] = None,
+        threshold: float = 0.75,
+        k: int = 5,
+        min_similarity: float = 0.3,
+        max_examples: int = 5000,
+        audit_rate: float = 0.05,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            db_path: SQLite file for examples and agreement records
+                (None keeps everything in memory).
+            embedder: Callable mapping texts to an (n, dim) float32 array.
+            threshold: Minimum confidence for routing without the LLM.
+            k: Neighbours consulted per lookup.
+            min_similarity: Neighbours below this similarity do not vote.
+            max_examples: Oldest examples are dropped beyond this many.
+            audit_rate: Share of confident routes re-checked by the LLM
+                in the background to measure agreement above the threshold.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for EmbeddingRouter")
+
+        self.embedder = embedder or default_embedder()
+        self.embedder_name = getattr(self.embedder, "name", type(self.embedder).__name__)
+        self.threshold = threshold
+        self.k = k
+        self.min_similarity = min_similarity
+        self.max_examples = max_examples
+        self.audit_rate = audit_rate
+
+        self._index = VectorIndex()
+        self._labels: Dict[str, str] = {}     # example key -> agent
+        self._added: Dict[str, float] = {}    # example key -> time added
+        self._audits: List[Tuple[float, bool]] = []  # (confidence, agreed with LLM)
+        self._lock = threading.Lock()
+        self._counters = {"lookups": 0, "fast_routes": 0, "llm_routes": 0, "audits_started": 0}
+
+        self._db = get_database(db_path) if db_path else None
+        if self._db is not None:
+            self._init_db()
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def _init_db(self) -> None:
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS routing_examples (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                source TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                embedder TEXT,
+                embedding BLOB
+            );
+            CREATE TABLE IF NOT EXISTS routing_agreement (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                predicted TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                chosen TEXT NOT NULL,
+                agreed INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            );
+        """)
+
+    def _load(self) -> None:
+        """Load persisted examples, re-embedding any made by another embedder."""
+        rows = self._db.fetchall(
+            "SELECT key, text, agent, created_at, embedder, embedding FROM routing_examples ORDER BY created_at"
+        )
+        stale = [row for row in rows if row["embedder"] != self.embedder_name or row["embedding"] is None]
+        if stale:
+            vectors = self.embedder([row["text"] for row in stale])
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "UPDATE routing_examples SET embedder = ?, embedding = ? WHERE key = ?",
+                    [(self.embedder_name, vec.tobytes(), row["key"]) for row, vec in zip(stale, vectors)],
+                )
+            restored = {row["key"]: vec for row, vec in zip(stale, vectors)}
+        else:
+            restored = {}
+
+        keys, vectors = [], []
+        for row in rows:
+            vec = restored.get(row["key"])
+            if vec is None:
+                vec = np.frombuffer(row["embedding"], dtype=np.float32)
+            keys.append(row["key"])
+            vectors.append(vec)
+            self._labels[row["key"]] = row["agent"]
+            self._added[row["key"]] = row["created_at"]
+        if keys:
+            self._index.add_many(keys, np.vstack(vectors))
+
+        self._audits = [
+            (row["confidence"], bool(row["agreed"]))
+            for row in self._db.fetchall(
+                "SELECT confidence, agreed FROM routing_agreement ORDER BY id DESC LIMIT 10000"
+            )
+        ]
+        logger.debug(f"Routing examples loaded: {len(keys)} ({len(stale)} re-embedded)")
+
+    def add_examples(self, examples: Iterable[Tuple[str, str]], source: str = "history") -> int:
+        """
+        Add labeled (task, agent) examples, e.g. mined from past sessions.
+
+        A task seen before takes the newest label.
+
+        Returns:
+            Number of examples stored
+        """
+        latest: Dict[str, Tuple[str, str]] = {}
+        for text, agent in examples:
+            key = normalize_task(text)
+            if key and agent:
+                latest[key] = (text, agent)
+        if not latest:
+            return 0
+
+        keys = list(latest)
+        vectors = self.embedder([latest[key][0] for key in keys])
+        now = time.time()
+
+        with self._lock:
+            for key, vec in zip(keys, vectors):
+                self._index.add(key, vec)
+                self._labels[key] = latest[key][1]
+                self._added[key] = now
+            evicted = self._evict()
+
+        if self._db is not None:
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO routing_examples "
+                    "(key, text, agent, source, created_at, embedder, embedding) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (key, latest[key][0], latest[key][1], source, now, self.embedder_name, vec.tobytes())
+                        for key, vec in zip(keys, vectors)
+                    ],
+                )
+                if evicted:
+                    conn.executemany("DELETE FROM routing_examples WHERE key = ?", [(key,) for key in evicted])
+        return len(keys)
+
+    def _evict(self) -> List[str]:
+        """Drop the oldest examples beyond max_examples (lock held)."""
+        excess = len(self._labels) - self.max_examples
+        if excess <= 0:
+            return []
+        oldest = sorted(self._added, key=self._added.get)[:excess]
+        for key in oldest:
+            self._index.remove(key)
+            self._labels.pop(key, None)
+            self._added.pop(key, None)
+        return oldest
+
+    def route(self, task: str, agents: Optional[Iterable[str]] = None) -> RouteDecision:
+        """
+        Predict the agent for a task.
+
+        Args:
+            task: User task
+            agents: Agents that may be chosen (default: any label)
+
+        Returns:
+            RouteDecision; `confident` is False when the LLM should decide
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._counters["lookups"] += 1
+            empty = not self._labels
+        if empty:
+            return RouteDecision(agent=None, confidence=0.0, confident=False)
+
+        vector = self.embedder([task])[0]
+        allowed = set(agents) if agents is not None else None
+
+        with self._lock:
+            hits = self._index.search(vector, k=self.k)
+            votes: Dict[str, float] = defaultdict(float)
+            best: Dict[str, float] = defaultdict(float)
+            for key, similarity in hits:
+                agent = self._labels.get(key)
+                if agent is None or similarity < self.min_similarity:
+                    continue
+                if allowed is not None and agent not in allowed:
+                    continue
+                votes[agent] += similarity
+                best[agent] = max(best[agent], similarity)
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        if not votes:
+            return RouteDecision(agent=None, confidence=0.0, confident=False, latency_ms=latency_ms)
+
+        agent = max(votes, key=votes.get)
+        confidence = votes[agent] / sum(votes.values()) * best[agent]
+        confident = confidence >= self.threshold
+        if confident:
+            with self._lock:
+                self._counters["fast_routes"] += 1
+
+        return RouteDecision(
+            agent=agent,
+            confidence=confidence,
+            confident=confident,
+            similarity=best[agent],
+            votes=dict(votes),
+            latency_ms=latency_ms,
+        )
+
+    def record(
+        self,
+        task: str,
+        chosen: str,
+        prediction: Optional[RouteDecision] = None,
+        learn: bool = True,
+    ) -> None:
+        """
+        Record the LLM's routing decision for a task.
+
+        Args:
+            task: User task
+            chosen: Agent the LLM chose
+            prediction: What route() predicted for the same task
+            learn: Store the decision as a labeled example
+        """
+        with self._lock:
+            self._counters["llm_routes"] += 1
+
+        if prediction is not None and prediction.agent is not None:
+            agreed = prediction.agent == chosen
+            with self._lock:
+                self._audits.append((prediction.confidence, agreed))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT INTO routing_agreement (predicted, confidence, chosen, agreed, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (prediction.agent, prediction.confidence, chosen, int(agreed), time.time()),
+                )
+
+        if learn:
+            self.add_examples([(task, chosen)], source="llm")
+
+    def maybe_audit(
+        self,
+        task: str,
+        prediction: RouteDecision,
+        ask_llm: Callable[[], Optional[str]],
+    ) -> bool:
+        """
+        Re-check a sample of confident routes with the LLM, off the request path.
+
+        Args:
+            task: User task
+            prediction: The confident decision that was used
+            ask_llm: Returns the LLM's choice for the task (None to skip)
+
+        Returns:
+            True if an audit was started
+        """
+        if self.audit_rate <= 0 or random.random() >= self.audit_rate:
+            return False
+
+        def run() -> None:
+            try:
+                chosen = ask_llm()
+                if chosen:
+                    self.record(task, chosen, prediction)
+            except Exception as e:
+                logger.debug(f"Routing audit failed: {e}")
+
+        with self._lock:
+            self._counters["audits_started"] += 1
+        threading.Thread(target=run, name="routing-audit", daemon=True).start()
+        return True
+
+    def suggest_threshold(self, target_agreement: float = 0.95, min_samples: int = 20) -> Optional[float]:
+        """
+        Lowest threshold whose recorded agreement meets the target.
+
+        Returns:
+            Threshold in [0.3, 0.95], or None without enough data
+        """
+        with self._lock:
+            audits = list(self._audits)
+        for step in range(6, 20):
+            threshold = step * 0.05
+            above = [agreed for confidence, agreed in audits if confidence >= threshold]
+            if len(above) >= min_samples and sum(above) / len(above) >= target_agreement:
+                return round(threshold, 2)
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Routing counts and LLM agreement by confidence band."""
+        with self._lock:
+            audits = list(self._audits)
+            counters = dict(self._counters)
+            examples = len(self._labels)
+
+        bands: Dict[str, List[bool]] = defaultdict(list)
+        for confidence, agreed in audits:
+            low = min(int(confidence * 10), 9) / 10
+            bands[f"{low:.1f}-{low + 0.1:.1f}"].append(agreed)
+
+        lookups = counters["lookups"]
+        return {
+            **counters,
+            "examples": examples,
+            "threshold": self.threshold,
+            "fast_route_rate": round(counters["fast_routes"] / lookups, 3) if lookups else 0.0,
+            "agreement": round(sum(a for _, a in audits) / len(audits), 3) if audits else None,
+            "agreement_by_confidence": {
+                band: {"samples": len(values), "agreement": round(sum(values) / len(values), 3)}
+                for band, values in sorted(bands.items())
+            },
+            "suggested_threshold": self.suggest_threshold(),
+            "embedder": self.embedder_name,
+        }
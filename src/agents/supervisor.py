@@ -22,6 +22,7 @@ except ImportError:
     logger.warning("LangGraph not available")
 
 from .base import AgentState, AgentResponse, AgentType, BaseAgent
+from .routing import EmbeddingRouter
 
 
 class SupervisorState(TypedDict):
@@ -34,6 +35,7 @@ class SupervisorState(TypedDict):
     max_iterations: int
     final_response: str
     completed: bool
+    routing: str  # "fast" (local router) or "llm"
 
 
 AGENT_DESCRIPTIONS = {
@@ -62,6 +64,7 @@ class SupervisorAgent(BaseAgent):
         llm_manager: Any,
         agents: Optional[Dict[str, BaseAgent]] = None,
         max_iterations: int = 10,
+        router: Optional[EmbeddingRouter] = None,
     ):
         """
         Initialize the supervisor agent.
@@ -70,6 +73,7 @@ class SupervisorAgent(BaseAgent):
             llm_manager: LLM manager for generating responses.
             agents: Dictionary of specialized agents.
             max_iterations: Maximum routing iterations.
+            router: Local router tried before the LLM routing call.
         """
         super().__init__(
             name="supervisor",
@@ -80,6 +84,7 @@ class SupervisorAgent(BaseAgent):
         
         self.agents = agents or {}
         self.max_iterations = max_iterations
+        self.router = router
         self._graph = None
         
         if LANGGRAPH_AVAILABLE:
@@ -155,8 +160,31 @@ Always be helpful, concise, and professional."""
                 "completed": True,
             }
         
-        # Build prompt with agent descriptions
+        # A task the local router was confident about needs one agent only
+        if state.get("routing") == "fast" and state["agent_outputs"]:
+            return {
+                **state,
+                "next_agent": "FINISH",
+                "final_response": list(state["agent_outputs"].values())[-1],
+                "completed": True,
+            }
+        
         agent_names = list(AGENT_DESCRIPTIONS.keys())
+        
+        # Try the local router before asking the LLM
+        prediction = None
+        if self.router is not None and state["iteration"] == 0:
+            prediction = self.router.route(state["task"], agents=agent_names)
+            if prediction.confident:
+                logger.debug(f"Fast route -> {prediction.agent} (confidence {prediction.confidence:.2f})")
+                return {
+                    **state,
+                    "next_agent": prediction.agent,
+                    "iteration": state["iteration"] + 1,
+                    "routing": "fast",
+                }
+        
+        # Build prompt with agent descriptions
         agent_desc = "\n".join([f"- {k}: {v}" for k, v in AGENT_DESCRIPTIONS.items()])
         
         system_prompt = self._default_system_prompt().format(
@@ -208,6 +236,9 @@ Always be helpful, concise, and professional."""
             if next_agent not in agent_names and next_agent != "FINISH":
                 next_agent = "direct"
             
+            if prediction is not None:
+                self.router.record(state["task"], next_agent, prediction, learn=next_agent in agent_names)
+            
             # Check if we should finish
             if next_agent == "FINISH" or (
                 state["agent_outputs"] and 
@@ -235,6 +266,7 @@ Always be helpful, concise, and professional."""
                 "next_agent": next_agent,
                 "iteration": state["iteration"] + 1,
                 "messages": state["messages"] + [AIMessage(content=content)],
+                "routing": "llm",
             }
         
         except Exception as e:
@@ -351,6 +383,7 @@ Always be helpful, concise, and professional."""
             "max_iterations": self.max_iterations,
             "final_response": "",
             "completed": False,
+            "routing": "",
         }
         
         try:
@@ -363,6 +396,7 @@ Always be helpful, concise, and professional."""
                 metadata={
                     "iterations": final_state["iteration"],
                     "agents_used": list(final_state["agent_outputs"].keys()),
+                    "routing": final_state.get("routing", ""),
                 },
             )
         except Exception as e:
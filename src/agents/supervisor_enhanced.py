@@ -6,6 +6,8 @@ Improvements over original:
 - Memory agent for long-term recall
 - Conversation summarization for long contexts
 - Intent classification for faster routing
+- Local embedding router that skips the LLM routing call when confident
+- Plan-then-fan-out: independent subtasks run on their agents concurrently
 - Tool integration with enhanced tools
 """
 
@@ -13,9 +15,11 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TypedDict, Annotated
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Annotated
 
 from loguru import logger
 
@@ -29,6 +33,8 @@ except ImportError:
     logger.warning("LangGraph not available")
 
 from .base import AgentState, AgentResponse, AgentType, BaseAgent
+from .routing import EmbeddingRouter
+from ..core.context_budget import ContextBuilder, count_tokens
 
 
 class IntentType(Enum):
@@ -166,6 +172,29 @@ class IntentClassifier:
             confidence=0.5,
             suggested_agent="direct",
         )
+    
+    CLAUSE_SPLIT = re.compile(r"\s*(?:[,;]|\band\s+then\b|\band\b|\bthen\b|\balso\b)\s*")
+    
+    @classmethod
+    def is_compound(cls, text: str) -> bool:
+        """
+        Check whether a request joins clauses meant for different agents.
+        
+        Args:
+            text: User input text.
+            
+        Returns:
+            True if at least two clauses classify to different agents.
+        """
+        clauses = [c for c in cls.CLAUSE_SPLIT.split(text.lower()) if len(c.split()) >= 2]
+        if len(clauses) < 2:
+            return False
+        agents = {
+            classification.suggested_agent
+            for classification in map(cls.classify, clauses)
+            if classification.intent != IntentType.UNKNOWN
+        }
+        return len(agents) >= 2
 
 
 class ContextEngineer:
@@ -176,7 +205,7 @@ class ContextEngineer:
     to avoid confusion and reduce token usage.
     """
     
-    MAX_CONTEXT_LENGTH = 4000  # Characters
+    MAX_CONTEXT_TOKENS = 1500  # Budget for the assembled context
     
     @staticmethod
     def prepare_context_for_agent(
@@ -185,41 +214,51 @@ class ContextEngineer:
         conversation_history: List[BaseMessage],
         agent_outputs: Dict[str, Any],
         memory_context: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        reserved_tokens: int = 0,
     ) -> str:
         """
         Prepare context tailored for a specific agent.
         
+        Pieces share a token budget by priority: memories first, then
+        findings from other agents, then conversation (oldest turns are
+        cut first).
+        
         Args:
             agent_name: Name of the target agent.
             task: Current task.
             conversation_history: Recent messages.
             agent_outputs: Outputs from other agents.
             memory_context: Relevant memories.
+            max_tokens: Token budget for the whole prompt (default MAX_CONTEXT_TOKENS).
+            reserved_tokens: Tokens of that budget already used by the
+                system prompt and task.
             
         Returns:
             Formatted context string.
         """
-        context_parts = []
+        builder = ContextBuilder(
+            max_tokens or ContextEngineer.MAX_CONTEXT_TOKENS,
+            label=f"agent:{agent_name}",
+        ).reserve(reserved_tokens)
         
         # Add relevant memory context
         if memory_context:
-            context_parts.append(f"Relevant memories:\n{memory_context}")
+            builder.add("memories", f"Relevant memories:\n{memory_context}", priority=30, kind="memory")
         
         # Add relevant agent outputs
         relevant_outputs = ContextEngineer._filter_relevant_outputs(
             agent_name, agent_outputs
         )
         if relevant_outputs:
-            context_parts.append(f"Previous findings:\n{relevant_outputs}")
+            builder.add("findings", f"Previous findings:\n{relevant_outputs}", priority=20, kind="findings")
         
-        # Add recent conversation (summarized if too long)
+        # Add recent conversation, keeping the latest turns
         if conversation_history:
             conv_text = ContextEngineer._format_conversation(conversation_history)
-            if len(conv_text) > ContextEngineer.MAX_CONTEXT_LENGTH:
-                conv_text = ContextEngineer._summarize_conversation(conv_text)
-            context_parts.append(f"Conversation:\n{conv_text}")
+            builder.add("conversation", f"Conversation:\n{conv_text}", priority=10, kind="history", keep="tail")
         
-        return "\n\n".join(context_parts)
+        return builder.build().text
     
     @staticmethod
     def _filter_relevant_outputs(
@@ -255,13 +294,6 @@ class ContextEngineer:
             elif isinstance(msg, AIMessage):
                 lines.append(f"Assistant: {msg.content[:200]}...")
         return "\n".join(lines)
-    
-    @staticmethod
-    def _summarize_conversation(text: str) -> str:
-        """Summarize long conversation (simple truncation for now)."""
-        if len(text) > ContextEngineer.MAX_CONTEXT_LENGTH:
-            return text[:ContextEngineer.MAX_CONTEXT_LENGTH] + "...[truncated]"
-        return text
 
 
 class EnhancedSupervisorState(TypedDict):
@@ -276,6 +308,9 @@ class EnhancedSupervisorState(TypedDict):
     max_iterations: int
     final_response: str
     completed: bool
+    routing: str  # "fast" (local router), "llm" or "parallel"
+    plan: List[Dict[str, str]]  # Independent subtasks: {"agent", "task"}
+    branch_timings: Dict[str, Dict[str, Any]]
 
 
 ENHANCED_AGENT_DESCRIPTIONS = {
@@ -298,14 +333,21 @@ class EnhancedSupervisorAgent(BaseAgent):
     - Context engineering (relevant context per agent)
     - Memory agent integration
     - Conversation summarization
+    - Compound requests planned once and fanned out to agents in parallel
     """
     
+    MAX_PARALLEL_BRANCHES = 4
+    
     def __init__(
         self,
         llm_manager: Any,
         agents: Optional[Dict[str, BaseAgent]] = None,
         max_iterations: int = 10,
         memory_store: Optional[Any] = None,
+        router: Optional[EmbeddingRouter] = None,
+        parallel: bool = True,
+        agent_timeout: float = 30.0,
+        agent_timeouts: Optional[Dict[str, float]] = None,
     ):
         """
         Initialize the enhanced supervisor.
@@ -315,6 +357,11 @@ class EnhancedSupervisorAgent(BaseAgent):
             agents: Dictionary of specialized agents.
             max_iterations: Maximum routing iterations.
             memory_store: Optional memory store for context.
+            router: Local router tried before the LLM routing call.
+            parallel: Plan compound requests into independent subtasks and
+                run them concurrently instead of one agent per iteration.
+            agent_timeout: Seconds a parallel branch may run.
+            agent_timeouts: Per-agent overrides of agent_timeout.
         """
         super().__init__(
             name="supervisor",
@@ -326,6 +373,10 @@ class EnhancedSupervisorAgent(BaseAgent):
         self.agents = agents or {}
         self.max_iterations = max_iterations
         self.memory_store = memory_store
+        self.router = router
+        self.parallel = parallel
+        self.agent_timeout = agent_timeout
+        self.agent_timeouts = agent_timeouts or {}
         self.intent_classifier = IntentClassifier()
         self.context_engineer = ContextEngineer()
         self._graph = None
@@ -371,6 +422,7 @@ Guidelines:
         workflow.add_node("communication", self._agent_node("communication"))
         workflow.add_node("memory", self._memory_node)
         workflow.add_node("direct", self._direct_response_node)
+        workflow.add_node("parallel", self._parallel_node)
         workflow.add_node("synthesize", self._synthesize_node)
         
         # Entry point is classification
@@ -400,6 +452,7 @@ Guidelines:
                 "communication": "communication",
                 "memory": "memory",
                 "direct": "direct",
+                "parallel": "parallel",
                 "synthesize": "synthesize",
                 "FINISH": END,
             }
@@ -409,6 +462,9 @@ Guidelines:
         for agent_name in ["research", "coding", "system", "iot", "communication", "memory"]:
             workflow.add_edge(agent_name, "supervisor")
         
+        # Parallel branches are merged in one step
+        workflow.add_edge("parallel", "synthesize")
+        
         # Direct and synthesize go to END
         workflow.add_edge("direct", END)
         workflow.add_edge("synthesize", END)
@@ -418,9 +474,10 @@ Guidelines:
     def _classify_node(self, state: EnhancedSupervisorState) -> EnhancedSupervisorState:
         """Fast intent classification node."""
         classification = self.intent_classifier.classify(state["task"])
+        compound = self.parallel and self.intent_classifier.is_compound(state["task"])
         
         # For high-confidence simple intents, skip supervisor
-        if classification.confidence >= 0.8 and classification.intent in [
+        if not compound and classification.confidence >= 0.8 and classification.intent in [
             IntentType.GREETING, IntentType.IOT, IntentType.SYSTEM
         ]:
             return {
@@ -452,6 +509,77 @@ Guidelines:
                 "completed": True,
             }
         
+        # A task the local router was confident about needs one agent only
+        if state.get("routing") == "fast" and state["agent_outputs"]:
+            return {**state, "next_agent": "synthesize"}
+        
+        agent_names = list(ENHANCED_AGENT_DESCRIPTIONS.keys())
+        
+        first_turn = state["iteration"] == 0
+        compound = first_turn and self.parallel and self.intent_classifier.is_compound(state["task"])
+        
+        prediction = None
+        if self.router is not None and first_turn and not compound:
+            prediction = self.router.route(state["task"], agents=agent_names)
+            if prediction.confident:
+                logger.debug(
+                    f"Fast route -> {prediction.agent} "
+                    f"(confidence {prediction.confidence:.2f}, {prediction.latency_ms:.1f} ms)"
+                )
+                self.router.maybe_audit(state["task"], prediction, lambda: self._llm_route(state))
+                return {
+                    **state,
+                    "next_agent": prediction.agent,
+                    "iteration": state["iteration"] + 1,
+                    "routing": "fast",
+                }
+        
+        # Plan compound requests once instead of routing turn by turn
+        if compound:
+            try:
+                plan = self._llm_plan(state)
+            except Exception as e:
+                logger.warning(f"Planning failed, routing sequentially: {e}")
+                plan = []
+            if len(plan) > 1:
+                logger.debug(f"Parallel plan: {[step['agent'] for step in plan]}")
+                return {
+                    **state,
+                    "next_agent": "parallel",
+                    "iteration": state["iteration"] + 1,
+                    "routing": "parallel",
+                    "plan": plan,
+                }
+            if len(plan) == 1:
+                return {
+                    **state,
+                    "next_agent": plan[0]["agent"],
+                    "iteration": state["iteration"] + 1,
+                    "routing": "llm",
+                }
+        
+        try:
+            next_agent = self._llm_route(state)
+        except Exception as e:
+            logger.error(f"Supervisor error: {e}")
+            return {
+                **state,
+                "next_agent": "direct",
+                "iteration": state["iteration"] + 1,
+            }
+        
+        if prediction is not None:
+            self.router.record(state["task"], next_agent, prediction, learn=next_agent in agent_names)
+        
+        return {
+            **state,
+            "next_agent": next_agent,
+            "iteration": state["iteration"] + 1,
+            "routing": "llm",
+        }
+    
+    def _llm_route(self, state: EnhancedSupervisorState) -> str:
+        """Ask the LLM which agent should handle the task next."""
         # Build agent descriptions
         agent_names = list(ENHANCED_AGENT_DESCRIPTIONS.keys())
         agent_desc = "\n".join([f"- {k}: {v}" for k, v in ENHANCED_AGENT_DESCRIPTIONS.items()])
@@ -466,13 +594,14 @@ Respond with JSON:
 
 If task is complete, use "synthesize" to generate final response."""
         
-        # Prepare context
+        # Prepare context within what the routing prompt leaves of the budget
         context = self.context_engineer.prepare_context_for_agent(
             "supervisor",
             state["task"],
             state["messages"],
             state["agent_outputs"],
             state.get("memory_context"),
+            reserved_tokens=count_tokens(system_prompt) + count_tokens(state["task"]),
         )
         
         from ..core.llm import Message
@@ -482,78 +611,116 @@ If task is complete, use "synthesize" to generate final response."""
             Message(role="user", content=f"Task: {state['task']}\n\nContext:\n{context}"),
         ]
         
+        response = self.llm_manager.generate(messages)
+        content = response.content
+        
+        # Parse JSON
         try:
-            response = self.llm_manager.generate(messages)
-            content = response.content
-            
-            # Parse JSON
-            try:
-                if "{" in content:
-                    json_str = content[content.index("{"):content.rindex("}")+1]
-                    decision = json.loads(json_str)
-                else:
-                    decision = {"next_agent": "direct"}
-            except (json.JSONDecodeError, ValueError):
+            if "{" in content:
+                json_str = content[content.index("{"):content.rindex("}")+1]
+                decision = json.loads(json_str)
+            else:
                 decision = {"next_agent": "direct"}
+        except (json.JSONDecodeError, ValueError):
+            decision = {"next_agent": "direct"}
+        
+        next_agent = decision.get("next_agent", "direct")
+        
+        # Validate
+        if next_agent not in agent_names + ["FINISH", "synthesize"]:
+            next_agent = "direct"
+        
+        if next_agent == "FINISH":
+            next_agent = "synthesize"
+        
+        return next_agent
+    
+    def _llm_plan(self, state: EnhancedSupervisorState) -> List[Dict[str, str]]:
+        """
+        Ask the LLM to split the task into independent subtasks.
+        
+        Returns:
+            Subtasks as {"agent", "task"} dicts (empty if the reply is unusable).
+        """
+        from ..core.llm import Message
+        
+        agent_names = [name for name in ENHANCED_AGENT_DESCRIPTIONS if name != "direct"]
+        agent_desc = "\n".join([f"- {k}: {ENHANCED_AGENT_DESCRIPTIONS[k]}" for k in agent_names])
+        
+        system_prompt = f"""You are a task planner. Split the user's request into independent subtasks.
+
+Agents:
+{agent_desc}
+
+Respond with JSON only:
+{{"subtasks": [{{"agent": "<agent_name>", "task": "<self-contained instruction>"}}]}}
+
+Rules:
+- Each subtask is handled by one agent and must not need another subtask's result
+- Keep steps that depend on each other together in one subtask
+- Use a single subtask if the request needs only one agent
+- At most {self.MAX_PARALLEL_BRANCHES} subtasks"""
+        
+        messages = [
+            Message(role="system", content=system_prompt),
+            Message(role="user", content=state["task"]),
+        ]
+        
+        content = self.llm_manager.generate(messages).content
+        try:
+            decision = json.loads(content[content.index("{"):content.rindex("}")+1])
+        except (json.JSONDecodeError, ValueError):
+            return []
+        
+        plan = []
+        for step in decision.get("subtasks", []):
+            if not isinstance(step, dict):
+                continue
+            agent = step.get("agent")
+            task = str(step.get("task") or "").strip()
+            if agent in agent_names and task:
+                plan.append({"agent": agent, "task": task})
+        return plan[:self.MAX_PARALLEL_BRANCHES]
+    
+    def _run_agent(self, agent_name: str, task: str, state: EnhancedSupervisorState) -> str:
+        """Run one specialized agent on a task and return its output."""
+        agent = self.agents.get(agent_name)
+        
+        if agent is None:
+            return f"Agent '{agent_name}' not available."
+        
+        try:
+            # Prepare context for this specific agent
+            context = self.context_engineer.prepare_context_for_agent(
+                agent_name,
+                task,
+                state["messages"],
+                state["agent_outputs"],
+                state.get("memory_context"),
+            )
             
-            next_agent = decision.get("next_agent", "direct")
-            
-            # Validate
-            if next_agent not in agent_names + ["FINISH", "synthesize"]:
-                next_agent = "direct"
-            
-            if next_agent == "FINISH":
-                next_agent = "synthesize"
+            agent_state = AgentState(
+                messages=state["messages"],
+                task=task,
+                context={"prepared_context": context, **state["agent_outputs"]},
+            )
             
-            return {
-                **state,
-                "next_agent": next_agent,
-                "iteration": state["iteration"] + 1,
-            }
+            import asyncio
+            loop = asyncio.new_event_loop()
+            try:
+                response = loop.run_until_complete(agent.process(agent_state))
+                return response.content
+            finally:
+                loop.close()
         
         except Exception as e:
-            logger.error(f"Supervisor error: {e}")
-            return {
-                **state,
-                "next_agent": "direct",
-                "iteration": state["iteration"] + 1,
-            }
+            logger.error(f"Agent {agent_name} error: {e}")
+            return f"Error: {e}"
     
     def _agent_node(self, agent_name: str):
         """Create a node for a specialized agent."""
         def node(state: EnhancedSupervisorState) -> EnhancedSupervisorState:
-            agent = self.agents.get(agent_name)
-            
-            if agent is None:
-                output = f"Agent '{agent_name}' not available."
-            else:
-                try:
-                    # Prepare context for this specific agent
-                    context = self.context_engineer.prepare_context_for_agent(
-                        agent_name,
-                        state["task"],
-                        state["messages"],
-                        state["agent_outputs"],
-                        state.get("memory_context"),
-                    )
-                    
-                    agent_state = AgentState(
-                        messages=state["messages"],
-                        task=state["task"],
-                        context={"prepared_context": context, **state["agent_outputs"]},
-                    )
-                    
-                    import asyncio
-                    loop = asyncio.new_event_loop()
-                    try:
-                        response = loop.run_until_complete(agent.process(agent_state))
-                        output = response.content
-                    finally:
-                        loop.close()
-                
-                except Exception as e:
-                    logger.error(f"Agent {agent_name} error: {e}")
-                    output = f"Error: {e}"
+            output = self._run_agent(agent_name, state["task"], state)
             
             agent_outputs = state["agent_outputs"].copy()
             agent_outputs[agent_name] = output
@@ -565,6 +732,78 @@ If task is complete, use "synthesize" to generate final response."""
         
         return node
     
+    def _run_branch(self, agent_name: str, task: str, state: EnhancedSupervisorState) -> Tuple[str, float]:
+        """Run one subtask of a parallel plan; returns (output, seconds)."""
+        start = time.perf_counter()
+        if agent_name != "memory":
+            output = self._run_agent(agent_name, task, state)
+        elif self.memory_store is None:
+            output = "No memory store configured."
+        else:
+            results = self.memory_store.search(task, k=3)
+            output = "\n".join([r.content for r in results]) if results else "No relevant memories found."
+        return output, time.perf_counter() - start
+    
+    def _parallel_node(self, state: EnhancedSupervisorState) -> EnhancedSupervisorState:
+        """Run the planned subtasks concurrently, each with its own timeout."""
+        plan = state.get("plan") or []
+        agent_outputs = state["agent_outputs"].copy()
+        timings: Dict[str, Dict[str, Any]] = {}
+        if not plan:
+            return {**state, "branch_timings": timings}
+        
+        # Output keys stay unique when one agent gets several subtasks
+        keys = []
+        for step in plan:
+            key = step["agent"]
+            suffix = 2
+            while key in keys or key in agent_outputs:
+                key = f"{step['agent']}_{suffix}"
+                suffix += 1
+            keys.append(key)
+        
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=len(plan), thread_name_prefix="agent-branch")
+        futures = [
+            executor.submit(self._run_branch, step["agent"], step["task"], state)
+            for step in plan
+        ]
+        
+        for key, step, future in zip(keys, plan, futures):
+            timeout = self.agent_timeouts.get(step["agent"], self.agent_timeout)
+            remaining = max(0.0, start + timeout - time.perf_counter())
+            try:
+                output, seconds = future.result(timeout=remaining)
+                status = "ok"
+            except FutureTimeoutError:
+                output, seconds = f"Timed out after {timeout:g}s.", timeout
+                status = "timeout"
+            except Exception as e:
+                logger.error(f"Branch {key} error: {e}")
+                output, seconds = f"Error: {e}", time.perf_counter() - start
+                status = "error"
+            
+            agent_outputs[key] = output
+            timings[key] = {
+                "agent": step["agent"],
+                "task": step["task"],
+                "status": status,
+                "seconds": round(seconds, 3),
+            }
+        
+        # Timed-out branches keep running in the background; don't wait for them
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        wall = time.perf_counter() - start
+        summary = ", ".join(f"{k}={t['seconds']:.2f}s ({t['status']})" for k, t in timings.items())
+        logger.info(f"Parallel agents finished in {wall:.2f}s: {summary}")
+        
+        return {
+            **state,
+            "agent_outputs": agent_outputs,
+            "branch_timings": timings,
+        }
+    
     def _memory_node(self, state: EnhancedSupervisorState) -> EnhancedSupervisorState:
         """Memory agent node for long-term recall."""
         if self.memory_store is None:
@@ -633,8 +872,12 @@ If task is complete, use "synthesize" to generate final response."""
                 "completed": True,
             }
         
-        # Synthesize from multiple agents
-        outputs_text = "\n\n".join([f"[{k}]: {v}" for k, v in outputs.items()])
+        # Synthesize from multiple agents, labelling planned branches with their subtask
+        timings = state.get("branch_timings") or {}
+        outputs_text = "\n\n".join([
+            f"[{k}] ({timings[k]['task']}): {v}" if k in timings else f"[{k}]: {v}"
+            for k, v in outputs.items()
+        ])
         
         messages = [
             Message(role="system", content="Synthesize the following agent outputs into a coherent response for the user. Be concise."),
@@ -645,7 +888,10 @@ If task is complete, use "synthesize" to generate final response."""
             response = self.llm_manager.generate(messages)
             final = response.content
         except Exception as e:
-            final = list(outputs.values())[-1]  # Use last output
+            if timings:
+                final = "\n\n".join(str(v) for v in outputs.values())  # Every branch answered part of the task
+            else:
+                final = list(outputs.values())[-1]  # Use last output
         
         return {
             **state,
@@ -686,6 +932,9 @@ If task is complete, use "synthesize" to generate final response."""
             "max_iterations": self.max_iterations,
             "final_response": "",
             "completed": False,
+            "routing": "",
+            "plan": [],
+            "branch_timings": {},
         }
         
         try:
@@ -699,6 +948,8 @@ If task is complete, use "synthesize" to generate final response."""
                     "intent": final_state["intent"],
                     "iterations": final_state["iteration"],
                     "agents_used": list(final_state["agent_outputs"].keys()),
+                    "routing": final_state.get("routing", ""),
+                    "branch_timings": final_state.get("branch_timings", {}),
                 },
             )
         except Exception as e:
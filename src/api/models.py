@@ -258,6 +258,7 @@ class WSMessageType(str, Enum):
     
     # Client -> Server
     AUDIO_CHUNK = "audio_chunk"
+    AUDIO_END = "audio_end"
     COMMAND = "command"
     CANCEL = "cancel"
     PING = "ping"
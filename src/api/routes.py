@@ -6,6 +6,7 @@ Implements all REST endpoints for the mobile app.
 
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
 from datetime import datetime
@@ -303,7 +304,7 @@ async def send_command(
     # Process command through JARVIS
     if _jarvis_instance:
         try:
-            response_text = _jarvis_instance._process_command(request.text)
+            response_text = await asyncio.to_thread(_jarvis_instance._process_command, request.text)
         except Exception as e:
             logger.error(f"Command processing error: {e}")
             response_text = f"Error processing command: {str(e)}"
@@ -551,7 +552,7 @@ async def device_action(
     
     if _jarvis_instance:
         try:
-            response = _jarvis_instance._process_command(command)
+            response = await asyncio.to_thread(_jarvis_instance._process_command, command)
             if "error" in response.lower() or "failed" in response.lower():
                 success = False
                 message = response
@@ -35,6 +35,55 @@ def set_voice_jarvis(jarvis):
     _jarvis_instance = jarvis
 
 
+def _get_local_tts():
+    """The running assistant's TextToSpeech, if any."""
+    if not _jarvis_instance:
+        return None
+    tts = getattr(_jarvis_instance, "_tts", None)
+    if tts is None:
+        pipeline = getattr(_jarvis_instance, "_voice_pipeline", None)
+        tts = getattr(pipeline, "tts", None)
+    return tts
+
+
+def _check_speech_format(format: str) -> None:
+    """Reject output formats other than the MP3 that synthesis produces."""
+    if format.lower() != "mp3":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported audio format '{format}'; only mp3 is available",
+        )
+
+
+async def _synthesize_speech(text: str, voice: Optional[str], speed: float) -> Optional[bytes]:
+    """
+    Synthesize MP3 audio for an API request.
+    
+    Uses the assistant's voice settings and shares its speech cache, so
+    phrases the assistant already spoke are returned without synthesis.
+    """
+    tts = _get_local_tts()
+    engine = getattr(tts, "_engine", None)
+    if engine is None:
+        return None
+    
+    from ..voice.tts import EdgeTTS
+    
+    rate = engine.rate
+    if speed != 1.0:
+        rate_percent = int((speed - 1.0) * 100)
+        rate = f"+{rate_percent}%" if rate_percent >= 0 else f"{rate_percent}%"
+    
+    request_engine = EdgeTTS(
+        voice=voice or engine.voice,
+        rate=rate,
+        volume=engine.volume,
+        pitch=engine.pitch,
+        cache=getattr(engine, "cache", None),
+    )
+    return await request_engine.synthesize(text)
+
+
 @voice_router.post("/transcribe", response_model=TranscribeResponse)
 async def transcribe_audio(
     file: UploadFile = File(...),
@@ -226,7 +275,7 @@ async def text_to_speech(
     text: str = Query(..., min_length=1, max_length=5000),
     voice: Optional[str] = Query(None, description="Voice name"),
     speed: float = Query(1.0, ge=0.5, le=2.0),
-    format: str = Query("mp3", description="Output format (mp3, wav)"),
+    format: str = Query("mp3", description="Output format (mp3)"),
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """
@@ -237,43 +286,18 @@ async def text_to_speech(
     - **text**: Text to convert to speech
     - **voice**: Voice name (default: en-US-GuyNeural)
     - **speed**: Speech speed (0.5-2.0)
-    - **format**: Output format (mp3, wav)
+    - **format**: Output format (mp3)
     """
-    audio_data = None
+    _check_speech_format(format)
     
-    if _jarvis_instance:
-        try:
-            if hasattr(_jarvis_instance, '_voice_pipeline') and _jarvis_instance._voice_pipeline:
-                voice_pipeline = _jarvis_instance._voice_pipeline
-                
-                if hasattr(voice_pipeline, '_tts') and voice_pipeline._tts:
-                    tts = voice_pipeline._tts
-                    
-                    # Generate speech
-                    if hasattr(tts, 'synthesize_to_bytes'):
-                        audio_data = tts.synthesize_to_bytes(
-                            text,
-                            voice=voice,
-                            speed=speed,
-                        )
-                    elif hasattr(tts, 'synthesize'):
-                        # Save to temp file and read
-                        with tempfile.NamedTemporaryFile(suffix=f".{format}", delete=False) as tmp:
-                            tmp_path = tmp.name
-                        
-                        try:
-                            tts.synthesize(text, tmp_path, voice=voice)
-                            with open(tmp_path, "rb") as f:
-                                audio_data = f.read()
-                        finally:
-                            Path(tmp_path).unlink(missing_ok=True)
-        
-        except Exception as e:
-            logger.error(f"TTS error: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Text-to-speech failed: {str(e)}",
-            )
+    try:
+        audio_data = await _synthesize_speech(text, voice, speed)
+    except Exception as e:
+        logger.error(f"TTS error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Text-to-speech failed: {str(e)}",
+        )
     
     if not audio_data:
         raise HTTPException(
@@ -281,14 +305,11 @@ async def text_to_speech(
             detail="Text-to-speech service not available",
         )
     
-    # Determine content type
-    content_type = "audio/mpeg" if format == "mp3" else "audio/wav"
-    
     return StreamingResponse(
         io.BytesIO(audio_data),
-        media_type=content_type,
+        media_type="audio/mpeg",
         headers={
-            "Content-Disposition": f"attachment; filename=speech.{format}",
+            "Content-Disposition": "attachment; filename=speech.mp3",
             "Content-Length": str(len(audio_data)),
         },
     )
@@ -308,41 +329,18 @@ async def text_to_speech_post(
     - **text**: Text to convert
     - **voice**: Voice name
     - **speed**: Speech speed
-    - **format**: Output format
+    - **format**: Output format (mp3)
     """
-    audio_data = None
+    _check_speech_format(format)
     
-    if _jarvis_instance:
-        try:
-            if hasattr(_jarvis_instance, '_voice_pipeline') and _jarvis_instance._voice_pipeline:
-                voice_pipeline = _jarvis_instance._voice_pipeline
-                
-                if hasattr(voice_pipeline, '_tts') and voice_pipeline._tts:
-                    tts = voice_pipeline._tts
-                    
-                    if hasattr(tts, 'synthesize_to_bytes'):
-                        audio_data = tts.synthesize_to_bytes(
-                            request.text,
-                            voice=request.voice,
-                            speed=request.speed,
-                        )
-                    elif hasattr(tts, 'synthesize'):
-                        with tempfile.NamedTemporaryFile(suffix=f".{format}", delete=False) as tmp:
-                            tmp_path = tmp.name
-                        
-                        try:
-                            tts.synthesize(request.text, tmp_path, voice=request.voice)
-                            with open(tmp_path, "rb") as f:
-                                audio_data = f.read()
-                        finally:
-                            Path(tmp_path).unlink(missing_ok=True)
-        
-        except Exception as e:
-            logger.error(f"TTS error: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Text-to-speech failed: {str(e)}",
-            )
+    try:
+        audio_data = await _synthesize_speech(request.text, request.voice, request.speed)
+    except Exception as e:
+        logger.error(f"TTS error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Text-to-speech failed: {str(e)}",
+        )
     
     if not audio_data:
         raise HTTPException(
@@ -355,7 +353,7 @@ async def text_to_speech_post(
     
     return {
         "audio_base64": audio_base64,
-        "format": format,
+        "format": "mp3",
         "size_bytes": len(audio_data),
         "text_length": len(request.text),
     }
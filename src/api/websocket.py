@@ -12,7 +12,8 @@ Server → Client Events:
 - health_alert: Performance/health warning
 
 Client → Server Events:
-- audio_chunk: Streaming voice input
+- audio_chunk: Streaming voice input (or raw PCM16 binary frames)
+- audio_end: End of push-to-talk, finalize the transcript
 - command: Text command
 - cancel: Cancel current operation
 - ping: Keep-alive
@@ -21,11 +22,14 @@ Client → Server Events:
 from __future__ import annotations
 
 import asyncio
+import base64
+import functools
 import json
 import time
 import uuid
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Union
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from loguru import logger
@@ -33,10 +37,169 @@ from loguru import logger
 from .auth import get_auth_manager
 from .models import WSMessage, WSMessageType
 
+if TYPE_CHECKING:
+    from ..voice.streaming_stt import StreamingSTTSession, TranscriptEvent
+
 
 websocket_router = APIRouter(tags=["WebSocket"])
 
 
+def encode_message(message: WSMessage) -> str:
+    """Serialize a message to a text frame (same format as send_json)."""
+    return json.dumps(
+        message.model_dump(mode="json"),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+class OutboundQueue:
+    """
+    Bounded outbound queue and sender task for one connection.
+    
+    Messages are enqueued as pre-serialized frames and written by a
+    dedicated task, so a slow client only backs up its own queue. When
+    the queue is full the oldest frame is dropped. A connection is closed
+    if a single send stalls past ``send_timeout``, or if it overflows
+    while its oldest queued frame has waited longer than that.
+    """
+    
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_size: int = 256,
+        send_timeout: float = 5.0,
+    ):
+        self.websocket = websocket
+        self.max_size = max_size
+        self.send_timeout = send_timeout
+        
+        self._frames: Deque[tuple] = deque()
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        
+        # Stats
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.total_send_ms = 0.0
+        self.max_send_ms = 0.0
+        self._recent_send_ms: Deque[float] = deque(maxlen=100)
+    
+    def start(self) -> None:
+        """Start the sender task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    @property
+    def depth(self) -> int:
+        return len(self._frames)
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed
+    
+    def put(self, frame: str) -> bool:
+        """
+        Enqueue a serialized frame without blocking.
+        
+        Returns:
+            False if the connection is closed or was closed for being slow.
+        """
+        if self._closed:
+            return False
+        
+        if len(self._frames) >= self.max_size:
+            _, oldest_at = self._frames.popleft()
+            self.dropped += 1
+            if time.perf_counter() - oldest_at > self.send_timeout:
+                logger.warning("Closing slow WebSocket consumer: outbound queue overflowing")
+                self.close(code=1013, reason="Client too slow")
+                return False
+        
+        self._frames.append((frame, time.perf_counter()))
+        self.max_depth = max(self.max_depth, len(self._frames))
+        self._ready.set()
+        return True
+    
+    async def _run(self) -> None:
+        while True:
+            if not self._frames:
+                if self._closed:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            
+            frame, enqueued_at = self._frames.popleft()
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(frame),
+                    timeout=self.send_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Closing slow WebSocket consumer: send timed out")
+                self.close(code=1013, reason="Client too slow")
+                return
+            except Exception as e:
+                logger.error(f"Error sending message: {e}")
+                self._closed = True
+                return
+            
+            elapsed_ms = (time.perf_counter() - enqueued_at) * 1000
+            self.sent += 1
+            self.total_send_ms += elapsed_ms
+            self.max_send_ms = max(self.max_send_ms, elapsed_ms)
+            self._recent_send_ms.append(elapsed_ms)
+    
+    def close(self, code: int = 1000, reason: str = "") -> None:
+        """
+        Stop accepting frames.
+        
+        A normal close (1000) lets the sender drain what is already
+        queued. Any other code drops the backlog and closes the socket
+        with that code.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._ready.set()
+        
+        if code != 1000:
+            self._frames.clear()
+            asyncio.ensure_future(self._close_socket(code, reason))
+    
+    async def _close_socket(self, code: int, reason: str) -> None:
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+    
+    async def stop(self) -> None:
+        """Stop the sender task."""
+        self._closed = True
+        self._ready.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        recent = sorted(self._recent_send_ms)
+        return {
+            "queue_depth": self.depth,
+            "max_queue_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "avg_send_latency_ms": round(self.total_send_ms / self.sent, 2) if self.sent else 0.0,
+            "p95_send_latency_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 2) if recent else 0.0,
+            "max_send_latency_ms": round(self.max_send_ms, 2),
+        }
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections.
@@ -46,9 +209,21 @@ class ConnectionManager:
     - Message broadcasting
     - User-specific messaging
     - Connection health monitoring
+    
+    Every connection gets an OutboundQueue; broadcasts serialize the
+    message once and enqueue the same frame on each recipient queue.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        outbound_queue_size: int = 256,
+        send_timeout: float = 5.0,
+    ):
+        self.outbound_queue_size = outbound_queue_size
+        self.send_timeout = send_timeout
+        
+        # Per-connection outbound queues
+        self._outbound: Dict[WebSocket, OutboundQueue] = {}
         # Active connections: user_id -> set of WebSocket connections
         self._connections: Dict[str, Set[WebSocket]] = {}
         # Connection metadata: WebSocket -> metadata dict
@@ -83,6 +258,14 @@ class ConnectionManager:
         
         self._last_ping[websocket] = time.time()
         
+        outbound = OutboundQueue(
+            websocket,
+            max_size=self.outbound_queue_size,
+            send_timeout=self.send_timeout,
+        )
+        outbound.start()
+        self._outbound[websocket] = outbound
+        
         logger.info(f"WebSocket connected: user={user_id}, device={device_id}")
         
         # Send queued messages
@@ -109,6 +292,10 @@ class ConnectionManager:
         self._metadata.pop(websocket, None)
         self._last_ping.pop(websocket, None)
         
+        outbound = self._outbound.pop(websocket, None)
+        if outbound:
+            await outbound.stop()
+        
         logger.info(f"WebSocket disconnected: user={user_id}")
     
     async def subscribe(self, websocket: WebSocket, topic: str) -> None:
@@ -122,14 +309,25 @@ class ConnectionManager:
         if topic in self._subscriptions:
             self._subscriptions[topic].discard(websocket)
     
+    def _enqueue(self, websocket: WebSocket, frame: str) -> bool:
+        """Put a serialized frame on a connection's outbound queue."""
+        outbound = self._outbound.get(websocket)
+        if outbound is None:
+            return False
+        return outbound.put(frame)
+    
     async def send_personal(
         self,
         websocket: WebSocket,
         message: WSMessage,
     ) -> bool:
         """Send message to a specific connection."""
+        frame = encode_message(message)
+        if websocket in self._outbound:
+            return self._enqueue(websocket, frame)
+        
         try:
-            await websocket.send_json(message.model_dump(mode="json"))
+            await websocket.send_text(frame)
             return True
         except Exception as e:
             logger.error(f"Error sending message: {e}")
@@ -145,8 +343,9 @@ class ConnectionManager:
         sent_count = 0
         
         if user_id in self._connections:
+            frame = encode_message(message)
             for websocket in self._connections[user_id].copy():
-                if await self.send_personal(websocket, message):
+                if self._enqueue(websocket, frame):
                     sent_count += 1
         
         # Queue if user offline and queueing enabled
@@ -160,31 +359,27 @@ class ConnectionManager:
         
         return sent_count
     
+    def _fan_out(self, websockets: List[WebSocket], message: WSMessage) -> int:
+        """Serialize once and enqueue on every connection."""
+        if not websockets:
+            return 0
+        frame = encode_message(message)
+        return sum(1 for websocket in websockets if self._enqueue(websocket, frame))
+    
     async def broadcast_to_topic(
         self,
         topic: str,
         message: WSMessage,
     ) -> int:
         """Broadcast message to all subscribers of a topic."""
-        sent_count = 0
-        
-        if topic in self._subscriptions:
-            for websocket in self._subscriptions[topic].copy():
-                if await self.send_personal(websocket, message):
-                    sent_count += 1
-        
-        return sent_count
+        return self._fan_out(list(self._subscriptions.get(topic, ())), message)
     
     async def broadcast_all(self, message: WSMessage) -> int:
         """Broadcast message to all connected users."""
-        sent_count = 0
-        
-        for connections in self._connections.values():
-            for websocket in connections.copy():
-                if await self.send_personal(websocket, message):
-                    sent_count += 1
-        
-        return sent_count
+        return self._fan_out(
+            [ws for connections in self._connections.values() for ws in connections],
+            message,
+        )
     
     async def _send_queued_messages(
         self,
@@ -208,6 +403,25 @@ class ConnectionManager:
     def get_user_count(self) -> int:
         """Get number of connected users."""
         return len(self._connections)
+    
+    def get_outbound_stats(self) -> Dict[str, Any]:
+        """Get outbound queue depth and send latency across connections."""
+        per_connection = []
+        for websocket, outbound in self._outbound.items():
+            metadata = self._metadata.get(websocket, {})
+            per_connection.append({
+                "user_id": metadata.get("user_id"),
+                "device_id": metadata.get("device_id"),
+                **outbound.get_stats(),
+            })
+        
+        return {
+            "total_queued": sum(c["queue_depth"] for c in per_connection),
+            "max_queue_depth": max((c["queue_depth"] for c in per_connection), default=0),
+            "total_dropped": sum(c["dropped"] for c in per_connection),
+            "max_send_latency_ms": max((c["max_send_latency_ms"] for c in per_connection), default=0.0),
+            "connections": per_connection,
+        }
 
 
 # Global connection manager
@@ -236,10 +450,13 @@ async def websocket_endpoint(
     
     Message format (JSON):
     {
-        "type": "command|audio_chunk|cancel|ping|subscribe|unsubscribe",
+        "type": "command|audio_chunk|audio_end|cancel|ping|subscribe|unsubscribe",
         "data": { ... },
         "message_id": "optional-uuid"
     }
+    
+    Binary frames are treated as audio: 16kHz mono little-endian PCM16,
+    with no base64 or JSON framing.
     """
     # Verify token
     auth = get_auth_manager()
@@ -258,7 +475,16 @@ async def websocket_endpoint(
     try:
         while True:
             # Receive message
-            data = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            
+            # Binary frames carry raw audio
+            if message.get("bytes") is not None:
+                await handle_audio_chunk(websocket, user_id, message["bytes"], None)
+                continue
+            
+            data = json.loads(message.get("text") or "{}")
             
             # Parse message
             try:
@@ -282,9 +508,13 @@ async def websocket_endpoint(
             )
     
     except WebSocketDisconnect:
-        await manager.disconnect(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
+        session = _stt_sessions.pop(websocket, None)
+        if session is not None:
+            session.close()
         await manager.disconnect(websocket)
 
 
@@ -326,6 +556,10 @@ async def handle_message(
         if audio_data:
             await handle_audio_chunk(websocket, user_id, audio_data, msg_id)
     
+    elif msg_type == WSMessageType.AUDIO_END:
+        # Push-to-talk released: finalize what is buffered
+        await handle_audio_end(websocket, user_id, msg_id)
+    
     elif msg_type == WSMessageType.CANCEL:
         # Cancel current operation
         await handle_cancel(websocket, user_id, msg_id)
@@ -370,7 +604,7 @@ async def process_command_streaming(
                     
                     # For now, process synchronously and send as single response
                     # TODO: Implement true streaming when LLM supports it
-                    response = _jarvis_instance._process_command(text)
+                    response = await asyncio.to_thread(_jarvis_instance._process_command, text)
                     
                     # Send response in chunks for demo
                     words = response.split()
@@ -389,9 +623,9 @@ async def process_command_streaming(
                     full_response = response
                 else:
                     # Non-streaming
-                    full_response = _jarvis_instance._process_command(text)
+                    full_response = await asyncio.to_thread(_jarvis_instance._process_command, text)
             else:
-                full_response = _jarvis_instance._process_command(text)
+                full_response = await asyncio.to_thread(_jarvis_instance._process_command, text)
             
             # Send complete response
             processing_time = (time.time() - start_time) * 1000
@@ -420,60 +654,112 @@ async def process_command_streaming(
         ))
 
 
-# Audio buffer for streaming STT
-_audio_buffers: Dict[str, bytes] = {}
+# Streaming STT session per connection
+_stt_sessions: Dict[WebSocket, StreamingSTTSession] = {}
+
+
+def _get_stt_session(websocket: WebSocket) -> Optional[StreamingSTTSession]:
+    """Get or create the streaming STT session for a connection."""
+    session = _stt_sessions.get(websocket)
+    if session is not None:
+        return session
+    
+    if not (_jarvis_instance and getattr(_jarvis_instance, '_voice_pipeline', None)):
+        return None
+    
+    voice = _jarvis_instance._voice_pipeline
+    stt = getattr(voice, 'stt', None)
+    if stt is not None and hasattr(stt, 'transcribe'):
+        # The session hands over VAD-cut utterances; don't segment them again
+        transcribe = functools.partial(stt.transcribe, pre_segmented=True)
+        vad = getattr(stt, 'vad', None)
+    elif hasattr(voice, 'transcribe'):
+        transcribe = voice.transcribe
+        vad = None
+    else:
+        return None
+    
+    try:
+        from ..voice.streaming_stt import StreamingSTTSession
+        
+        session = StreamingSTTSession(transcribe=transcribe, vad=vad)
+    except Exception as e:
+        logger.error(f"Streaming STT unavailable: {e}")
+        return None
+    
+    _stt_sessions[websocket] = session
+    return session
+
+
+async def _send_transcripts(
+    websocket: WebSocket,
+    events: List[TranscriptEvent],
+    msg_id: Optional[str],
+) -> None:
+    for event in events:
+        await manager.send_personal(websocket, WSMessage(
+            type=WSMessageType.NOTIFICATION,
+            data=event.to_dict(),
+            message_id=msg_id,
+        ))
 
 
 async def handle_audio_chunk(
     websocket: WebSocket,
     user_id: str,
-    audio_data: str,  # Base64 encoded
-    msg_id: str,
+    audio_data: Union[str, bytes],
+    msg_id: Optional[str],
 ) -> None:
-    """Handle incoming audio chunk for STT."""
-    import base64
+    """
+    Handle incoming audio chunk for STT.
     
+    Binary frames arrive as raw PCM16 bytes; JSON audio_chunk messages
+    carry the same payload base64 encoded.
+    """
     try:
-        # Decode audio
-        audio_bytes = base64.b64decode(audio_data)
+        session = _get_stt_session(websocket)
+        if session is None:
+            return
         
-        # Add to buffer
-        if user_id not in _audio_buffers:
-            _audio_buffers[user_id] = b""
-        _audio_buffers[user_id] += audio_bytes
+        if isinstance(audio_data, str):
+            audio_data = base64.b64decode(audio_data)
         
-        # Check if we have enough audio (e.g., 1 second at 16kHz 16-bit = 32000 bytes)
-        if len(_audio_buffers[user_id]) >= 32000:
-            # Process audio
-            audio = _audio_buffers[user_id]
-            _audio_buffers[user_id] = b""
-            
-            # Transcribe
-            if _jarvis_instance and hasattr(_jarvis_instance, '_voice_pipeline'):
-                voice = _jarvis_instance._voice_pipeline
-                if voice and hasattr(voice, 'transcribe'):
-                    text = await asyncio.to_thread(voice.transcribe, audio)
-                    
-                    if text:
-                        await manager.send_personal(websocket, WSMessage(
-                            type=WSMessageType.NOTIFICATION,
-                            data={"transcript": text, "final": False},
-                            message_id=msg_id,
-                        ))
+        events = await session.feed(audio_data)
+        await _send_transcripts(websocket, events, msg_id)
     
     except Exception as e:
         logger.error(f"Audio processing error: {e}")
 
 
+async def handle_audio_end(
+    websocket: WebSocket,
+    user_id: str,
+    msg_id: str,
+) -> None:
+    """Finalize the current utterance and reset the stream."""
+    session = _stt_sessions.get(websocket)
+    if session is None:
+        return
+    
+    try:
+        events = await session.flush()
+        await _send_transcripts(websocket, events, msg_id)
+    except Exception as e:
+        logger.error(f"Audio finalize error: {e}")
+    finally:
+        session.reset()
+
+
 async def handle_cancel(
     websocket: WebSocket,
     user_id: str,
     msg_id: str,
 ) -> None:
     """Handle cancel request."""
-    # Clear audio buffer
-    if user_id in _audio_buffers:
-        del _audio_buffers[user_id]
+    # Drop buffered audio
+    session = _stt_sessions.get(websocket)
+    if session is not None:
+        session.reset()
     
     # Interrupt streaming if active
     if _jarvis_instance and hasattr(_jarvis_instance, '_performance'):
@@ -551,4 +837,5 @@ def get_connection_stats() -> Dict[str, Any]:
     return {
         "total_connections": manager.get_connection_count(),
         "unique_users": manager.get_user_count(),
+        "outbound": manager.get_outbound_stats(),
     }
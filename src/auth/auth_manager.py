@@ -80,6 +80,10 @@ class AuthenticationManager:
             tolerance=face_config.get("tolerance", 0.5),
             model=face_config.get("model", "hog"),
             num_jitters=face_config.get("num_jitters", 1),
+            detection_scale=face_config.get("detection_scale", 1.0),
+            reverify_frames=face_config.get("reverify_frames", 3),
+            match_reverify_frames=face_config.get("match_reverify_frames", 15),
+            reverify_iou=face_config.get("reverify_iou", 0.5),
         )
         
         self.voice_auth = VoiceAuthenticator(
@@ -329,13 +333,15 @@ class AuthenticationManager:
             
             if cap.isOpened():
                 try:
-                    # Try multiple frames for better accuracy
+                    # Try multiple frames; tracked faces are only re-encoded
+                    # while they have not matched
+                    self.face_auth.reset_tracking()
                     for _ in range(10):
                         ret, frame = cap.read()
                         if not ret:
                             continue
                         
-                        face_verified, face_confidence = self.face_auth.verify_face(frame)
+                        face_verified, face_confidence = self.face_auth.verify_frame(frame)
                         if face_verified:
                             break
                 finally:
@@ -3,13 +3,20 @@ Face Authentication Module for JARVIS.
 
 Provides face recognition capabilities using the face_recognition library
 with support for multiple face encodings per user.
+
+For continuous verification (e.g. the door camera), frames are downscaled
+before detection, faces are tracked across frames so only new tracks are
+encoded, and enrolled encodings are matched as one float32 matrix.
 """
 
 from __future__ import annotations
 
 import pickle
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -39,6 +46,230 @@ except ImportError:
     logger.warning("face_recognition not available. Face authentication disabled.")
 
 
+Location = Tuple[int, int, int, int]  # (top, right, bottom, left)
+
+
+def _detect_locations(rgb_frame: np.ndarray, model: str) -> List[Location]:
+    """Run face detection on an RGB frame."""
+    return face_recognition.face_locations(rgb_frame, model=model)
+
+
+class StageTimer:
+    """Rolling latency samples for one pipeline stage."""
+    
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+    
+    def record(self, ms: float) -> None:
+        self._samples.append(ms)
+        self.count += 1
+    
+    def to_dict(self) -> Dict[str, float]:
+        if not self._samples:
+            return {"count": self.count, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "last_ms": 0.0}
+        
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "mean_ms": round(sum(ordered) / len(ordered), 2),
+            "p50_ms": round(ordered[len(ordered) // 2], 2),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            "last_ms": round(self._samples[-1], 2),
+        }
+
+
+class FaceEncodingIndex:
+    """
+    Enrolled face encodings as a stacked float32 matrix.
+    
+    Stored as a .npy file and memory-mapped on load, so startup does not
+    unpickle anything. Squared row norms are precomputed so matching a
+    probe is a single matrix-vector product.
+    """
+    
+    def __init__(self, path: Path, legacy_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self._matrix: Optional[np.ndarray] = None
+        self._sq_norms: Optional[np.ndarray] = None
+    
+    def _migrate_legacy(self) -> None:
+        """Convert a pickled list of encodings to the .npy format."""
+        try:
+            with open(self.legacy_path, "rb") as f:
+                encodings = pickle.load(f)
+            if encodings:
+                self._write(np.asarray(encodings, dtype=np.float32))
+            self.legacy_path.unlink()
+            logger.info(f"Migrated {len(encodings)} face encodings to {self.path.name}")
+        except Exception as e:
+            logger.error(f"Failed to migrate face encodings: {e}")
+    
+    def load(self) -> np.ndarray:
+        """Load (memory-mapped) encodings, shape (n, 128)."""
+        if self._matrix is not None:
+            return self._matrix
+        
+        if not self.path.exists() and self.legacy_path and self.legacy_path.exists():
+            self._migrate_legacy()
+        
+        if self.path.exists():
+            try:
+                self._set(np.load(self.path, mmap_mode="r"))
+                logger.debug(f"Loaded {len(self._matrix)} face encodings")
+                return self._matrix
+            except Exception as e:
+                logger.error(f"Failed to load face encodings: {e}")
+        
+        self._set(np.zeros((0, 128), dtype=np.float32))
+        return self._matrix
+    
+    def _set(self, matrix: Optional[np.ndarray]) -> None:
+        self._matrix = matrix
+        self._sq_norms = np.einsum("ij,ij->i", matrix, matrix) if matrix is not None and len(matrix) else None
+    
+    def _write(self, matrix: np.ndarray) -> None:
+        # Release the old mapping before replacing the file (Windows refuses
+        # to replace a mapped file)
+        self._set(None)
+        tmp = self.path.with_suffix(".tmp.npy")
+        np.save(tmp, np.ascontiguousarray(matrix, dtype=np.float32))
+        tmp.replace(self.path)
+    
+    def __len__(self) -> int:
+        return len(self.load())
+    
+    def add(self, encodings: List[np.ndarray]) -> bool:
+        """Append encodings and persist."""
+        if not encodings:
+            return True
+        try:
+            new = np.asarray(encodings, dtype=np.float32).reshape(len(encodings), -1)
+            # Copy out of the mapping so the file can be replaced
+            current = np.array(self.load(), dtype=np.float32)
+            matrix = np.concatenate([current, new]) if len(current) else new
+            self._write(matrix)
+            self._set(np.load(self.path, mmap_mode="r"))
+            logger.info(f"Saved {len(matrix)} face encodings")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save face encodings: {e}")
+            return False
+    
+    def distances(self, encoding: np.ndarray) -> np.ndarray:
+        """Euclidean distance from a probe encoding to every enrolled one."""
+        matrix = self.load()
+        if not len(matrix):
+            return np.zeros(0, dtype=np.float32)
+        
+        probe = np.asarray(encoding, dtype=np.float32)
+        sq = self._sq_norms - 2.0 * (matrix @ probe) + float(probe @ probe)
+        return np.sqrt(np.maximum(sq, 0.0))
+    
+    def best_match(self, encoding: np.ndarray) -> Tuple[int, float]:
+        """Return (index, distance) of the closest encoding, or (-1, inf)."""
+        distances = self.distances(encoding)
+        if not len(distances):
+            return -1, float("inf")
+        idx = int(np.argmin(distances))
+        return idx, float(distances[idx])
+    
+    def clear(self) -> None:
+        self._set(None)
+        for path in (self.path, self.legacy_path):
+            if path and path.exists():
+                path.unlink()
+
+
+@dataclass
+class FaceTrack:
+    """A face followed across consecutive frames."""
+    track_id: int
+    location: Location
+    last_frame: int
+    encoded_frame: int = -1
+    encoded_location: Optional[Location] = None
+    is_match: bool = False
+    confidence: float = 0.0
+
+
+def _iou(a: Location, b: Location) -> float:
+    top = max(a[0], b[0])
+    right = min(a[1], b[1])
+    bottom = min(a[2], b[2])
+    left = max(a[3], b[3])
+    if right <= left or bottom <= top:
+        return 0.0
+    inter = (right - left) * (bottom - top)
+    area_a = (a[1] - a[3]) * (a[2] - a[0])
+    area_b = (b[1] - b[3]) * (b[2] - b[0])
+    return inter / float(area_a + area_b - inter)
+
+
+class FaceTracker:
+    """
+    Greedy IoU tracker for face boxes.
+    
+    Detections that overlap an existing track keep its id (and verdict);
+    the rest start new tracks. Tracks unseen for `max_missed` frames
+    are dropped.
+    """
+    
+    def __init__(self, iou_threshold: float = 0.3, max_missed: int = 5):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.tracks: Dict[int, FaceTrack] = {}
+        self.frame_index = 0
+        self._next_id = 0
+    
+    def update(self, locations: List[Location]) -> List[Tuple[FaceTrack, bool]]:
+        """
+        Associate this frame's detections with tracks.
+        
+        Returns:
+            List of (track, is_new) for each detection.
+        """
+        self.frame_index += 1
+        pairs = sorted(
+            (
+                (_iou(track.location, loc), tid, i)
+                for tid, track in self.tracks.items()
+                for i, loc in enumerate(locations)
+            ),
+            reverse=True,
+        )
+        
+        assigned: Dict[int, Tuple[FaceTrack, bool]] = {}
+        used_tracks = set()
+        for score, tid, i in pairs:
+            if score < self.iou_threshold:
+                break
+            if tid in used_tracks or i in assigned:
+                continue
+            track = self.tracks[tid]
+            track.location = locations[i]
+            track.last_frame = self.frame_index
+            assigned[i] = (track, False)
+            used_tracks.add(tid)
+        
+        for i, loc in enumerate(locations):
+            if i not in assigned:
+                track = FaceTrack(self._next_id, loc, self.frame_index)
+                self.tracks[track.track_id] = track
+                self._next_id += 1
+                assigned[i] = (track, True)
+        
+        for tid in [t for t, tr in self.tracks.items() if self.frame_index - tr.last_frame > self.max_missed]:
+            del self.tracks[tid]
+        
+        return [assigned[i] for i in range(len(locations))]
+    
+    def reset(self) -> None:
+        self.tracks.clear()
+        self.frame_index = 0
+
+
 class FaceAuthenticator:
     """
     Face authentication using face_recognition library.
@@ -47,7 +278,9 @@ class FaceAuthenticator:
     - Face detection and encoding
     - Multiple face encodings per user for robustness
     - Configurable tolerance for matching
-    - Caching of encodings for performance
+    - Memory-mapped encoding matrix with vectorized matching
+    - Continuous verification with face tracking (verify_frame)
+    - Per-stage latency stats (detect/encode/match)
     """
     
     def __init__(
@@ -56,6 +289,12 @@ class FaceAuthenticator:
         tolerance: float = 0.5,
         model: str = "hog",
         num_jitters: int = 1,
+        detection_scale: float = 1.0,
+        track_iou: float = 0.3,
+        track_max_missed: int = 5,
+        reverify_frames: int = 3,
+        match_reverify_frames: int = 15,
+        reverify_iou: float = 0.5,
     ):
         """
         Initialize the face authenticator.
@@ -65,6 +304,14 @@ class FaceAuthenticator:
             tolerance: How much distance between faces to consider a match (lower = stricter).
             model: Face detection model - "hog" (faster, CPU) or "cnn" (more accurate, GPU).
             num_jitters: Number of times to re-sample face when calculating encoding.
+            detection_scale: Frames are resized by this factor before detection
+                (below 1.0 is faster but misses small or distant faces).
+            track_iou: Minimum box overlap to continue a track.
+            track_max_missed: Frames a track survives without a detection.
+            reverify_frames: Frames between re-encoding a track that did not match.
+            match_reverify_frames: Frames between re-encoding a track that matched.
+            reverify_iou: Re-encode a track early when its box overlaps the
+                box it was last encoded at by less than this.
         """
         self.encodings_dir = Path(encodings_dir)
         self.encodings_dir.mkdir(parents=True, exist_ok=True)
@@ -72,10 +319,17 @@ class FaceAuthenticator:
         self.tolerance = tolerance
         self.model = model
         self.num_jitters = num_jitters
-        
-        # Cache for loaded encodings
-        self._encodings_cache: Optional[List[np.ndarray]] = None
-        self._cache_valid = False
+        self.detection_scale = detection_scale
+        self.reverify_frames = reverify_frames
+        self.match_reverify_frames = match_reverify_frames
+        self.reverify_iou = reverify_iou
+        
+        self._index = FaceEncodingIndex(
+            self.encodings_file,
+            legacy_path=self.encodings_dir / "user_encodings.pkl",
+        )
+        self._tracker = FaceTracker(iou_threshold=track_iou, max_missed=track_max_missed)
+        self._stages = {name: StageTimer() for name in ("detect", "encode", "match")}
         
         if not FACE_RECOGNITION_AVAILABLE:
             logger.error("Face recognition library not installed!")
@@ -88,51 +342,19 @@ class FaceAuthenticator:
     @property
     def encodings_file(self) -> Path:
         """Path to the encodings file."""
-        return self.encodings_dir / "user_encodings.pkl"
-    
-    def _load_encodings(self) -> List[np.ndarray]:
-        """Load cached face encodings from disk."""
-        if self._cache_valid and self._encodings_cache is not None:
-            return self._encodings_cache
-        
-        if not self.encodings_file.exists():
-            self._encodings_cache = []
-            self._cache_valid = True
-            return []
-        
-        try:
-            with open(self.encodings_file, "rb") as f:
-                self._encodings_cache = pickle.load(f)
-            self._cache_valid = True
-            logger.debug(f"Loaded {len(self._encodings_cache)} face encodings")
-            return self._encodings_cache
-        except Exception as e:
-            logger.error(f"Failed to load face encodings: {e}")
-            self._encodings_cache = []
-            self._cache_valid = True
-            return []
-    
-    def _save_encodings(self, encodings: List[np.ndarray]) -> bool:
-        """Save face encodings to disk."""
-        try:
-            with open(self.encodings_file, "wb") as f:
-                pickle.dump(encodings, f)
-            self._encodings_cache = encodings
-            self._cache_valid = True
-            logger.info(f"Saved {len(encodings)} face encodings")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save face encodings: {e}")
-            return False
+        return self.encodings_dir / "user_encodings.npy"
     
     def has_enrolled_faces(self) -> bool:
         """Check if any faces are enrolled."""
-        return len(self._load_encodings()) > 0
+        return len(self._index) > 0
     
-    def detect_faces(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    def detect_faces(self, frame: np.ndarray) -> List[Location]:
         """
         Detect faces in a frame.
         
+        The frame is downscaled by `detection_scale` before detection and
+        the locations are mapped back to full-frame coordinates.
+        
         Args:
             frame: BGR image from OpenCV.
             
@@ -142,15 +364,39 @@ class FaceAuthenticator:
         if not FACE_RECOGNITION_AVAILABLE:
             return []
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        start = time.perf_counter()
+        scale = self.detection_scale
+        small = cv2.resize(frame, (0, 0), fx=scale, fy=scale) if scale != 1.0 else frame
+        rgb_small = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+        
+        locations = _detect_locations(rgb_small, self.model)
         
-        # Detect faces
-        face_locations = face_recognition.face_locations(rgb_frame, model=self.model)
+        if scale != 1.0:
+            locations = [tuple(int(round(v / scale)) for v in loc) for loc in locations]
         
-        return face_locations
+        self._stages["detect"].record((time.perf_counter() - start) * 1000)
+        return locations
+    
+    def _encode(self, rgb_frame: np.ndarray, location: Location) -> Optional[np.ndarray]:
+        start = time.perf_counter()
+        encodings = face_recognition.face_encodings(
+            rgb_frame,
+            known_face_locations=[location],
+            num_jitters=self.num_jitters,
+        )
+        self._stages["encode"].record((time.perf_counter() - start) * 1000)
+        return encodings[0] if encodings else None
     
-    def get_face_encoding(self, frame: np.ndarray, face_location: Optional[Tuple[int, int, int, int]] = None) -> Optional[np.ndarray]:
+    def _match(self, encoding: np.ndarray) -> Tuple[bool, float]:
+        start = time.perf_counter()
+        _, distance = self._index.best_match(encoding)
+        self._stages["match"].record((time.perf_counter() - start) * 1000)
+        
+        if distance == float("inf"):
+            return False, 0.0
+        return distance <= self.tolerance, 1.0 - distance
+    
+    def get_face_encoding(self, frame: np.ndarray, face_location: Optional[Location] = None) -> Optional[np.ndarray]:
         """
         Get face encoding from a frame.
         
@@ -164,27 +410,16 @@ class FaceAuthenticator:
         if not FACE_RECOGNITION_AVAILABLE:
             return None
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
         # Get face locations if not provided
         if face_location is None:
-            face_locations = face_recognition.face_locations(rgb_frame, model=self.model)
+            face_locations = self.detect_faces(frame)
             if not face_locations:
                 return None
             face_location = face_locations[0]
         
-        # Get encoding
-        encodings = face_recognition.face_encodings(
-            rgb_frame,
-            known_face_locations=[face_location],
-            num_jitters=self.num_jitters,
-        )
-        
-        if not encodings:
-            return None
-        
-        return encodings[0]
+        # Encode at full resolution for accuracy
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return self._encode(rgb_frame, face_location)
     
     def enroll_face(self, frame: np.ndarray) -> bool:
         """
@@ -205,11 +440,7 @@ class FaceAuthenticator:
             logger.warning("No face detected in frame for enrollment")
             return False
         
-        # Load existing encodings and add new one
-        encodings = self._load_encodings()
-        encodings.append(encoding)
-        
-        return self._save_encodings(encodings)
+        return self._index.add([encoding])
     
     def enroll_multiple_faces(self, frames: List[np.ndarray]) -> int:
         """
@@ -224,17 +455,16 @@ class FaceAuthenticator:
         if not FACE_RECOGNITION_AVAILABLE:
             return 0
         
-        encodings = self._load_encodings()
-        enrolled_count = 0
+        encodings = []
         
         for frame in frames:
             encoding = self.get_face_encoding(frame)
             if encoding is not None:
                 encodings.append(encoding)
-                enrolled_count += 1
         
+        enrolled_count = len(encodings)
         if enrolled_count > 0:
-            self._save_encodings(encodings)
+            self._index.add(encodings)
         
         logger.info(f"Enrolled {enrolled_count} faces from {len(frames)} frames")
         return enrolled_count
@@ -253,8 +483,7 @@ class FaceAuthenticator:
         if not FACE_RECOGNITION_AVAILABLE:
             return False, 0.0
         
-        known_encodings = self._load_encodings()
-        if not known_encodings:
+        if not self.has_enrolled_faces():
             logger.warning("No enrolled faces to verify against")
             return False, 0.0
         
@@ -264,30 +493,81 @@ class FaceAuthenticator:
             logger.debug("No face detected in verification frame")
             return False, 0.0
         
-        # Compare with all known encodings
-        distances = face_recognition.face_distance(known_encodings, encoding)
+        is_match, confidence = self._match(encoding)
         
-        if len(distances) == 0:
-            return False, 0.0
+        logger.debug(f"Face verification: match={is_match}, confidence={confidence:.3f}")
         
-        # Get best match (lowest distance)
-        min_distance = float(np.min(distances))
-        confidence = 1.0 - min_distance
+        return is_match, confidence
+    
+    def verify_frame(self, frame: np.ndarray) -> Tuple[bool, float]:
+        """
+        Continuous verification for a camera stream.
         
-        # Check if within tolerance
-        is_match = min_distance <= self.tolerance
+        Faces are tracked across calls; a track is encoded and matched
+        when it first appears, then re-encoded every `reverify_frames`
+        frames while it has not matched and every `match_reverify_frames`
+        once it has. A box that jumps away from where it was last encoded
+        is re-encoded immediately, so a different face taking over the
+        track cannot inherit its verdict. Call reset_tracking() between
+        unrelated streams.
         
-        logger.debug(f"Face verification: match={is_match}, confidence={confidence:.3f}, distance={min_distance:.3f}")
+        Args:
+            frame: BGR image from the stream.
+            
+        Returns:
+            Tuple of (is_match, confidence) for the best visible face.
+        """
+        if not FACE_RECOGNITION_AVAILABLE:
+            return False, 0.0
         
-        return is_match, confidence
+        if not self.has_enrolled_faces():
+            logger.warning("No enrolled faces to verify against")
+            return False, 0.0
+        
+        tracked = self._tracker.update(self.detect_faces(frame))
+        frame_index = self._tracker.frame_index
+        rgb_frame = None
+        best_match, best_confidence = False, 0.0
+        
+        for track, is_new in tracked:
+            interval = self.match_reverify_frames if track.is_match else self.reverify_frames
+            stale = frame_index - track.encoded_frame >= interval
+            jumped = (
+                track.encoded_location is not None
+                and _iou(track.location, track.encoded_location) < self.reverify_iou
+            )
+            if is_new or stale or jumped:
+                if rgb_frame is None:
+                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                encoding = self._encode(rgb_frame, track.location)
+                track.encoded_frame = frame_index
+                track.encoded_location = track.location
+                track.is_match, track.confidence = False, 0.0
+                if encoding is not None:
+                    track.is_match, track.confidence = self._match(encoding)
+            
+            if (track.is_match, track.confidence) > (best_match, best_confidence):
+                best_match, best_confidence = track.is_match, track.confidence
+        
+        return best_match, best_confidence
+    
+    def reset_tracking(self) -> None:
+        """Forget tracked faces (start of a new verification session)."""
+        self._tracker.reset()
+    
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Per-stage latency (detect/encode/match) and tracking state."""
+        return {
+            **{name: timer.to_dict() for name, timer in self._stages.items()},
+            "active_tracks": len(self._tracker.tracks),
+            "enrolled": len(self._index),
+        }
     
     def clear_enrollments(self) -> bool:
         """Clear all enrolled face encodings."""
         try:
-            if self.encodings_file.exists():
-                self.encodings_file.unlink()
-            self._encodings_cache = []
-            self._cache_valid = True
+            self._index.clear()
+            self._tracker.reset()
             logger.info("Cleared all face enrollments")
             return True
         except Exception as e:
@@ -296,7 +576,7 @@ class FaceAuthenticator:
     
     def get_enrollment_count(self) -> int:
         """Get the number of enrolled face encodings."""
-        return len(self._load_encodings())
+        return len(self._index)
 
 
 def capture_enrollment_frames(
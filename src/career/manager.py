@@ -15,7 +15,7 @@ Orchestrates all career and advanced intelligence features:
 import re
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -44,6 +44,51 @@ class CareerManager:
     - Learning path generation
     """
     
+    # Trigger phrases per command type; also registered with the
+    # assistant's intent index so this manager is only called on a match
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "interview": (
+            "interview", "coding question", "ml question", "behavioral question",
+            "system design question", "give me a hint", "show solution",
+            "rate my answer", "interview stats", "mock interview",
+            "practice question", "leetcode",
+        ),
+        "resume": (
+            "add experience", "show experience", "my experience", "add skill",
+            "my skills", "update gpa", "resume", "generate bullet",
+            "add certification", "add project", "what's on my resume",
+        ),
+        "application": (
+            "add application", "applied to", "application status", "update application",
+            "my applications", "pending application", "application stats",
+            "applications due", "job application", "internship application",
+        ),
+        "expense": (
+            "log expense", "spent", "expense", "budget", "how much did i spend",
+            "spending", "add income", "set budget", "budget status",
+            "weekly spending", "monthly spending",
+        ),
+        "notion": (
+            "open notion", "notion page", "save notion", "my notion",
+            "notion pages", "search notion",
+        ),
+        "networking": (
+            "add networking contact", "my network", "professional contact",
+            "follow up with", "who should i contact", "networking", "met someone",
+            "add note for contact", "network stats", "linkedin contact",
+        ),
+        "journal": (
+            "voice journal", "diary", "today's journal", "journal entry",
+            "how am i feeling", "mood", "journal stats", "search journal",
+            "grateful for", "reflect on", "daily reflection",
+        ),
+        "learning": (
+            "learning path", "what should i learn", "create path",
+            "my learning", "completed", "next in", "add to path",
+            "learning progress", "skill roadmap",
+        ),
+    }
+    
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
@@ -174,52 +219,28 @@ class CareerManager:
     # =========================================================================
     
     def _is_interview_command(self, text: str) -> bool:
-        patterns = [
-            "interview", "coding question", "ml question", "behavioral question",
-            "system design question", "give me a hint", "show solution",
-            "rate my answer", "interview stats", "mock interview",
-            "practice question", "leetcode",
-        ]
+        patterns = self.COMMAND_TRIGGERS["interview"]
         return any(p in text for p in patterns)
     
     def _is_resume_command(self, text: str) -> bool:
-        patterns = [
-            "add experience", "show experience", "my experience", "add skill",
-            "my skills", "update gpa", "resume", "generate bullet",
-            "add certification", "add project", "what's on my resume",
-        ]
+        patterns = self.COMMAND_TRIGGERS["resume"]
         return any(p in text for p in patterns)
     
     def _is_application_command(self, text: str) -> bool:
-        patterns = [
-            "add application", "applied to", "application status", "update application",
-            "my applications", "pending application", "application stats",
-            "applications due", "job application", "internship application",
-        ]
+        patterns = self.COMMAND_TRIGGERS["application"]
         return any(p in text for p in patterns)
     
     def _is_expense_command(self, text: str) -> bool:
-        patterns = [
-            "log expense", "spent", "expense", "budget", "how much did i spend",
-            "spending", "add income", "set budget", "budget status",
-            "weekly spending", "monthly spending",
-        ]
+        patterns = self.COMMAND_TRIGGERS["expense"]
         return any(p in text for p in patterns)
     
     def _is_notion_command(self, text: str) -> bool:
-        patterns = [
-            "open notion", "notion page", "save notion", "my notion",
-            "notion pages", "search notion",
-        ]
+        patterns = self.COMMAND_TRIGGERS["notion"]
         return any(p in text for p in patterns)
     
     def _is_networking_command(self, text: str) -> bool:
         # Professional networking - distinct from communication contacts
-        patterns = [
-            "add networking contact", "my network", "professional contact",
-            "follow up with", "who should i contact", "networking", "met someone",
-            "add note for contact", "network stats", "linkedin contact",
-        ]
+        patterns = self.COMMAND_TRIGGERS["networking"]
         # Exclude communication contact patterns (handled by communication module)
         exclude_patterns = ["whatsapp", "phone number", "call", "message"]
         if any(p in text for p in exclude_patterns):
@@ -228,11 +249,7 @@ class CareerManager:
     
     def _is_journal_command(self, text: str) -> bool:
         # Voice journal - distinct from learning journal in productivity module
-        patterns = [
-            "voice journal", "diary", "today's journal", "journal entry",
-            "how am i feeling", "mood", "journal stats", "search journal",
-            "grateful for", "reflect on", "daily reflection",
-        ]
+        patterns = self.COMMAND_TRIGGERS["journal"]
         # Exclude learning journal patterns (handled by productivity module)
         exclude_patterns = ["learning journal", "what did i learn", "log learning", "til:"]
         if any(p in text for p in exclude_patterns):
@@ -240,11 +257,7 @@ class CareerManager:
         return any(p in text for p in patterns)
     
     def _is_learning_command(self, text: str) -> bool:
-        patterns = [
-            "learning path", "what should i learn", "create path",
-            "my learning", "completed", "next in", "add to path",
-            "learning progress", "skill roadmap",
-        ]
+        patterns = self.COMMAND_TRIGGERS["learning"]
         return any(p in text for p in patterns)
     
     # =========================================================================
@@ -17,6 +17,7 @@ try:
         ContactsDatabase,
         ContactsManager,
     )
+    from .contact_index import ContactIndex, phonetic_key
     CONTACTS_AVAILABLE = True
 except ImportError as e:
     logger.debug(f"Contacts not available: {e}")
@@ -24,6 +25,8 @@ except ImportError as e:
     Contact = None
     ContactsDatabase = None
     ContactsManager = None
+    ContactIndex = None
+    phonetic_key = None
 
 # WhatsApp Automation
 try:
@@ -66,6 +69,8 @@ __all__ = [
     "CONTACTS_AVAILABLE",
     "Contact",
     "ContactsDatabase",
+    "ContactIndex",
+    "phonetic_key",
     "ContactsManager",
     # WhatsApp
     "WHATSAPP_AVAILABLE",
@@ -0,0 +1,297 @@
+"""
+In-Memory Contact Index for JARVIS.
+
+Voice commands ("message papa", "call jon") resolve a spoken name on
+every send, so contact lookups are served from memory instead of
+scanning the contacts table:
+- Exact name/nickname keys with relationship alias expansion
+- Trigram inverted index for substring and typo-tolerant matches
+- Phonetic keys so names that sound alike ("Jon" / "John") match
+
+Usage:
+    index = ContactIndex(similarity=db._similarity, aliases=db.RELATIONSHIP_ALIASES)
+    index.rebuild(db.list_contacts(limit=-1))
+    matches = index.suggest("jon", threshold=0.6)
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .contacts import Contact
+
+
+_NON_ALPHA = re.compile(r"[^a-z]")
+
+# Multi-letter spellings collapsed before single-letter mapping ("X" = sh, "0" = th)
+_PHONETIC_PREFIXES = (("kn", "n"), ("gn", "n"), ("pn", "n"), ("wr", "r"), ("ps", "s"), ("wh", "w"), ("x", "s"))
+_PHONETIC_DIGRAPHS = (
+    ("tch", "X"), ("sch", "sk"), ("ph", "f"), ("ck", "k"), ("sh", "X"),
+    ("ch", "X"), ("th", "0"), ("dg", "j"), ("gh", "h"), ("cia", "Xa"),
+)
+_PHONETIC_LETTERS = {
+    "b": "p", "c": "k", "d": "t", "g": "k", "q": "k", "v": "f", "x": "ks", "z": "s",
+}
+_VOWELS = set("aeiou")
+
+
+def phonetic_key(word: str) -> str:
+    """
+    Metaphone-style sound key for a single name token.
+
+    Spellings that sound alike map to the same key, e.g. "jon" and
+    "john" -> "JN", "catherine" and "kathryn" -> "K0RN".
+    """
+    word = _NON_ALPHA.sub("", word.lower())
+    if not word:
+        return ""
+
+    for prefix, replacement in _PHONETIC_PREFIXES:
+        if word.startswith(prefix):
+            word = replacement + word[len(prefix):]
+            break
+
+    # Soft c / g before e, i, y
+    word = re.sub(r"c(?=[eiy])", "s", word)
+    word = re.sub(r"g(?=[eiy])", "j", word)
+    for spelling, sound in _PHONETIC_DIGRAPHS:
+        word = word.replace(spelling, sound)
+
+    key = []
+    for i, ch in enumerate(word):
+        if ch in _VOWELS or ch == "y":
+            # Vowels only count at the start; y only as a consonant
+            if i == 0 and ch != "y":
+                key.append(ch)
+            elif ch == "y" and i + 1 < len(word) and word[i + 1] in _VOWELS:
+                key.append(ch)
+            continue
+        if ch in "hw" and not (i + 1 < len(word) and word[i + 1] in _VOWELS):
+            continue  # Silent h / w
+        sound = _PHONETIC_LETTERS.get(ch, ch)
+        if not key or key[-1] != sound:
+            key.append(sound)
+
+    return "".join(key).upper()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of text padded at both ends."""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bigrams(text: str) -> Set[str]:
+    """Character bigrams of text (unpadded, for two-letter queries)."""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class ContactIndex:
+    """
+    Inverted indexes over contact names and nicknames.
+
+    Candidates are gathered from exact/alias keys, shared trigrams and
+    phonetic keys, then ranked with the database's similarity function,
+    so results agree with the full-table scan they replace. Writes to
+    the database are mirrored with add() / remove().
+    """
+
+    PHONETIC_SCORE = 0.7
+    # Highest score _similarity gives without a substring, prefix or alias
+    # match (character overlap is scaled to 0.5)
+    OVERLAP_SCORE_CEILING = 0.5
+    MIN_PHONETIC_LENGTH = 2  # One-consonant keys ("P" for papa, pia, pooja) match too much
+
+    def __init__(
+        self,
+        similarity: Callable[[str, str], float],
+        aliases: Optional[Mapping[str, Iterable[str]]] = None,
+        max_candidates: int = 64,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            similarity: Scoring function (query, key) -> 0..1 on lowercase strings.
+            aliases: Relationship aliases, e.g. {"dad": ["papa", ...]}.
+            max_candidates: Trigram candidates scored per query.
+        """
+        self.similarity = similarity
+        self.max_candidates = max_candidates
+
+        self._aliases: Dict[str, Set[str]] = defaultdict(set)
+        for key, values in (aliases or {}).items():
+            for value in values:
+                self._aliases[key].add(value)
+                self._aliases[value].add(key)
+
+        self._contacts: Dict[int, "Contact"] = {}
+        self._exact: Dict[str, Set[int]] = defaultdict(set)
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+        self._pairs: Dict[str, Set[int]] = defaultdict(set)
+        self._phonetic: Dict[str, Set[int]] = defaultdict(set)
+        self._sounds: Dict[int, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def __contains__(self, contact_id: int) -> bool:
+        return contact_id in self._contacts
+
+    @staticmethod
+    def _keys(contact: "Contact") -> List[str]:
+        keys = [contact.name.lower()]
+        if contact.nickname:
+            keys.append(contact.nickname.lower())
+        return keys
+
+    def _phonetic_keys(self, text: str) -> Set[str]:
+        keys = {phonetic_key(token) for token in text.split()}
+        return {key for key in keys if len(key) >= self.MIN_PHONETIC_LENGTH}
+
+    def _entries(self, contact: "Contact"):
+        """(exact keys, trigrams, bigrams, phonetic keys) for a contact."""
+        keys = self._keys(contact)
+        grams: Set[str] = set()
+        pairs: Set[str] = set()
+        sounds: Set[str] = set()
+        for key in keys:
+            grams |= trigrams(key)
+            pairs |= bigrams(key)
+            sounds |= self._phonetic_keys(key)
+        return keys, grams, pairs, sounds
+
+    def _tables(self):
+        """Inverted indexes, in the order _entries() returns their keys."""
+        return self._exact, self._grams, self._pairs, self._phonetic
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def add(self, contact: "Contact") -> None:
+        """Index a contact, replacing any previous entry with its id."""
+        with self._lock:
+            self.remove(contact.id)
+            self._contacts[contact.id] = contact
+            entries = self._entries(contact)
+            self._sounds[contact.id] = entries[-1]
+            for table, values in zip(self._tables(), entries):
+                for value in values:
+                    table[value].add(contact.id)
+
+    def remove(self, contact_id: int) -> None:
+        """Drop a contact from the index (no-op if absent)."""
+        with self._lock:
+            contact = self._contacts.pop(contact_id, None)
+            if contact is None:
+                return
+            self._sounds.pop(contact_id, None)
+            for table, values in zip(self._tables(), self._entries(contact)):
+                for value in values:
+                    ids = table.get(value)
+                    if ids is not None:
+                        ids.discard(contact_id)
+                        if not ids:
+                            del table[value]
+
+    def rebuild(self, contacts: Iterable["Contact"]) -> None:
+        """Replace the index contents."""
+        with self._lock:
+            self._contacts.clear()
+            self._sounds.clear()
+            for table in self._tables():
+                table.clear()
+            for contact in contacts:
+                self.add(contact)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _candidates(self, query: str, query_sounds: Set[str], threshold: float) -> Set[int]:
+        candidates: Set[int] = set()
+        for key in {query} | self._aliases.get(query, set()):
+            candidates |= self._exact.get(key, set())
+
+        if len(query) >= 3:
+            overlap: Counter = Counter()
+            for gram in trigrams(query):
+                overlap.update(self._grams.get(gram, ()))
+            candidates.update(cid for cid, _ in overlap.most_common(self.max_candidates))
+        elif len(query) == 2 and threshold > self.OVERLAP_SCORE_CEILING:
+            # Only a substring can score this high; every key containing
+            # the query is in its bigram postings
+            candidates |= self._pairs.get(query, set())
+        else:
+            return set(self._contacts)  # Too short to narrow anything
+
+        for sound in query_sounds:
+            candidates |= self._phonetic.get(sound, set())
+        return candidates
+
+    def _score(self, query: str, query_sounds: Set[str], contact: "Contact") -> float:
+        score = max(self.similarity(query, key) for key in self._keys(contact))
+        if score < self.PHONETIC_SCORE and query_sounds and query_sounds <= self._sounds[contact.id]:
+            score = self.PHONETIC_SCORE
+        return score
+
+    def suggest(self, query: str, threshold: float = 0.6, limit: int = 5) -> List[Tuple["Contact", float]]:
+        """
+        Contacts similar to query, best first.
+
+        Args:
+            query: Spoken or typed name
+            threshold: Minimum similarity score (0-1)
+            limit: Maximum results
+
+        Returns:
+            List of (contact, score) tuples
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+
+        query_sounds = self._phonetic_keys(query)
+        with self._lock:
+            scored = []
+            for cid in self._candidates(query, query_sounds, threshold):
+                contact = self._contacts[cid]
+                score = self._score(query, query_sounds, contact)
+                if score >= threshold:
+                    scored.append((contact, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0].id))
+        return scored[:limit]
+
+    def search(self, query: str, limit: int = 10) -> Optional[List["Contact"]]:
+        """
+        Contacts whose name or nickname contains query.
+
+        Ordered favorites first, then by name. Returns None for queries
+        shorter than a trigram; callers fall back to the database.
+        """
+        query = query.lower()
+        if len(query) < 3:
+            return None
+
+        grams = [query[i:i + 3] for i in range(len(query) - 2)]
+        with self._lock:
+            ids: Optional[Set[int]] = None
+            for gram in grams:
+                postings = self._grams.get(gram, set())
+                ids = set(postings) if ids is None else ids & postings
+                if not ids:
+                    return []
+            matches = [
+                self._contacts[cid] for cid in ids
+                if any(query in key for key in self._keys(self._contacts[cid]))
+            ]
+
+        matches.sort(key=lambda c: (not c.favorite, c.name))
+        return matches[:limit]
@@ -4,7 +4,7 @@ JARVIS Contacts Management System
 Provides:
 - Contact storage with SQLite database
 - CRUD operations for contacts
-- Smart contact resolution (name/nickname search)
+- Smart contact resolution (name/nickname search, served from an in-memory index)
 - CSV/vCard import
 - Country code handling
 """
@@ -21,6 +21,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from .contact_index import ContactIndex
+
 
 @dataclass
 class Contact:
@@ -69,6 +71,9 @@ class ContactsDatabase:
         self.default_country_code = default_country_code
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
+        
+        # Built on first search and kept in sync by the write methods
+        self._index: Optional[ContactIndex] = None
     
     def _init_database(self) -> None:
         """Initialize database schema."""
@@ -151,6 +156,19 @@ class ContactsDatabase:
         # Add default country code
         return self.default_country_code + cleaned
     
+    def _get_index(self) -> ContactIndex:
+        """In-memory name index, loaded from the database on first use."""
+        if self._index is None:
+            index = ContactIndex(similarity=self._similarity, aliases=self.RELATIONSHIP_ALIASES)
+            index.rebuild(self.list_contacts(limit=-1))
+            self._index = index
+            logger.debug(f"Contact index built ({len(index)} contacts)")
+        return self._index
+    
+    def invalidate_index(self) -> None:
+        """Drop the index (e.g. after the database was changed externally)."""
+        self._index = None
+    
     def _row_to_contact(self, row: tuple) -> Contact:
         """Convert database row to Contact object."""
         return Contact(
@@ -225,6 +243,8 @@ class ContactsDatabase:
                 
                 # Fetch the created contact
                 contact = self.get_contact_by_id(contact_id)
+                if self._index is not None and contact:
+                    self._index.add(contact)
                 logger.info(f"Added contact: {name}")
                 return True, f"Added {name} to contacts", contact
                 
@@ -275,9 +295,14 @@ class ContactsDatabase:
                     return False, "Contact not found"
                 
                 conn.commit()
-                logger.info(f"Updated contact ID {contact_id}")
-                return True, "Contact updated"
-                
+            
+            if self._index is not None:
+                contact = self.get_contact_by_id(contact_id)
+                if contact:
+                    self._index.add(contact)
+            logger.info(f"Updated contact ID {contact_id}")
+            return True, "Contact updated"
+            
         except Exception as e:
             logger.error(f"Failed to update contact: {e}")
             return False, f"Failed to update contact: {e}"
@@ -298,16 +323,21 @@ class ContactsDatabase:
                 cursor = conn.cursor()
                 
                 if contact_id:
-                    cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+                    ids = [contact_id]
                 elif name:
-                    cursor.execute("DELETE FROM contacts WHERE name = ? COLLATE NOCASE", (name,))
+                    cursor.execute("SELECT id FROM contacts WHERE name = ? COLLATE NOCASE", (name,))
+                    ids = [row[0] for row in cursor.fetchall()]
                 else:
                     return False, "Must provide contact_id or name"
                 
-                if cursor.rowcount == 0:
+                cursor.executemany("DELETE FROM contacts WHERE id = ?", [(i,) for i in ids])
+                if cursor.rowcount <= 0:
                     return False, "Contact not found"
                 
                 conn.commit()
+                if self._index is not None:
+                    for i in ids:
+                        self._index.remove(i)
                 logger.info(f"Deleted contact: {contact_id or name}")
                 return True, "Contact deleted"
                 
@@ -370,10 +400,14 @@ class ContactsDatabase:
         Returns:
             List of matching contacts
         """
+        matches = self._get_index().search(query, limit)
+        if matches is not None:
+            return matches
+        
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
-            # Use LIKE for fuzzy matching
+            # Use LIKE for queries too short for the index
             pattern = f"%{query}%"
             cursor.execute("""
                 SELECT * FROM contacts 
@@ -494,10 +528,9 @@ class ContactsDatabase:
         """
         Find contacts similar to query (for "Did you mean?" suggestions).
         
-        Uses simple similarity scoring based on:
-        - Substring matching
-        - Common prefix/suffix
-        - Character overlap
+        Candidates come from the in-memory index (aliases, trigrams and
+        phonetic keys) and are scored with _similarity against name and
+        nickname; names that sound alike score at least 0.7.
         
         Args:
             query: Search query
@@ -506,30 +539,7 @@ class ContactsDatabase:
         Returns:
             List of (contact, score) tuples sorted by score
         """
-        query_lower = query.lower()
-        results = []
-        
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM contacts")
-            
-            for row in cursor.fetchall():
-                contact = self._row_to_contact(row)
-                
-                # Calculate similarity for name and nickname
-                name_score = self._similarity(query_lower, contact.name.lower())
-                nickname_score = 0.0
-                if contact.nickname:
-                    nickname_score = self._similarity(query_lower, contact.nickname.lower())
-                
-                best_score = max(name_score, nickname_score)
-                
-                if best_score >= threshold:
-                    results.append((contact, best_score))
-        
-        # Sort by score descending
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:5]
+        return self._get_index().suggest(query, threshold=threshold, limit=5)
     
     # Common aliases for relationship names
     RELATIONSHIP_ALIASES = {
@@ -13,7 +13,7 @@ import re
 import urllib.parse
 import webbrowser
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from loguru import logger
 
@@ -390,6 +390,16 @@ class CommunicationRouter:
     Routes communication commands to appropriate services.
     """
     
+    # Trigger phrases for the assistant's intent index
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "whatsapp": ("whatsapp", "message", "text"),
+        "call": ("call", "phone", "number", "what's"),
+        "contacts": (
+            "contact", "add contact", "delete contact",
+            "list contacts", "my contacts",
+        ),
+    }
+    
     def __init__(
         self,
         contacts_manager: ContactsManager,
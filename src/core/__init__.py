@@ -212,6 +212,42 @@ except ImportError as e:
     get_performance_integration = None
     init_performance_integration = None
 
+# Async Runtime & Intent Dispatch
+try:
+    from .async_runtime import AsyncRuntime
+    from .intent_index import (
+        IntentDispatcher,
+        IntentRoute,
+        DispatchResult,
+        PhraseIndex,
+        collect_triggers,
+    )
+except ImportError as e:
+    logger.warning(f"Intent dispatch not available: {e}")
+    AsyncRuntime = None
+    IntentDispatcher = None
+    IntentRoute = None
+    DispatchResult = None
+    PhraseIndex = None
+    collect_triggers = None
+
+# Context Budget
+try:
+    from .context_budget import (
+        ContextBuilder,
+        TokenCounter,
+        count_tokens,
+        fit_messages,
+        get_prompt_stats,
+    )
+except ImportError as e:
+    logger.warning(f"Context budget not available: {e}")
+    ContextBuilder = None
+    TokenCounter = None
+    count_tokens = None
+    fit_messages = None
+    get_prompt_stats = None
+
 # Setup Wizard
 try:
     from .setup_wizard import (
@@ -250,6 +286,12 @@ __all__ = [
     "LLMResponse",
     "IntelligentLLMRouter",
     "create_intelligent_router",
+    # Context Budget
+    "ContextBuilder",
+    "TokenCounter",
+    "count_tokens",
+    "fit_messages",
+    "get_prompt_stats",
     # Internal API
     "InternalAPI",
     "EventBus",
@@ -319,6 +361,13 @@ __all__ = [
     "CommandPredictor",
     "get_performance_integration",
     "init_performance_integration",
+    # Async Runtime & Intent Dispatch
+    "AsyncRuntime",
+    "IntentDispatcher",
+    "IntentRoute",
+    "DispatchResult",
+    "PhraseIndex",
+    "collect_triggers",
     # Setup Wizard
     "SETUP_WIZARD_AVAILABLE",
     "run_first_time_setup",
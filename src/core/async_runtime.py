@@ -0,0 +1,152 @@
+"""
+Persistent Async Runtime for JARVIS.
+
+The voice and text paths are synchronous but most managers are async.
+Instead of creating (and tearing down) an event loop per call, async
+work is submitted to one long-lived loop running in a daemon thread.
+
+Usage:
+    runtime = AsyncRuntime()
+    result = runtime.run(manager.handle_command(text), timeout=30)
+
+    future = runtime.submit(fetch_news())  # concurrent.futures.Future
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Optional
+
+from loguru import logger
+
+
+class AsyncRuntime:
+    """
+    A dedicated asyncio event loop in a background thread.
+
+    The loop is started lazily on first use and keeps running until
+    stop(), so resources bound to it (tasks, clients, connection pools)
+    survive across calls.
+    """
+
+    def __init__(self, name: str = "jarvis-async"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "timeouts": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop, starting it if needed."""
+        return self.start()
+
+    def in_runtime_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread (no-op if already running)."""
+        if self.is_running and self._loop is not None:
+            return self._loop
+
+        with self._lock:
+            if self.is_running and self._loop is not None:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+                # Let cancelled tasks unwind before closing the loop
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+            thread = threading.Thread(target=run, name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            logger.debug(f"Async runtime '{self.name}' started")
+            return loop
+
+    def submit(self, coro: Awaitable[Any]) -> Future:
+        """
+        Schedule a coroutine on the runtime loop.
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result.
+        """
+        loop = self.start()
+        self.stats["submitted"] += 1
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the runtime loop and block for its result.
+
+        Raises:
+            RuntimeError: If called from the runtime thread (would deadlock).
+            concurrent.futures.TimeoutError: If the timeout expires; the
+                coroutine is cancelled.
+        """
+        if self.in_runtime_thread():
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            raise RuntimeError("AsyncRuntime.run() called from its own loop; await instead")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.stats["timeouts"] += 1
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop, cancelling anything still running."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+        logger.debug(f"Async runtime '{self.name}' stopped")
+
+    def get_stats(self) -> dict:
+        return {**self.stats, "running": self.is_running}
+
+
+async def close_loop_bound(resource: Any, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Close an async resource (e.g. httpx.AsyncClient) created on `loop`.
+
+    Its connections belong to that loop, so while the loop is still
+    running the close is scheduled there; otherwise it runs here.
+    Failures are logged, not raised.
+    """
+    try:
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            asyncio.run_coroutine_threadsafe(resource.aclose(), loop)
+        else:
+            await resource.aclose()
+    except Exception as e:
+        logger.debug(f"Error closing {type(resource).__name__}: {e}")
@@ -34,7 +34,6 @@ import re
 import sqlite3
 import time
 from collections import OrderedDict
-from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -44,15 +43,31 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from loguru import logger
 
+from .database import get_database
+
+# Optional: numpy for the vector index
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 # Optional: sentence-transformers for semantic caching
 try:
     from sentence_transformers import SentenceTransformer
-    import numpy as np
-    EMBEDDINGS_AVAILABLE = True
+    EMBEDDINGS_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
     EMBEDDINGS_AVAILABLE = False
     SentenceTransformer = None
-    np = None
+
+# Optional: hnswlib for approximate search on large semantic caches
+try:
+    import hnswlib
+    HNSW_AVAILABLE = True
+except ImportError:
+    HNSW_AVAILABLE = False
+    hnswlib = None
 
 
 class CacheCategory(Enum):
@@ -100,6 +115,8 @@ class CacheConfig:
     semantic_threshold: float = 0.92  # Similarity threshold
     semantic_model: str = "all-MiniLM-L6-v2"
     semantic_cache_size: int = 1000
+    semantic_ann_threshold: int = 20000  # Switch to HNSW above this size
+    semantic_persist: bool = True  # Store embeddings next to the SQLite cache
     
     # Response templates
     templates_enabled: bool = True
@@ -281,18 +298,12 @@ class SQLiteCache:
         self.max_entries = max_entries
         self.cleanup_interval = cleanup_interval
         self._last_cleanup = time.time()
+        self._db = get_database(db_path)
         
         self._init_db()
     
-    @contextmanager
     def _get_connection(self):
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        return self._db.transaction()
     
     def _init_db(self) -> None:
         """Initialize the database schema."""
@@ -455,11 +466,300 @@ class SQLiteCache:
             }
 
 
+class VectorIndex:
+    """
+    Contiguous embedding index for the semantic cache.
+    
+    Embeddings are L2-normalized on insert and stored as rows of a single
+    float32 matrix, so a top-k lookup is one matrix-vector product instead
+    of a Python loop. Removed rows go onto a free list and are reused by
+    later inserts, which makes eviction O(1) with no rebuild. Once the
+    index grows past ``ann_threshold`` rows an HNSW graph (hnswlib) is
+    built over the same row ids when the package is installed.
+    """
+    
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        initial_capacity: int = 256,
+        ann_threshold: int = 20000,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for VectorIndex")
+        
+        self.dim = dim
+        self.ann_threshold = ann_threshold
+        self._capacity = max(1, initial_capacity)
+        
+        self._matrix = None  # (capacity, dim) float32, allocated on first add
+        self._valid = np.zeros(self._capacity, dtype=bool)
+        self._expires = np.zeros(self._capacity, dtype=np.float64)
+        self._keys: List[Optional[str]] = [None] * self._capacity
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._high_water = 0  # Rows [0, high_water) have been used at least once
+        
+        self._ann = None
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+    
+    @property
+    def ann_enabled(self) -> bool:
+        return self._ann is not None
+    
+    def _normalize(self, vector: Any) -> Any:
+        vec = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec = vec / norm
+        return vec
+    
+    def _grow(self, needed: int) -> None:
+        """Grow storage geometrically so inserts stay amortized O(d)."""
+        new_capacity = self._capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        if new_capacity == self._capacity:
+            return
+        
+        matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        matrix[:self._capacity] = self._matrix
+        self._matrix = matrix
+        self._valid = np.concatenate(
+            [self._valid, np.zeros(new_capacity - self._capacity, dtype=bool)]
+        )
+        self._expires = np.concatenate(
+            [self._expires, np.zeros(new_capacity - self._capacity, dtype=np.float64)]
+        )
+        self._keys.extend([None] * (new_capacity - self._capacity))
+        self._capacity = new_capacity
+        
+        if self._ann is not None:
+            self._ann.resize_index(new_capacity)
+    
+    def _allocate_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._high_water >= self._capacity:
+            self._grow(self._high_water + 1)
+        row = self._high_water
+        self._high_water += 1
+        return row
+    
+    def add(self, key: str, vector: Any, expires_at: float = 0.0) -> int:
+        """
+        Insert or replace the embedding for a key.
+        
+        Args:
+            key: Entry key.
+            vector: Embedding (any sequence of floats).
+            expires_at: Unix expiry time, 0 for never.
+            
+        Returns:
+            Row index the embedding was stored in.
+        """
+        vec = self._normalize(vector)
+        
+        if self.dim is None:
+            self.dim = vec.shape[0]
+        elif vec.shape[0] != self.dim:
+            raise ValueError(f"Expected embedding of dim {self.dim}, got {vec.shape[0]}")
+        
+        if self._matrix is None:
+            self._matrix = np.zeros((self._capacity, self.dim), dtype=np.float32)
+        
+        row = self._rows.get(key)
+        if row is None:
+            row = self._allocate_row()
+            self._rows[key] = row
+            self._keys[row] = key
+        
+        self._matrix[row] = vec
+        self._valid[row] = True
+        self._expires[row] = expires_at
+        
+        if self._ann is not None:
+            self._ann.add_items(vec.reshape(1, -1), np.array([row]))
+        elif len(self._rows) >= self.ann_threshold:
+            self._build_ann()
+        
+        return row
+    
+    def add_many(
+        self,
+        keys: List[str],
+        vectors: Any,
+        expires_at: Optional[List[float]] = None,
+    ) -> None:
+        """Bulk insert, used when loading a persisted index."""
+        if not keys:
+            return
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+        
+        if self.dim is None:
+            self.dim = matrix.shape[1]
+        if self._matrix is None:
+            self._matrix = np.zeros((self._capacity, self.dim), dtype=np.float32)
+        
+        for i, key in enumerate(keys):
+            row = self._rows.get(key)
+            if row is None:
+                row = self._allocate_row()
+                self._rows[key] = row
+                self._keys[row] = key
+            self._matrix[row] = matrix[i]
+            self._valid[row] = True
+            self._expires[row] = expires_at[i] if expires_at else 0.0
+        
+        if self._ann is None and len(self._rows) >= self.ann_threshold:
+            self._build_ann()
+        elif self._ann is not None:
+            rows = np.array([self._rows[k] for k in keys])
+            self._ann.add_items(self._matrix[rows], rows)
+    
+    def remove(self, key: str) -> bool:
+        """Remove a key; its row is recycled by the next insert."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        
+        self._valid[row] = False
+        self._expires[row] = 0.0
+        self._keys[row] = None
+        self._free.append(row)
+        
+        if self._ann is not None:
+            try:
+                self._ann.mark_deleted(row)
+            except RuntimeError:
+                pass
+        
+        return True
+    
+    def expire(self, now: Optional[float] = None) -> List[str]:
+        """
+        Remove every expired row.
+        
+        Returns:
+            Keys that were removed.
+        """
+        if self._high_water == 0:
+            return []
+        
+        now = now if now is not None else time.time()
+        live = slice(0, self._high_water)
+        expired_rows = np.nonzero(
+            self._valid[live] & (self._expires[live] > 0) & (self._expires[live] < now)
+        )[0]
+        
+        removed = [self._keys[row] for row in expired_rows]
+        for key in removed:
+            self.remove(key)
+        return removed
+    
+    def search(
+        self,
+        vector: Any,
+        k: int = 1,
+        now: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar live entries.
+        
+        Args:
+            vector: Query embedding.
+            k: Number of results.
+            now: Reference time for TTL filtering.
+            
+        Returns:
+            List of (key, cosine similarity) sorted by descending similarity.
+        """
+        if not self._rows or k <= 0:
+            return []
+        
+        query = self._normalize(vector)
+        now = now if now is not None else time.time()
+        
+        if self._ann is not None:
+            return self._search_ann(query, k, now)
+        
+        live = slice(0, self._high_water)
+        scores = self._matrix[live] @ query
+        expires = self._expires[live]
+        usable = self._valid[live] & ((expires == 0) | (expires >= now))
+        scores = np.where(usable, scores, -np.inf)
+        
+        k = min(k, int(usable.sum()))
+        if k == 0:
+            return []
+        
+        if k == 1:
+            top = np.array([int(np.argmax(scores))])
+        else:
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+        
+        return [(self._keys[row], float(scores[row])) for row in top]
+    
+    def _search_ann(self, query: Any, k: int, now: float) -> List[Tuple[str, float]]:
+        # Over-fetch a little so expired-but-not-yet-evicted rows can be skipped
+        fetch = min(len(self._rows), max(k * 4, k + 8))
+        self._ann.set_ef(max(64, fetch))
+        labels, _ = self._ann.knn_query(query.reshape(1, -1), k=fetch)
+        
+        results: List[Tuple[str, float]] = []
+        for row in labels[0]:
+            row = int(row)
+            if not self._valid[row]:
+                continue
+            expires = self._expires[row]
+            if expires > 0 and expires < now:
+                continue
+            results.append((self._keys[row], float(self._matrix[row] @ query)))
+        
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results[:k]
+    
+    def _build_ann(self) -> None:
+        if not HNSW_AVAILABLE or self.dim is None:
+            return
+        
+        index = hnswlib.Index(space="ip", dim=self.dim)
+        index.init_index(max_elements=self._capacity, ef_construction=200, M=16)
+        rows = np.nonzero(self._valid[:self._high_water])[0]
+        if len(rows):
+            index.add_items(self._matrix[rows], rows)
+        self._ann = index
+        logger.info(f"Semantic cache switched to HNSW index ({len(rows)} entries)")
+    
+    def clear(self) -> int:
+        count = len(self._rows)
+        self._valid[:] = False
+        self._expires[:] = 0.0
+        self._keys = [None] * self._capacity
+        self._rows.clear()
+        self._free.clear()
+        self._high_water = 0
+        self._ann = None
+        return count
+
+
 class SemanticCache:
     """
     Semantic similarity cache using embeddings.
     
-    Level 3 cache - finds similar queries.
+    Level 3 cache - finds similar queries. Embeddings live in a
+    VectorIndex; entries are kept in LRU order for capacity eviction.
+    When ``db_path`` is given, entries are written through to a
+    ``semantic_cache`` table so the index is restored on restart
+    without re-encoding anything.
     """
     
     def __init__(
@@ -467,14 +767,119 @@ class SemanticCache:
         model_name: str = "all-MiniLM-L6-v2",
         threshold: float = 0.92,
         max_entries: int = 1000,
+        ann_threshold: int = 20000,
+        db_path: Optional[Path] = None,
     ):
         self.model_name = model_name
         self.threshold = threshold
         self.max_entries = max_entries
+        self.db_path = db_path
         
         self._model: Optional[SentenceTransformer] = None
-        self._embeddings: Dict[str, Tuple[List[float], CacheEntry]] = {}
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._index: Optional[VectorIndex] = None
+        if NUMPY_AVAILABLE:
+            self._index = VectorIndex(
+                initial_capacity=min(max_entries, 1024),
+                ann_threshold=ann_threshold,
+            )
         self._lock = Lock()
+        
+        if self.db_path and self._index is not None:
+            self._db = get_database(self.db_path)
+            self._init_db()
+            self._load()
+    
+    def _get_connection(self):
+        return self._db.transaction()
+    
+    def _init_db(self) -> None:
+        """Initialize the persistence table."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_accessed REAL,
+                    embedding BLOB NOT NULL,
+                    metadata TEXT
+                )
+            """)
+    
+    def _load(self) -> None:
+        """Restore non-expired entries from disk in a single bulk insert."""
+        now = time.time()
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "DELETE FROM semantic_cache WHERE expires_at > 0 AND expires_at < ?",
+                    (now,)
+                )
+                rows = conn.execute(
+                    "SELECT * FROM semantic_cache ORDER BY last_accessed DESC LIMIT ?",
+                    (self.max_entries,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load semantic cache: {e}")
+            return
+        
+        if not rows:
+            return
+        
+        keys, vectors, expires = [], [], []
+        # Oldest first so LRU order matches last access time
+        for row in reversed(rows):
+            entry = CacheEntry(
+                key=row["key"],
+                value=row["value"],
+                category=CacheCategory(row["category"]),
+                created_at=row["created_at"],
+                expires_at=row["expires_at"],
+                last_accessed=row["last_accessed"] or 0,
+                metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            )
+            self._entries[entry.key] = entry
+            keys.append(entry.key)
+            vectors.append(np.frombuffer(row["embedding"], dtype=np.float32))
+            expires.append(entry.expires_at)
+        
+        self._index.add_many(keys, np.stack(vectors), expires)
+        logger.info(f"Loaded {len(keys)} semantic cache entries from disk")
+    
+    def _persist(self, entry: CacheEntry, embedding: Any) -> None:
+        try:
+            with self._get_connection() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO semantic_cache
+                    (key, value, category, created_at, expires_at, last_accessed, embedding, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    entry.key,
+                    entry.value,
+                    entry.category.value,
+                    entry.created_at,
+                    entry.expires_at,
+                    time.time(),
+                    np.asarray(embedding, dtype=np.float32).tobytes(),
+                    json.dumps(entry.metadata) if entry.metadata else None,
+                ))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist semantic cache entry: {e}")
+    
+    def _unpersist(self, keys: List[str]) -> None:
+        if not keys or not self.db_path:
+            return
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "DELETE FROM semantic_cache WHERE key = ?",
+                    [(key,) for key in keys]
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to delete semantic cache entries: {e}")
     
     def _get_model(self) -> Optional[SentenceTransformer]:
         """Lazy load the embedding model."""
@@ -491,35 +896,43 @@ class SemanticCache:
         
         return self._model
     
-    def _compute_embedding(self, text: str) -> Optional[List[float]]:
-        """Compute embedding for text."""
+    def _compute_embedding(self, text: str) -> Optional[Any]:
+        """Compute a normalized float32 embedding for text."""
         model = self._get_model()
         if model is None:
             return None
         
         try:
-            embedding = model.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            return model.encode(
+                text, convert_to_numpy=True, normalize_embeddings=True
+            ).astype(np.float32)
         except Exception as e:
             logger.error(f"Embedding computation failed: {e}")
             return None
     
-    def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if not EMBEDDINGS_AVAILABLE:
-            return 0.0
-        
-        a_arr = np.array(a)
-        b_arr = np.array(b)
+    def search(self, query: str, k: int = 5) -> List[Tuple[CacheEntry, float]]:
+        """
+        Find the top-k cached entries most similar to a query.
         
-        dot = np.dot(a_arr, b_arr)
-        norm_a = np.linalg.norm(a_arr)
-        norm_b = np.linalg.norm(b_arr)
+        Args:
+            query: Query text to match.
+            k: Maximum number of results.
+            
+        Returns:
+            List of (entry, similarity) sorted by descending similarity.
+        """
+        if self._index is None:
+            return []
         
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
+        query_embedding = self._compute_embedding(query)
+        if query_embedding is None:
+            return []
         
-        return dot / (norm_a * norm_b)
+        with self._lock:
+            return [
+                (self._entries[key], score)
+                for key, score in self._index.search(query_embedding, k=k)
+            ]
     
     def find_similar(self, query: str) -> Optional[Tuple[CacheEntry, float]]:
         """
@@ -531,55 +944,95 @@ class SemanticCache:
         Returns:
             Tuple of (entry, similarity) or None if no match.
         """
-        if not EMBEDDINGS_AVAILABLE:
+        results = self.search(query, k=1)
+        if not results or results[0][1] < self.threshold:
             return None
         
-        query_embedding = self._compute_embedding(query)
-        if query_embedding is None:
-            return None
-        
-        best_match: Optional[Tuple[CacheEntry, float]] = None
-        
+        entry, similarity = results[0]
         with self._lock:
-            for key, (embedding, entry) in self._embeddings.items():
-                if entry.is_expired:
-                    continue
-                
-                similarity = self._cosine_similarity(query_embedding, embedding)
-                
-                if similarity >= self.threshold:
-                    if best_match is None or similarity > best_match[1]:
-                        best_match = (entry, similarity)
-        
-        return best_match
+            if entry.key in self._entries:
+                self._entries.move_to_end(entry.key)
+            entry.access_count += 1
+            entry.last_accessed = time.time()
+        
+        return entry, similarity
     
     def add(self, key: str, entry: CacheEntry) -> bool:
         """Add entry with embedding."""
-        if not EMBEDDINGS_AVAILABLE:
+        if self._index is None:
             return False
         
         embedding = self._compute_embedding(key)
         if embedding is None:
             return False
         
+        return self.add_embedding(key, entry, embedding)
+    
+    def add_embedding(self, key: str, entry: CacheEntry, embedding: Any) -> bool:
+        """Add entry with a precomputed embedding."""
+        if self._index is None:
+            return False
+        
+        evicted: List[str] = []
         with self._lock:
-            # Evict if at capacity
-            while len(self._embeddings) >= self.max_entries:
-                # Remove oldest
-                oldest_key = next(iter(self._embeddings))
-                del self._embeddings[oldest_key]
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Drop expired rows first, then fall back to LRU order
+                for expired_key in self._index.expire():
+                    self._entries.pop(expired_key, None)
+                    evicted.append(expired_key)
+                while len(self._entries) >= self.max_entries:
+                    oldest_key, _ = self._entries.popitem(last=False)
+                    self._index.remove(oldest_key)
+                    evicted.append(oldest_key)
             
-            entry.embedding = embedding
-            self._embeddings[key] = (embedding, entry)
+            entry.key = key
+            self._index.add(key, embedding, entry.expires_at)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+        
+        if self.db_path:
+            self._unpersist(evicted)
+            self._persist(entry, embedding)
         
         return True
     
+    def remove(self, key: str) -> bool:
+        """Remove an entry by key."""
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return False
+            self._index.remove(key)
+        self._unpersist([key])
+        return True
+    
+    def cleanup_expired(self) -> int:
+        """Remove expired entries."""
+        if self._index is None:
+            return 0
+        with self._lock:
+            removed = self._index.expire()
+            for key in removed:
+                self._entries.pop(key, None)
+        self._unpersist(removed)
+        return len(removed)
+    
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+    
     def clear(self) -> int:
         """Clear all entries."""
         with self._lock:
-            count = len(self._embeddings)
-            self._embeddings.clear()
-            return count
+            count = len(self._entries)
+            self._entries.clear()
+            if self._index is not None:
+                self._index.clear()
+        
+        if self.db_path and self._index is not None:
+            with self._get_connection() as conn:
+                conn.execute("DELETE FROM semantic_cache")
+        
+        return count
 
 
 class ResponseTemplates:
@@ -725,10 +1178,16 @@ class IntelligentCache:
         
         self._semantic_cache: Optional[SemanticCache] = None
         if self.config.semantic_enabled and EMBEDDINGS_AVAILABLE:
+            semantic_db = None
+            if self.config.semantic_persist and self.config.cache_dir:
+                self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+                semantic_db = self.config.cache_dir / "response_cache.db"
             self._semantic_cache = SemanticCache(
                 model_name=self.config.semantic_model,
                 threshold=self.config.semantic_threshold,
                 max_entries=self.config.semantic_cache_size,
+                ann_threshold=self.config.semantic_ann_threshold,
+                db_path=semantic_db,
             )
         
         self._templates: Optional[ResponseTemplates] = None
@@ -889,6 +1348,8 @@ class IntelligentCache:
                 count += 1
             if self._sqlite_cache and self._sqlite_cache.delete(key):
                 count += 1
+            if self._semantic_cache and self._semantic_cache.remove(query):
+                count += 1
         
         if category:
             if self._sqlite_cache:
@@ -919,6 +1380,8 @@ class IntelligentCache:
             stats["sqlite_stats"] = self._sqlite_cache.get_stats()
         
         stats["semantic_available"] = self._semantic_cache is not None
+        if self._semantic_cache:
+            stats["semantic_cache_size"] = self._semantic_cache.size
         stats["templates_available"] = self._templates is not None
         
         return stats
@@ -32,6 +32,10 @@ class FaceRecognitionConfig(BaseModel):
     tolerance: float = Field(default=0.5, ge=0.0, le=1.0)
     num_jitters: int = Field(default=1, ge=1)
     model: str = Field(default="hog", pattern="^(hog|cnn)$")
+    detection_scale: float = Field(default=1.0, gt=0.0, le=1.0)
+    reverify_frames: int = Field(default=3, ge=1)
+    match_reverify_frames: int = Field(default=15, ge=1)
+    reverify_iou: float = Field(default=0.5, ge=0.0, le=1.0)
 
 
 class LivenessConfig(BaseModel):
@@ -116,6 +120,10 @@ class STTConfig(BaseModel):
     device: str = Field(default="cpu", pattern="^(cpu|cuda)$")
     compute_type: str = Field(default="int8", pattern="^(float16|int8|float32)$")
     language: str = "en"
+    # Transcribe while the user is still speaking
+    streaming: bool = True
+    # Seconds the final decode may take; sets the beam width
+    latency_budget: float = Field(default=0.3, gt=0.0)
 
 
 class VADConfig(BaseModel):
@@ -126,12 +134,21 @@ class VADConfig(BaseModel):
     silence_duration: float = Field(default=1.0, ge=0.0)
 
 
+class TTSCacheConfig(BaseModel):
+    """Synthesized speech cache configuration."""
+    enabled: bool = True
+    max_size_mb: float = Field(default=200.0, ge=1.0)
+    warm_count: int = Field(default=50, ge=0)
+    max_text_length: int = Field(default=200, ge=1)
+
+
 class TTSConfig(BaseModel):
     """Text-to-speech configuration."""
     engine: str = Field(default="edge_tts", pattern="^(edge_tts|piper|kokoro)$")
     voice: str = "en-US-GuyNeural"
     rate: float = Field(default=1.0, ge=0.5, le=2.0)
     volume: float = Field(default=1.0, ge=0.0, le=1.0)
+    cache: TTSCacheConfig = Field(default_factory=TTSCacheConfig)
 
 
 class AudioConfig(BaseModel):
@@ -141,6 +158,10 @@ class AudioConfig(BaseModel):
     chunk_size: int = Field(default=1024, ge=256)
     input_device: Optional[int] = None
     output_device: Optional[int] = None
+    # Microphone history kept by the shared capture stream
+    buffer_seconds: float = Field(default=30.0, ge=12.0)
+    # Audio before the wake word detection point included in commands
+    pre_roll: float = Field(default=0.3, ge=0.0, le=2.0)
 
 
 class VoiceConfig(BaseModel):
@@ -191,11 +212,17 @@ class AgentConfig(BaseModel):
     allowed_apps: Optional[List[str]] = None
     discovery_timeout: Optional[int] = None
     email_provider: Optional[str] = None
+    fast_routing: Optional[bool] = None
+    routing_threshold: Optional[float] = None
+    parallel_agents: Optional[bool] = None
 
 
 class AgentsConfig(BaseModel):
     """Agents configuration."""
-    supervisor: AgentConfig = Field(default_factory=lambda: AgentConfig(max_iterations=10))
+    supervisor: AgentConfig = Field(default_factory=lambda: AgentConfig(
+        max_iterations=10, fast_routing=True, routing_threshold=0.75,
+        parallel_agents=True, timeout=30,
+    ))
     research: AgentConfig = Field(default_factory=lambda: AgentConfig(max_results=5, timeout=30))
     coding: AgentConfig = Field(default_factory=lambda: AgentConfig(execution_timeout=30, sandbox=True))
     system: AgentConfig = Field(default_factory=lambda: AgentConfig(
@@ -270,6 +297,22 @@ class GeneralConfig(BaseModel):
     models_dir: str = "models"
 
 
+class SemanticCacheConfig(BaseModel):
+    """Semantic similarity response cache configuration."""
+    enabled: bool = True
+    threshold: float = Field(default=0.92, ge=0.0, le=1.0)
+    model: str = "all-MiniLM-L6-v2"
+    cache_size: int = Field(default=1000, ge=1)
+    ann_threshold: int = Field(default=20000, ge=1)
+    persist: bool = True
+
+
+class ResponseCacheConfig(BaseModel):
+    """Response cache configuration."""
+    enabled: bool = True
+    semantic: SemanticCacheConfig = Field(default_factory=SemanticCacheConfig)
+
+
 class JarvisConfig(BaseModel):
     """Main JARVIS configuration."""
     general: GeneralConfig = Field(default_factory=GeneralConfig)
@@ -282,6 +325,7 @@ class JarvisConfig(BaseModel):
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
     proactive: ProactiveConfig = Field(default_factory=ProactiveConfig)
     system: SystemConfig = Field(default_factory=SystemConfig)
+    cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
 
 
 class EnvSettings(BaseSettings):
@@ -0,0 +1,414 @@
+"""
+Shared SQLite Access Layer for JARVIS.
+
+Every store that keeps a SQLite file goes through a `Database` obtained
+from `get_database(path)`, so all stores share one connection pool per
+file instead of opening a new connection for every call.
+
+Features:
+- Per-thread pooled connections (statement cache survives across calls)
+- WAL journal, synchronous=NORMAL, mmap reads, busy timeout
+- Re-entrant transactions (nested blocks become savepoints)
+- Async facade with a dedicated writer thread that batches queued
+  writes into a single transaction
+
+Usage:
+    db = get_database("data/memory.db")
+
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO t VALUES (?)", (1,))
+
+    rows = db.fetchall("SELECT * FROM t WHERE id = ?", (1,))
+
+    # From async code
+    await db.aio.execute("UPDATE t SET seen = 1 WHERE id = ?", (1,))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+Params = Sequence[Any]
+
+_memory_ids = itertools.count()
+
+
+class _ThreadConnection:
+    """Thread-local marker whose collection releases the thread's connection."""
+
+
+def _release_thread_connection(db_ref: "weakref.ref[Database]", conn: sqlite3.Connection) -> None:
+    db = db_ref()
+    if db is not None:
+        db._release(conn)
+    else:
+        conn.close()
+
+
+class Database:
+    """
+    Pooled SQLite access for one database file.
+
+    Each thread lazily gets its own long-lived connection; connections are
+    configured once (WAL, synchronous=NORMAL, mmap) and reused, so the
+    sqlite3 statement cache stays warm. A thread's connection is closed
+    when the thread exits, and all of them on `close()`. Connections run in autocommit
+    mode; `transaction()` opens an explicit BEGIN ... COMMIT.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        mmap_size: int = 64 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+        cached_statements: int = 256,
+        batch_size: int = 64,
+    ):
+        """
+        Initialize the database.
+
+        Args:
+            path: Database file (":memory:" gives a shared in-memory database).
+            mmap_size: Bytes of the file SQLite may memory-map for reads.
+            busy_timeout: Seconds to wait on a locked database.
+            cached_statements: Prepared statements cached per connection.
+            batch_size: Maximum queued writes committed in one transaction.
+        """
+        self.mmap_size = mmap_size
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self.batch_size = batch_size
+
+        if str(path) == ":memory:":
+            self.path: Optional[Path] = None
+            self._target = f"file:jarvis-mem-{next(_memory_ids)}?mode=memory&cache=shared"
+            self._uri = True
+        else:
+            self.path = Path(path)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._target = str(self.path)
+            self._uri = False
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._writer: Optional[threading.Thread] = None
+        self._write_queue: "queue.Queue[Optional[Tuple[Callable[[sqlite3.Connection], Any], Future]]]" = queue.Queue()
+        self.stats = {"connections": 0, "transactions": 0, "batched_writes": 0, "write_batches": 0}
+
+        # Open eagerly: creates the file and, for in-memory databases,
+        # keeps the data alive for the lifetime of this object
+        self.connection()
+
+        self.aio = AsyncDatabase(self)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._target,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,  # Only so close() works from any thread
+            cached_statements=self.cached_statements,
+            uri=self._uri,
+        )
+        conn.row_factory = sqlite3.Row
+
+        if not self._uri:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        with self._lock:
+            self._connections.append(conn)
+            self.stats["connections"] += 1
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled connection."""
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"Database {self._target} is closed")
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.depth = 0
+            # Thread-local values are dropped when the thread exits; close
+            # the connection then instead of holding it until close()
+            self._local.owner = _ThreadConnection()
+            weakref.finalize(self._local.owner, _release_thread_connection, weakref.ref(self), conn)
+        return conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow this thread's connection for reads (no transaction)."""
+        yield self.connection()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block in a transaction on this thread's connection.
+
+        Commits on success and rolls back on error. Nested blocks use
+        savepoints, so helpers can open their own transaction safely.
+        """
+        conn = self.connection()
+        depth = self._local.depth
+        savepoint = f"sp_{depth}"
+
+        if depth == 0:
+            conn.execute("BEGIN")
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        self._local.depth = depth + 1
+
+        try:
+            yield conn
+        except BaseException:
+            if depth == 0:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            elif conn.in_transaction:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            # Legacy callers may already have called conn.commit()
+            if depth == 0:
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+                self.stats["transactions"] += 1
+            elif conn.in_transaction:
+                conn.execute(f"RELEASE {savepoint}")
+        finally:
+            self._local.depth = depth
+
+    # ------------------------------------------------------------------
+    # Convenience helpers
+    # ------------------------------------------------------------------
+
+    def execute(self, sql: str, params: Params = ()) -> sqlite3.Cursor:
+        """Execute one statement (autocommit outside a transaction)."""
+        return self.connection().execute(sql, params)
+
+    def executemany(self, sql: str, seq: Iterable[Params]) -> int:
+        """Execute a statement for each parameter set in one transaction."""
+        with self.transaction() as conn:
+            return conn.executemany(sql, seq).rowcount
+
+    def executescript(self, script: str) -> None:
+        """Run a multi-statement script (schema setup)."""
+        self.connection().executescript(script)
+
+    def fetchone(self, sql: str, params: Params = ()) -> Optional[sqlite3.Row]:
+        return self.connection().execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: Params = ()) -> List[sqlite3.Row]:
+        return self.connection().execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name=f"sqlite-writer-{self.path.name if self.path else 'memory'}",
+                    daemon=True,
+                )
+                self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    nxt = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            self._run_batch(batch)
+            if stop:
+                break
+
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._release(conn)
+
+    def _run_batch(self, batch: List[Tuple[Callable[[sqlite3.Connection], Any], Future]]) -> None:
+        """Commit a batch of writes in one transaction, isolating failures."""
+        outcomes: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        try:
+            with self.transaction() as conn:
+                for fn, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with self.transaction():
+                            outcomes.append((future, fn(conn), None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+        except Exception as e:
+            logger.error(f"SQLite write batch failed: {e}")
+            outcomes = [(future, None, e) for _, future in batch if not future.cancelled()]
+
+        self.stats["write_batches"] += 1
+        self.stats["batched_writes"] += len(batch)
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def submit_write(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Queue a write for the writer thread.
+
+        Writes queued together are committed in a single transaction, each
+        inside its own savepoint so one failure does not undo the others.
+
+        Returns:
+            Future resolving to fn's return value.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"Database {self._target} is closed")
+        future: Future = Future()
+        self._write_queue.put((fn, future))
+        self._ensure_writer()
+        return future
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    def close(self) -> None:
+        """Stop the writer thread and close every pooled connection."""
+        if self._closed:
+            return
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join(timeout=5.0)
+        self._closed = True
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "open_connections": len(self._connections),
+            "pending_writes": self._write_queue.qsize(),
+            "path": str(self.path) if self.path else ":memory:",
+        }
+
+
+class AsyncDatabase:
+    """
+    Async facade over a Database.
+
+    Writes go to the database's writer thread (and are batched with other
+    queued writes); reads run in the default executor on that thread's
+    pooled connection.
+    """
+
+    def __init__(self, db: Database):
+        self._db = db
+
+    async def run_write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run fn(conn) on the writer thread inside a transaction."""
+        return await asyncio.wrap_future(self._db.submit_write(fn))
+
+    async def execute(self, sql: str, params: Params = ()) -> int:
+        """Execute a write statement. Returns the affected row count."""
+        return await self.run_write(lambda conn: conn.execute(sql, params).rowcount)
+
+    async def executemany(self, sql: str, seq: Iterable[Params]) -> int:
+        rows = list(seq)
+        return await self.run_write(lambda conn: conn.executemany(sql, rows).rowcount)
+
+    async def fetchone(self, sql: str, params: Params = ()) -> Optional[sqlite3.Row]:
+        return await asyncio.to_thread(self._db.fetchone, sql, params)
+
+    async def fetchall(self, sql: str, params: Params = ()) -> List[sqlite3.Row]:
+        return await asyncio.to_thread(self._db.fetchall, sql, params)
+
+
+_registry: Dict[str, Database] = {}
+_registry_lock = threading.Lock()
+
+
+def get_database(path: Path | str, **kwargs: Any) -> Database:
+    """
+    Get the shared Database for a file, creating it on first use.
+
+    Keyword arguments only apply when the Database is created. A database
+    whose file was deleted since it was opened is reopened.
+    """
+    if str(path) == ":memory:":
+        return Database(path, **kwargs)
+
+    key = os.path.abspath(str(path))
+    with _registry_lock:
+        db = _registry.get(key)
+        if db is not None and (db.closed or not os.path.exists(key)):
+            db.close()
+            db = None
+        if db is None:
+            db = Database(path, **kwargs)
+            _registry[key] = db
+        return db
+
+
+def close_all_databases() -> None:
+    """Close every shared database (shutdown hook)."""
+    with _registry_lock:
+        databases = list(_registry.values())
+        _registry.clear()
+    for db in databases:
+        db.close()
@@ -0,0 +1,297 @@
+"""
+Compiled Intent Dispatch for JARVIS.
+
+Feature managers declare the phrases (and, rarely, regexes) that can
+trigger them. All phrases are compiled into one Aho-Corasick automaton,
+so a single pass over the command finds every manager that could
+handle it; only those managers are called, in priority order.
+
+Usage:
+    dispatcher = IntentDispatcher(runtime=AsyncRuntime())
+    dispatcher.register("academic", handle_academic, phrases=["canvas", "due"])
+    dispatcher.register("finance", handle_finance, patterns=[r"add.*shares.*at"])
+
+    response = dispatcher.dispatch("What's due this week?")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Pattern, Tuple
+
+from loguru import logger
+
+
+class PhraseIndex:
+    """
+    Aho-Corasick automaton over trigger phrases.
+
+    Each phrase carries a bitmask of the routes it triggers; match()
+    returns the OR of the masks of every phrase occurring in the text
+    (substring semantics, like `phrase in text`).
+    """
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[int] = [0]
+        self._compiled = True
+        self.phrase_count = 0
+
+    def add(self, phrase: str, mask: int) -> None:
+        if not phrase:
+            return
+        node = 0
+        for ch in phrase:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(0)
+            node = nxt
+        self._out[node] |= mask
+        self.phrase_count += 1
+        self._compiled = False
+
+    def compile(self) -> None:
+        """Compute failure links and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] |= self._out[self._fail[child]]
+                queue.append(child)
+
+        self._compiled = True
+
+    def match(self, text: str) -> int:
+        """Bitmask of routes with at least one phrase in text."""
+        if not self._compiled:
+            self.compile()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        found = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            found |= out[node]
+        return found
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+@dataclass
+class IntentRoute:
+    """A handler and the triggers that select it."""
+    name: str
+    handler: Callable[[str, str], Any]
+    bit: int
+    phrases: Tuple[str, ...] = ()
+    patterns: Tuple[Pattern[str], ...] = ()
+    timeout: Optional[float] = 30.0
+    calls: int = 0
+    hits: int = 0
+    total_ms: float = 0.0
+
+
+@dataclass
+class DispatchResult:
+    """Outcome of one dispatch."""
+    response: Optional[str]
+    route: Optional[str] = None
+    candidates: List[str] = field(default_factory=list)
+    match_ms: float = 0.0
+
+
+def collect_triggers(source: Any) -> Tuple[List[str], List[str]]:
+    """
+    Flatten a manager's declared triggers.
+
+    Managers declare `COMMAND_TRIGGERS` (intent -> phrases) and,
+    optionally, `COMMAND_PATTERNS` (intent -> regexes) as class attributes.
+
+    Returns:
+        (phrases, patterns)
+    """
+    def flatten(table: Optional[Mapping[str, Iterable[str]]]) -> List[str]:
+        items: List[str] = []
+        for values in (table or {}).values():
+            for value in values:
+                if value not in items:
+                    items.append(value)
+        return items
+
+    return (
+        flatten(getattr(source, "COMMAND_TRIGGERS", None)),
+        flatten(getattr(source, "COMMAND_PATTERNS", None)),
+    )
+
+
+class IntentDispatcher:
+    """
+    Routes a command to the first handler that accepts it.
+
+    Routes are tried in registration order, but only routes whose
+    phrases or patterns occur in the lowercased command are called at
+    all. Handlers take (text_lower, text) and return a response or None
+    to let the next candidate try; coroutine results are run on the
+    async runtime with the route's timeout.
+    """
+
+    def __init__(self, runtime: Optional[Any] = None):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            runtime: AsyncRuntime used for async handlers. Without one,
+                coroutines are run with asyncio.run().
+        """
+        self.runtime = runtime
+        self._routes: List[IntentRoute] = []
+        self._by_name: Dict[str, IntentRoute] = {}
+        self._index = PhraseIndex()
+        self._pattern_routes: List[IntentRoute] = []
+        self.stats = {"dispatches": 0, "matched": 0, "handled": 0}
+
+    @property
+    def routes(self) -> List[str]:
+        return [route.name for route in self._routes]
+
+    def register(
+        self,
+        name: str,
+        handler: Callable[[str, str], Any],
+        phrases: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        timeout: Optional[float] = 30.0,
+    ) -> None:
+        """
+        Add a route. Earlier routes win when several match.
+
+        Args:
+            name: Route name (e.g. "academic").
+            handler: Callable (text_lower, text) -> response, None or coroutine.
+            phrases: Lowercase substrings that select this route.
+            patterns: Regexes searched in the lowercased text.
+            timeout: Seconds to wait for an async handler.
+        """
+        if name in self._by_name:
+            raise ValueError(f"Intent route already registered: {name}")
+
+        route = IntentRoute(
+            name=name,
+            handler=handler,
+            bit=1 << len(self._routes),
+            phrases=tuple(p.lower() for p in phrases),
+            patterns=tuple(re.compile(p) for p in patterns),
+            timeout=timeout,
+        )
+        for phrase in route.phrases:
+            self._index.add(phrase, route.bit)
+        if route.patterns:
+            self._pattern_routes.append(route)
+
+        self._routes.append(route)
+        self._by_name[name] = route
+
+    def register_manager(
+        self,
+        name: str,
+        handler: Callable[[str, str], Any],
+        manager: Any,
+        timeout: Optional[float] = 30.0,
+    ) -> None:
+        """Register a route using a manager's declared COMMAND_TRIGGERS."""
+        phrases, patterns = collect_triggers(manager)
+        self.register(name, handler, phrases=phrases, patterns=patterns, timeout=timeout)
+
+    def match(self, text_lower: str) -> List[IntentRoute]:
+        """Routes that could handle the command, in priority order."""
+        mask = self._index.match(text_lower)
+        for route in self._pattern_routes:
+            if not mask & route.bit and any(p.search(text_lower) for p in route.patterns):
+                mask |= route.bit
+        if not mask:
+            return []
+        return [route for route in self._routes if mask & route.bit]
+
+    def _run(self, route: IntentRoute, result: Any) -> Any:
+        if not asyncio.iscoroutine(result):
+            return result
+        if self.runtime is not None:
+            return self.runtime.run(result, timeout=route.timeout)
+        return asyncio.run(asyncio.wait_for(result, route.timeout))
+
+    def resolve(self, text: str) -> DispatchResult:
+        """Dispatch a command and report which route handled it."""
+        text_lower = text.lower()
+        start = time.perf_counter()
+        candidates = self.match(text_lower)
+        match_ms = (time.perf_counter() - start) * 1000
+
+        self.stats["dispatches"] += 1
+        if candidates:
+            self.stats["matched"] += 1
+
+        for route in candidates:
+            route.calls += 1
+            call_start = time.perf_counter()
+            try:
+                response = self._run(route, route.handler(text_lower, text))
+            except Exception as e:
+                logger.error(f"{route.name.replace('_', ' ').title()} command error: {e!r}")
+                response = None
+            finally:
+                route.total_ms += (time.perf_counter() - call_start) * 1000
+
+            if response:
+                route.hits += 1
+                self.stats["handled"] += 1
+                return DispatchResult(
+                    response=response,
+                    route=route.name,
+                    candidates=[r.name for r in candidates],
+                    match_ms=match_ms,
+                )
+
+        return DispatchResult(
+            response=None,
+            candidates=[r.name for r in candidates],
+            match_ms=match_ms,
+        )
+
+    def dispatch(self, text: str) -> Optional[str]:
+        """Return the first handler response for text, or None."""
+        return self.resolve(text).response
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "phrases": self._index.phrase_count,
+            "states": len(self._index),
+            "routes": {
+                route.name: {
+                    "calls": route.calls,
+                    "hits": route.hits,
+                    "avg_ms": round(route.total_ms / route.calls, 2) if route.calls else 0.0,
+                }
+                for route in self._routes
+            },
+        }
@@ -13,6 +13,7 @@ Supported providers (FREE ONLY):
 from __future__ import annotations
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -20,6 +21,8 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from loguru import logger
 
+from .context_budget import record_prompt
+
 
 class LLMProvider(Enum):
     """Supported LLM providers (FREE ONLY)."""
@@ -445,14 +448,18 @@ class LLMManager:
             for attempt in range(self.retry_attempts):
                 try:
                     logger.debug(f"Trying {client.provider.value} (attempt {attempt + 1})")
+                    start = time.perf_counter()
                     response = client.generate(messages, **kwargs)
+                    response.metadata["prompt_tokens"] = record_prompt(
+                        f"llm:{client.provider.value}", messages,
+                        latency_ms=(time.perf_counter() - start) * 1000,
+                    )
                     logger.info(f"Generated response using {client.provider.value}")
                     return response
                 except Exception as e:
                     last_error = e
                     logger.warning(f"{client.provider.value} failed: {e}")
                     if attempt < self.retry_attempts - 1:
-                        import time
                         time.sleep(self.retry_delay)
         
         raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
@@ -478,7 +485,12 @@ class LLMManager:
             
             for attempt in range(self.retry_attempts):
                 try:
+                    start = time.perf_counter()
                     response = await client.agenerate(messages, **kwargs)
+                    response.metadata["prompt_tokens"] = record_prompt(
+                        f"llm:{client.provider.value}", messages,
+                        latency_ms=(time.perf_counter() - start) * 1000,
+                    )
                     logger.info(f"Generated response using {client.provider.value}")
                     return response
                 except Exception as e:
@@ -510,7 +522,16 @@ class LLMManager:
             
             try:
                 logger.info(f"Streaming from {client.provider.value}")
-                yield from client.stream(messages, **kwargs)
+                start = time.perf_counter()
+                first_token_ms = None
+                for chunk in client.stream(messages, **kwargs):
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - start) * 1000
+                    yield chunk
+                record_prompt(
+                    f"llm:{client.provider.value}", messages,
+                    latency_ms=(time.perf_counter() - start) * 1000, first_token_ms=first_token_ms,
+                )
                 return
             except Exception as e:
                 last_error = e
@@ -539,8 +560,16 @@ class LLMManager:
             
             try:
                 logger.info(f"Streaming from {client.provider.value}")
+                start = time.perf_counter()
+                first_token_ms = None
                 async for chunk in client.astream(messages, **kwargs):
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - start) * 1000
                     yield chunk
+                record_prompt(
+                    f"llm:{client.provider.value}", messages,
+                    latency_ms=(time.perf_counter() - start) * 1000, first_token_ms=first_token_ms,
+                )
                 return
             except Exception as e:
                 last_error = e
@@ -6,6 +6,7 @@ Provides:
 - Rate limit tracking per provider
 - Response caching with SQLite
 - Exponential backoff for failover
+- Prompt token and latency accounting per provider
 """
 
 from __future__ import annotations
@@ -14,9 +15,7 @@ import asyncio
 import hashlib
 import json
 import re
-import sqlite3
 import time
-from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -24,10 +23,60 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
+from .context_budget import get_prompt_stats, record_prompt
+from .database import get_database
 from .llm import BaseLLMClient, LLMProvider, LLMResponse, Message, GroqClient, OllamaClient
 from .llm_providers import GeminiClient, RateLimitInfo
 
 
+def hash_messages(messages: List[Message]) -> str:
+    """Stable digest of a message list (cache and single-flight key)."""
+    content = json.dumps([m.to_dict() for m in messages], sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class _StreamFlight:
+    """
+    One in-flight streamed generation shared by every identical request.
+    
+    The producer task appends chunks as they arrive; subscribers replay
+    what was already emitted and then follow the live tail.
+    """
+    
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+    
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+    
+    def push(self, chunk: str) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+    
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+    
+    async def subscribe(self) -> AsyncIterator[str]:
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
 class TaskType(Enum):
     """Types of tasks for intelligent routing."""
     FAST_QUERY = "fast_query"  # Simple questions, quick responses
@@ -70,18 +119,12 @@ class ResponseCache:
         self.db_path = db_path
         self.max_age_seconds = max_age_hours * 3600
         self.max_entries = max_entries
+        self._db = get_database(db_path)
         
         self._init_db()
     
-    @contextmanager
     def _get_connection(self):
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+        return self._db.transaction()
     
     def _init_db(self) -> None:
         """Initialize the cache database."""
@@ -101,8 +144,7 @@ class ResponseCache:
     
     def _hash_messages(self, messages: List[Message]) -> str:
         """Create a hash of the messages for cache lookup."""
-        content = json.dumps([m.to_dict() for m in messages], sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hash_messages(messages)
     
     def get(self, messages: List[Message]) -> Optional[LLMResponse]:
         """
@@ -288,6 +330,7 @@ class IntelligentLLMRouter:
     - Response caching
     - Exponential backoff
     - Provider health monitoring
+    - Single-flight coalescing of identical concurrent requests
     """
     
     # Default routing preferences by task type (FREE PROVIDERS ONLY)
@@ -371,6 +414,17 @@ class IntelligentLLMRouter:
             cache_dir.mkdir(parents=True, exist_ok=True)
             self.cache = ResponseCache(cache_dir / "llm_cache.db")
         
+        # Single-flight: identical concurrent requests share one provider call
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._inflight_streams: Dict[str, _StreamFlight] = {}
+        self._coalesce_stats = {
+            "generate_calls": 0,
+            "generate_coalesced": 0,
+            "stream_calls": 0,
+            "stream_coalesced": 0,
+            "replayed_chunks": 0,
+        }
+        
         logger.info(f"LLM Router initialized with {len(self.clients)} providers: {list(self.clients.keys())}")
     
     def _get_provider_order(self, task_type: TaskType) -> List[str]:
@@ -474,7 +528,9 @@ class IntelligentLLMRouter:
             for attempt in range(self.max_retries):
                 try:
                     logger.debug(f"Trying {provider} (attempt {attempt + 1})")
+                    start = time.perf_counter()
                     response = client.generate(messages, **kwargs)
+                    latency_ms = (time.perf_counter() - start) * 1000
                     
                     # Record success
                     self._record_success(provider, response.tokens_used or 0)
@@ -483,6 +539,7 @@ class IntelligentLLMRouter:
                     response.metadata = response.metadata or {}
                     response.metadata["provider_name"] = provider
                     response.metadata["task_type"] = task_type.value
+                    response.metadata["prompt_tokens"] = record_prompt(f"llm:{provider}", messages, latency_ms=latency_ms)
                     
                     # Cache response
                     if use_cache and self.cache:
@@ -512,13 +569,77 @@ class IntelligentLLMRouter:
         use_cache: bool = True,
         **kwargs,
     ) -> LLMResponse:
-        """Generate a response asynchronously with intelligent routing."""
+        """
+        Generate a response asynchronously with intelligent routing.
+        
+        Concurrent calls with identical messages and options share one
+        provider call; each caller gets its own copy of the response.
+        """
         # Check cache first
         if use_cache and self.cache:
             cached = self.cache.get(messages)
             if cached:
                 return cached
         
+        key = self._flight_key(messages, task_type, preferred_provider, kwargs)
+        loop = asyncio.get_running_loop()
+        self._coalesce_stats["generate_calls"] += 1
+        
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop:
+            self._coalesce_stats["generate_coalesced"] += 1
+            response = await asyncio.shield(task)
+            return LLMResponse(
+                content=response.content,
+                provider=response.provider,
+                model=response.model,
+                tokens_used=response.tokens_used,
+                finish_reason=response.finish_reason,
+                metadata={**response.metadata, "coalesced": True},
+            )
+        
+        # The call runs as its own task so a cancelled caller does not
+        # cancel it for everyone else waiting on the same key
+        task = loop.create_task(
+            self._agenerate_uncoalesced(messages, task_type, preferred_provider, use_cache, **kwargs)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._generate_done(key, t))
+        return await asyncio.shield(task)
+    
+    def _flight_key(
+        self,
+        messages: List[Message],
+        task_type: Optional[TaskType],
+        preferred_provider: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Single-flight key: message digest plus anything that changes the output."""
+        key = hash_messages(messages)
+        if task_type or preferred_provider or kwargs:
+            extra = json.dumps(
+                [task_type.value if task_type else None, preferred_provider, kwargs],
+                sort_keys=True,
+                default=str,
+            )
+            key += ":" + hashlib.sha256(extra.encode()).hexdigest()[:16]
+        return key
+    
+    def _generate_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved; callers re-raise it themselves
+            task.exception()
+    
+    async def _agenerate_uncoalesced(
+        self,
+        messages: List[Message],
+        task_type: Optional[TaskType],
+        preferred_provider: Optional[str],
+        use_cache: bool,
+        **kwargs,
+    ) -> LLMResponse:
         if task_type is None:
             user_messages = [m for m in messages if m.role == "user"]
             if user_messages:
@@ -541,12 +662,15 @@ class IntelligentLLMRouter:
             
             for attempt in range(self.max_retries):
                 try:
+                    start = time.perf_counter()
                     response = await client.agenerate(messages, **kwargs)
+                    latency_ms = (time.perf_counter() - start) * 1000
                     self._record_success(provider, response.tokens_used or 0)
                     
                     response.metadata = response.metadata or {}
                     response.metadata["provider_name"] = provider
                     response.metadata["task_type"] = task_type.value
+                    response.metadata["prompt_tokens"] = record_prompt(f"llm:{provider}", messages, latency_ms=latency_ms)
                     
                     if use_cache and self.cache:
                         self.cache.set(messages, response)
@@ -592,8 +716,17 @@ class IntelligentLLMRouter:
             
             try:
                 logger.info(f"Streaming from {provider}")
-                yield from client.stream(messages, **kwargs)
+                start = time.perf_counter()
+                first_token_ms = None
+                for chunk in client.stream(messages, **kwargs):
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - start) * 1000
+                    yield chunk
                 self._record_success(provider)
+                record_prompt(
+                    f"llm:{provider}", messages,
+                    latency_ms=(time.perf_counter() - start) * 1000, first_token_ms=first_token_ms,
+                )
                 return
             except Exception as e:
                 last_error = str(e)
@@ -608,7 +741,71 @@ class IntelligentLLMRouter:
         preferred_provider: Optional[str] = None,
         **kwargs,
     ) -> AsyncIterator[str]:
-        """Stream a response asynchronously with intelligent routing."""
+        """
+        Stream a response asynchronously with intelligent routing.
+        
+        Concurrent identical requests share one provider stream: a late
+        joiner first receives the chunks already emitted, then the live
+        tail. The shared stream is cancelled once every subscriber has
+        gone away.
+        """
+        key = self._flight_key(messages, task_type, preferred_provider, kwargs)
+        loop = asyncio.get_running_loop()
+        self._coalesce_stats["stream_calls"] += 1
+        
+        flight = self._inflight_streams.get(key)
+        if flight is not None and flight.task.get_loop() is loop:
+            self._coalesce_stats["stream_coalesced"] += 1
+            self._coalesce_stats["replayed_chunks"] += len(flight.chunks)
+        else:
+            flight = _StreamFlight()
+            flight.task = loop.create_task(
+                self._produce_stream(flight, messages, task_type, preferred_provider, **kwargs)
+            )
+            self._inflight_streams[key] = flight
+            flight.task.add_done_callback(lambda _: self._stream_done(key, flight))
+        
+        flight.subscribers += 1
+        try:
+            async for chunk in flight.subscribe():
+                yield chunk
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                flight.task.cancel()
+                # Don't let a new request join the stream being cancelled
+                self._stream_done(key, flight)
+    
+    def _stream_done(self, key: str, flight: _StreamFlight) -> None:
+        if self._inflight_streams.get(key) is flight:
+            del self._inflight_streams[key]
+    
+    async def _produce_stream(
+        self,
+        flight: _StreamFlight,
+        messages: List[Message],
+        task_type: Optional[TaskType],
+        preferred_provider: Optional[str],
+        **kwargs,
+    ) -> None:
+        try:
+            async for chunk in self._astream_uncoalesced(messages, task_type, preferred_provider, **kwargs):
+                flight.push(chunk)
+        except asyncio.CancelledError:
+            flight.finish(RuntimeError("Stream cancelled"))
+            raise
+        except Exception as e:
+            flight.finish(e)
+        else:
+            flight.finish()
+    
+    async def _astream_uncoalesced(
+        self,
+        messages: List[Message],
+        task_type: Optional[TaskType],
+        preferred_provider: Optional[str],
+        **kwargs,
+    ) -> AsyncIterator[str]:
         if task_type is None:
             user_messages = [m for m in messages if m.role == "user"]
             if user_messages:
@@ -630,9 +827,17 @@ class IntelligentLLMRouter:
             client = self.clients[provider]
             
             try:
+                start = time.perf_counter()
+                first_token_ms = None
                 async for chunk in client.astream(messages, **kwargs):
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - start) * 1000
                     yield chunk
                 self._record_success(provider)
+                record_prompt(
+                    f"llm:{provider}", messages,
+                    latency_ms=(time.perf_counter() - start) * 1000, first_token_ms=first_token_ms,
+                )
                 return
             except Exception as e:
                 last_error = str(e)
@@ -654,6 +859,15 @@ class IntelligentLLMRouter:
                 for name, status in self.provider_status.items()
             },
             "cache_stats": self.cache.get_stats() if self.cache else None,
+            "coalescing": {
+                **self._coalesce_stats,
+                "in_flight": len(self._inflight) + len(self._inflight_streams),
+            },
+            "prompts": {
+                label: stats
+                for label, stats in get_prompt_stats().get_stats().items()
+                if label.startswith("llm:")
+            },
         }
     
     def reset_provider(self, provider: str) -> bool:
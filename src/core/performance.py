@@ -72,6 +72,7 @@ class PerformanceConfig:
     streaming_enabled: bool = True
     min_sentence_length: int = 10
     max_buffer_sentences: int = 5
+    clause_min_length: int = 0
     
     # Parallel processing
     parallel_enabled: bool = True
@@ -497,6 +498,7 @@ class PerformanceOptimizer:
             tts_callback=tts_callback,
             min_sentence_length=self.config.min_sentence_length,
             max_buffer_sentences=self.config.max_buffer_sentences,
+            clause_min_length=self.config.clause_min_length,
         )
         
         self._streaming_handler = handler
@@ -67,12 +67,17 @@ class IntegrationConfig:
     streaming_enabled: bool = True
     min_sentence_length: int = 10
     max_buffer_sentences: int = 5
+    clause_min_length: int = 0
     
     # Caching
     cache_enabled: bool = True
     cache_dir: Optional[Path] = None
     semantic_cache_enabled: bool = True
     semantic_threshold: float = 0.92
+    semantic_model: str = "all-MiniLM-L6-v2"
+    semantic_cache_size: int = 1000
+    semantic_ann_threshold: int = 20000
+    semantic_persist: bool = True
     
     # Parallel execution
     parallel_enabled: bool = True
@@ -104,9 +109,11 @@ class StreamingLLMIntegration:
         min_sentence_length: int = 10,
         max_buffer_sentences: int = 5,
         metrics_collector: Optional[MetricsCollector] = None,
+        clause_min_length: int = 0,
     ):
         self.min_sentence_length = min_sentence_length
         self.max_buffer_sentences = max_buffer_sentences
+        self.clause_min_length = clause_min_length
         self.metrics_collector = metrics_collector
         
         self._current_handler: Optional[StreamingResponseHandler] = None
@@ -118,6 +125,7 @@ class StreamingLLMIntegration:
         messages: List[Message],
         tts_speak: Optional[Callable[[str], Coroutine[Any, Any, None]]] = None,
         on_sentence: Optional[Callable[[str], None]] = None,
+        speech_engine: Optional[Any] = None,
         **llm_kwargs,
     ) -> tuple[str, StreamMetrics]:
         """
@@ -128,6 +136,8 @@ class StreamingLLMIntegration:
             messages: Chat messages to send.
             tts_speak: Optional async function to speak each sentence.
             on_sentence: Optional callback for each sentence.
+            speech_engine: Optional PipelinedSpeechEngine; synthesizes
+                upcoming sentences while earlier ones play.
             **llm_kwargs: Additional arguments for LLM.
             
         Returns:
@@ -140,6 +150,8 @@ class StreamingLLMIntegration:
             tts_callback=tts_speak,
             min_sentence_length=self.min_sentence_length,
             max_buffer_sentences=self.max_buffer_sentences,
+            clause_min_length=self.clause_min_length,
+            speech_engine=speech_engine,
         )
         
         self._is_streaming = True
@@ -162,6 +174,8 @@ class StreamingLLMIntegration:
                 self.metrics_collector.record_latency("llm", metrics.total_time)
                 if metrics.time_to_first_sentence > 0:
                     self.metrics_collector.record_latency("ttfs", metrics.time_to_first_sentence)
+                if metrics.time_to_first_audio > 0:
+                    self.metrics_collector.record_latency("ttfa", metrics.time_to_first_audio)
             
             return full_response, metrics
             
@@ -173,7 +187,10 @@ class StreamingLLMIntegration:
                 full_response = response.content
                 
                 # Speak the full response if TTS available
-                if tts_speak:
+                if speech_engine:
+                    await speech_engine.enqueue(full_response)
+                    await speech_engine.drain()
+                elif tts_speak:
                     await tts_speak(full_response)
                 
                 # Create fallback metrics
@@ -596,6 +613,7 @@ class PerformanceIntegration:
                 min_sentence_length=self.config.min_sentence_length,
                 max_buffer_sentences=self.config.max_buffer_sentences,
                 metrics_collector=self._metrics_collector,
+                clause_min_length=self.config.clause_min_length,
             )
             logger.info("Streaming integration initialized")
         
@@ -606,6 +624,10 @@ class PerformanceIntegration:
                 cache_dir=self.config.cache_dir,
                 semantic_enabled=self.config.semantic_cache_enabled,
                 semantic_threshold=self.config.semantic_threshold,
+                semantic_model=self.config.semantic_model,
+                semantic_cache_size=self.config.semantic_cache_size,
+                semantic_ann_threshold=self.config.semantic_ann_threshold,
+                semantic_persist=self.config.semantic_persist,
             )
             cache = get_cache(cache_config)
             self._cache_integration = CacheIntegration(
@@ -693,6 +715,7 @@ class PerformanceIntegration:
         llm_router,
         messages: List[Message],
         tts_speak: Optional[Callable[[str], Coroutine[Any, Any, None]]] = None,
+        speech_engine: Optional[Any] = None,
         **llm_kwargs,
     ) -> str:
         """
@@ -702,6 +725,7 @@ class PerformanceIntegration:
             llm_router: LLM router for generation.
             messages: Chat messages.
             tts_speak: Async TTS function.
+            speech_engine: Optional PipelinedSpeechEngine used instead of tts_speak.
             **llm_kwargs: Additional LLM arguments.
             
         Returns:
@@ -715,7 +739,7 @@ class PerformanceIntegration:
             return response.content
         
         response, metrics = await self._streaming.stream_response(
-            llm_router, messages, tts_speak, **llm_kwargs
+            llm_router, messages, tts_speak, speech_engine=speech_engine, **llm_kwargs
         )
         
         return response
@@ -56,6 +56,9 @@ class StreamMetrics:
     total_tokens: int = 0
     total_sentences: int = 0
     total_characters: int = 0
+    first_audio_time: float = 0.0
+    synth_latencies_ms: List[float] = field(default_factory=list)
+    sentence_gaps_ms: List[float] = field(default_factory=list)
     
     @property
     def time_to_first_token(self) -> float:
@@ -71,6 +74,13 @@ class StreamMetrics:
             return (self.first_sentence_time - self.start_time) * 1000
         return 0.0
     
+    @property
+    def time_to_first_audio(self) -> float:
+        """Time from start until speech audio was first queued, in ms."""
+        if self.first_audio_time and self.start_time:
+            return (self.first_audio_time - self.start_time) * 1000
+        return 0.0
+    
     @property
     def total_time(self) -> float:
         """Total streaming time in ms."""
@@ -86,15 +96,31 @@ class StreamMetrics:
             return self.total_tokens / total_seconds
         return 0.0
     
+    def record_speech(self, items: List[Any]) -> None:
+        """Record per-sentence timings from a pipelined speech engine."""
+        for i, item in enumerate(items):
+            self.synth_latencies_ms.append(item.synth_ms)
+            if i:
+                self.sentence_gaps_ms.append(item.gap_ms)
+            if item.started_at and (not self.first_audio_time or item.started_at < self.first_audio_time):
+                self.first_audio_time = item.started_at
+    
     def to_dict(self) -> Dict[str, Any]:
+        synth = self.synth_latencies_ms
+        gaps = self.sentence_gaps_ms
         return {
             "time_to_first_token_ms": round(self.time_to_first_token, 2),
             "time_to_first_sentence_ms": round(self.time_to_first_sentence, 2),
+            "time_to_first_audio_ms": round(self.time_to_first_audio, 2),
             "total_time_ms": round(self.total_time, 2),
             "total_tokens": self.total_tokens,
             "total_sentences": self.total_sentences,
             "total_characters": self.total_characters,
             "tokens_per_second": round(self.tokens_per_second, 2),
+            "avg_synth_latency_ms": round(sum(synth) / len(synth), 2) if synth else 0.0,
+            "max_synth_latency_ms": round(max(synth), 2) if synth else 0.0,
+            "avg_sentence_gap_ms": round(sum(gaps) / len(gaps), 2) if gaps else 0.0,
+            "max_sentence_gap_ms": round(max(gaps), 2) if gaps else 0.0,
         }
 
 
@@ -118,6 +144,13 @@ class SentenceDetector:
     - URLs and emails
     - Quoted text
     - Lists and bullet points
+    - Optional clause boundaries (, ; :) for earlier TTS
+    
+    Detection is incremental: incoming tokens are kept in a chunk list
+    and only text after the last examined position is scanned, so a long
+    answer without boundaries costs linear rather than quadratic time.
+    Punctuation at the very end of the buffer is decided once the next
+    character arrives (or on flush), so "3." + "14" is not split.
     """
     
     # Common abbreviations that don't end sentences
@@ -130,6 +163,9 @@ class SentenceDetector:
     # Sentence-ending punctuation
     SENTENCE_ENDERS = ".!?"
     
+    # Punctuation that may end a speakable clause
+    CLAUSE_ENDERS = ",;:"
+    
     # Pattern for detecting sentence boundaries
     SENTENCE_PATTERN = re.compile(
         r'(?<=[.!?])\s+(?=[A-Z])|'  # Standard sentence boundary
@@ -138,16 +174,36 @@ class SentenceDetector:
         re.MULTILINE
     )
     
-    def __init__(self, min_sentence_length: int = 10):
+    _NON_SPACE = re.compile(r"\S")
+    
+    def __init__(self, min_sentence_length: int = 10, clause_min_length: int = 0):
         """
         Initialize sentence detector.
         
         Args:
             min_sentence_length: Minimum characters for a valid sentence.
+            clause_min_length: Also split at , ; : once the pending text is
+                at least this long (0 disables clause splitting).
         """
         self.min_sentence_length = min_sentence_length
-        self.buffer = ""
+        self.clause_min_length = (
+            max(clause_min_length, min_sentence_length) if clause_min_length > 0 else 0
+        )
         self.sentences: List[str] = []
+        
+        enders = self.SENTENCE_ENDERS + "\n"
+        if self.clause_min_length:
+            enders += self.CLAUSE_ENDERS
+        self._candidates = re.compile(f"[{re.escape(enders)}]")
+        
+        self._parts: List[str] = []  # Pending text, not yet joined
+        self._size = 0               # Total length of _parts
+        self._scan = 0               # Pending text before this offset has been examined
+    
+    @property
+    def buffer(self) -> str:
+        """Text received but not yet emitted as a sentence."""
+        return "".join(self._parts)
     
     def add_text(self, text: str) -> List[str]:
         """
@@ -159,75 +215,101 @@ class SentenceDetector:
         Returns:
             List of complete sentences extracted.
         """
-        self.buffer += text
+        if not self._size:
+            text = text.lstrip()
+        if not text:
+            return []
+        
+        self._parts.append(text)
+        self._size += len(text)
+        
+        # Nothing to examine: no candidate in the new chunk and no
+        # candidate left waiting for lookahead
+        if self._scan == self._size - len(text) and not self._candidates.search(text):
+            self._scan = self._size
+            return []
+        
         return self._extract_sentences()
     
     def _extract_sentences(self) -> List[str]:
-        """Extract complete sentences from buffer."""
+        """Extract complete sentences from the unexamined part of the buffer."""
+        text = "".join(self._parts)
         extracted = []
+        pos = self._scan
         
         while True:
-            sentence, remaining = self._find_sentence_boundary()
-            if sentence:
-                # Clean up the sentence
-                sentence = sentence.strip()
-                if len(sentence) >= self.min_sentence_length:
-                    extracted.append(sentence)
-                    self.sentences.append(sentence)
-                self.buffer = remaining
-            else:
+            match = self._candidates.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            
+            pos = match.start()
+            end = self._boundary_end(text, pos)
+            if end is None:
+                # Needs more text to decide
                 break
+            if end < 0:
+                pos += 1
+                continue
+            
+            sentence = text[:end].strip()
+            if len(sentence) >= self.min_sentence_length:
+                extracted.append(sentence)
+                self.sentences.append(sentence)
+            text = text[pos + 1:].lstrip()
+            pos = 0
         
+        self._parts = [text] if text else []
+        self._size = len(text)
+        self._scan = pos
         return extracted
     
-    def _find_sentence_boundary(self) -> tuple[Optional[str], str]:
+    def _boundary_end(self, text: str, pos: int) -> Optional[int]:
         """
-        Find the next sentence boundary in the buffer.
+        Classify the candidate character at pos.
         
         Returns:
-            Tuple of (sentence, remaining_buffer) or (None, buffer) if no boundary found.
+            End offset of the sentence if pos is a boundary, -1 if it is
+            not, or None if the text after pos is needed to decide.
         """
-        if not self.buffer:
-            return None, ""
-        
-        # Look for sentence-ending punctuation
-        for i, char in enumerate(self.buffer):
-            if char in self.SENTENCE_ENDERS:
-                # Check if this is a real sentence boundary
-                if self._is_sentence_boundary(i):
-                    # Include the punctuation
-                    sentence = self.buffer[:i + 1]
-                    remaining = self.buffer[i + 1:].lstrip()
-                    return sentence, remaining
-        
-        # Check for newline boundaries (for lists, code, etc.)
-        newline_pos = self.buffer.find('\n')
-        if newline_pos > self.min_sentence_length:
-            sentence = self.buffer[:newline_pos]
-            remaining = self.buffer[newline_pos + 1:]
-            return sentence, remaining
-        
-        return None, self.buffer
-    
-    def _is_sentence_boundary(self, pos: int) -> bool:
+        char = text[pos]
+        
+        if char == "\n":
+            return pos if pos > self.min_sentence_length else -1
+        
+        if char in self.CLAUSE_ENDERS:
+            if pos + 1 < self.clause_min_length:
+                return -1
+            if pos + 1 >= len(text):
+                return None
+            # "1,000" and "12:30" are not clause boundaries
+            return pos + 1 if text[pos + 1].isspace() else -1
+        
+        decision = self._is_sentence_boundary(text, pos)
+        if decision is None:
+            return None
+        return pos + 1 if decision else -1
+    
+    def _is_sentence_boundary(self, text: str, pos: int) -> Optional[bool]:
         """
         Check if position is a real sentence boundary.
         
         Args:
+            text: Pending text.
             pos: Position of potential sentence-ending punctuation.
             
         Returns:
-            True if this is a real sentence boundary.
+            True if this is a real sentence boundary, None if undecided.
         """
-        if pos >= len(self.buffer) - 1:
-            # End of buffer - might be end of sentence
-            return len(self.buffer) > self.min_sentence_length
+        if pos >= len(text) - 1:
+            # End of buffer - wait for the next character
+            return None
         
-        char = self.buffer[pos]
-        next_char = self.buffer[pos + 1] if pos + 1 < len(self.buffer) else ""
+        char = text[pos]
+        next_char = text[pos + 1]
         
         # Must be followed by space or end of text
-        if next_char and not next_char.isspace():
+        if not next_char.isspace():
             # Could be decimal number (3.14) or abbreviation
             if char == "." and next_char.isdigit():
                 return False
@@ -239,9 +321,9 @@ class SentenceDetector:
         if char == ".":
             # Find the word before the period
             word_start = pos
-            while word_start > 0 and self.buffer[word_start - 1].isalpha():
+            while word_start > 0 and text[word_start - 1].isalpha():
                 word_start -= 1
-            word = self.buffer[word_start:pos].lower()
+            word = text[word_start:pos].lower()
             
             if word in self.ABBREVIATIONS:
                 return False
@@ -250,16 +332,15 @@ class SentenceDetector:
             if len(word) == 1 and word.isupper():
                 return False
         
-        # Check if next non-space character is uppercase (new sentence)
-        remaining = self.buffer[pos + 1:].lstrip()
-        if remaining and remaining[0].isupper():
-            return True
-        
         # If followed by space and we have enough content, consider it a boundary
         if next_char.isspace() and pos > self.min_sentence_length:
             return True
         
-        return False
+        # Check if next non-space character is uppercase (new sentence)
+        match = self._NON_SPACE.search(text, pos + 1)
+        if match is None:
+            return None
+        return text[match.start()].isupper()
     
     def flush(self) -> Optional[str]:
         """
@@ -268,17 +349,20 @@ class SentenceDetector:
         Returns:
             Remaining text or None if buffer is empty.
         """
-        if self.buffer.strip():
-            sentence = self.buffer.strip()
-            self.buffer = ""
-            if len(sentence) >= 3:  # Allow shorter final sentences
-                self.sentences.append(sentence)
-                return sentence
+        sentence = self.buffer.strip()
+        self._parts = []
+        self._size = 0
+        self._scan = 0
+        if len(sentence) >= 3:  # Allow shorter final sentences
+            self.sentences.append(sentence)
+            return sentence
         return None
     
     def reset(self) -> None:
         """Reset the detector state."""
-        self.buffer = ""
+        self._parts = []
+        self._size = 0
+        self._scan = 0
         self.sentences = []
 
 
@@ -289,6 +373,7 @@ class StreamingResponseHandler:
     Features:
     - Real-time sentence extraction from token stream
     - Async queue for TTS playback
+    - Pipelined synthesis/playback through an optional speech engine
     - Interruption handling
     - Performance metrics
     """
@@ -299,6 +384,8 @@ class StreamingResponseHandler:
         min_sentence_length: int = 10,
         max_buffer_sentences: int = 5,
         enable_metrics: bool = True,
+        clause_min_length: int = 0,
+        speech_engine: Optional[Any] = None,
     ):
         """
         Initialize the streaming handler.
@@ -308,19 +395,25 @@ class StreamingResponseHandler:
             min_sentence_length: Minimum characters for a sentence.
             max_buffer_sentences: Maximum sentences to buffer.
             enable_metrics: Whether to collect performance metrics.
+            clause_min_length: Split at , ; : after this many characters
+                so TTS can start before the sentence ends (0 disables).
+            speech_engine: PipelinedSpeechEngine-compatible object. When
+                set, sentences are enqueued on it (synthesized ahead and
+                played gaplessly) instead of awaiting tts_callback.
         """
         self.tts_callback = tts_callback
+        self.speech_engine = speech_engine
         self.min_sentence_length = min_sentence_length
         self.max_buffer_sentences = max_buffer_sentences
         self.enable_metrics = enable_metrics
         
         self.state = StreamState.IDLE
         self.metrics = StreamMetrics()
-        self.sentence_detector = SentenceDetector(min_sentence_length)
+        self.sentence_detector = SentenceDetector(min_sentence_length, clause_min_length)
         
         # Sentence queue for TTS
         self._sentence_queue: asyncio.Queue[SentenceChunk] = asyncio.Queue()
-        self._full_response = ""
+        self._response_parts: List[str] = []
         self._sentence_index = 0
         self._interrupted = False
         
@@ -330,7 +423,7 @@ class StreamingResponseHandler:
     @property
     def full_response(self) -> str:
         """Get the full accumulated response."""
-        return self._full_response
+        return "".join(self._response_parts)
     
     @property
     def is_streaming(self) -> bool:
@@ -357,7 +450,7 @@ class StreamingResponseHandler:
         self.metrics.start_time = time.time()
         
         # Start TTS consumer if callback provided
-        if start_tts and self.tts_callback:
+        if start_tts and (self.tts_callback or self.speech_engine):
             self._tts_task = asyncio.create_task(self._tts_consumer())
         
         try:
@@ -371,7 +464,7 @@ class StreamingResponseHandler:
                     self.metrics.first_token_time = time.time()
                 
                 self.metrics.total_tokens += 1
-                self._full_response += token
+                self._response_parts.append(token)
                 
                 # Extract sentences
                 sentences = self.sentence_detector.add_text(token)
@@ -475,7 +568,10 @@ class StreamingResponseHandler:
                     break
                 
                 # Speak the sentence
-                if self.tts_callback and chunk.text:
+                if self.speech_engine and chunk.text:
+                    # Returns once accepted; synthesis overlaps playback
+                    await self.speech_engine.enqueue(chunk.text)
+                elif self.tts_callback and chunk.text:
                     try:
                         await self.tts_callback(chunk.text)
                     except Exception as e:
@@ -485,11 +581,16 @@ class StreamingResponseHandler:
                 
             except asyncio.CancelledError:
                 break
+        
+        if self.speech_engine and not self._interrupted:
+            self.metrics.record_speech(await self.speech_engine.drain())
     
     def interrupt(self) -> None:
         """Interrupt the current stream."""
         self._interrupted = True
         self.state = StreamState.INTERRUPTED
+        if self.speech_engine:
+            self.speech_engine.interrupt()
         logger.debug("Stream interrupted by user")
     
     def _reset(self) -> None:
@@ -498,7 +599,7 @@ class StreamingResponseHandler:
         self.metrics = StreamMetrics()
         self.sentence_detector.reset()
         self._sentence_queue = asyncio.Queue()
-        self._full_response = ""
+        self._response_parts = []
         self._sentence_index = 0
         self._interrupted = False
         self._tts_task = None
@@ -517,12 +618,14 @@ class StreamingTTSQueue:
     - Playback state management
     - Interruption support
     - Overlap prevention
+    - Optional pipelined speech engine
     """
     
     def __init__(
         self,
-        speak_func: Callable[[str, bool], Coroutine[Any, Any, None]],
+        speak_func: Optional[Callable[[str, bool], Coroutine[Any, Any, None]]] = None,
         max_queue_size: int = 10,
+        speech_engine: Optional[Any] = None,
     ):
         """
         Initialize TTS queue.
@@ -530,8 +633,13 @@ class StreamingTTSQueue:
         Args:
             speak_func: Async function to speak text. Args: (text, blocking).
             max_queue_size: Maximum sentences to queue.
+            speech_engine: PipelinedSpeechEngine-compatible object used
+                instead of speak_func.
         """
+        if speak_func is None and speech_engine is None:
+            raise ValueError("speak_func or speech_engine is required")
         self.speak_func = speak_func
+        self.speech_engine = speech_engine
         self.max_queue_size = max_queue_size
         
         self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
@@ -582,7 +690,10 @@ class StreamingTTSQueue:
                 
                 self._is_speaking = True
                 try:
-                    await self.speak_func(text, True)
+                    if self.speech_engine:
+                        await self.speech_engine.enqueue(text)
+                    else:
+                        await self.speak_func(text, True)
                 except Exception as e:
                     logger.error(f"TTS error: {e}")
                 finally:
@@ -597,6 +708,8 @@ class StreamingTTSQueue:
     def interrupt(self) -> None:
         """Interrupt current playback and clear queue."""
         self._should_stop = True
+        if self.speech_engine:
+            self.speech_engine.interrupt()
         # Clear the queue
         while not self._queue.empty():
             try:
@@ -607,6 +720,8 @@ class StreamingTTSQueue:
     @property
     def is_speaking(self) -> bool:
         """Check if currently speaking."""
+        if self.speech_engine and self.speech_engine.is_speaking:
+            return True
         return self._is_speaking
     
     @property
@@ -17,7 +17,7 @@ Orchestrates all financial features:
 import re
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -51,6 +51,82 @@ class FinanceManager:
     - Portfolio tracking
     """
     
+    # Trigger phrases per command type; also registered with the
+    # assistant's intent index so this manager is only called on a match
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "realtime_advice": (
+            "should i buy", "should i invest", "is now a good time",
+            "good time to invest", "good time to buy",
+            "market update", "how's the market", "how is the market",
+            "what's vti at", "what is vti at", "vti right now",
+            "what's spy at", "what is spy at", "spy right now",
+            "buy right now", "invest right now", "invest now",
+        ),
+        "stock": (
+            "stock price", "price of", "how is", "how's",
+            "market summary", "watchlist", "add to watchlist",
+            "compare", "vs", "stock", "ticker",
+            "s&p", "nasdaq", "dow", "market today",
+        ),
+        "education": (
+            "investment advice", "investing advice", "why index",
+            "dollar cost", "compound interest", "expense ratio",
+            "should i invest", "best investment", "beginner invest",
+            "individual stock", "etf", "what is", "explain",
+            "investment tip", "how to invest",
+        ),
+        "retirement": (
+            "401k", "401(k)", "roth ira", "traditional ira",
+            "retirement", "matching", "vesting", "target date",
+            "how much to save", "contribution limit",
+        ),
+        "savings": (
+            "savings rate", "apy", "high yield", "hysa",
+            "best savings", "sofi", "marcus", "ally",
+            "emergency fund", "where to keep", "savings account",
+            "interest rate", "compare savings",
+        ),
+        "tax": (
+            "tax", "taxes", "deduction", "capital gains",
+            "tax loss", "harvesting", "tax bracket",
+            "education credit", "aotc", "rich people",
+            "avoid taxes", "reduce taxes",
+        ),
+        "credit": (
+            "credit score", "credit card", "build credit",
+            "utilization", "fico", "authorized user",
+            "first credit", "student card", "800 credit",
+        ),
+        "debt": (
+            "debt", "loan", "pay off", "student loan",
+            "good debt", "bad debt", "leverage", "borrow",
+            "rich people loan", "0% financing", "avalanche",
+            "snowball",
+        ),
+        "tips": (
+            "save money", "money saving", "student discount",
+            "free stuff", "subscription", "cash back",
+            "negotiate", "food saving", "wealth habit",
+        ),
+        "dashboard": (
+            "financial health", "net worth", "savings rate",
+            "am i on track", "financial goal", "update",
+            "my finances", "financial summary", "dashboard",
+        ),
+        "portfolio": (
+            "portfolio", "my holdings", "add shares",
+            "sell shares", "asset allocation", "rebalance",
+            "dividend", "investment performance",
+        ),
+    }
+    
+    # Regex triggers for commands phrases alone cannot describe
+    COMMAND_PATTERNS: Dict[str, Tuple[str, ...]] = {
+        "portfolio": (
+            r"add.*shares.*at",  # "add 10 shares VTI at 220"
+        ),
+    }
+    
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
@@ -135,111 +211,52 @@ class FinanceManager:
     
     def _is_realtime_advice_command(self, text: str) -> bool:
         """Check if command needs real-time market data for advice."""
-        patterns = [
-            "should i buy", "should i invest", "is now a good time",
-            "good time to invest", "good time to buy",
-            "market update", "how's the market", "how is the market",
-            "what's vti at", "what is vti at", "vti right now",
-            "what's spy at", "what is spy at", "spy right now",
-            "buy right now", "invest right now", "invest now",
-        ]
+        patterns = self.COMMAND_TRIGGERS["realtime_advice"]
         return any(p in text for p in patterns)
     
     def _is_stock_command(self, text: str) -> bool:
-        patterns = [
-            "stock price", "price of", "how is", "how's",
-            "market summary", "watchlist", "add to watchlist",
-            "compare", "vs", "stock", "ticker",
-            "s&p", "nasdaq", "dow", "market today",
-        ]
+        patterns = self.COMMAND_TRIGGERS["stock"]
         # Check for stock symbols (uppercase 1-5 letters)
         has_symbol = bool(re.search(r'\b[A-Z]{1,5}\b', text.upper()))
         return any(p in text for p in patterns) or (has_symbol and "stock" in text)
     
     def _is_education_command(self, text: str) -> bool:
-        patterns = [
-            "investment advice", "investing advice", "why index",
-            "dollar cost", "compound interest", "expense ratio",
-            "should i invest", "best investment", "beginner invest",
-            "individual stock", "etf", "what is", "explain",
-            "investment tip", "how to invest",
-        ]
+        patterns = self.COMMAND_TRIGGERS["education"]
         return any(p in text for p in patterns)
     
     def _is_retirement_command(self, text: str) -> bool:
-        patterns = [
-            "401k", "401(k)", "roth ira", "traditional ira",
-            "retirement", "matching", "vesting", "target date",
-            "how much to save", "contribution limit",
-        ]
+        patterns = self.COMMAND_TRIGGERS["retirement"]
         return any(p in text for p in patterns)
     
     def _is_savings_command(self, text: str) -> bool:
-        patterns = [
-            "savings rate", "apy", "high yield", "hysa",
-            "best savings", "sofi", "marcus", "ally",
-            "emergency fund", "where to keep", "savings account",
-            "interest rate", "compare savings",
-        ]
+        patterns = self.COMMAND_TRIGGERS["savings"]
         return any(p in text for p in patterns)
     
     def _is_tax_command(self, text: str) -> bool:
-        patterns = [
-            "tax", "taxes", "deduction", "capital gains",
-            "tax loss", "harvesting", "tax bracket",
-            "education credit", "aotc", "rich people",
-            "avoid taxes", "reduce taxes",
-        ]
+        patterns = self.COMMAND_TRIGGERS["tax"]
         return any(p in text for p in patterns)
     
     def _is_credit_command(self, text: str) -> bool:
-        patterns = [
-            "credit score", "credit card", "build credit",
-            "utilization", "fico", "authorized user",
-            "first credit", "student card", "800 credit",
-        ]
+        patterns = self.COMMAND_TRIGGERS["credit"]
         return any(p in text for p in patterns)
     
     def _is_debt_command(self, text: str) -> bool:
-        patterns = [
-            "debt", "loan", "pay off", "student loan",
-            "good debt", "bad debt", "leverage", "borrow",
-            "rich people loan", "0% financing", "avalanche",
-            "snowball",
-        ]
+        patterns = self.COMMAND_TRIGGERS["debt"]
         return any(p in text for p in patterns)
     
     def _is_tips_command(self, text: str) -> bool:
-        patterns = [
-            "save money", "money saving", "student discount",
-            "free stuff", "subscription", "cash back",
-            "negotiate", "food saving", "wealth habit",
-        ]
+        patterns = self.COMMAND_TRIGGERS["tips"]
         return any(p in text for p in patterns)
     
     def _is_dashboard_command(self, text: str) -> bool:
-        patterns = [
-            "financial health", "net worth", "savings rate",
-            "am i on track", "financial goal", "update",
-            "my finances", "financial summary", "dashboard",
-        ]
+        patterns = self.COMMAND_TRIGGERS["dashboard"]
         return any(p in text for p in patterns)
     
     def _is_portfolio_command(self, text: str) -> bool:
-        patterns = [
-            "portfolio", "my holdings", "add shares",
-            "sell shares", "asset allocation", "rebalance",
-            "dividend", "investment performance",
-            "add.*shares.*at",  # "add 10 shares VTI at 220"
-        ]
-        import re
-        for p in patterns:
-            if ".*" in p:
-                if re.search(p, text):
-                    return True
-            elif p in text:
-                return True
-        return False
+        patterns = self.COMMAND_TRIGGERS["portfolio"]
+        if any(p in text for p in patterns):
+            return True
+        return any(re.search(p, text) for p in self.COMMAND_PATTERNS["portfolio"])
     
     # =========================================================================
     # Command Handlers
@@ -30,6 +30,7 @@ try:
         CommandPriority,
         QueuedCommand,
         DeviceStateCache,
+        LatencyHistogram,
     )
 except ImportError as e:
     logger.warning(f"Production IoT controller not available: {e}")
@@ -37,6 +38,7 @@ except ImportError as e:
     CommandPriority = None
     QueuedCommand = None
     DeviceStateCache = None
+    LatencyHistogram = None
 
 # Legacy alias for backwards compatibility
 try:
@@ -50,6 +52,7 @@ __all__ = [
     "CommandPriority",
     "QueuedCommand",
     "DeviceStateCache",
+    "LatencyHistogram",
     # Enhanced
     "EnhancedESP32Controller",
     "SecureDeviceClient",
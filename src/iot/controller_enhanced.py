@@ -2,7 +2,7 @@
 Enhanced IoT Controller for JARVIS.
 
 Production-ready controller with:
-- Command queue with retry logic
+- Per-device command workers with priority, coalescing and retry
 - State tracking and synchronization
 - Graceful offline handling
 - Event bus integration
@@ -12,13 +12,17 @@ Production-ready controller with:
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
+import itertools
 import json
+import random
+import threading
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
@@ -54,10 +58,24 @@ class QueuedCommand:
     retry_count: int = 0
     created_at: float = field(default_factory=time.time)
     callback: Optional[Callable[[CommandResult], None]] = None
+    coalesce: bool = False
+    merged_callbacks: List[Callable[[CommandResult], None]] = field(default_factory=list)
     
     def __lt__(self, other):
         """For priority queue ordering."""
         return self.priority.value > other.priority.value
+    
+    # Payload fields naming what on the device a command addresses
+    TARGET_FIELDS: ClassVar[Tuple[str, ...]] = ("pin", "led", "relay", "channel", "zone", "target", "id")
+    
+    @property
+    def coalesce_key(self) -> Optional[Tuple[Any, ...]]:
+        """Key under which a newer command supersedes this one, if any."""
+        if not self.coalesce:
+            return None
+        data = self.data or {}
+        target = tuple((name, str(data[name])) for name in self.TARGET_FIELDS if name in data)
+        return (self.device_id, self.endpoint, self.method.upper(), target)
 
 
 @dataclass
@@ -81,6 +99,50 @@ class DeviceStateCache:
         self.last_updated = time.time()
 
 
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+    
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, value_ms: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+    
+    def percentile(self, pct: float) -> float:
+        """Upper bucket bound containing the given percentile."""
+        if not self.total:
+            return 0.0
+        target = self.total * pct / 100
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                if i < len(self.BUCKETS_MS):
+                    return min(float(self.BUCKETS_MS[i]), round(self.max_ms, 1))
+                return round(self.max_ms, 1)
+        return round(self.max_ms, 1)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sum_ms / self.total, 1) if self.total else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": {label: c for label, c in zip(labels, self.counts) if c},
+        }
+
+
 class ProductionIoTController:
     """
     Production-ready IoT controller.
@@ -101,8 +163,13 @@ class ProductionIoTController:
         data_dir: Optional[Path] = None,
         auto_discover: bool = True,
         max_queue_size: int = 100,
+        max_parallel_devices: int = 16,
         retry_delay: float = 2.0,
         state_sync_interval: int = 30,
+        sync_concurrency: int = 8,
+        sync_timeout: float = 3.0,
+        sync_spread: float = 1.0,
+        sync_jitter: float = 0.1,
     ):
         """
         Initialize production IoT controller.
@@ -112,14 +179,25 @@ class ProductionIoTController:
             data_dir: Directory for state persistence.
             auto_discover: Enable automatic device discovery.
             max_queue_size: Maximum commands in queue.
+            max_parallel_devices: Devices that may execute commands at once.
             retry_delay: Delay between retries in seconds.
             state_sync_interval: Interval for state synchronization.
+            sync_concurrency: Maximum devices polled at once during a sync.
+            sync_timeout: Per-device status deadline in seconds.
+            sync_spread: Window in seconds over which polls in a periodic
+                sync are randomly staggered.
+            sync_jitter: Fractional jitter applied to the sync interval.
         """
         self.shared_secret = shared_secret
         self.data_dir = data_dir or Path("data")
         self.max_queue_size = max_queue_size
+        self.max_parallel_devices = max(1, max_parallel_devices)
         self.retry_delay = retry_delay
         self.state_sync_interval = state_sync_interval
+        self.sync_concurrency = max(1, sync_concurrency)
+        self.sync_timeout = sync_timeout
+        self.sync_spread = sync_spread
+        self.sync_jitter = sync_jitter
         
         # Core controller
         self._controller = EnhancedESP32Controller(
@@ -127,15 +205,33 @@ class ProductionIoTController:
             auto_discover=auto_discover,
         )
         
-        # Command queue
-        self._command_queue: deque = deque(maxlen=max_queue_size)
+        # Command queue: one priority heap of (-priority, seq, command) per
+        # device, drained by at most one worker per device so per-device
+        # ordering holds while different devices run in parallel
+        self._pending: Dict[str, List[Tuple[int, int, QueuedCommand]]] = {}
+        self._coalesce_index: Dict[Tuple[Any, ...], QueuedCommand] = {}
+        self._active_devices: Set[str] = set()
+        self._workers: Set[asyncio.Task] = set()
+        self._queue_lock = threading.RLock()
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._processing = False
         self._queue_task: Optional[asyncio.Task] = None
         
+        # Command metrics
+        self._command_latency = LatencyHistogram()
+        self._command_stats = {"executed": 0, "failed": 0, "retried": 0, "coalesced": 0, "dropped": 0}
+        
         # State cache
         self._state_cache: Dict[str, DeviceStateCache] = {}
         self._sync_task: Optional[asyncio.Task] = None
         
+        # Sync metrics
+        self._sync_wall_time = LatencyHistogram()
+        self._device_rtt: Dict[str, LatencyHistogram] = {}
+        self._last_sync: Dict[str, Any] = {}
+        
         # Offline command storage
         self._offline_commands: List[QueuedCommand] = []
         
@@ -256,10 +352,14 @@ class ProductionIoTController:
         method: str = "POST",
         priority: CommandPriority = CommandPriority.NORMAL,
         callback: Optional[Callable[[CommandResult], None]] = None,
+        coalesce: bool = False,
     ) -> bool:
         """
         Queue a command for execution.
         
+        Commands for one device run in priority order, oldest first.
+        Safe to call from any thread.
+        
         Args:
             device_id: Target device ID.
             endpoint: API endpoint.
@@ -267,14 +367,14 @@ class ProductionIoTController:
             method: HTTP method.
             priority: Command priority.
             callback: Callback for result.
+            coalesce: The command sets state, so a newer one for the same
+                device, endpoint, method and target (pin, led, relay, ...)
+                supersedes it while pending (on→off→on runs once as "on").
+                Toggles are never coalesced.
             
         Returns:
             True if queued successfully.
         """
-        if len(self._command_queue) >= self.max_queue_size:
-            logger.warning("Command queue full, dropping oldest command")
-            self._command_queue.popleft()
-        
         command = QueuedCommand(
             device_id=device_id,
             endpoint=endpoint,
@@ -282,38 +382,172 @@ class ProductionIoTController:
             method=method,
             priority=priority,
             callback=callback,
+            coalesce=coalesce and not (data and "toggle" in data.values()),
         )
         
-        # Insert by priority
-        inserted = False
-        for i, existing in enumerate(self._command_queue):
-            if command.priority.value > existing.priority.value:
-                self._command_queue.insert(i, command)
-                inserted = True
-                break
-        
-        if not inserted:
-            self._command_queue.append(command)
-        
+        self._enqueue(command)
         logger.debug(f"Queued command for {device_id}: {endpoint}")
         return True
     
+    @property
+    def queued_count(self) -> int:
+        """Number of commands waiting to execute."""
+        with self._queue_lock:
+            return sum(len(heap) for heap in self._pending.values())
+    
+    def _enqueue(self, command: QueuedCommand) -> None:
+        """Add a command to its device heap, coalescing if possible."""
+        with self._queue_lock:
+            key = command.coalesce_key
+            existing = self._coalesce_index.get(key) if key else None
+            
+            if existing is not None:
+                self._supersede(existing, command)
+            else:
+                if sum(len(heap) for heap in self._pending.values()) >= self.max_queue_size:
+                    self._drop_one()
+                
+                heap = self._pending.setdefault(command.device_id, [])
+                heapq.heappush(heap, (-command.priority.value, next(self._seq), command))
+                if key:
+                    self._coalesce_index[key] = command
+        
+        self._wake()
+    
+    def _supersede(self, existing: QueuedCommand, command: QueuedCommand) -> None:
+        """Fold a newer command into a pending one. Caller holds the lock."""
+        if existing.callback:
+            existing.merged_callbacks.append(existing.callback)
+        existing.callback = command.callback
+        existing.data = command.data
+        existing.retry_count = 0
+        self._command_stats["coalesced"] += 1
+        
+        if command.priority.value > existing.priority.value:
+            existing.priority = command.priority
+            heap = self._pending[existing.device_id]
+            heap[:] = [
+                (-cmd.priority.value, seq, cmd) for _, seq, cmd in heap
+            ]
+            heapq.heapify(heap)
+    
+    def _drop_one(self) -> None:
+        """Drop the oldest lowest-priority pending command. Caller holds the lock."""
+        victim = None
+        for device_id, heap in self._pending.items():
+            for entry in heap:
+                if victim is None or (entry[0], -entry[1]) > (victim[1][0], -victim[1][1]):
+                    victim = (device_id, entry)
+        if victim is None:
+            return
+        
+        device_id, entry = victim
+        heap = self._pending[device_id]
+        heap.remove(entry)
+        heapq.heapify(heap)
+        command = entry[2]
+        if command.coalesce_key:
+            self._coalesce_index.pop(command.coalesce_key, None)
+        
+        self._command_stats["dropped"] += 1
+        logger.warning(f"Command queue full, dropped {command.endpoint} for {device_id}")
+        self._finish(command, CommandResult(False, "Dropped: command queue full"), record=False)
+    
+    def _wake(self) -> None:
+        """Wake the dispatcher from any thread."""
+        if self._wakeup is None or self._loop is None or self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+    
+    def _finish(
+        self,
+        command: QueuedCommand,
+        result: CommandResult,
+        record: bool = True,
+    ) -> None:
+        """Deliver a final result to every callback folded into a command."""
+        if record:
+            self._command_latency.record((time.time() - command.created_at) * 1000)
+            self._command_stats["executed" if result.success else "failed"] += 1
+        
+        for callback in [*command.merged_callbacks, command.callback]:
+            if callback:
+                try:
+                    callback(result)
+                except Exception as e:
+                    logger.error(f"Command callback error: {e}")
+    
     async def _process_queue(self) -> None:
-        """Process command queue."""
+        """
+        Dispatch pending commands to per-device workers.
+        
+        Sleeps on an event until commands arrive; devices are started in
+        order of their highest-priority pending command.
+        """
         while self._processing:
-            if not self._command_queue:
-                await asyncio.sleep(0.1)
-                continue
+            await self._wakeup.wait()
+            self._wakeup.clear()
             
-            command = self._command_queue.popleft()
+            with self._queue_lock:
+                ready = sorted(
+                    (heap[0][0], heap[0][1], device_id)
+                    for device_id, heap in self._pending.items()
+                    if heap and device_id not in self._active_devices
+                )
+                slots = self.max_parallel_devices - len(self._active_devices)
+                to_start = [device_id for _, _, device_id in ready[:max(0, slots)]]
+                self._active_devices.update(to_start)
             
+            for device_id in to_start:
+                task = asyncio.create_task(self._device_worker(device_id))
+                self._workers.add(task)
+                task.add_done_callback(self._workers.discard)
+    
+    def _next_command(self, device_id: str) -> Optional[QueuedCommand]:
+        """Pop the next command for a device, or release the device."""
+        with self._queue_lock:
+            heap = self._pending.get(device_id)
+            if not heap:
+                self._pending.pop(device_id, None)
+                self._active_devices.discard(device_id)
+                return None
+            
+            _, _, command = heapq.heappop(heap)
+            if command.coalesce_key and self._coalesce_index.get(command.coalesce_key) is command:
+                del self._coalesce_index[command.coalesce_key]
+            return command
+    
+    async def _device_worker(self, device_id: str) -> None:
+        """Execute one device's commands in order until its heap is empty."""
+        try:
+            while self._processing:
+                command = self._next_command(device_id)
+                if command is None:
+                    break
+                await self._execute_command(command)
+        finally:
+            with self._queue_lock:
+                self._active_devices.discard(device_id)
+            # Let the dispatcher start devices that were waiting for a slot
+            if self._wakeup is not None:
+                self._wakeup.set()
+    
+    async def _execute_command(self, command: QueuedCommand) -> None:
+        """Execute a command, retrying in place on failure."""
+        while True:
             # Check if device is online
             device = self.get_device(command.device_id)
             if not device:
                 logger.warning(f"Device not found: {command.device_id}")
-                if command.callback:
-                    command.callback(CommandResult(False, "Device not found"))
-                continue
+                self._finish(command, CommandResult(False, "Device not found"))
+                return
             
             if not device.is_online:
                 # Store for later if device is offline
@@ -323,11 +557,9 @@ class ProductionIoTController:
                     logger.info(f"Device offline, queued for retry: {command.device_id}")
                 else:
                     logger.warning(f"Max retries reached for offline device: {command.device_id}")
-                    if command.callback:
-                        command.callback(CommandResult(False, "Device offline"))
-                continue
+                    self._finish(command, CommandResult(False, "Device offline"))
+                return
             
-            # Execute command
             result = await self._controller.client.send_command(
                 device, command.endpoint, command.data, command.method
             )
@@ -335,25 +567,22 @@ class ProductionIoTController:
             if result.success:
                 # Update state cache
                 self._update_state_cache(command.device_id, command.endpoint, command.data, result)
-                
-                if command.callback:
-                    command.callback(result)
+                self._finish(command, result)
                 
                 if self._on_command_result:
                     self._on_command_result(command.device_id, result)
-            else:
-                # Retry on failure
-                if command.retry_count < command.max_retries:
-                    command.retry_count += 1
-                    self._command_queue.append(command)
-                    logger.info(f"Command failed, retrying ({command.retry_count}/{command.max_retries})")
-                    await asyncio.sleep(self.retry_delay)
-                else:
-                    logger.error(f"Command failed after {command.max_retries} retries: {result.message}")
-                    if command.callback:
-                        command.callback(result)
+                return
             
-            await asyncio.sleep(0.05)  # Small delay between commands
+            # Retry on failure; only this device waits
+            if command.retry_count < command.max_retries:
+                command.retry_count += 1
+                self._command_stats["retried"] += 1
+                logger.info(f"Command failed, retrying ({command.retry_count}/{command.max_retries})")
+                await asyncio.sleep(self.retry_delay)
+            else:
+                logger.error(f"Command failed after {command.max_retries} retries: {result.message}")
+                self._finish(command, result)
+                return
     
     def _update_state_cache(
         self,
@@ -361,6 +590,7 @@ class ProductionIoTController:
         endpoint: str,
         data: Optional[Dict],
         result: CommandResult,
+        persist: bool = True,
     ) -> None:
         """Update state cache after command."""
         if device_id not in self._state_cache:
@@ -396,7 +626,8 @@ class ProductionIoTController:
             self._on_state_change(device_id, cache.state)
         
         # Persist state
-        self._save_state()
+        if persist:
+            self._save_state()
     
     # =========================================================================
     # High-Level Commands
@@ -452,7 +683,7 @@ class ProductionIoTController:
         self._update_state_cache(device_id, "/door", {"action": "lock"}, result)
         return result
     
-    async def get_device_status(self, device_id: str) -> CommandResult:
+    async def get_device_status(self, device_id: str, persist: bool = True) -> CommandResult:
         """Get device status."""
         device = self.get_device(device_id)
         if not device:
@@ -461,7 +692,7 @@ class ProductionIoTController:
         result = await self._controller.client.send_command(device, "/status", method="GET")
         
         if result.success:
-            self._update_state_cache(device_id, "/status", None, result)
+            self._update_state_cache(device_id, "/status", None, result, persist=persist)
         
         return result
     
@@ -469,45 +700,117 @@ class ProductionIoTController:
     # State Synchronization
     # =========================================================================
     
-    async def sync_all_devices(self) -> Dict[str, bool]:
+    async def _sync_device(
+        self,
+        device: DeviceInfo,
+        semaphore: asyncio.Semaphore,
+        delay: float,
+    ) -> Tuple[bool, bool]:
         """
-        Synchronize state with all devices.
+        Poll one device within the sync deadline.
         
         Returns:
-            Dict mapping device_id to sync success.
+            Tuple of (success, timed_out).
         """
-        results = {}
+        if delay > 0:
+            await asyncio.sleep(delay)
         
-        for device in self.get_all_devices():
+        timed_out = False
+        async with semaphore:
+            start = time.perf_counter()
             try:
-                result = await self.get_device_status(device.device_id)
-                results[device.device_id] = result.success
-                
-                if result.success:
-                    device.state = DeviceState.ONLINE
-                    device.last_seen = time.time()
-                    
-                    if self._on_device_online:
-                        self._on_device_online(device)
-                else:
-                    if device.state == DeviceState.ONLINE:
-                        device.state = DeviceState.OFFLINE
-                        if self._on_device_offline:
-                            self._on_device_offline(device)
-                            
+                result = await asyncio.wait_for(
+                    self.get_device_status(device.device_id, persist=False),
+                    timeout=self.sync_timeout,
+                )
+                success = result.success
+            except asyncio.TimeoutError:
+                success, timed_out = False, True
+                logger.debug(f"Sync timed out for {device.device_id}")
             except Exception as e:
                 logger.error(f"Sync failed for {device.device_id}: {e}")
-                results[device.device_id] = False
+                success = False
+            
+            self._device_rtt.setdefault(device.device_id, LatencyHistogram()).record(
+                (time.perf_counter() - start) * 1000
+            )
+        
+        if success:
+            device.state = DeviceState.ONLINE
+            device.last_seen = time.time()
+            
+            if self._on_device_online:
+                self._on_device_online(device)
+        elif device.state == DeviceState.ONLINE:
+            device.state = DeviceState.OFFLINE
+            if self._on_device_offline:
+                self._on_device_offline(device)
+        
+        return success, timed_out
+    
+    async def sync_all_devices(self, spread: float = 0.0) -> Dict[str, bool]:
+        """
+        Synchronize state with all devices.
+        
+        Devices are polled concurrently (at most ``sync_concurrency`` at a
+        time), each bounded by ``sync_timeout`` so one unreachable device
+        cannot hold up the sweep. State is persisted once at the end.
+        
+        Args:
+            spread: Randomly stagger poll start times over this many seconds.
+        
+        Returns:
+            Dict mapping device_id to sync success.
+        """
+        devices = self.get_all_devices()
+        if not devices:
+            return {}
+        
+        semaphore = asyncio.Semaphore(self.sync_concurrency)
+        start = time.perf_counter()
+        
+        outcomes = await asyncio.gather(*(
+            self._sync_device(
+                device,
+                semaphore,
+                random.uniform(0, spread) if spread > 0 else 0.0,
+            )
+            for device in devices
+        ))
+        
+        wall_ms = (time.perf_counter() - start) * 1000
+        self._sync_wall_time.record(wall_ms)
+        self._save_state()
+        
+        results = {
+            device.device_id: success
+            for device, (success, _) in zip(devices, outcomes)
+        }
+        self._last_sync = {
+            "timestamp": time.time(),
+            "wall_time_ms": round(wall_ms, 1),
+            "devices": len(devices),
+            "succeeded": sum(1 for success, _ in outcomes if success),
+            "timed_out": sum(1 for _, timed_out in outcomes if timed_out),
+            "overran_interval": wall_ms / 1000 > self.state_sync_interval,
+        }
+        
+        if self._last_sync["overran_interval"]:
+            logger.warning(
+                f"Device sync took {wall_ms / 1000:.1f}s, "
+                f"longer than the {self.state_sync_interval}s sync interval"
+            )
         
         return results
     
     async def _sync_loop(self) -> None:
         """Periodic state synchronization loop."""
         while self._processing:
-            await asyncio.sleep(self.state_sync_interval)
+            jitter = self.state_sync_interval * self.sync_jitter
+            await asyncio.sleep(self.state_sync_interval + random.uniform(-jitter, jitter))
             
             try:
-                await self.sync_all_devices()
+                await self.sync_all_devices(spread=self.sync_spread)
                 
                 # Retry offline commands
                 if self._offline_commands:
@@ -517,7 +820,7 @@ class ProductionIoTController:
                     for cmd in commands_to_retry:
                         device = self.get_device(cmd.device_id)
                         if device and device.is_online:
-                            self._command_queue.append(cmd)
+                            self._enqueue(cmd)
                             
             except Exception as e:
                 logger.error(f"Sync loop error: {e}")
@@ -532,6 +835,10 @@ class ProductionIoTController:
             return
         
         self._processing = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        if self.queued_count:
+            self._wakeup.set()
         
         # Start command queue processor
         self._queue_task = asyncio.create_task(self._process_queue())
@@ -555,6 +862,14 @@ class ProductionIoTController:
             except asyncio.CancelledError:
                 pass
         
+        for task in list(self._workers):
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._active_devices.clear()
+        self._wakeup = None
+        self._loop = None
+        
         if self._sync_task:
             self._sync_task.cancel()
             try:
@@ -591,8 +906,21 @@ class ProductionIoTController:
             "total_devices": len(devices),
             "online_devices": len(online),
             "offline_devices": len(devices) - len(online),
-            "queued_commands": len(self._command_queue),
+            "queued_commands": self.queued_count,
             "offline_commands": len(self._offline_commands),
+            "commands": {
+                **self._command_stats,
+                "active_devices": len(self._active_devices),
+                "latency": self._command_latency.to_dict(),
+            },
+            "sync": {
+                "last": self._last_sync,
+                "wall_time": self._sync_wall_time.to_dict(),
+                "device_rtt": {
+                    device_id: hist.to_dict()
+                    for device_id, hist in self._device_rtt.items()
+                },
+            },
             "devices": [
                 {
                     "id": d.device_id,
@@ -120,6 +120,10 @@ class Jarvis:
                     "tolerance": auth_config.face_recognition.tolerance,
                     "model": auth_config.face_recognition.model,
                     "num_jitters": auth_config.face_recognition.num_jitters,
+                    "detection_scale": auth_config.face_recognition.detection_scale,
+                    "reverify_frames": auth_config.face_recognition.reverify_frames,
+                    "match_reverify_frames": auth_config.face_recognition.match_reverify_frames,
+                    "reverify_iou": auth_config.face_recognition.reverify_iou,
                 },
                 voice_config={
                     "similarity_threshold": auth_config.voice_verification.similarity_threshold,
@@ -15,6 +15,7 @@ import asyncio
 import signal
 import sys
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -33,6 +34,9 @@ except ImportError:
 # Core imports
 from .core.config import config, env, ensure_directories, PROJECT_ROOT, DATA_DIR
 from .core.logger import setup_logging
+from .core.database import close_all_databases
+from .core.async_runtime import AsyncRuntime
+from .core.intent_index import IntentDispatcher
 from .core.llm_router import IntelligentLLMRouter, create_intelligent_router, TaskType
 
 # Performance Integration (Phase 5)
@@ -350,6 +354,7 @@ class JarvisUnified:
         self._auth_manager: Optional[AuthenticationManager] = None
         self._voice_pipeline: Optional[EnhancedVoicePipeline] = None
         self._tts: Optional[TextToSpeech] = None
+        self._speech_engine = None
         self._supervisor: Optional[SupervisorAgent] = None
         self._tool_registry: Optional[ToolRegistry] = None
         self._conversation_memory: Optional[ConversationMemory] = None
@@ -402,6 +407,34 @@ class JarvisUnified:
         self._current_user: Optional[str] = None
         self._current_language: str = "en"  # Multilingual support
         self._streaming_enabled = True  # Can be toggled
+        
+        # All async work (command handlers, API, Telegram, dashboard) runs on
+        # one persistent loop thread; see submit() and run_async()
+        self._runtime = AsyncRuntime(name="jarvis-async")
+        
+        # Commands are routed through a precompiled trigger index
+        # instead of trying every handler in turn
+        self._intents = self._build_intent_index()
+    
+    # =========================================================================
+    # Async Bridge
+    # =========================================================================
+    
+    def submit(self, coro) -> Future:
+        """
+        Schedule a coroutine on JARVIS's background event loop.
+        
+        The loop lives as long as JARVIS, so clients and tasks created by
+        async code (HTTP connection pools, servers) are reused across calls.
+        
+        Returns:
+            concurrent.futures.Future with the coroutine's result.
+        """
+        return self._runtime.submit(coro)
+    
+    def run_async(self, coro, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background loop and wait for its result."""
+        return self._runtime.run(coro, timeout=timeout)
     
     # =========================================================================
     # Configuration Validation
@@ -534,6 +567,10 @@ class JarvisUnified:
                     "tolerance": auth_config.face_recognition.tolerance,
                     "model": auth_config.face_recognition.model,
                     "num_jitters": auth_config.face_recognition.num_jitters,
+                    "detection_scale": auth_config.face_recognition.detection_scale,
+                    "reverify_frames": auth_config.face_recognition.reverify_frames,
+                    "match_reverify_frames": auth_config.face_recognition.match_reverify_frames,
+                    "reverify_iou": auth_config.face_recognition.reverify_iou,
                 },
                 voice_config={
                     "similarity_threshold": auth_config.voice_verification.similarity_threshold,
@@ -571,12 +608,35 @@ class JarvisUnified:
             
             voice_config = self._config.voice
             
+            # Shared cache of synthesized audio for repeated phrases
+            tts_cache = None
+            cache_config = voice_config.text_to_speech.cache
+            if cache_config.enabled:
+                try:
+                    from .voice.tts_cache import get_tts_cache
+                    tts_cache = get_tts_cache(
+                        cache_dir=DATA_DIR / "cache" / "tts",
+                        max_size_mb=cache_config.max_size_mb,
+                        warm_count=cache_config.warm_count,
+                        max_text_length=cache_config.max_text_length,
+                    )
+                except Exception as e:
+                    logger.warning(f"TTS cache unavailable: {e}")
+            
             # Initialize TTS separately for direct access
             self._tts = TextToSpeech(
                 voice=voice_config.text_to_speech.voice,
                 rate=voice_config.text_to_speech.rate,
+                cache=tts_cache,
             )
             
+            # Replies are spoken sentence by sentence, synthesizing ahead
+            try:
+                self._speech_engine = self._tts.create_speech_engine()
+            except Exception as e:
+                logger.warning(f"Pipelined speech unavailable: {e}")
+                self._speech_engine = None
+            
             # Create enhanced pipeline with dict configs
             self._voice_pipeline = EnhancedVoicePipeline(
                 wake_word_config={
@@ -589,14 +649,24 @@ class JarvisUnified:
                     "model": voice_config.speech_to_text.model,
                     "device": voice_config.speech_to_text.device,
                     "language": voice_config.speech_to_text.language,
+                    "streaming": voice_config.speech_to_text.streaming,
+                    "latency_budget": voice_config.speech_to_text.latency_budget,
                 },
                 tts_config={
                     "engine": voice_config.text_to_speech.engine,
                     "voice": voice_config.text_to_speech.voice,
                     "rate": voice_config.text_to_speech.rate,
+                    "cache": tts_cache,
                 },
                 conversation_timeout=30.0,  # Stay listening for 30s
                 groq_api_key=self._env.groq_api_key,
+                capture_config={
+                    "input_device": voice_config.audio.input_device,
+                    "buffer_seconds": voice_config.audio.buffer_seconds,
+                    "pre_roll": voice_config.audio.pre_roll,
+                },
+                speech_engine=self._speech_engine,
+                runtime=self._runtime,
             )
             
             # Set callbacks
@@ -656,12 +726,33 @@ class JarvisUnified:
             # Initialize memory for context engineering
             self._init_memory()
             
+            # Local router that learns from the supervisor's LLM decisions
+            supervisor_config = self._config.agents.supervisor
+            router = None
+            if supervisor_config.fast_routing:
+                try:
+                    from .agents.routing import EmbeddingRouter
+                    router = EmbeddingRouter(
+                        db_path=DATA_DIR / "routing.db",
+                        threshold=supervisor_config.routing_threshold or 0.75,
+                    )
+                except Exception as e:
+                    logger.warning(f"Fast routing disabled: {e}")
+            
             # Use enhanced supervisor with context engineering
             self._supervisor = EnhancedSupervisorAgent(
                 llm_manager=llm,
                 agents=agents,
-                max_iterations=self._config.agents.supervisor.max_iterations or 10,
+                max_iterations=supervisor_config.max_iterations or 10,
                 memory_store=self._vector_memory,  # For long-term recall
+                router=router,
+                parallel=supervisor_config.parallel_agents is not False,
+                agent_timeout=supervisor_config.timeout or 30,
+                agent_timeouts={
+                    name: agent_config.timeout
+                    for name, agent_config in self._config.agents
+                    if name != "supervisor" and agent_config.timeout
+                },
             )
             
             logger.info(f"Initialized enhanced supervisor with {len(agents)} specialized agents")
@@ -793,6 +884,12 @@ class JarvisUnified:
             'arxiv': {
                 'enabled': getattr(getattr(academic_config, 'arxiv', None), 'enabled', True),
             } if hasattr(academic_config, 'arxiv') else {},
+            'briefing': {
+                'morning_time': getattr(getattr(academic_config, 'briefing', None), 'morning_time', None),
+                'section_timeout': getattr(getattr(academic_config, 'briefing', None), 'section_timeout', 2.0),
+                'cache_ttl': getattr(getattr(academic_config, 'briefing', None), 'cache_ttl', 900),
+                'precompute_lead_minutes': getattr(getattr(academic_config, 'briefing', None), 'precompute_lead_minutes', 10),
+            } if hasattr(academic_config, 'briefing') else {},
         }
         
         self._academic = AcademicManager(
@@ -1019,7 +1116,7 @@ class JarvisUnified:
         """Handle research progress updates."""
         logger.info(f"Research: {message}")
         if self._tts and "complete" in message.lower():
-            asyncio.create_task(self._speak_async(message))
+            self.submit(self._speak_async(message))
     
     def _init_scholarship(self) -> None:
         """Initialize scholarship features (Essay Generation, Application Tracking)."""
@@ -1083,14 +1180,14 @@ class JarvisUnified:
         """Handle break reminder."""
         logger.info(f"Break reminder: {message}")
         if self._tts:
-            asyncio.create_task(self._speak_async(message))
+            self.submit(self._speak_async(message))
     
     def _on_pomodoro_end(self, message: str) -> None:
         """Handle pomodoro timer completion."""
         logger.info(f"Pomodoro: {message}")
         # Speak the message if TTS is available
         if self._tts:
-            asyncio.create_task(self._speak_async(message))
+            self.submit(self._speak_async(message))
     
     def _on_pomodoro_music(self, playlist: str) -> str:
         """Play music when Pomodoro starts with music request."""
@@ -1155,12 +1252,17 @@ class JarvisUnified:
                 streaming_enabled=getattr(perf_config.streaming, 'enabled', True) if perf_config else True,
                 min_sentence_length=getattr(perf_config.streaming, 'min_sentence_length', 10) if perf_config else 10,
                 max_buffer_sentences=getattr(perf_config.streaming, 'max_buffer_sentences', 5) if perf_config else 5,
+                clause_min_length=getattr(perf_config.streaming, 'clause_min_length', 0) if perf_config else 0,
                 
                 # Caching
                 cache_enabled=getattr(cache_config, 'enabled', True) if cache_config else True,
                 cache_dir=DATA_DIR / "cache",
                 semantic_cache_enabled=getattr(cache_config.semantic, 'enabled', True) if cache_config else True,
                 semantic_threshold=getattr(cache_config.semantic, 'threshold', 0.92) if cache_config else 0.92,
+                semantic_model=getattr(cache_config.semantic, 'model', "all-MiniLM-L6-v2") if cache_config else "all-MiniLM-L6-v2",
+                semantic_cache_size=getattr(cache_config.semantic, 'cache_size', 1000) if cache_config else 1000,
+                semantic_ann_threshold=getattr(cache_config.semantic, 'ann_threshold', 20000) if cache_config else 20000,
+                semantic_persist=getattr(cache_config.semantic, 'persist', True) if cache_config else True,
                 
                 # Parallel
                 parallel_enabled=getattr(perf_config.parallel, 'enabled', True) if perf_config else True,
@@ -1401,45 +1503,11 @@ class JarvisUnified:
                 self._voice_pipeline.exit_conversation_mode()
             return "Alright, let me know if you need anything else."
         
-        # Communication commands (WhatsApp, contacts)
-        comm_result = self._handle_communication(text_lower, text)
-        if comm_result:
-            return comm_result
-        
-        # Quick Launch commands (open, play, add app/bookmark, list)
-        quick_launch_result = self._handle_quick_launch(text_lower, text)
-        if quick_launch_result:
-            return quick_launch_result
-        
-        # Academic commands (Canvas, Pomodoro, Notes, GitHub, arXiv, etc.)
-        academic_result = self._handle_academic(text_lower, text)
-        if academic_result:
-            return academic_result
-        
-        # Productivity commands (Music, Journal, Habits, Projects, etc.)
-        productivity_result = self._handle_productivity(text_lower, text)
-        if productivity_result:
-            return productivity_result
-        
-        # Career commands (Interview, Resume, Applications, Expense, etc.)
-        career_result = self._handle_career(text_lower, text)
-        if career_result:
-            return career_result
-        
-        # Finance commands (Stocks, Investment, Savings, Tax, Credit, etc.)
-        finance_result = self._handle_finance(text_lower, text)
-        if finance_result:
-            return finance_result
-        
-        # Research commands (Paper Writing, Scholarly Search, Citations)
-        research_result = self._handle_research(text_lower, text)
-        if research_result:
-            return research_result
-        
-        # Scholarship commands (Find scholarships, Generate essays, Track applications)
-        scholarship_result = self._handle_scholarship(text_lower, text)
-        if scholarship_result:
-            return scholarship_result
+        # Feature commands (communication, quick launch, academic, ...):
+        # only handlers whose trigger phrases occur in the text are tried
+        feature_result = self._intents.dispatch(text)
+        if feature_result:
+            return feature_result
         
         # Log command for prediction (Phase 5)
         if self._performance:
@@ -1456,8 +1524,7 @@ class JarvisUnified:
         
         if self._performance and PERFORMANCE_AVAILABLE:
             # Use cached agent call
-            loop = asyncio.get_event_loop()
-            response = loop.run_until_complete(
+            response = self.run_async(
                 self._process_command_async(query_with_context, supervisor)
             )
         else:
@@ -1474,8 +1541,7 @@ class JarvisUnified:
         # Define the agent call
         async def agent_call():
             # Run supervisor in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, supervisor.run_sync, text)
+            return await asyncio.to_thread(supervisor.run_sync, text)
         
         # Use cached agent call
         response = await self._performance.cached_agent_call(
@@ -1894,21 +1960,42 @@ I can help you with academics, productivity, career, finance, and more!
         }
         return instructions.get(language, "Respond in the same language as the user's query.")
     
+    def _build_intent_index(self) -> IntentDispatcher:
+        """
+        Compile the feature command routes.
+        
+        Trigger phrases come from each manager's COMMAND_TRIGGERS. Routes
+        are tried in registration order, and only when one of their
+        triggers occurs in the command.
+        """
+        dispatcher = IntentDispatcher(runtime=self._runtime)
+        routes = [
+            ("communication", self._handle_communication, CommunicationRouter, 30.0),
+            ("quick_launch", self._handle_quick_launch, QuickLaunchManager, 30.0),
+            ("academic", self._handle_academic, AcademicManager, 30.0),
+            ("productivity", self._handle_productivity, ProductivityManager, 30.0),
+            ("career", self._handle_career, CareerManager, 30.0),
+            ("finance", self._handle_finance, FinanceManager, 30.0),
+            ("research", self._handle_research, ResearchManager, 120.0),  # Longer timeout for research
+            ("scholarship", self._handle_scholarship, ScholarshipManager, 60.0),
+        ]
+        for name, handler, manager_cls, timeout in routes:
+            if manager_cls is None:
+                continue
+            dispatcher.register_manager(name, handler, manager_cls, timeout=timeout)
+        
+        stats = dispatcher.get_stats()
+        logger.debug(
+            f"Intent index compiled: {len(dispatcher.routes)} routes, "
+            f"{stats['phrases']} phrases, {stats['states']} states"
+        )
+        return dispatcher
+    
     def _handle_communication(self, text_lower: str, text: str) -> Optional[str]:
         """Handle communication commands (WhatsApp, contacts)."""
         if not self._communication_router:
             return None
         
-        # Check if this is a communication-related command
-        comm_keywords = [
-            "whatsapp", "contact", "call", "message", "text",
-            "what's", "number", "phone", "add contact", "delete contact",
-            "list contacts", "my contacts",
-        ]
-        
-        if not any(kw in text_lower for kw in comm_keywords):
-            return None
-        
         # Route through communication router
         response, needs_confirmation = self._communication_router.handle_command(text)
         
@@ -2010,163 +2097,54 @@ I can help you with academics, productivity, career, finance, and more!
         
         return None
     
-    def _handle_academic(self, text_lower: str, text: str) -> Optional[str]:
+    async def _handle_academic(self, text_lower: str, text: str) -> Optional[str]:
         """Handle academic commands (Canvas, Pomodoro, Notes, GitHub, arXiv, etc.)."""
         if not self._academic:
             return None
         
-        # Run async handler in event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Create a new task if loop is already running
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._academic.handle_command(text)
-                    )
-                    return future.result(timeout=30)
-            else:
-                return loop.run_until_complete(self._academic.handle_command(text))
-        except Exception as e:
-            logger.error(f"Academic command error: {e}")
-            return None
+        return await self._academic.handle_command(text)
     
-    def _handle_productivity(self, text_lower: str, text: str) -> Optional[str]:
+    async def _handle_productivity(self, text_lower: str, text: str) -> Optional[str]:
         """Handle productivity commands (Music, Journal, Habits, Projects, etc.)."""
         if not self._productivity:
             return None
         
-        # Run async handler in event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._productivity.handle_command(text)
-                    )
-                    return future.result(timeout=30)
-            else:
-                return loop.run_until_complete(self._productivity.handle_command(text))
-        except Exception as e:
-            logger.error(f"Productivity command error: {e}")
-            return None
+        return await self._productivity.handle_command(text)
     
-    def _handle_career(self, text_lower: str, text: str) -> Optional[str]:
+    async def _handle_career(self, text_lower: str, text: str) -> Optional[str]:
         """Handle career commands (Interview, Resume, Applications, Expense, etc.)."""
         if not self._career:
             return None
         
-        # Run async handler in event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._career.handle_command(text)
-                    )
-                    return future.result(timeout=30)
-            else:
-                return loop.run_until_complete(self._career.handle_command(text))
-        except Exception as e:
-            logger.error(f"Career command error: {e}")
-            return None
+        return await self._career.handle_command(text)
     
-    def _handle_finance(self, text_lower: str, text: str) -> Optional[str]:
+    async def _handle_finance(self, text_lower: str, text: str) -> Optional[str]:
         """Handle finance commands (Stocks, Investment, Savings, Tax, Credit, etc.)."""
         if not self._finance:
             return None
         
-        # Run async handler in event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._finance.handle_command(text)
-                    )
-                    return future.result(timeout=30)
-            else:
-                return loop.run_until_complete(self._finance.handle_command(text))
-        except Exception as e:
-            logger.error(f"Finance command error: {e}")
-            return None
+        return await self._finance.handle_command(text)
     
-    def _handle_research(self, text_lower: str, text: str) -> Optional[str]:
+    async def _handle_research(self, text_lower: str, text: str) -> Optional[str]:
         """Handle research commands (Paper Writing, Scholarly Search, Citations)."""
         if not self._research:
             return None
         
-        # Check if this is a research command
-        research_patterns = [
-            "research paper", "write a paper", "write paper",
-            "find papers", "search for papers", "scholarly search",
-            "research projects", "resume my", "research status",
-            "citation", "cite", "bibliography", "works cited",
-            "apa format", "mla format", "chicago format", "ieee format",
-        ]
-        
-        if not any(p in text_lower for p in research_patterns):
-            return None
-        
-        # Run async handler in event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._research.handle_command(text)
-                    )
-                    return future.result(timeout=120)  # Longer timeout for research
-            else:
-                return loop.run_until_complete(self._research.handle_command(text))
-        except Exception as e:
-            logger.error(f"Research command error: {e}")
-            return None
+        return await self._research.handle_command(text)
     
-    def _handle_scholarship(self, text_lower: str, text: str) -> Optional[str]:
+    async def _handle_scholarship(self, text_lower: str, text: str) -> Optional[str]:
         """Handle scholarship commands (Discovery, Essay Generation, Application Tracking)."""
         if not self._scholarship:
             return None
         
-        # Check if this is a scholarship command
-        scholarship_patterns = [
-            "scholarship", "find scholarship", "search scholarship",
-            "scholarship due", "due soon", "application status",
-            "generate essay", "write essay", "essay for",
-            "mark submitted", "mark won", "mark lost",
-            "import essay", "import winning", "past essay",
-            "scholarship stats", "scholarship status",
-        ]
-        
-        if not any(p in text_lower for p in scholarship_patterns):
-            return None
-        
-        # Run async handler in event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        self._scholarship.handle_voice_command(text)
-                    )
-                    return future.result(timeout=60)
-            else:
-                return loop.run_until_complete(self._scholarship.handle_voice_command(text))
-        except Exception as e:
-            logger.error(f"Scholarship command error: {e}")
-            return None
+        return await self._scholarship.handle_voice_command(text)
+    
+    async def _speak_async(self, text: str) -> None:
+        """Speak text from the background loop without blocking it."""
+        if self._tts:
+            await asyncio.to_thread(self._tts.speak, text, blocking=True)
+        else:
+            logger.info(f"JARVIS: {text}")
     
     def say(self, text: str, blocking: bool = True) -> None:
         """Speak text."""
@@ -2278,33 +2256,34 @@ I can help you with academics, productivity, career, finance, and more!
             self.run_text_mode()
             return
         
-        # Start async components in background
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+        # Start async components on the background loop
         # Initialize performance integration (Phase 5)
         try:
-            loop.run_until_complete(self._init_performance())
+            self.run_async(self._init_performance())
         except Exception as e:
             logger.warning(f"Performance integration failed to start: {e}")
         
         # Initialize Telegram bot
         try:
-            loop.run_until_complete(self._init_telegram())
+            self.run_async(self._init_telegram())
         except Exception as e:
             logger.warning(f"Telegram bot failed to start: {e}")
         
         # Initialize Mobile API (Phase 6)
         try:
             api_port = getattr(getattr(self._config, 'api', None), 'port', 8000) or 8000
-            loop.run_until_complete(self._init_mobile_api(port=api_port))
+            self.run_async(self._init_mobile_api(port=api_port))
         except Exception as e:
             logger.warning(f"Mobile API failed to start: {e}")
         
+        # Refresh the morning briefing shortly before the usual wake time
+        if self._academic:
+            self.submit(self._academic.briefing.start_precompute())
+        
         # Main loop
         try:
             while self._running:
-                loop.run_until_complete(asyncio.sleep(0.1))
+                time.sleep(0.1)
         except KeyboardInterrupt:
             pass
         finally:
@@ -2343,20 +2322,22 @@ I can help you with academics, productivity, career, finance, and more!
         self._init_proactive()
         
         # Initialize performance integration (Phase 5)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            loop.run_until_complete(self._init_performance())
+            self.run_async(self._init_performance())
         except Exception as e:
             logger.warning(f"Performance integration failed to start: {e}")
         
         # Initialize Mobile API (Phase 6)
         try:
             api_port = getattr(getattr(self._config, 'api', None), 'port', 8000) or 8000
-            loop.run_until_complete(self._init_mobile_api(port=api_port))
+            self.run_async(self._init_mobile_api(port=api_port))
         except Exception as e:
             logger.warning(f"Mobile API failed to start: {e}")
         
+        # Refresh the morning briefing shortly before the usual wake time
+        if self._academic:
+            self.submit(self._academic.briefing.start_precompute())
+        
         self._startup_state = StartupState.READY
         
         print("\n" + "=" * 60)
@@ -2412,34 +2393,57 @@ I can help you with academics, productivity, career, finance, and more!
         # Stop performance integration (Phase 5)
         if self._performance:
             try:
-                asyncio.get_event_loop().run_until_complete(self._performance.stop())
+                self.run_async(self._performance.stop(), timeout=10)
             except Exception:
                 pass
         
         # Stop Mobile API (Phase 6)
         if self._api_server:
             try:
-                asyncio.get_event_loop().run_until_complete(self._stop_mobile_api())
+                self.run_async(self._stop_mobile_api(), timeout=10)
             except Exception:
                 pass
         
         # Close browser sessions
         if self._browser:
             try:
-                asyncio.get_event_loop().run_until_complete(self._browser.close())
+                self.run_async(self._browser.close(), timeout=10)
             except Exception:
                 pass
         
         # Stop Telegram bot
         if self._telegram_bot:
             try:
-                asyncio.get_event_loop().run_until_complete(self._telegram_bot.stop())
+                self.run_async(self._telegram_bot.stop(), timeout=10)
             except Exception:
                 pass
         
         # Stop IoT heartbeat
         if self._iot_controller:
             self._iot_controller.stop_heartbeat()
+
+        if self._academic:
+            self._academic.briefing.stop_precompute()
+        
+        # Close managers' HTTP clients on the loop they were created on
+        for manager in (self._academic, self._productivity, self._research):
+            if manager is not None:
+                try:
+                    self.run_async(manager.close(), timeout=5)
+                except Exception as e:
+                    logger.debug(f"Error closing {type(manager).__name__}: {e}")
+        
+        if self._speech_engine is not None:
+            try:
+                self.run_async(self._speech_engine.aclose(), timeout=5)
+            except Exception as e:
+                logger.debug(f"Error closing speech engine: {e}")
+        
+        # Stop the background event loop
+        self._runtime.stop()
+
+        # Flush queued writes and close pooled SQLite connections
+        close_all_databases()
         
         logger.info("JARVIS shutdown complete")
 
@@ -6,12 +6,19 @@ Detects and tracks user behavior patterns:
 - Time-based patterns (morning routine, etc.)
 - Command sequences
 - Topic preferences
+
+Queries are logged through a buffered queue and mined incrementally
+in the background.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
+import queue
 import sqlite3
+import threading
+import time
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -22,6 +29,9 @@ from enum import Enum
 from loguru import logger
 
 
+_STOP = object()  # Worker shutdown marker
+
+
 class PatternType(Enum):
     """Types of usage patterns."""
     TIME_BASED = "time_based"  # Morning routine, evening check
@@ -68,6 +78,17 @@ class QueryLog:
     duration_ms: int = 0
 
 
+@dataclass
+class _RollingStats:
+    """Per-user aggregates kept up to date as queries arrive."""
+    hour_intent: Counter = field(default_factory=Counter)  # (hour, intent) -> count
+    transitions: Dict[Tuple[str, str], float] = field(default_factory=dict)  # (prev, next) -> decayed count
+    last_intent: Optional[str] = None
+    last_time: Optional[float] = None  # Epoch seconds of the last query
+    since_analysis: int = 0
+    dirty_hours: set = field(default_factory=set)
+
+
 class PatternDetector:
     """
     Detects usage patterns from query history.
@@ -76,19 +97,49 @@ class PatternDetector:
     - Time-based routines
     - Common query sequences
     - Topic preferences
+    
+    Logging only enqueues the query. A background worker appends queued
+    queries to the log in batches and updates rolling aggregates (hour x
+    intent counts and time-decayed intent transition counts), so pattern
+    analysis reads the aggregates instead of rescanning the history.
     """
     
-    def __init__(self, db_path: str = "data/patterns.db"):
+    def __init__(
+        self,
+        db_path: str = "data/patterns.db",
+        analyze_every: int = 10,
+        sequence_half_life_days: float = 14.0,
+        max_pending: int = 10000,
+        batch_size: int = 200,
+    ):
         """
         Initialize pattern detector.
         
         Args:
             db_path: Path to SQLite database
+            analyze_every: Re-derive a user's patterns after this many queries
+            sequence_half_life_days: Half-life of query sequence counts
+            max_pending: Queries buffered before new ones are dropped
+            batch_size: Most queries written per transaction
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.analyze_every = analyze_every
+        self.sequence_half_life = sequence_half_life_days * 86400
+        self.batch_size = batch_size
         self._init_db()
         self._patterns_cache: Dict[str, List[UsagePattern]] = {}
+        
+        self._stats: Dict[str, _RollingStats] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._counters = {"logged": 0, "dropped": 0, "batches": 0, "analyses": 0}
+        self._last_batch_ms = 0.0
+        self._last_analysis_ms = 0.0
+        
+        self._worker = threading.Thread(target=self._worker_loop, name="pattern-miner", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
     
     def _init_db(self):
         """Initialize database schema."""
@@ -130,8 +181,79 @@ class PatternDetector:
                 ON query_log(user_id, timestamp)
             """)
             
+            # Rolling aggregates
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS hour_intent_counts (
+                    user_id TEXT,
+                    hour INTEGER,
+                    intent TEXT,
+                    count INTEGER,
+                    PRIMARY KEY (user_id, hour, intent)
+                )
+            """)
+            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS intent_transitions (
+                    user_id TEXT,
+                    prev_intent TEXT,
+                    next_intent TEXT,
+                    weight REAL,
+                    PRIMARY KEY (user_id, prev_intent, next_intent)
+                )
+            """)
+            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pattern_state (
+                    user_id TEXT PRIMARY KEY,
+                    last_intent TEXT,
+                    last_time REAL
+                )
+            """)
+            
             conn.commit()
     
+    def _load_stats(self):
+        """Load the rolling aggregates, rebuilding them from an older query log."""
+        with sqlite3.connect(self.db_path) as conn:
+            for user_id, last_intent, last_time in conn.execute(
+                "SELECT user_id, last_intent, last_time FROM pattern_state"
+            ):
+                self._stats[user_id] = _RollingStats(last_intent=last_intent, last_time=last_time)
+            
+            for user_id, hour, intent, count in conn.execute(
+                "SELECT user_id, hour, intent, count FROM hour_intent_counts"
+            ):
+                self._user_stats(user_id).hour_intent[(hour, intent)] = count
+            
+            for user_id, prev_intent, next_intent, weight in conn.execute(
+                "SELECT user_id, prev_intent, next_intent, weight FROM intent_transitions"
+            ):
+                self._user_stats(user_id).transitions[(prev_intent, next_intent)] = weight
+            
+            # Databases written before the aggregates existed: one replay of the log
+            missing = [
+                row[0] for row in conn.execute(
+                    "SELECT DISTINCT user_id FROM query_log "
+                    "WHERE user_id NOT IN (SELECT user_id FROM pattern_state)"
+                )
+            ]
+            for user_id in missing:
+                cursor = conn.execute("""
+                    SELECT user_id, intent, timestamp FROM query_log
+                    WHERE user_id = ?
+                    ORDER BY timestamp
+                """, (user_id,))
+                for _, intent, timestamp in cursor:
+                    self._update_stats(user_id, intent, datetime.fromisoformat(timestamp))
+                self._persist_stats(conn, [user_id])
+                logger.info(f"Rebuilt usage pattern aggregates for '{user_id}' from the query log")
+    
+    def _user_stats(self, user_id: str) -> _RollingStats:
+        stats = self._stats.get(user_id)
+        if stats is None:
+            stats = self._stats[user_id] = _RollingStats()
+        return stats
+    
     def log_query(
         self,
         query: str,
@@ -144,6 +266,9 @@ class PatternDetector:
         """
         Log a user query for pattern analysis.
         
+        The query is queued and written by the background worker, so
+        this returns immediately.
+        
         Args:
             query: User query text
             intent: Detected intent type
@@ -152,123 +277,232 @@ class PatternDetector:
             duration_ms: Response time in milliseconds
             user_id: User identifier
         """
+        row = (
+            user_id, query, intent, datetime.now().isoformat(),
+            response_type, int(success), duration_ms
+        )
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._counters["dropped"] += 1
+            logger.debug("Pattern log queue full, dropping query")
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every query logged so far is written and aggregated.
+        
+        Returns:
+            False if the worker did not catch up within the timeout
+        """
+        if not self._worker.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = 5.0):
+        """Write pending queries and stop the background worker."""
+        if self._worker.is_alive():
+            self._queue.put(_STOP)
+            self._worker.join(timeout)
+    
+    def _worker_loop(self):
+        """Append queued queries in batches and keep the aggregates current."""
+        try:
+            with self._lock:
+                self._load_stats()
+        except Exception as e:
+            logger.error(f"Failed to load usage pattern aggregates: {e}")
+        
+        while True:
+            item = self._queue.get()
+            batch, waiters, stop = [], [], False
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    self._process_batch(batch)
+                except Exception as e:
+                    logger.error(f"Pattern logging failed for {len(batch)} queries: {e}")
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+    
+    def _process_batch(self, batch: List[Tuple]):
+        """Write one batch of queries and fold it into the aggregates."""
+        start = time.perf_counter()
+        users = []
+        
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT INTO query_log (
                     user_id, query, intent, timestamp, response_type, success, duration_ms
                 ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user_id, query, intent, datetime.now().isoformat(),
-                response_type, int(success), duration_ms
-            ))
+            """, batch)
+            
+            with self._lock:
+                for user_id, _, intent, timestamp, *_ in batch:
+                    self._update_stats(user_id, intent, datetime.fromisoformat(timestamp))
+                    if user_id not in users:
+                        users.append(user_id)
+                self._persist_stats(conn, users)
             conn.commit()
         
-        # Trigger pattern analysis periodically
-        self._maybe_analyze_patterns(user_id)
+        self._counters["logged"] += len(batch)
+        self._counters["batches"] += 1
+        self._last_batch_ms = (time.perf_counter() - start) * 1000
+        
+        for user_id in users:
+            if self._stats[user_id].since_analysis >= self.analyze_every:
+                self.analyze_patterns(user_id)
     
-    def _maybe_analyze_patterns(self, user_id: str, threshold: int = 10):
-        """Analyze patterns if enough new queries."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT COUNT(*) FROM query_log WHERE user_id = ?
-            """, (user_id,))
-            count = cursor.fetchone()[0]
+    def _update_stats(self, user_id: str, intent: str, when: datetime):
+        """Fold one query into the user's rolling aggregates."""
+        stats = self._user_stats(user_id)
+        now = when.timestamp()
+        
+        stats.hour_intent[(when.hour, intent)] += 1
+        stats.dirty_hours.add((when.hour, intent))
+        
+        if stats.last_intent is not None:
+            # Decay every transition to `now`, then count this one
+            elapsed = max(0.0, now - stats.last_time)
+            if elapsed and self.sequence_half_life > 0:
+                decay = 0.5 ** (elapsed / self.sequence_half_life)
+                stats.transitions = {
+                    pair: weight * decay
+                    for pair, weight in stats.transitions.items()
+                    if weight * decay >= 0.01
+                }
+            pair = (stats.last_intent, intent)
+            stats.transitions[pair] = stats.transitions.get(pair, 0.0) + 1.0
+        
+        stats.last_intent = intent
+        stats.last_time = now
+        stats.since_analysis += 1
+    
+    def _persist_stats(self, conn: sqlite3.Connection, user_ids: List[str]):
+        """Write changed aggregates for the given users."""
+        for user_id in user_ids:
+            stats = self._stats[user_id]
+            conn.executemany(
+                "INSERT OR REPLACE INTO hour_intent_counts (user_id, hour, intent, count) VALUES (?, ?, ?, ?)",
+                [(user_id, hour, intent, stats.hour_intent[(hour, intent)]) for hour, intent in stats.dirty_hours],
+            )
+            stats.dirty_hours.clear()
             
-            if count % threshold == 0:
-                self.analyze_patterns(user_id)
+            # Every weight decays on each query, so the (small) table is rewritten
+            conn.execute("DELETE FROM intent_transitions WHERE user_id = ?", (user_id,))
+            conn.executemany(
+                "INSERT INTO intent_transitions (user_id, prev_intent, next_intent, weight) VALUES (?, ?, ?, ?)",
+                [(user_id, prev, nxt, weight) for (prev, nxt), weight in stats.transitions.items()],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO pattern_state (user_id, last_intent, last_time) VALUES (?, ?, ?)",
+                (user_id, stats.last_intent, stats.last_time),
+            )
     
     def analyze_patterns(self, user_id: str = "default") -> List[UsagePattern]:
         """
         Analyze query history to detect patterns.
         
+        Reads the rolling aggregates, so the cost does not grow with the
+        length of the history.
+        
         Args:
             user_id: User identifier
             
         Returns:
             List of detected patterns
         """
-        patterns = []
+        if threading.current_thread() is not self._worker:
+            self.flush()
         
-        # Analyze time-based patterns
-        patterns.extend(self._detect_time_patterns(user_id))
-        
-        # Analyze query sequences
-        patterns.extend(self._detect_sequence_patterns(user_id))
+        start = time.perf_counter()
+        patterns = []
         
-        # Analyze topic preferences
-        patterns.extend(self._detect_topic_patterns(user_id))
+        with self._lock:
+            # Analyze time-based patterns
+            patterns.extend(self._detect_time_patterns(user_id))
+            
+            # Analyze query sequences
+            patterns.extend(self._detect_sequence_patterns(user_id))
+            
+            # Analyze topic preferences
+            patterns.extend(self._detect_topic_patterns(user_id))
+            
+            self._user_stats(user_id).since_analysis = 0
         
         # Save patterns
-        for pattern in patterns:
-            self._save_pattern(pattern, user_id)
+        self._save_patterns(patterns, user_id)
         
         self._patterns_cache[user_id] = patterns
+        self._counters["analyses"] += 1
+        self._last_analysis_ms = (time.perf_counter() - start) * 1000
         return patterns
     
     def _detect_time_patterns(self, user_id: str) -> List[UsagePattern]:
         """Detect time-based usage patterns."""
         patterns = []
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Get queries by hour
-            cursor = conn.execute("""
-                SELECT 
-                    CAST(strftime('%H', timestamp) AS INTEGER) as hour,
-                    intent,
-                    COUNT(*) as count
-                FROM query_log
-                WHERE user_id = ?
-                GROUP BY hour, intent
-                HAVING count >= 3
-                ORDER BY count DESC
-            """, (user_id,))
-            
-            hour_intents = {}
-            for row in cursor.fetchall():
-                hour, intent, count = row
-                if hour not in hour_intents:
-                    hour_intents[hour] = []
-                hour_intents[hour].append((intent, count))
-            
-            # Detect morning routine (6-9 AM)
-            morning_intents = []
-            for hour in range(6, 10):
-                if hour in hour_intents:
-                    morning_intents.extend(hour_intents[hour])
-            
-            if morning_intents:
-                top_intents = [i[0] for i in sorted(morning_intents, key=lambda x: -x[1])[:3]]
-                if top_intents:
-                    patterns.append(UsagePattern(
-                        pattern_id=f"morning_routine_{user_id}",
-                        pattern_type=PatternType.TIME_BASED,
-                        description="Morning routine pattern",
-                        frequency=sum(i[1] for i in morning_intents),
-                        confidence=0.7,
-                        triggers=["morning", "wake up", "good morning"],
-                        actions=top_intents,
-                        time_window=(6, 9),
-                    ))
-            
-            # Detect evening routine (6-10 PM)
-            evening_intents = []
-            for hour in range(18, 23):
-                if hour in hour_intents:
-                    evening_intents.extend(hour_intents[hour])
-            
-            if evening_intents:
-                top_intents = [i[0] for i in sorted(evening_intents, key=lambda x: -x[1])[:3]]
-                if top_intents:
-                    patterns.append(UsagePattern(
-                        pattern_id=f"evening_routine_{user_id}",
-                        pattern_type=PatternType.TIME_BASED,
-                        description="Evening routine pattern",
-                        frequency=sum(i[1] for i in evening_intents),
-                        confidence=0.7,
-                        triggers=["evening", "night", "good evening"],
-                        actions=top_intents,
-                        time_window=(18, 22),
-                    ))
+        # Intents asked at least 3 times in an hour of the day
+        hour_intents: Dict[int, List[Tuple[str, int]]] = {}
+        for (hour, intent), count in self._user_stats(user_id).hour_intent.items():
+            if count >= 3:
+                hour_intents.setdefault(hour, []).append((intent, count))
+        
+        # Detect morning routine (6-9 AM)
+        morning_intents = []
+        for hour in range(6, 10):
+            if hour in hour_intents:
+                morning_intents.extend(hour_intents[hour])
+        
+        if morning_intents:
+            top_intents = [i[0] for i in sorted(morning_intents, key=lambda x: -x[1])[:3]]
+            if top_intents:
+                patterns.append(UsagePattern(
+                    pattern_id=f"morning_routine_{user_id}",
+                    pattern_type=PatternType.TIME_BASED,
+                    description="Morning routine pattern",
+                    frequency=sum(i[1] for i in morning_intents),
+                    confidence=0.7,
+                    triggers=["morning", "wake up", "good morning"],
+                    actions=top_intents,
+                    time_window=(6, 9),
+                ))
+        
+        # Detect evening routine (6-10 PM)
+        evening_intents = []
+        for hour in range(18, 23):
+            if hour in hour_intents:
+                evening_intents.extend(hour_intents[hour])
+        
+        if evening_intents:
+            top_intents = [i[0] for i in sorted(evening_intents, key=lambda x: -x[1])[:3]]
+            if top_intents:
+                patterns.append(UsagePattern(
+                    pattern_id=f"evening_routine_{user_id}",
+                    pattern_type=PatternType.TIME_BASED,
+                    description="Evening routine pattern",
+                    frequency=sum(i[1] for i in evening_intents),
+                    confidence=0.7,
+                    triggers=["evening", "night", "good evening"],
+                    actions=top_intents,
+                    time_window=(18, 22),
+                ))
         
         return patterns
     
@@ -276,36 +510,20 @@ class PatternDetector:
         """Detect query sequence patterns."""
         patterns = []
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Get recent queries in order
-            cursor = conn.execute("""
-                SELECT intent, timestamp FROM query_log
-                WHERE user_id = ?
-                ORDER BY timestamp DESC
-                LIMIT 100
-            """, (user_id,))
-            
-            intents = [row[0] for row in cursor.fetchall()]
-            
-            # Find common bigrams (two-query sequences)
-            bigrams = []
-            for i in range(len(intents) - 1):
-                bigrams.append((intents[i+1], intents[i]))  # Reversed for chronological order
-            
-            bigram_counts = Counter(bigrams)
-            
-            for bigram, count in bigram_counts.most_common(5):
-                if count >= 3:
-                    patterns.append(UsagePattern(
-                        pattern_id=f"sequence_{bigram[0]}_{bigram[1]}_{user_id}",
-                        pattern_type=PatternType.QUERY_SEQUENCE,
-                        description=f"Often asks {bigram[1]} after {bigram[0]}",
-                        frequency=count,
-                        confidence=min(0.9, count / 10),
-                        triggers=[bigram[0]],
-                        actions=[bigram[1]],
-                        metadata={"sequence": list(bigram)},
-                    ))
+        # Transition counts decay, so old habits fade out
+        transitions = self._user_stats(user_id).transitions
+        for bigram, weight in sorted(transitions.items(), key=lambda x: -x[1])[:5]:
+            if weight >= 3:
+                patterns.append(UsagePattern(
+                    pattern_id=f"sequence_{bigram[0]}_{bigram[1]}_{user_id}",
+                    pattern_type=PatternType.QUERY_SEQUENCE,
+                    description=f"Often asks {bigram[1]} after {bigram[0]}",
+                    frequency=round(weight),
+                    confidence=min(0.9, weight / 10),
+                    triggers=[bigram[0]],
+                    actions=[bigram[1]],
+                    metadata={"sequence": list(bigram), "weight": round(weight, 2)},
+                ))
         
         return patterns
     
@@ -313,50 +531,52 @@ class PatternDetector:
         """Detect topic preference patterns."""
         patterns = []
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Get intent frequencies
-            cursor = conn.execute("""
-                SELECT intent, COUNT(*) as count
-                FROM query_log
-                WHERE user_id = ?
-                GROUP BY intent
-                ORDER BY count DESC
-                LIMIT 10
-            """, (user_id,))
-            
-            total = 0
-            intent_counts = []
-            for row in cursor.fetchall():
-                intent_counts.append((row[0], row[1]))
-                total += row[1]
-            
-            # Create patterns for top topics
-            for intent, count in intent_counts[:5]:
-                if count >= 5:
-                    patterns.append(UsagePattern(
-                        pattern_id=f"topic_{intent}_{user_id}",
-                        pattern_type=PatternType.TOPIC_PREFERENCE,
-                        description=f"Frequently asks about {intent}",
-                        frequency=count,
-                        confidence=count / total if total > 0 else 0,
-                        triggers=[intent],
-                        actions=[],
-                        metadata={"percentage": round(count / total * 100, 1) if total > 0 else 0},
-                    ))
+        # Intent frequencies from the hour x intent counts
+        intent_totals: Counter = Counter()
+        for (_, intent), count in self._user_stats(user_id).hour_intent.items():
+            intent_totals[intent] += count
+        
+        intent_counts = intent_totals.most_common(10)
+        total = sum(count for _, count in intent_counts)
+        
+        # Create patterns for top topics
+        for intent, count in intent_counts[:5]:
+            if count >= 5:
+                patterns.append(UsagePattern(
+                    pattern_id=f"topic_{intent}_{user_id}",
+                    pattern_type=PatternType.TOPIC_PREFERENCE,
+                    description=f"Frequently asks about {intent}",
+                    frequency=count,
+                    confidence=count / total if total > 0 else 0,
+                    triggers=[intent],
+                    actions=[],
+                    metadata={"percentage": round(count / total * 100, 1) if total > 0 else 0},
+                ))
         
         return patterns
     
-    def _save_pattern(self, pattern: UsagePattern, user_id: str):
-        """Save pattern to database."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Logging queue and mining statistics."""
+        return {
+            **self._counters,
+            "pending": self._queue.qsize(),
+            "users": len(self._stats),
+            "last_batch_ms": round(self._last_batch_ms, 2),
+            "last_analysis_ms": round(self._last_analysis_ms, 2),
+        }
+    
+    def _save_patterns(self, patterns: List[UsagePattern], user_id: str):
+        """Save patterns to database."""
+        now = datetime.now().isoformat()
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT OR REPLACE INTO detected_patterns (
                     pattern_id, user_id, pattern_type, description,
                     frequency, confidence, triggers, actions,
                     time_window_start, time_window_end, last_triggered,
                     metadata, created_at, updated_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            """, [(
                 pattern.pattern_id, user_id, pattern.pattern_type.value,
                 pattern.description, pattern.frequency, pattern.confidence,
                 json.dumps(pattern.triggers), json.dumps(pattern.actions),
@@ -364,8 +584,8 @@ class PatternDetector:
                 pattern.time_window[1] if pattern.time_window else None,
                 pattern.last_triggered.isoformat() if pattern.last_triggered else None,
                 json.dumps(pattern.metadata),
-                datetime.now().isoformat(), datetime.now().isoformat()
-            ))
+                now, now
+            ) for pattern in patterns])
             conn.commit()
     
     def get_patterns(self, user_id: str = "default") -> List[UsagePattern]:
@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from ..core.context_budget import fit_messages, record_prompt
+
 
 @dataclass
 class Message:
@@ -82,6 +84,7 @@ class ConversationMemory:
     Features:
     - Configurable message limit
     - Sliding window for context management
+    - Optional token budget for context messages
     - Conversation summarization
     - Multiple conversation support
     """
@@ -91,6 +94,7 @@ class ConversationMemory:
         max_messages: int = 20,
         window_size: int = 10,
         llm_manager: Any = None,
+        max_context_tokens: Optional[int] = None,
     ):
         """
         Initialize conversation memory.
@@ -99,10 +103,13 @@ class ConversationMemory:
             max_messages: Maximum messages to store per conversation.
             window_size: Number of recent messages to include in context.
             llm_manager: LLM manager for summarization.
+            max_context_tokens: Token budget for context messages
+                (None: window only).
         """
         self.max_messages = max_messages
         self.window_size = window_size
         self.llm_manager = llm_manager
+        self.max_context_tokens = max_context_tokens
         
         self._conversations: Dict[str, Conversation] = {}
         self._active_conversation_id: Optional[str] = None
@@ -233,13 +240,18 @@ Summary:"""
         self,
         conversation_id: Optional[str] = None,
         include_summary: bool = True,
+        max_tokens: Optional[int] = None,
     ) -> List[Dict[str, str]]:
         """
         Get messages for LLM context.
         
+        With a token budget, the latest messages are kept first, then
+        the summary, then older messages while they fit.
+        
         Args:
             conversation_id: Conversation ID (uses active if not specified).
             include_summary: Include conversation summary as system message.
+            max_tokens: Token budget (default: max_context_tokens).
             
         Returns:
             List of message dictionaries for LLM.
@@ -270,6 +282,11 @@ Summary:"""
                 "content": msg.content,
             })
         
+        max_tokens = max_tokens or self.max_context_tokens
+        if max_tokens:
+            messages = fit_messages(messages, max_tokens)
+            record_prompt("conversation", messages)
+        
         return messages
     
     def clear_conversation(self, conversation_id: Optional[str] = None) -> bool:
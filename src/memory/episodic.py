@@ -8,8 +8,6 @@ and historical data using SQLite.
 from __future__ import annotations
 
 import json
-import sqlite3
-from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -38,21 +36,14 @@ class EpisodicMemory:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        from ..core.database import get_database
+        self._db = get_database(self.db_path)
+        
         self._init_database()
     
-    @contextmanager
     def _get_connection(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        """Get a pooled connection inside a transaction."""
+        return self._db.transaction()
     
     def _init_database(self) -> None:
         """Initialize database tables."""
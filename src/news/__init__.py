@@ -29,9 +29,19 @@ try:
         RedditAPI,
         DevToAPI,
         GoogleNewsRSS,
+        NewsHTTPClient,
+        SourceLatency,
         test_all_apis,
     )
     
+    from .pipeline import (
+        NewsSourceExecutor,
+        SourceTask,
+        SourceResult,
+        NearDuplicateDetector,
+        dedupe_articles,
+    )
+    
     from .manager import (
         NewsManager,
         NewsConfig,
@@ -63,7 +73,15 @@ __all__ = [
     "RedditAPI",
     "DevToAPI",
     "GoogleNewsRSS",
+    "NewsHTTPClient",
+    "SourceLatency",
     "test_all_apis",
+    # Pipeline
+    "NewsSourceExecutor",
+    "SourceTask",
+    "SourceResult",
+    "NearDuplicateDetector",
+    "dedupe_articles",
     # Manager
     "NewsManager",
     "NewsConfig",
@@ -4,13 +4,25 @@ News API integrations for JARVIS Smart News Module.
 Integrates with NewsAPI, HackerNews, Reddit, and Dev.to.
 """
 
+import asyncio
 import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 from loguru import logger
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from ..core.async_runtime import close_loop_bound
 from .models import (
     Article, NewsCategory, NewsSource,
     RedditPost, HackerNewsItem, DevToArticle,
@@ -18,6 +30,116 @@ from .models import (
 )
 
 
+@dataclass
+class SourceLatency:
+    """Rolling request latency for one news source."""
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    recent_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    
+    def record(self, elapsed_ms: float, ok: bool = True) -> None:
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent_ms.append(elapsed_ms)
+    
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.requests if self.requests else 0.0
+    
+    @property
+    def p95_ms(self) -> float:
+        if not self.recent_ms:
+            return 0.0
+        ordered = sorted(self.recent_ms)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.avg_ms, 1),
+            "p95_ms": round(self.p95_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class NewsHTTPClient:
+    """
+    Pooled HTTP client shared by all news sources.
+    
+    Holds one keep-alive ``httpx.AsyncClient`` (HTTP/2 when h2 is
+    installed) instead of opening a new client per request, and records
+    per-source latency. The client is recreated if it is used from a
+    different event loop than the one it was created on.
+    """
+    
+    def __init__(
+        self,
+        timeout: float = 30,
+        max_connections: int = 20,
+        http2: bool = True,
+    ):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.http2 = http2 and HTTP2_AVAILABLE
+        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.latency: Dict[str, SourceLatency] = {}
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=self.http2,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._loop)
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+    
+    async def get(self, source: str, url: str, **kwargs) -> httpx.Response:
+        """GET a URL, recording latency under ``source``."""
+        stats = self.latency.setdefault(source, SourceLatency())
+        start = time.perf_counter()
+        try:
+            client = await self._get_client()
+            response = await client.get(url, **kwargs)
+        except Exception:
+            stats.record((time.perf_counter() - start) * 1000, ok=False)
+            raise
+        stats.record(
+            (time.perf_counter() - start) * 1000,
+            ok=response.status_code < 400,
+        )
+        return response
+    
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency statistics per source."""
+        return {source: stats.to_dict() for source, stats in self.latency.items()}
+    
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None and not self._client.is_closed:
+            await close_loop_bound(self._client, self._loop)
+        self._client = None
+        self._loop = None
+
+
 class NewsAPI:
     """
     NewsAPI integration for headlines and articles.
@@ -28,8 +150,9 @@ class NewsAPI:
     
     BASE_URL = "https://newsapi.org/v2"
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http: Optional[NewsHTTPClient] = None):
         self.api_key = api_key or os.getenv("NEWS_API_KEY", "")
+        self.http = http or NewsHTTPClient()
     
     @property
     def is_configured(self) -> bool:
@@ -48,29 +171,29 @@ class NewsAPI:
             return []
         
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                params = {
-                    "apiKey": self.api_key,
-                    "category": category,
-                    "country": country,
-                    "pageSize": page_size,
-                }
-                
-                if query:
-                    params["q"] = query
-                
-                response = await client.get(
-                    f"{self.BASE_URL}/top-headlines",
-                    params=params,
-                )
+            params = {
+                "apiKey": self.api_key,
+                "category": category,
+                "country": country,
+                "pageSize": page_size,
+            }
+            
+            if query:
+                params["q"] = query
+            
+            response = await self.http.get(
+                "newsapi",
+                f"{self.BASE_URL}/top-headlines",
+                params=params,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return self._parse_articles(data.get("articles", []))
+            else:
+                logger.error(f"NewsAPI error: {response.status_code}")
+                return []
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_articles(data.get("articles", []))
-                else:
-                    logger.error(f"NewsAPI error: {response.status_code}")
-                    return []
-                    
         except Exception as e:
             logger.error(f"NewsAPI error: {e}")
             return []
@@ -87,29 +210,29 @@ class NewsAPI:
             return []
         
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                params = {
-                    "apiKey": self.api_key,
-                    "q": query,
-                    "sortBy": sort_by,
-                    "pageSize": page_size,
-                    "language": "en",
-                }
-                
-                if from_date:
-                    params["from"] = from_date.isoformat()
-                
-                response = await client.get(
-                    f"{self.BASE_URL}/everything",
-                    params=params,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_articles(data.get("articles", []))
-                
-                return []
-                
+            params = {
+                "apiKey": self.api_key,
+                "q": query,
+                "sortBy": sort_by,
+                "pageSize": page_size,
+                "language": "en",
+            }
+            
+            if from_date:
+                params["from"] = from_date.isoformat()
+            
+            response = await self.http.get(
+                "newsapi",
+                f"{self.BASE_URL}/everything",
+                params=params,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return self._parse_articles(data.get("articles", []))
+            
+            return []
+            
         except Exception as e:
             logger.error(f"NewsAPI search error: {e}")
             return []
@@ -154,70 +277,104 @@ class HackerNewsAPI:
     
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
     
+    def __init__(
+        self,
+        http: Optional[NewsHTTPClient] = None,
+        max_concurrency: int = 8,
+        item_cache_ttl: float = 300,
+    ):
+        self.http = http or NewsHTTPClient()
+        self.max_concurrency = max(1, max_concurrency)
+        self.item_cache_ttl = item_cache_ttl
+        
+        # Item cache keyed by HN id: (fetched_at, item or None for non-stories)
+        self._item_cache: Dict[int, Tuple[float, Optional[HackerNewsItem]]] = {}
+    
     async def get_top_stories(self, limit: int = 20) -> List[Article]:
         """Get top stories from Hacker News."""
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                # Get top story IDs
-                response = await client.get(f"{self.BASE_URL}/topstories.json")
-                
-                if response.status_code != 200:
-                    return []
-                
-                story_ids = response.json()[:limit]
-                
-                # Fetch each story
-                articles = []
-                for story_id in story_ids:
-                    item = await self._get_item(client, story_id)
-                    if item:
-                        articles.append(item.to_article())
-                
-                return articles
-                
-        except Exception as e:
-            logger.error(f"HackerNews error: {e}")
-            return []
+        return await self._get_stories("topstories", limit)
     
     async def get_best_stories(self, limit: int = 20) -> List[Article]:
         """Get best stories from Hacker News."""
+        return await self._get_stories("beststories", limit)
+    
+    async def _get_stories(self, listing: str, limit: int) -> List[Article]:
+        """Fetch a story listing and its items."""
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(f"{self.BASE_URL}/beststories.json")
-                
-                if response.status_code != 200:
-                    return []
-                
-                story_ids = response.json()[:limit]
-                
-                articles = []
-                for story_id in story_ids:
-                    item = await self._get_item(client, story_id)
-                    if item:
-                        articles.append(item.to_article())
-                
-                return articles
-                
+            response = await self.http.get(
+                "hackernews", f"{self.BASE_URL}/{listing}.json"
+            )
+            
+            if response.status_code != 200:
+                return []
+            
+            story_ids = response.json()[:limit]
+            items = await self.get_items(story_ids)
+            
+            return [item.to_article() for item in items if item]
+            
         except Exception as e:
             logger.error(f"HackerNews error: {e}")
             return []
     
-    async def _get_item(
-        self,
-        client: httpx.AsyncClient,
-        item_id: int,
-    ) -> Optional[HackerNewsItem]:
+    async def get_items(self, item_ids: Iterable[int]) -> List[Optional[HackerNewsItem]]:
+        """
+        Fetch several items concurrently.
+        
+        Cached items are returned without a request; the rest are fetched
+        with at most ``max_concurrency`` requests in flight.
+        
+        Returns:
+            Items in the same order as ``item_ids`` (None for misses).
+        """
+        item_ids = list(item_ids)
+        now = time.monotonic()
+        results: Dict[int, Optional[HackerNewsItem]] = {}
+        to_fetch: List[int] = []
+        
+        for item_id in item_ids:
+            cached = self._item_cache.get(item_id)
+            if cached and now - cached[0] < self.item_cache_ttl:
+                results[item_id] = cached[1]
+            elif item_id not in to_fetch:
+                to_fetch.append(item_id)
+        
+        if to_fetch:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async def fetch(item_id: int) -> None:
+                async with semaphore:
+                    results[item_id] = await self._get_item(item_id)
+            
+            await asyncio.gather(*(fetch(item_id) for item_id in to_fetch))
+            self._prune_cache(now)
+        
+        return [results.get(item_id) for item_id in item_ids]
+    
+    def _prune_cache(self, now: float) -> None:
+        """Drop expired cache entries."""
+        expired = [
+            item_id for item_id, (fetched_at, _) in self._item_cache.items()
+            if now - fetched_at >= self.item_cache_ttl
+        ]
+        for item_id in expired:
+            del self._item_cache[item_id]
+    
+    async def _get_item(self, item_id: int) -> Optional[HackerNewsItem]:
         """Get a single item."""
         try:
-            response = await client.get(f"{self.BASE_URL}/item/{item_id}.json")
+            response = await self.http.get(
+                "hackernews", f"{self.BASE_URL}/item/{item_id}.json"
+            )
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                if not data or data.get("type") != "story":
-                    return None
-                
-                return HackerNewsItem(
+            if response.status_code != 200:
+                return None
+            
+            data = response.json()
+            item = None
+            
+            if data and data.get("type") == "story":
+                item = HackerNewsItem(
                     id=data.get("id", 0),
                     title=data.get("title", ""),
                     url=data.get("url", ""),
@@ -229,7 +386,8 @@ class HackerNewsAPI:
                     type=data.get("type", "story"),
                 )
             
-            return None
+            self._item_cache[item_id] = (time.monotonic(), item)
+            return item
             
         except Exception as e:
             logger.debug(f"Error fetching HN item {item_id}: {e}")
@@ -245,7 +403,8 @@ class RedditAPI:
     
     BASE_URL = "https://www.reddit.com"
     
-    def __init__(self):
+    def __init__(self, http: Optional[NewsHTTPClient] = None):
+        self.http = http or NewsHTTPClient()
         self.headers = {
             "User-Agent": "JARVIS/1.0 (Personal Assistant)"
         }
@@ -258,40 +417,40 @@ class RedditAPI:
     ) -> List[Article]:
         """Get posts from a subreddit."""
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/r/{subreddit}/{sort}.json",
-                    params={"limit": limit},
-                    headers=self.headers,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    posts = data.get("data", {}).get("children", [])
-                    
-                    articles = []
-                    for post in posts:
-                        post_data = post.get("data", {})
-                        reddit_post = RedditPost(
-                            id=post_data.get("id", ""),
-                            title=post_data.get("title", ""),
-                            selftext=post_data.get("selftext", ""),
-                            url=post_data.get("url", ""),
-                            permalink=post_data.get("permalink", ""),
-                            subreddit=post_data.get("subreddit", ""),
-                            author=post_data.get("author", ""),
-                            score=post_data.get("score", 0),
-                            upvote_ratio=post_data.get("upvote_ratio", 0),
-                            num_comments=post_data.get("num_comments", 0),
-                            created_utc=datetime.fromtimestamp(post_data.get("created_utc", 0)),
-                            is_self=post_data.get("is_self", True),
-                        )
-                        articles.append(reddit_post.to_article())
-                    
-                    return articles
+            response = await self.http.get(
+                "reddit",
+                f"{self.BASE_URL}/r/{subreddit}/{sort}.json",
+                params={"limit": limit},
+                headers=self.headers,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                posts = data.get("data", {}).get("children", [])
                 
-                return []
+                articles = []
+                for post in posts:
+                    post_data = post.get("data", {})
+                    reddit_post = RedditPost(
+                        id=post_data.get("id", ""),
+                        title=post_data.get("title", ""),
+                        selftext=post_data.get("selftext", ""),
+                        url=post_data.get("url", ""),
+                        permalink=post_data.get("permalink", ""),
+                        subreddit=post_data.get("subreddit", ""),
+                        author=post_data.get("author", ""),
+                        score=post_data.get("score", 0),
+                        upvote_ratio=post_data.get("upvote_ratio", 0),
+                        num_comments=post_data.get("num_comments", 0),
+                        created_utc=datetime.fromtimestamp(post_data.get("created_utc", 0)),
+                        is_self=post_data.get("is_self", True),
+                    )
+                    articles.append(reddit_post.to_article())
                 
+                return articles
+            
+            return []
+            
         except Exception as e:
             logger.error(f"Reddit API error: {e}")
             return []
@@ -304,10 +463,11 @@ class RedditAPI:
         """Get posts from multiple subreddits."""
         subreddits = subreddits or SUBREDDITS
         
-        all_articles = []
-        for subreddit in subreddits:
-            articles = await self.get_subreddit_posts(subreddit, limit=limit_per_sub)
-            all_articles.extend(articles)
+        results = await asyncio.gather(*(
+            self.get_subreddit_posts(subreddit, limit=limit_per_sub)
+            for subreddit in subreddits
+        ))
+        all_articles = [article for articles in results for article in articles]
         
         # Sort by score
         all_articles.sort(key=lambda a: a.score, reverse=True)
@@ -325,6 +485,9 @@ class DevToAPI:
     
     BASE_URL = "https://dev.to/api"
     
+    def __init__(self, http: Optional[NewsHTTPClient] = None):
+        self.http = http or NewsHTTPClient()
+    
     async def get_articles(
         self,
         tag: Optional[str] = None,
@@ -333,25 +496,25 @@ class DevToAPI:
     ) -> List[Article]:
         """Get articles from Dev.to."""
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                params = {"per_page": per_page}
-                
-                if tag:
-                    params["tag"] = tag
-                if top:
-                    params["top"] = top  # Days (1, 7, 30, 365, infinity)
-                
-                response = await client.get(
-                    f"{self.BASE_URL}/articles",
-                    params=params,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_articles(data)
-                
-                return []
-                
+            params = {"per_page": per_page}
+            
+            if tag:
+                params["tag"] = tag
+            if top:
+                params["top"] = top  # Days (1, 7, 30, 365, infinity)
+            
+            response = await self.http.get(
+                "devto",
+                f"{self.BASE_URL}/articles",
+                params=params,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return self._parse_articles(data)
+            
+            return []
+            
         except Exception as e:
             logger.error(f"Dev.to API error: {e}")
             return []
@@ -399,39 +562,42 @@ class GoogleNewsRSS:
     
     BASE_URL = "https://news.google.com/rss"
     
+    def __init__(self, http: Optional[NewsHTTPClient] = None):
+        self.http = http or NewsHTTPClient()
+    
     async def search(self, query: str, limit: int = 10) -> List[Article]:
         """Search Google News."""
         try:
             import xml.etree.ElementTree as ET
             
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search",
-                    params={"q": query, "hl": "en-US", "gl": "US", "ceid": "US:en"},
-                )
+            response = await self.http.get(
+                "google_news",
+                f"{self.BASE_URL}/search",
+                params={"q": query, "hl": "en-US", "gl": "US", "ceid": "US:en"},
+            )
+            
+            if response.status_code == 200:
+                root = ET.fromstring(response.text)
                 
-                if response.status_code == 200:
-                    root = ET.fromstring(response.text)
-                    
-                    articles = []
-                    for item in root.findall(".//item")[:limit]:
-                        title = item.find("title")
-                        link = item.find("link")
-                        pub_date = item.find("pubDate")
-                        source = item.find("source")
-                        
-                        articles.append(Article(
-                            title=title.text if title is not None else "",
-                            url=link.text if link is not None else "",
-                            source=source.text if source is not None else "Google News",
-                            source_type=NewsSource.RSS,
-                            published_at=self._parse_date(pub_date.text) if pub_date is not None else None,
-                        ))
+                articles = []
+                for item in root.findall(".//item")[:limit]:
+                    title = item.find("title")
+                    link = item.find("link")
+                    pub_date = item.find("pubDate")
+                    source = item.find("source")
                     
-                    return articles
-                
-                return []
+                    articles.append(Article(
+                        title=title.text if title is not None else "",
+                        url=link.text if link is not None else "",
+                        source=source.text if source is not None else "Google News",
+                        source_type=NewsSource.RSS,
+                        published_at=self._parse_date(pub_date.text) if pub_date is not None else None,
+                    ))
                 
+                return articles
+            
+            return []
+            
         except Exception as e:
             logger.error(f"Google News RSS error: {e}")
             return []
@@ -448,9 +614,10 @@ class GoogleNewsRSS:
 async def test_all_apis() -> Dict[str, bool]:
     """Test all news APIs."""
     results = {}
+    http = NewsHTTPClient()
     
     # NewsAPI
-    newsapi = NewsAPI()
+    newsapi = NewsAPI(http=http)
     if newsapi.is_configured:
         articles = await newsapi.get_headlines(page_size=1)
         results["newsapi"] = len(articles) > 0
@@ -458,18 +625,19 @@ async def test_all_apis() -> Dict[str, bool]:
         results["newsapi"] = False
     
     # HackerNews
-    hn = HackerNewsAPI()
+    hn = HackerNewsAPI(http=http)
     articles = await hn.get_top_stories(limit=1)
     results["hackernews"] = len(articles) > 0
     
     # Reddit
-    reddit = RedditAPI()
+    reddit = RedditAPI(http=http)
     articles = await reddit.get_subreddit_posts("technology", limit=1)
     results["reddit"] = len(articles) > 0
     
     # Dev.to
-    devto = DevToAPI()
+    devto = DevToAPI(http=http)
     articles = await devto.get_articles(per_page=1)
     results["devto"] = len(articles) > 0
     
+    await http.aclose()
     return results
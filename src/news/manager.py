@@ -4,12 +4,11 @@ News Manager for JARVIS Smart News Module.
 Main orchestrator for personalized news, digests, and company tracking.
 """
 
+import asyncio
 import os
-import sqlite3
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from loguru import logger
 
@@ -19,8 +18,10 @@ from .models import (
     DEFAULT_INTERESTS, SUBREDDITS
 )
 from .apis import (
-    NewsAPI, HackerNewsAPI, RedditAPI, DevToAPI, GoogleNewsRSS
+    NewsAPI, HackerNewsAPI, RedditAPI, DevToAPI, GoogleNewsRSS,
+    NewsHTTPClient,
 )
+from .pipeline import NewsSourceExecutor, SourceTask, NearDuplicateDetector, dedupe_articles
 
 
 @dataclass
@@ -41,9 +42,23 @@ class NewsConfig:
     max_articles: int = 20
     digest_day: str = "sunday"
     
+    # Networking
+    max_concurrency: int = 8  # Concurrent item fetches per source
+    max_connections: int = 20  # Pooled connections shared by all sources
+    request_timeout: float = 30
+    http2: bool = True
+    hn_item_cache_ttl: int = 300  # Seconds to reuse fetched HN items
+    
+    # Pipeline
+    source_timeout: float = 8.0  # Per-source deadline in seconds
+    source_timeouts: Dict[str, float] = None  # Per-source overrides by task name
+    duplicate_threshold: float = 0.6  # Title shingle Jaccard for near-duplicates
+    
     def __post_init__(self):
         if self.interests is None:
             self.interests = DEFAULT_INTERESTS
+        if self.source_timeouts is None:
+            self.source_timeouts = {}
 
 
 class NewsManager:
@@ -67,12 +82,23 @@ class NewsManager:
         self.config = config or NewsConfig()
         self.llm_router = llm_router
         
-        # Initialize APIs
-        self.newsapi = NewsAPI()
-        self.hackernews = HackerNewsAPI()
-        self.reddit = RedditAPI()
-        self.devto = DevToAPI()
-        self.google_news = GoogleNewsRSS()
+        # Initialize APIs on one pooled client
+        self.http = NewsHTTPClient(
+            timeout=self.config.request_timeout,
+            max_connections=self.config.max_connections,
+            http2=self.config.http2,
+        )
+        self.newsapi = NewsAPI(http=self.http)
+        self.hackernews = HackerNewsAPI(
+            http=self.http,
+            max_concurrency=self.config.max_concurrency,
+            item_cache_ttl=self.config.hn_item_cache_ttl,
+        )
+        self.reddit = RedditAPI(http=self.http)
+        self.devto = DevToAPI(http=self.http)
+        self.google_news = GoogleNewsRSS(http=self.http)
+        
+        self.executor = NewsSourceExecutor(default_timeout=self.config.source_timeout)
         
         # Initialize database
         self._init_db()
@@ -81,12 +107,10 @@ class NewsManager:
     
     def _init_db(self):
         """Initialize SQLite database."""
-        Path(self.config.db_path).parent.mkdir(parents=True, exist_ok=True)
+        from ..core.database import get_database
         
-        conn = sqlite3.connect(self.config.db_path)
-        cursor = conn.cursor()
-        
-        cursor.executescript("""
+        self.db = get_database(self.config.db_path)
+        self.db.executescript("""
             CREATE TABLE IF NOT EXISTS saved_articles (
                 id TEXT PRIMARY KEY,
                 title TEXT,
@@ -124,79 +148,100 @@ class NewsManager:
             
             CREATE INDEX IF NOT EXISTS idx_saved_date ON saved_articles(saved_at);
         """)
-        
-        conn.commit()
-        conn.close()
     
     # =========================================================================
     # News Fetching
     # =========================================================================
     
-    async def get_tech_news(self, limit: int = 10) -> List[Article]:
-        """Get technology news from multiple sources."""
-        all_articles = []
+    def _source(self, name: str, fetch) -> SourceTask:
+        """Build a pipeline task with the configured deadline."""
+        return SourceTask(
+            name=name,
+            fetch=fetch,
+            timeout=self.config.source_timeouts.get(name),
+        )
+    
+    def _tech_sources(self, limit: int) -> List[SourceTask]:
+        sources = []
         
         # NewsAPI headlines
         if self.config.use_newsapi and self.newsapi.is_configured:
-            articles = await self.newsapi.get_headlines(
-                category="technology",
-                page_size=limit,
-            )
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "newsapi_tech",
+                lambda: self.newsapi.get_headlines(category="technology", page_size=limit),
+            ))
         
         # Hacker News
         if self.config.use_hackernews:
-            articles = await self.hackernews.get_top_stories(limit=limit)
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "hackernews",
+                lambda: self.hackernews.get_top_stories(limit=limit),
+            ))
         
-        # Rank and deduplicate
-        return self._rank_articles(all_articles)[:limit]
+        return sources
     
-    async def get_ai_news(self, limit: int = 10) -> List[Article]:
-        """Get AI/ML specific news."""
-        all_articles = []
+    def _ai_sources(self, limit: int) -> List[SourceTask]:
+        sources = []
         
         # Search NewsAPI for AI
         if self.newsapi.is_configured:
-            articles = await self.newsapi.search(
-                query="artificial intelligence OR machine learning OR GPT OR LLM",
-                from_date=datetime.now() - timedelta(days=7),
-                page_size=limit,
-            )
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "newsapi_ai",
+                lambda: self.newsapi.search(
+                    query="artificial intelligence OR machine learning OR GPT OR LLM",
+                    from_date=datetime.now() - timedelta(days=7),
+                    page_size=limit,
+                ),
+            ))
         
         # Reddit ML subreddit
         if self.config.use_reddit:
-            articles = await self.reddit.get_subreddit_posts(
-                "MachineLearning",
-                limit=limit,
-            )
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "reddit_machinelearning",
+                lambda: self.reddit.get_subreddit_posts("MachineLearning", limit=limit),
+            ))
         
         # Dev.to AI tag
         if self.config.use_devto:
-            articles = await self.devto.get_articles(tag="ai", per_page=limit)
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "devto_ai",
+                lambda: self.devto.get_articles(tag="ai", per_page=limit),
+            ))
+        
+        return sources
+    
+    async def get_tech_news(self, limit: int = 10) -> List[Article]:
+        """Get technology news from multiple sources."""
+        all_articles = await self.executor.gather(self._tech_sources(limit))
+        
+        # Rank and deduplicate
+        return self._rank_articles(all_articles)[:limit]
+    
+    async def get_ai_news(self, limit: int = 10) -> List[Article]:
+        """Get AI/ML specific news."""
+        all_articles = await self.executor.gather(self._ai_sources(limit))
         
         return self._rank_articles(all_articles)[:limit]
     
     async def get_data_science_news(self, limit: int = 10) -> List[Article]:
         """Get data science news."""
-        all_articles = []
+        sources = []
         
         # Reddit datascience
         if self.config.use_reddit:
-            articles = await self.reddit.get_subreddit_posts(
-                "datascience",
-                limit=limit,
-            )
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "reddit_datascience",
+                lambda: self.reddit.get_subreddit_posts("datascience", limit=limit),
+            ))
         
         # Dev.to datascience tag
         if self.config.use_devto:
-            articles = await self.devto.get_articles(tag="datascience", per_page=limit)
-            all_articles.extend(articles)
+            sources.append(self._source(
+                "devto_datascience",
+                lambda: self.devto.get_articles(tag="datascience", per_page=limit),
+            ))
         
+        all_articles = await self.executor.gather(sources)
         return self._rank_articles(all_articles)[:limit]
     
     async def get_reddit_top(
@@ -211,38 +256,59 @@ class NewsManager:
         """Get top Hacker News stories."""
         return await self.hackernews.get_top_stories(limit=limit)
     
-    async def get_personalized_feed(self, limit: int = 20) -> List[Article]:
-        """Get personalized news feed based on interests."""
-        all_articles = []
+    def _feed_sources(self) -> List[SourceTask]:
+        """Every source feeding the personalized feed, as independent tasks."""
+        sources = self._tech_sources(10) + self._ai_sources(10)
         
-        # Fetch from multiple sources
-        tasks = []
-        
-        # Tech news
-        tech = await self.get_tech_news(limit=10)
-        all_articles.extend(tech)
-        
-        # AI news
-        ai = await self.get_ai_news(limit=10)
-        all_articles.extend(ai)
-        
-        # Reddit aggregation
-        reddit = await self.reddit.get_multiple_subreddits(limit_per_sub=3)
-        all_articles.extend(reddit)
-        
-        # Rank by relevance to interests
-        ranked = self._rank_by_interests(all_articles)
-        
-        # Deduplicate
-        seen_titles = set()
-        unique = []
-        for article in ranked:
-            title_key = article.title.lower()[:50]
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
-                unique.append(article)
+        # Reddit aggregation, one task per subreddit
+        if self.config.use_reddit:
+            for subreddit in SUBREDDITS:
+                if subreddit == "MachineLearning":
+                    continue  # Already fetched as an AI source
+                sources.append(self._source(
+                    f"reddit_{subreddit.lower()}",
+                    lambda sub=subreddit: self.reddit.get_subreddit_posts(sub, limit=3),
+                ))
         
-        return unique[:limit]
+        return sources
+    
+    async def stream_personalized_feed(
+        self,
+        limit: int = 20,
+    ) -> AsyncIterator[List[Article]]:
+        """
+        Build the personalized feed incrementally.
+        
+        All sources run concurrently; after each one finishes its articles
+        are scored, merged through the near-duplicate detector, and the
+        current top ``limit`` articles are yielded.
+        
+        Yields:
+            Ranked feed snapshots, best first.
+        """
+        detector = NearDuplicateDetector(threshold=self.config.duplicate_threshold)
+        unique: List[Article] = []
+        
+        async for result in self.executor.stream(self._feed_sources()):
+            if not result.articles:
+                continue
+            
+            for article in result.articles:
+                article.relevance_score = self._interest_score(article)
+                idx, duplicate = detector.add(article.title, article.url)
+                if not duplicate:
+                    unique.append(article)
+                elif article.relevance_score > unique[idx].relevance_score:
+                    unique[idx] = article
+            
+            yield sorted(unique, key=lambda a: a.relevance_score, reverse=True)[:limit]
+    
+    async def get_personalized_feed(self, limit: int = 20) -> List[Article]:
+        """Get personalized news feed based on interests."""
+        feed: List[Article] = []
+        async for snapshot in self.stream_personalized_feed(limit=limit):
+            feed = snapshot
+        return feed
     
     def _rank_articles(self, articles: List[Article]) -> List[Article]:
         """Rank articles by score and recency."""
@@ -263,21 +329,25 @@ class NewsManager:
         
         return sorted(articles, key=lambda a: a.relevance_score, reverse=True)
     
+    def _interest_score(self, article: Article) -> float:
+        """Score an article by relevance to user interests."""
+        score = 0
+        text = f"{article.title} {article.description}".lower()
+        
+        for interest in self.config.interests:
+            for keyword in interest.keywords:
+                if keyword.lower() in text:
+                    score += interest.weight * 10
+        
+        # Add base engagement score
+        score += min(article.score / 10, 50)
+        
+        return score
+    
     def _rank_by_interests(self, articles: List[Article]) -> List[Article]:
         """Rank articles by relevance to user interests."""
         for article in articles:
-            score = 0
-            text = f"{article.title} {article.description}".lower()
-            
-            for interest in self.config.interests:
-                for keyword in interest.keywords:
-                    if keyword.lower() in text:
-                        score += interest.weight * 10
-            
-            # Add base engagement score
-            score += min(article.score / 10, 50)
-            
-            article.relevance_score = score
+            article.relevance_score = self._interest_score(article)
         
         return sorted(articles, key=lambda a: a.relevance_score, reverse=True)
     
@@ -291,28 +361,29 @@ class NewsManager:
         limit: int = 5,
     ) -> CompanyNews:
         """Get news about a specific company."""
-        articles = []
+        sources = []
         
         # Search NewsAPI
         if self.newsapi.is_configured:
-            results = await self.newsapi.search(
-                query=company,
-                from_date=datetime.now() - timedelta(days=7),
-                page_size=limit,
-            )
-            articles.extend(results)
+            sources.append(self._source(
+                "newsapi_company",
+                lambda: self.newsapi.search(
+                    query=company,
+                    from_date=datetime.now() - timedelta(days=7),
+                    page_size=limit,
+                ),
+            ))
         
         # Google News RSS
-        results = await self.google_news.search(company, limit=limit)
-        articles.extend(results)
+        sources.append(self._source(
+            "google_news",
+            lambda: self.google_news.search(company, limit=limit),
+        ))
+        
+        articles = await self.executor.gather(sources)
         
         # Deduplicate
-        seen = set()
-        unique = []
-        for a in articles:
-            if a.title not in seen:
-                seen.add(a.title)
-                unique.append(a)
+        unique = dedupe_articles(articles, threshold=self.config.duplicate_threshold)
         
         # Analyze sentiment (simple keyword-based)
         sentiment = self._analyze_sentiment(unique)
@@ -360,8 +431,10 @@ class NewsManager:
         )
         
         # Gather news from the week
-        ai_news = await self.get_ai_news(limit=10)
-        tech_news = await self.get_tech_news(limit=10)
+        ai_news, tech_news = await asyncio.gather(
+            self.get_ai_news(limit=10),
+            self.get_tech_news(limit=10),
+        )
         
         digest.ai_news = ai_news[:5]
         digest.tech_news = tech_news[:5]
@@ -381,7 +454,7 @@ class NewsManager:
         digest.summary = self._generate_summary(digest)
         
         # Save to database
-        self._save_digest(digest)
+        await self._save_digest(digest)
         
         return digest
     
@@ -421,14 +494,11 @@ class NewsManager:
         
         return "\n".join(lines)
     
-    def _save_digest(self, digest: NewsDigest):
+    async def _save_digest(self, digest: NewsDigest):
         """Save digest to database."""
         import json
         
-        conn = sqlite3.connect(self.config.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        await self.db.aio.execute("""
             INSERT OR REPLACE INTO weekly_digests (id, week_start, summary, key_stories, generated_at)
             VALUES (?, ?, ?, ?, ?)
         """, (
@@ -438,9 +508,6 @@ class NewsManager:
             json.dumps([a.to_dict() for a in digest.key_stories]),
             digest.generated_at.isoformat(),
         ))
-        
-        conn.commit()
-        conn.close()
     
     # =========================================================================
     # Article Management
@@ -449,10 +516,7 @@ class NewsManager:
     def save_article(self, article: Article) -> bool:
         """Save an article for later."""
         try:
-            conn = sqlite3.connect(self.config.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
+            self.db.execute("""
                 INSERT OR REPLACE INTO saved_articles
                 (id, title, description, url, source, author, published_at, category, score, saved_at, read)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -469,9 +533,6 @@ class NewsManager:
                 datetime.now().isoformat(),
                 0,
             ))
-            
-            conn.commit()
-            conn.close()
             return True
             
         except Exception as e:
@@ -480,18 +541,11 @@ class NewsManager:
     
     def get_saved_articles(self, limit: int = 20) -> List[Dict]:
         """Get saved articles."""
-        conn = sqlite3.connect(self.config.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        rows = self.db.fetchall("""
             SELECT * FROM saved_articles ORDER BY saved_at DESC LIMIT ?
         """, (limit,))
         
-        columns = [desc[0] for desc in cursor.description]
-        articles = [dict(zip(columns, row)) for row in cursor.fetchall()]
-        
-        conn.close()
-        return articles
+        return [dict(row) for row in rows]
     
     # =========================================================================
     # Voice Command Handler
@@ -636,6 +690,8 @@ class NewsManager:
             ]),
             "saved_articles": saved,
             "interests": len(self.config.interests),
+            "source_latency": self.http.get_latency_stats(),
+            "last_fetch": [r.to_dict() for r in self.executor.last_results],
         }
     
     def get_status_summary(self) -> str:
@@ -651,4 +707,14 @@ class NewsManager:
             f"🎯 {status['interests']} interest topics",
         ]
         
+        for source, stats in status["source_latency"].items():
+            lines.append(
+                f"⏱️ {source}: {stats['avg_ms']:.0f}ms avg, "
+                f"{stats['p95_ms']:.0f}ms p95 ({stats['requests']} requests)"
+            )
+        
         return "\n".join(lines)
+    
+    async def close(self):
+        """Close the pooled HTTP client."""
+        await self.http.aclose()
@@ -0,0 +1,271 @@
+"""
+Concurrent source pipeline for JARVIS Smart News Module.
+
+Runs every enabled news source at once with a per-source deadline,
+yields results as each source finishes, and removes near-duplicate
+stories across sources with MinHash over title shingles.
+"""
+
+import asyncio
+import re
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from loguru import logger
+
+from .models import Article
+
+
+@dataclass
+class SourceTask:
+    """A single news source to fetch."""
+    name: str
+    fetch: Callable[[], Awaitable[List[Article]]]
+    timeout: Optional[float] = None  # Falls back to the executor default
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one source fetch."""
+    name: str
+    articles: List[Article] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.timed_out and self.error is None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "articles": len(self.articles),
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "timed_out": self.timed_out,
+            "error": self.error,
+        }
+
+
+class NewsSourceExecutor:
+    """
+    Launches all sources concurrently with per-source deadlines.
+
+    A slow or failing source yields an empty SourceResult when its
+    deadline passes instead of holding up the rest of the feed.
+    ``last_results`` holds the results of the most recently finished
+    run; concurrent runs each collect their own.
+    """
+
+    def __init__(self, default_timeout: float = 8.0):
+        self.default_timeout = default_timeout
+        self.last_results: List[SourceResult] = []
+
+    async def _run_one(self, task: SourceTask) -> SourceResult:
+        timeout = task.timeout if task.timeout is not None else self.default_timeout
+        start = time.perf_counter()
+        result = SourceResult(name=task.name)
+
+        try:
+            result.articles = await asyncio.wait_for(task.fetch(), timeout=timeout)
+        except asyncio.TimeoutError:
+            result.timed_out = True
+            logger.warning(f"News source '{task.name}' exceeded {timeout:.1f}s deadline")
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"News source '{task.name}' failed: {e}")
+
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    async def stream(self, tasks: List[SourceTask]) -> AsyncIterator[SourceResult]:
+        """
+        Run sources concurrently, yielding each result as it completes.
+
+        Args:
+            tasks: Sources to fetch.
+
+        Yields:
+            SourceResult in completion order.
+        """
+        results: List[SourceResult] = []
+        pending = [asyncio.ensure_future(self._run_one(task)) for task in tasks]
+
+        try:
+            for next_done in asyncio.as_completed(pending):
+                result = await next_done
+                results.append(result)
+                yield result
+        finally:
+            for future in pending:
+                if not future.done():
+                    future.cancel()
+            self.last_results = results
+
+    async def gather(self, tasks: List[SourceTask]) -> List[Article]:
+        """Run sources concurrently and return all articles."""
+        articles: List[Article] = []
+        async for result in self.stream(tasks):
+            articles.extend(result.articles)
+        return articles
+
+
+_TRACKING_PARAMS = ("utm_", "ref", "fbclid", "gclid", "source")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for duplicate detection."""
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip().lower())
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query)
+        if not k.startswith(_TRACKING_PARAMS)
+    ))
+    path = parts.path.rstrip("/")
+
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+class NearDuplicateDetector:
+    """
+    MinHash/LSH near-duplicate detector for article titles.
+
+    Each title is reduced to character shingles, summarized by a MinHash
+    signature and bucketed into LSH bands, so checking a new article only
+    compares it against the few candidates sharing a band. Candidates are
+    confirmed with exact Jaccard similarity; identical normalized URLs
+    are always duplicates.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        num_perm: int = 32,
+        bands: int = 8,
+        shingle_size: int = 4,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # Fixed seeds keep signatures stable across runs
+        self._perms = [
+            (
+                (zlib.crc32(f"a{i}".encode()) << 16 | 1) % _MERSENNE_PRIME,
+                zlib.crc32(f"b{i}".encode()) % _MERSENNE_PRIME,
+            )
+            for i in range(num_perm)
+        ]
+
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._shingles: List[Set[int]] = []
+        self._urls: Dict[str, int] = {}
+
+    def _shingle(self, text: str) -> Set[int]:
+        text = re.sub(r"[^a-z0-9 ]+", "", text.lower())
+        text = re.sub(r"\s+", " ", text).strip()
+        k = self.shingle_size
+        if len(text) <= k:
+            return {zlib.crc32(text.encode())} if text else set()
+        return {zlib.crc32(text[i:i + k].encode()) for i in range(len(text) - k + 1)}
+
+    def _signature(self, shingles: Set[int]) -> List[int]:
+        return [
+            min(((a * s + b) % _MERSENNE_PRIME) & _MAX_HASH for s in shingles)
+            for a, b in self._perms
+        ]
+
+    def find(self, title: str, url: str = "") -> Optional[int]:
+        """
+        Check whether an article duplicates one already added.
+
+        Returns:
+            Index of the matching article, or None.
+        """
+        match, _, _ = self._lookup(title, url)
+        return match
+
+    def _lookup(
+        self,
+        title: str,
+        url: str,
+    ) -> Tuple[Optional[int], Set[int], Optional[List[int]]]:
+        norm_url = normalize_url(url)
+        if norm_url and norm_url in self._urls:
+            return self._urls[norm_url], set(), None
+
+        shingles = self._shingle(title)
+        if not shingles:
+            return None, shingles, None
+
+        signature = self._signature(shingles)
+        candidates: Set[int] = set()
+        for band in range(self.bands):
+            key = tuple(signature[band * self.rows:(band + 1) * self.rows])
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best, best_score = None, self.threshold
+        for idx in candidates:
+            other = self._shingles[idx]
+            score = len(shingles & other) / len(shingles | other)
+            if score >= best_score:
+                best, best_score = idx, score
+
+        return best, shingles, signature
+
+    def add(self, title: str, url: str = "") -> Tuple[int, bool]:
+        """
+        Add an article unless it duplicates an existing one.
+
+        Returns:
+            Tuple of (index, is_duplicate). For duplicates the index is
+            that of the earlier article.
+        """
+        match, shingles, signature = self._lookup(title, url)
+        if match is not None:
+            return match, True
+
+        idx = len(self._shingles)
+        self._shingles.append(shingles)
+
+        norm_url = normalize_url(url)
+        if norm_url:
+            self._urls[norm_url] = idx
+
+        if signature is not None:
+            for band in range(self.bands):
+                key = tuple(signature[band * self.rows:(band + 1) * self.rows])
+                self._buckets[band].setdefault(key, []).append(idx)
+
+        return idx, False
+
+
+def dedupe_articles(
+    articles: List[Article],
+    threshold: float = 0.6,
+) -> List[Article]:
+    """Remove near-duplicates, keeping the highest-relevance copy."""
+    detector = NearDuplicateDetector(threshold=threshold)
+    unique: List[Article] = []
+
+    for article in articles:
+        idx, duplicate = detector.add(article.title, article.url)
+        if not duplicate:
+            unique.append(article)
+        elif article.relevance_score > unique[idx].relevance_score:
+            unique[idx] = article
+
+    return unique
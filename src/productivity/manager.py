@@ -20,7 +20,7 @@ import asyncio
 import re
 from datetime import datetime, timedelta, date
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -47,6 +47,68 @@ class ProductivityManager:
         response = await manager.handle_command("Play focus music")
     """
     
+    # Trigger phrases per command type; also registered with the
+    # assistant's intent index so this manager is only called on a match
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "music": (
+            "play music", "play focus", "play study", "play lofi", "play lo-fi",
+            "play hindi", "play bollywood", "play gym", "play workout",
+            "play classical", "play chill", "play coding", "play ambient",
+            "pause music", "stop music", "what's playing", "show playlists",
+            "play playlist", "music",
+            # Personal library commands (YouTube Music Premium)
+            "play my liked", "liked songs", "my library", "play my mix",
+            "my mix", "discover mix", "play history", "recently played",
+            "new releases", "music charts", "browse moods",
+            # Search commands
+            "search on youtube music", "search youtube music", "find song",
+        ),
+        "journal": (
+            "log learning", "learned today", "learning journal", "what did i learn",
+            "learning summary", "add takeaway", "learning streak",
+            "log what i learned", "today i learned", "til:",
+        ),
+        "habit": (
+            "log habit", "habit done", "did i", "show habits", "my habits",
+            "add habit", "habit streak", "habit report", "today's habits",
+            "mark habit", "complete habit", "habit check", "exercise done",
+            "meditate done", "study done", "water done", "read done",
+        ),
+        "project": (
+            "create project", "new project", "show projects", "my projects",
+            "update project", "log time", "add milestone", "mark milestone",
+            "project status", "active project",
+        ),
+        "snippet": (
+            "save snippet", "find snippet", "show snippet", "search snippet",
+            "code snippet", "my snippets", "get snippet",
+        ),
+        "planner": (
+            "plan my", "study plan", "what should i", "study schedule",
+            "generate schedule", "i have", "hours free", "work on",
+            "suggest task", "next task",
+        ),
+        "review": (
+            "weekly review", "how was my week", "week summary",
+            "what did i accomplish", "weekly summary",
+        ),
+        "focus": (
+            "focus mode", "start focus", "end focus", "stop focus",
+            "block site", "unblock site", "blocked sites", "blocklist",
+            "focus stats", "focus status",
+        ),
+        "dataset": (
+            "analyze dataset", "load dataset", "describe data", "show missing",
+            "data shape", "column types", "data stats", "explore data",
+            "analyze csv", "load csv",
+        ),
+        "break": (
+            "take a break", "break reminder", "skip break", "break status",
+            "enable break", "disable break", "suggest stretch",
+            "need a break", "time for break",
+        ),
+    }
+    
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
@@ -253,28 +315,12 @@ class ProductivityManager:
     # =========================================================================
     
     def _is_music_command(self, text: str) -> bool:
-        patterns = [
-            "play music", "play focus", "play study", "play lofi", "play lo-fi",
-            "play hindi", "play bollywood", "play gym", "play workout",
-            "play classical", "play chill", "play coding", "play ambient",
-            "pause music", "stop music", "what's playing", "show playlists",
-            "play playlist", "music",
-            # Personal library commands (YouTube Music Premium)
-            "play my liked", "liked songs", "my library", "play my mix",
-            "my mix", "discover mix", "play history", "recently played",
-            "new releases", "music charts", "browse moods",
-            # Search commands
-            "search on youtube music", "search youtube music", "find song",
-        ]
+        patterns = self.COMMAND_TRIGGERS["music"]
         return any(p in text for p in patterns)
     
     def _is_journal_command(self, text: str) -> bool:
         # Learning journal - distinct from voice journal in career module
-        patterns = [
-            "log learning", "learned today", "learning journal", "what did i learn",
-            "learning summary", "add takeaway", "learning streak",
-            "log what i learned", "today i learned", "til:",
-        ]
+        patterns = self.COMMAND_TRIGGERS["journal"]
         # Exclude voice journal patterns (handled by career module)
         exclude_patterns = ["voice journal", "diary", "mood", "grateful", "reflect", "feeling"]
         if any(p in text for p in exclude_patterns):
@@ -282,66 +328,35 @@ class ProductivityManager:
         return any(p in text for p in patterns)
     
     def _is_habit_command(self, text: str) -> bool:
-        patterns = [
-            "log habit", "habit done", "did i", "show habits", "my habits",
-            "add habit", "habit streak", "habit report", "today's habits",
-            "mark habit", "complete habit", "habit check", "exercise done",
-            "meditate done", "study done", "water done", "read done",
-        ]
+        patterns = self.COMMAND_TRIGGERS["habit"]
         return any(p in text for p in patterns)
     
     def _is_project_command(self, text: str) -> bool:
-        patterns = [
-            "create project", "new project", "show projects", "my projects",
-            "update project", "log time", "add milestone", "mark milestone",
-            "project status", "active project",
-        ]
+        patterns = self.COMMAND_TRIGGERS["project"]
         return any(p in text for p in patterns)
     
     def _is_snippet_command(self, text: str) -> bool:
-        patterns = [
-            "save snippet", "find snippet", "show snippet", "search snippet",
-            "code snippet", "my snippets", "get snippet",
-        ]
+        patterns = self.COMMAND_TRIGGERS["snippet"]
         return any(p in text for p in patterns)
     
     def _is_planner_command(self, text: str) -> bool:
-        patterns = [
-            "plan my", "study plan", "what should i", "study schedule",
-            "generate schedule", "i have", "hours free", "work on",
-            "suggest task", "next task",
-        ]
+        patterns = self.COMMAND_TRIGGERS["planner"]
         return any(p in text for p in patterns)
     
     def _is_review_command(self, text: str) -> bool:
-        patterns = [
-            "weekly review", "how was my week", "week summary",
-            "what did i accomplish", "weekly summary",
-        ]
+        patterns = self.COMMAND_TRIGGERS["review"]
         return any(p in text for p in patterns)
     
     def _is_focus_command(self, text: str) -> bool:
-        patterns = [
-            "focus mode", "start focus", "end focus", "stop focus",
-            "block site", "unblock site", "blocked sites", "blocklist",
-            "focus stats", "focus status",
-        ]
+        patterns = self.COMMAND_TRIGGERS["focus"]
         return any(p in text for p in patterns)
     
     def _is_dataset_command(self, text: str) -> bool:
-        patterns = [
-            "analyze dataset", "load dataset", "describe data", "show missing",
-            "data shape", "column types", "data stats", "explore data",
-            "analyze csv", "load csv",
-        ]
+        patterns = self.COMMAND_TRIGGERS["dataset"]
         return any(p in text for p in patterns)
     
     def _is_break_command(self, text: str) -> bool:
-        patterns = [
-            "take a break", "break reminder", "skip break", "break status",
-            "enable break", "disable break", "suggest stretch",
-            "need a break", "time for break",
-        ]
+        patterns = self.COMMAND_TRIGGERS["break"]
         return any(p in text for p in patterns)
     
     # =========================================================================
@@ -8,7 +8,7 @@ Handles voice commands and coordinates the research workflow.
 import asyncio
 import re
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -33,6 +33,22 @@ class ResearchManager:
         response = await manager.handle_command("Write a research paper on AI ethics")
     """
     
+    # Trigger phrases per command type; also registered with the
+    # assistant's intent index so this manager is only called on a match
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "paper": (
+            "research paper", "write a paper", "write paper",
+            "research projects", "resume my", "research status",
+        ),
+        "search": (
+            "find papers", "search for papers", "scholarly search",
+        ),
+        "citation": (
+            "citation", "cite", "bibliography", "works cited",
+            "apa format", "mla format", "chicago format", "ieee format",
+        ),
+    }
+    
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
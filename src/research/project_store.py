@@ -9,7 +9,6 @@ Handles:
 """
 
 import json
-import sqlite3
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
@@ -150,79 +149,80 @@ class ProjectStore:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        from ..core.database import get_database
+        self._db = get_database(self.db_path)
         self._init_db()
     
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
-                -- Research projects table
-                CREATE TABLE IF NOT EXISTS research_projects (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    topic TEXT NOT NULL,
-                    title TEXT,
-                    thesis TEXT,
-                    page_count INTEGER DEFAULT 10,
-                    citation_style TEXT DEFAULT 'apa',
-                    focus_areas TEXT DEFAULT '[]',
-                    custom_requirements TEXT,
-                    status TEXT DEFAULT 'planning',
-                    current_section TEXT,
-                    progress_percent REAL DEFAULT 0.0,
-                    google_doc_id TEXT,
-                    google_doc_url TEXT,
-                    created_at TEXT,
-                    updated_at TEXT,
-                    completed_at TEXT,
-                    word_count INTEGER DEFAULT 0,
-                    source_count INTEGER DEFAULT 0
-                );
-                
-                -- Research sources table
-                CREATE TABLE IF NOT EXISTS research_sources (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id INTEGER NOT NULL,
-                    source_id TEXT,
-                    title TEXT NOT NULL,
-                    authors TEXT,
-                    year INTEGER,
-                    abstract TEXT,
-                    doi TEXT,
-                    url TEXT,
-                    pdf_url TEXT,
-                    citation_count INTEGER DEFAULT 0,
-                    source_database TEXT,
-                    venue TEXT,
-                    keywords TEXT DEFAULT '[]',
-                    is_open_access INTEGER DEFAULT 0,
-                    summary TEXT,
-                    key_findings TEXT DEFAULT '[]',
-                    relevant_quotes TEXT DEFAULT '[]',
-                    methodology TEXT,
-                    relevance_score REAL DEFAULT 0.0,
-                    status TEXT DEFAULT 'found',
-                    added_at TEXT,
-                    FOREIGN KEY (project_id) REFERENCES research_projects(id)
-                );
-                
-                -- Research sections table
-                CREATE TABLE IF NOT EXISTS research_sections (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    project_id INTEGER NOT NULL,
-                    section_name TEXT NOT NULL,
-                    level INTEGER DEFAULT 1,
-                    content TEXT,
-                    word_count INTEGER DEFAULT 0,
-                    status TEXT DEFAULT 'pending',
-                    section_order INTEGER DEFAULT 0,
-                    FOREIGN KEY (project_id) REFERENCES research_projects(id)
-                );
-                
-                -- Create indexes
-                CREATE INDEX IF NOT EXISTS idx_sources_project ON research_sources(project_id);
-                CREATE INDEX IF NOT EXISTS idx_sections_project ON research_sections(project_id);
-            """)
-            conn.commit()
+        self._db.executescript("""
+            -- Research projects table
+            CREATE TABLE IF NOT EXISTS research_projects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                topic TEXT NOT NULL,
+                title TEXT,
+                thesis TEXT,
+                page_count INTEGER DEFAULT 10,
+                citation_style TEXT DEFAULT 'apa',
+                focus_areas TEXT DEFAULT '[]',
+                custom_requirements TEXT,
+                status TEXT DEFAULT 'planning',
+                current_section TEXT,
+                progress_percent REAL DEFAULT 0.0,
+                google_doc_id TEXT,
+                google_doc_url TEXT,
+                created_at TEXT,
+                updated_at TEXT,
+                completed_at TEXT,
+                word_count INTEGER DEFAULT 0,
+                source_count INTEGER DEFAULT 0
+            );
+            
+            -- Research sources table
+            CREATE TABLE IF NOT EXISTS research_sources (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_id INTEGER NOT NULL,
+                source_id TEXT,
+                title TEXT NOT NULL,
+                authors TEXT,
+                year INTEGER,
+                abstract TEXT,
+                doi TEXT,
+                url TEXT,
+                pdf_url TEXT,
+                citation_count INTEGER DEFAULT 0,
+                source_database TEXT,
+                venue TEXT,
+                keywords TEXT DEFAULT '[]',
+                is_open_access INTEGER DEFAULT 0,
+                summary TEXT,
+                key_findings TEXT DEFAULT '[]',
+                relevant_quotes TEXT DEFAULT '[]',
+                methodology TEXT,
+                relevance_score REAL DEFAULT 0.0,
+                status TEXT DEFAULT 'found',
+                added_at TEXT,
+                FOREIGN KEY (project_id) REFERENCES research_projects(id)
+            );
+            
+            -- Research sections table
+            CREATE TABLE IF NOT EXISTS research_sections (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_id INTEGER NOT NULL,
+                section_name TEXT NOT NULL,
+                level INTEGER DEFAULT 1,
+                content TEXT,
+                word_count INTEGER DEFAULT 0,
+                status TEXT DEFAULT 'pending',
+                section_order INTEGER DEFAULT 0,
+                FOREIGN KEY (project_id) REFERENCES research_projects(id)
+            );
+            
+            -- Create indexes
+            CREATE INDEX IF NOT EXISTS idx_sources_project ON research_sources(project_id);
+            CREATE INDEX IF NOT EXISTS idx_sections_project ON research_sections(project_id);
+        """)
         
         logger.debug(f"Research database initialized at {self.db_path}")
     
@@ -243,7 +243,7 @@ class ProjectStore:
         project.created_at = datetime.now()
         project.updated_at = datetime.now()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             cursor = conn.execute("""
                 INSERT INTO research_projects (
                     topic, title, thesis, page_count, citation_style,
@@ -262,7 +262,6 @@ class ProjectStore:
                 project.source_count,
             ))
             project.id = cursor.lastrowid
-            conn.commit()
         
         logger.info(f"Created research project: {project.topic} (ID: {project.id})")
         return project.id
@@ -271,7 +270,7 @@ class ProjectStore:
         """Update an existing project."""
         project.updated_at = datetime.now()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             conn.execute("""
                 UPDATE research_projects SET
                     topic = ?, title = ?, thesis = ?, page_count = ?,
@@ -290,12 +289,10 @@ class ProjectStore:
                 project.completed_at.isoformat() if project.completed_at else None,
                 project.word_count, project.source_count, project.id,
             ))
-            conn.commit()
     
     def get_project(self, project_id: int) -> Optional[ResearchProject]:
         """Get project by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM research_projects WHERE id = ?",
                 (project_id,)
@@ -308,8 +305,7 @@ class ProjectStore:
     
     def get_project_by_topic(self, topic: str) -> Optional[ResearchProject]:
         """Get project by topic (partial match)."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM research_projects WHERE topic LIKE ? ORDER BY created_at DESC LIMIT 1",
                 (f"%{topic}%",)
@@ -322,8 +318,7 @@ class ProjectStore:
     
     def get_all_projects(self, limit: int = 20) -> List[ResearchProject]:
         """Get all projects, most recent first."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM research_projects ORDER BY updated_at DESC LIMIT ?",
                 (limit,)
@@ -332,8 +327,7 @@ class ProjectStore:
     
     def get_incomplete_projects(self) -> List[ResearchProject]:
         """Get projects that aren't complete."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM research_projects WHERE status != 'complete' ORDER BY updated_at DESC"
             )
@@ -341,11 +335,10 @@ class ProjectStore:
     
     def delete_project(self, project_id: int):
         """Delete a project and all its data."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             conn.execute("DELETE FROM research_sources WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM research_sections WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM research_projects WHERE id = ?", (project_id,))
-            conn.commit()
         
         logger.info(f"Deleted research project ID: {project_id}")
     
@@ -355,7 +348,7 @@ class ProjectStore:
     
     def add_source(self, project_id: int, source: Source) -> int:
         """Add a source to a project."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             cursor = conn.execute("""
                 INSERT INTO research_sources (
                     project_id, source_id, title, authors, year, abstract,
@@ -374,26 +367,23 @@ class ProjectStore:
                 source.relevance_score, source.status.value,
                 source.added_at.isoformat(),
             ))
-            conn.commit()
             return cursor.lastrowid
     
     def add_sources(self, project_id: int, sources: List[Source]):
-        """Add multiple sources to a project."""
-        for source in sources:
-            self.add_source(project_id, source)
-        
-        # Update source count
-        with sqlite3.connect(self.db_path) as conn:
+        """Add multiple sources to a project in one transaction."""
+        with self._db.transaction() as conn:
+            for source in sources:
+                self.add_source(project_id, source)
+            
+            # Update source count
             conn.execute(
                 "UPDATE research_projects SET source_count = ? WHERE id = ?",
                 (len(sources), project_id)
             )
-            conn.commit()
     
     def get_sources(self, project_id: int) -> List[Source]:
         """Get all sources for a project."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM research_sources WHERE project_id = ? ORDER BY relevance_score DESC",
                 (project_id,)
@@ -446,7 +436,7 @@ class ProjectStore:
         """Save or update a section."""
         word_count = len(content.split())
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             # Check if section exists
             cursor = conn.execute(
                 "SELECT id FROM research_sections WHERE project_id = ? AND section_name = ?",
@@ -467,13 +457,10 @@ class ProjectStore:
                         word_count, status, section_order
                     ) VALUES (?, ?, ?, ?, ?, 'complete', ?)
                 """, (project_id, section_name, level, content, word_count, order))
-            
-            conn.commit()
     
     def get_sections(self, project_id: int) -> List[Dict[str, Any]]:
         """Get all sections for a project."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db.read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM research_sections WHERE project_id = ? ORDER BY section_order",
                 (project_id,)
@@ -510,7 +497,7 @@ class ProjectStore:
         current_section: str = "",
     ):
         """Update project progress."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             conn.execute("""
                 UPDATE research_projects SET
                     status = ?, progress_percent = ?, current_section = ?,
@@ -520,7 +507,6 @@ class ProjectStore:
                 status.value, progress, current_section,
                 datetime.now().isoformat(), project_id,
             ))
-            conn.commit()
     
     def mark_complete(
         self,
@@ -529,7 +515,7 @@ class ProjectStore:
         word_count: int,
     ):
         """Mark project as complete."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db.transaction() as conn:
             conn.execute("""
                 UPDATE research_projects SET
                     status = 'complete', progress_percent = 100.0,
@@ -541,6 +527,5 @@ class ProjectStore:
                 datetime.now().isoformat(), datetime.now().isoformat(),
                 project_id,
             ))
-            conn.commit()
         
         logger.info(f"Research project {project_id} marked complete")
@@ -19,6 +19,8 @@ from urllib.parse import quote_plus
 import httpx
 from loguru import logger
 
+from ..core.async_runtime import close_loop_bound
+
 
 class SearchDatabase(Enum):
     """Available academic databases."""
@@ -76,12 +78,16 @@ class SemanticScholarClient:
         """Initialize client with optional API key for higher rate limits."""
         self.api_key = api_key
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._request_count = 0
         self._window_start = datetime.now()
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             headers = {"Content-Type": "application/json"}
             if self.api_key:
                 headers["x-api-key"] = self.api_key
@@ -90,6 +96,7 @@ class SemanticScholarClient:
                 headers=headers,
                 timeout=30.0,
             )
+            self._client_loop = loop
         return self._client
     
     async def _check_rate_limit(self):
@@ -238,7 +245,7 @@ class SemanticScholarClient:
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
 
 
 class OpenAlexClient:
@@ -257,10 +264,14 @@ class OpenAlexClient:
         """Initialize client with optional email for polite pool."""
         self.email = email
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             headers = {"Content-Type": "application/json"}
             if self.email:
                 headers["User-Agent"] = f"mailto:{self.email}"
@@ -269,6 +280,7 @@ class OpenAlexClient:
                 headers=headers,
                 timeout=30.0,
             )
+            self._client_loop = loop
         return self._client
     
     async def search(
@@ -395,7 +407,7 @@ class OpenAlexClient:
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
 
 
 class ArxivClient:
@@ -413,11 +425,16 @@ class ArxivClient:
     def __init__(self):
         """Initialize client."""
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             self._client = httpx.AsyncClient(timeout=30.0)
+            self._client_loop = loop
         return self._client
     
     async def search(
@@ -560,7 +577,7 @@ class ArxivClient:
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
 
 
 class CrossRefClient:
@@ -579,10 +596,14 @@ class CrossRefClient:
         """Initialize client with optional email for polite pool."""
         self.email = email
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
+        """Get or create the HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                await close_loop_bound(self._client, self._client_loop)
             headers = {"Content-Type": "application/json"}
             if self.email:
                 headers["User-Agent"] = f"JARVIS/2.0 (mailto:{self.email})"
@@ -591,6 +612,7 @@ class CrossRefClient:
                 headers=headers,
                 timeout=30.0,
             )
+            self._client_loop = loop
         return self._client
     
     async def search(
@@ -741,7 +763,7 @@ class CrossRefClient:
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
-            await self._client.aclose()
+            await close_loop_bound(self._client, self._client_loop)
 
 
 @dataclass
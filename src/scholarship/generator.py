@@ -53,6 +53,7 @@ class GenerationConfig:
     num_statement_sections: int = 3
     num_profile_sections: int = 5
     prefer_winning_essays: bool = True
+    rag_context_tokens: int = 6000  # Budget for retrieved essays and sections
     
     # Quality settings
     min_quality_score: float = 7.0
@@ -251,7 +252,10 @@ class EssayGenerator:
         state.current_step = "Generating Essay"
         
         # Build prompt
-        rag_context = state.rag_context.to_prompt_context() if state.rag_context else {}
+        rag_context = (
+            state.rag_context.to_prompt_context(max_tokens=self.config.rag_context_tokens)
+            if state.rag_context else {}
+        )
         
         prompt_vars = {
             # Scholarship info
@@ -13,7 +13,7 @@ Main orchestrator that integrates all components:
 import os
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -74,6 +74,23 @@ class ScholarshipManager:
     - Managing output
     """
     
+    # Trigger phrases per command type; also registered with the
+    # assistant's intent index so this manager is only called on a match
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "discovery": (
+            "scholarship", "find scholarship", "search scholarship",
+        ),
+        "tracking": (
+            "scholarship due", "due soon", "application status",
+            "mark submitted", "mark won", "mark lost",
+            "scholarship stats", "scholarship status",
+        ),
+        "essay": (
+            "generate essay", "write essay", "essay for",
+            "import essay", "import winning", "past essay",
+        ),
+    }
+    
     def __init__(
         self,
         config: Optional[ScholarshipConfig] = None,
@@ -16,6 +16,8 @@ from .models import PastEssay, PersonalStatement, PersonalProfile, EssayOutcome
 from .embeddings import EmbeddingGenerator, get_default_embedder
 from .local_rag import LocalRAGStore, CHROMADB_AVAILABLE
 
+from ..core.context_budget import ContextBuilder
+
 
 @dataclass
 class RAGContext:
@@ -35,55 +37,93 @@ class RAGContext:
     # Themes identified
     themes: List[str] = field(default_factory=list)
     
+    def _essay_block(self, i: int, essay: PastEssay, score: float) -> str:
+        outcome_emoji = "🏆" if essay.outcome == EssayOutcome.WON else "📝"
+        return "\n".join([
+            f"--- Essay {i} ({outcome_emoji} {essay.outcome.value}, {score:.0%} match) ---",
+            f"Scholarship: {essay.scholarship_name}",
+            f"Question: {essay.question}",
+            f"Essay ({essay.word_count} words):",
+            essay.essay_text,
+            "",
+        ])
+    
+    @staticmethod
+    def _section_block(name: str, content: str, score: float) -> str:
+        return f"--- {name} ({score:.0%} relevant) ---\n{content}\n"
+    
     def get_essays_text(self) -> str:
         """Get formatted text of similar essays."""
         if not self.similar_essays:
             return "No similar past essays found."
         
-        lines = []
-        for i, (essay, score) in enumerate(self.similar_essays, 1):
-            outcome_emoji = "🏆" if essay.outcome == EssayOutcome.WON else "📝"
-            lines.append(f"--- Essay {i} ({outcome_emoji} {essay.outcome.value}, {score:.0%} match) ---")
-            lines.append(f"Scholarship: {essay.scholarship_name}")
-            lines.append(f"Question: {essay.question}")
-            lines.append(f"Essay ({essay.word_count} words):")
-            lines.append(essay.essay_text)
-            lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(
+            self._essay_block(i, essay, score)
+            for i, (essay, score) in enumerate(self.similar_essays, 1)
+        )
     
     def get_personal_statement_text(self) -> str:
         """Get formatted personal statement sections."""
         if not self.personal_statement_sections:
             return "No personal statement sections found."
         
-        lines = []
-        for section, score in self.personal_statement_sections:
-            lines.append(f"--- {section.section_name} ({score:.0%} relevant) ---")
-            lines.append(section.content)
-            lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(
+            self._section_block(section.section_name, section.content, score)
+            for section, score in self.personal_statement_sections
+        )
     
     def get_profile_text(self) -> str:
         """Get formatted profile sections."""
         if not self.profile_sections:
             return "No profile sections found."
         
-        lines = []
-        for profile, score in self.profile_sections:
-            lines.append(f"--- {profile.section} ({score:.0%} relevant) ---")
-            lines.append(profile.content)
-            lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(
+            self._section_block(profile.section, profile.content, score)
+            for profile, score in self.profile_sections
+        )
     
-    def to_prompt_context(self) -> Dict[str, str]:
-        """Convert to dictionary for prompt templates."""
+    def to_prompt_context(self, max_tokens: Optional[int] = None) -> Dict[str, str]:
+        """
+        Convert to dictionary for prompt templates.
+        
+        Args:
+            max_tokens: Token budget shared by essays, statement and profile
+                sections. Items are granted budget by relevance; the least
+                relevant are truncated or dropped first.
+        """
+        if max_tokens is None:
+            return {
+                "similar_essays": self.get_essays_text(),
+                "personal_statement": self.get_personal_statement_text(),
+                "profile": self.get_profile_text(),
+                "themes": ", ".join(self.themes) if self.themes else "general",
+            }
+        
+        builder = ContextBuilder(max_tokens, label="scholarship_rag", separator="\n")
+        for i, (essay, score) in enumerate(self.similar_essays, 1):
+            # Winning essays are worth more than an equally similar loss
+            bonus = 0.1 if essay.outcome == EssayOutcome.WON else 0.0
+            builder.add(f"essay:{i}", self._essay_block(i, essay, score), priority=score + bonus, kind="docs")
+        for i, (section, score) in enumerate(self.personal_statement_sections):
+            builder.add(
+                f"statement:{i}", self._section_block(section.section_name, section.content, score),
+                priority=score, kind="memory",
+            )
+        for i, (profile, score) in enumerate(self.profile_sections):
+            builder.add(
+                f"profile:{i}", self._section_block(profile.section, profile.content, score),
+                priority=score, kind="memory",
+            )
+        context = builder.build()
+        
+        def joined(prefix: str, empty: str) -> str:
+            blocks = [p.text for p in context.included if p.name.startswith(prefix)]
+            return "\n".join(blocks) if blocks else empty
+        
         return {
-            "similar_essays": self.get_essays_text(),
-            "personal_statement": self.get_personal_statement_text(),
-            "profile": self.get_profile_text(),
+            "similar_essays": joined("essay:", "No similar past essays found."),
+            "personal_statement": joined("statement:", "No personal statement sections found."),
+            "profile": joined("profile:", "No profile sections found."),
             "themes": ", ".join(self.themes) if self.themes else "general",
         }
 
@@ -925,6 +925,19 @@ class QuickLaunchManager:
     Handles "Open [something]" commands intelligently.
     """
     
+    # Trigger phrases and regexes for the assistant's intent index
+    COMMAND_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+        "youtube": ("youtube", " on yt"),
+        "applications": (
+            "add app", "register app", "remove app",
+            "list apps", "list applications", "my apps", "what apps", "show apps",
+        ),
+        "bookmarks": ("bookmark",),
+    }
+    COMMAND_PATTERNS: Dict[str, Tuple[str, ...]] = {
+        "open": (r"^(?:open|launch|start) .",),
+    }
+    
     def __init__(
         self,
         db_path: Path | str,
@@ -325,7 +325,7 @@ Sensitive actions require confirmation or PIN.
         # Get system status if handler available
         if self.command_handler:
             try:
-                response = self.command_handler("system status brief")
+                response = await asyncio.to_thread(self.command_handler, "system status brief")
                 status_text += f"\n{response}"
             except Exception as e:
                 status_text += f"\n⚠️ Status check failed: {e}"
@@ -355,7 +355,7 @@ Sensitive actions require confirmation or PIN.
         
         if self.command_handler:
             try:
-                response = self.command_handler(text)
+                response = await asyncio.to_thread(self.command_handler, text)
                 self._log_command(user_id, text, response)
                 
                 # Split long responses
@@ -467,7 +467,7 @@ Sensitive actions require confirmation or PIN.
             status_text = "📊 *System Status*\n\n✅ JARVIS Online"
             if self.command_handler:
                 try:
-                    response = self.command_handler("system status brief")
+                    response = await asyncio.to_thread(self.command_handler, "system status brief")
                     status_text += f"\n\n{response}"
                 except Exception:
                     pass
@@ -493,13 +493,13 @@ Sensitive actions require confirmation or PIN.
             
             if self.command_handler:
                 if action == "all_on":
-                    result = self.command_handler("turn on all lights")
+                    result = await asyncio.to_thread(self.command_handler, "turn on all lights")
                 elif action == "all_off":
-                    result = self.command_handler("turn off all lights")
+                    result = await asyncio.to_thread(self.command_handler, "turn off all lights")
                 elif action == "living":
-                    result = self.command_handler("toggle living room lights")
+                    result = await asyncio.to_thread(self.command_handler, "toggle living room lights")
                 elif action == "bedroom":
-                    result = self.command_handler("toggle bedroom lights")
+                    result = await asyncio.to_thread(self.command_handler, "toggle bedroom lights")
             
             keyboard = [[InlineKeyboardButton("« Back", callback_data="lights_menu")]]
             await query.edit_message_text(
@@ -550,7 +550,7 @@ Sensitive actions require confirmation or PIN.
             
             # Execute action
             try:
-                result = action.callback()
+                result = await asyncio.to_thread(action.callback)
                 del self._pending_actions[action_id]
                 
                 keyboard = [[InlineKeyboardButton("« Back", callback_data="main_menu")]]
@@ -575,7 +575,7 @@ Sensitive actions require confirmation or PIN.
         elif data == "door_lock":
             result = "🔒 Door locked"
             if self.command_handler:
-                result = self.command_handler("lock the door")
+                result = await asyncio.to_thread(self.command_handler, "lock the door")
             
             keyboard = [[InlineKeyboardButton("« Back", callback_data="door_menu")]]
             await query.edit_message_text(result, reply_markup=InlineKeyboardMarkup(keyboard))
@@ -583,7 +583,7 @@ Sensitive actions require confirmation or PIN.
         elif data == "door_status":
             result = "🚪 Door status: Unknown"
             if self.command_handler:
-                result = self.command_handler("door status")
+                result = await asyncio.to_thread(self.command_handler, "door status")
             
             keyboard = [[InlineKeyboardButton("« Back", callback_data="door_menu")]]
             await query.edit_message_text(result, reply_markup=InlineKeyboardMarkup(keyboard))
@@ -592,7 +592,7 @@ Sensitive actions require confirmation or PIN.
         elif data.startswith("exec_"):
             command = context.user_data.get("pending_voice_command")
             if command and self.command_handler:
-                response = self.command_handler(command)
+                response = await asyncio.to_thread(self.command_handler, command)
                 await query.edit_message_text(f"✅ {response}")
             else:
                 await query.edit_message_text("❌ Command not found or expired.")
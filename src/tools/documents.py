@@ -9,12 +9,17 @@ Features:
 - Web page content extraction
 - Semantic chunking
 - Vector search with ChromaDB
+- Hybrid retrieval: BM25 over the same chunks fused with vector search,
+  optional cross-encoder reranking
 - Question answering with citations
+- Bulk directory ingestion: files are streamed page by page, unchanged
+  files and chunks are skipped by content hash, and embedding runs in
+  batches on a worker pool
 
 Dependencies:
 - chromadb: Vector database
 - pypdf2 or pdfplumber: PDF parsing
-- sentence-transformers: Embeddings (optional, uses ChromaDB default)
+- sentence-transformers: Embeddings and reranking (optional, uses ChromaDB default)
 """
 
 from __future__ import annotations
@@ -23,14 +28,22 @@ import asyncio
 import hashlib
 import os
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
 
 from loguru import logger
 
+from .retrieval import BM25Index, CrossEncoderReranker, reciprocal_rank_fusion
+
+from ..core.context_budget import ContextBuilder
+
 # ChromaDB (optional)
 try:
     import chromadb
@@ -94,14 +107,19 @@ class Document:
     name: str
     source: str  # File path or URL
     doc_type: DocumentType
-    content: str
+    content: str = ""  # Not retained for streamed file ingestion
     chunks: List[DocumentChunk] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     ingested_at: datetime = field(default_factory=datetime.now)
+    chunk_ids: List[str] = field(default_factory=list)
     
     @property
     def chunk_count(self) -> int:
-        return len(self.chunks)
+        return len(self.chunk_ids) or len(self.chunks)
+    
+    def get_chunk_ids(self) -> List[str]:
+        """IDs of this document's chunks in the vector store."""
+        return self.chunk_ids or [c.id for c in self.chunks]
     
     def format_info(self) -> str:
         """Format document info for display."""
@@ -118,6 +136,9 @@ class SearchResult:
     """A search result from the vector store."""
     chunk: DocumentChunk
     score: float
+    dense_rank: Optional[int] = None  # 1-based rank in vector search
+    sparse_rank: Optional[int] = None  # 1-based rank in BM25 search
+    rerank_score: Optional[float] = None
     
     def format_citation(self) -> str:
         """Format as a citation."""
@@ -129,13 +150,19 @@ class TextChunker:
     Splits text into semantic chunks for vector storage.
     
     Uses sentence-aware chunking with overlap for context continuity.
+    Text can be chunked in one piece or streamed block by block (pages,
+    paragraphs); both give the same chunks for the same text.
     """
     
+    _WHITESPACE = re.compile(r'\s+')
+    _SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+    
     def __init__(
         self,
         chunk_size: int = 500,
         chunk_overlap: int = 50,
         min_chunk_size: int = 100,
+        max_sentence_size: Optional[int] = None,
     ):
         """
         Initialize chunker.
@@ -144,10 +171,14 @@ class TextChunker:
             chunk_size: Target chunk size in characters
             chunk_overlap: Overlap between chunks
             min_chunk_size: Minimum chunk size
+            max_sentence_size: When streaming, text without a sentence break
+                is cut at this length so memory stays bounded
+                (default: 20 x chunk_size)
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
+        self.max_sentence_size = max_sentence_size or chunk_size * 20
     
     def chunk_text(self, text: str) -> List[str]:
         """
@@ -159,27 +190,51 @@ class TextChunker:
         Returns:
             List of text chunks
         """
-        # Clean text
-        text = re.sub(r'\s+', ' ', text).strip()
+        return list(self.iter_chunks([text]))
+    
+    def iter_sentences(self, blocks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield whitespace-normalized sentences from consecutive text blocks.
         
-        if len(text) <= self.chunk_size:
-            return [text] if len(text) >= self.min_chunk_size else []
+        Only the unfinished sentence at the end of a block is carried over
+        to the next one.
+        """
+        pending = ""
+        for block in blocks:
+            pending = self._WHITESPACE.sub(' ', f"{pending} {block}" if pending else block).lstrip()
+            parts = self._SENTENCE_BREAK.split(pending)
+            pending = parts.pop()
+            yield from parts
+            
+            if len(pending) > self.max_sentence_size:
+                yield pending
+                pending = ""
         
-        # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        pending = pending.strip()
+        if pending:
+            yield pending
+    
+    def iter_chunks(self, blocks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield chunks from consecutive text blocks (e.g. PDF pages).
         
-        chunks = []
+        Args:
+            blocks: Text blocks, in document order
+            
+        Yields:
+            Text chunks
+        """
         current_chunk = []
         current_length = 0
         
-        for sentence in sentences:
+        for sentence in self.iter_sentences(blocks):
             sentence_length = len(sentence)
             
             if current_length + sentence_length > self.chunk_size and current_chunk:
                 # Save current chunk
                 chunk_text = ' '.join(current_chunk)
                 if len(chunk_text) >= self.min_chunk_size:
-                    chunks.append(chunk_text)
+                    yield chunk_text
                 
                 # Start new chunk with overlap
                 overlap_text = ' '.join(current_chunk[-2:]) if len(current_chunk) > 1 else ''
@@ -193,9 +248,7 @@ class TextChunker:
         if current_chunk:
             chunk_text = ' '.join(current_chunk)
             if len(chunk_text) >= self.min_chunk_size:
-                chunks.append(chunk_text)
-        
-        return chunks
+                yield chunk_text
 
 
 class DocumentParser:
@@ -216,30 +269,61 @@ class DocumentParser:
         return type_map.get(ext, DocumentType.UNKNOWN)
     
     @staticmethod
-    def parse_pdf(path: str) -> str:
-        """Parse PDF file to text."""
+    def iter_pdf(path: str) -> Iterator[str]:
+        """Yield the text of each PDF page; pages are extracted one at a time."""
         if not PDF_AVAILABLE:
             raise ImportError("PDF parsing not available. Install pypdf.")
         
         reader = PdfReader(path)
-        text_parts = []
-        
         for page in reader.pages:
             text = page.extract_text()
             if text:
-                text_parts.append(text)
-        
-        return "\n\n".join(text_parts)
+                yield text
     
     @staticmethod
-    def parse_docx(path: str) -> str:
-        """Parse DOCX file to text."""
+    def iter_docx(path: str, block_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield DOCX paragraphs in blocks of roughly block_size characters."""
         if not DOCX_AVAILABLE:
             raise ImportError("DOCX parsing not available. Install python-docx.")
         
         doc = DocxDocument(path)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        return "\n\n".join(paragraphs)
+        block: List[str] = []
+        size = 0
+        for paragraph in doc.paragraphs:
+            if not paragraph.text.strip():
+                continue
+            block.append(paragraph.text)
+            size += len(paragraph.text)
+            if size >= block_size:
+                yield "\n\n".join(block)
+                block, size = [], 0
+        if block:
+            yield "\n\n".join(block)
+    
+    @staticmethod
+    def iter_text(path: str, block_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield a text file in blocks of whole lines."""
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            block: List[str] = []
+            size = 0
+            for line in f:
+                block.append(line)
+                size += len(line)
+                if size >= block_size:
+                    yield "".join(block)
+                    block, size = [], 0
+            if block:
+                yield "".join(block)
+    
+    @classmethod
+    def parse_pdf(cls, path: str) -> str:
+        """Parse PDF file to text."""
+        return "\n\n".join(cls.iter_pdf(path))
+    
+    @classmethod
+    def parse_docx(cls, path: str) -> str:
+        """Parse DOCX file to text."""
+        return "\n\n".join(cls.iter_docx(path))
     
     @staticmethod
     def parse_text(path: str) -> str:
@@ -285,6 +369,134 @@ class DocumentParser:
             doc_type = DocumentType.TEXT
         
         return content, doc_type
+    
+    @classmethod
+    def iter_file(cls, path: str) -> Tuple[Iterator[str], DocumentType]:
+        """
+        Stream a file as text blocks without loading it whole.
+        
+        HTML is still parsed in one piece (tags can span blocks).
+        
+        Returns:
+            Tuple of (block iterator, document type)
+        """
+        doc_type = cls.detect_type(path)
+        
+        if doc_type == DocumentType.PDF:
+            return cls.iter_pdf(path), doc_type
+        if doc_type == DocumentType.DOCX:
+            return cls.iter_docx(path), doc_type
+        if doc_type == DocumentType.HTML:
+            return iter([cls.parse_html(cls.parse_text(path))]), doc_type
+        if doc_type == DocumentType.UNKNOWN:
+            doc_type = DocumentType.TEXT
+        return cls.iter_text(path), doc_type
+
+
+@dataclass
+class IngestProgress:
+    """Running totals for a bulk ingestion."""
+    files_total: int = 0
+    files_done: int = 0
+    files_skipped: int = 0
+    files_failed: int = 0
+    chunks_embedded: int = 0
+    chunks_reused: int = 0
+    bytes_read: int = 0
+    current_file: Optional[str] = None
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+    
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+    
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks_embedded / self.elapsed if self.elapsed > 0 else 0.0
+    
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / (1024 * 1024) / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def format_summary(self) -> str:
+        """Format totals for display."""
+        return (
+            f"{self.files_done}/{self.files_total} files "
+            f"({self.files_skipped} unchanged, {self.files_failed} failed), "
+            f"{self.chunks_embedded} chunks embedded, {self.chunks_reused} reused, "
+            f"{self.elapsed:.1f}s ({self.chunks_per_second:.1f} chunks/s, {self.mb_per_second:.2f} MB/s)"
+        )
+
+
+class IngestManifest:
+    """
+    Record of ingested files and chunk hashes.
+    
+    Lets re-ingestion skip files whose content hash is unchanged and
+    re-embed only the chunks whose text changed.
+    """
+    
+    def __init__(self, db_path: Path | str):
+        from ..core.database import get_database
+        self._db = get_database(db_path)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                doc_id TEXT PRIMARY KEY,
+                source TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                doc_type TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                chunk_count INTEGER NOT NULL,
+                ingested_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS ingested_chunks (
+                doc_id TEXT NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                PRIMARY KEY (doc_id, chunk_index)
+            );
+        """)
+    
+    def get_file(self, source: str) -> Optional[Dict[str, Any]]:
+        row = self._db.fetchone("SELECT * FROM ingested_files WHERE source = ?", (source,))
+        return dict(row) if row else None
+    
+    def get_chunk_hashes(self, doc_id: str) -> Dict[int, str]:
+        rows = self._db.fetchall(
+            "SELECT chunk_index, content_hash FROM ingested_chunks WHERE doc_id = ?", (doc_id,)
+        )
+        return {row["chunk_index"]: row["content_hash"] for row in rows}
+    
+    def save(self, record: Dict[str, Any], chunk_hashes: List[str]) -> None:
+        """Store a file record and its chunk hashes, replacing older ones."""
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO ingested_files
+                (doc_id, source, name, doc_type, content_hash, size, mtime, chunk_count, ingested_at)
+                VALUES (:doc_id, :source, :name, :doc_type, :content_hash, :size, :mtime, :chunk_count, :ingested_at)
+                """,
+                record,
+            )
+            conn.execute("DELETE FROM ingested_chunks WHERE doc_id = ?", (record["doc_id"],))
+            conn.executemany(
+                "INSERT INTO ingested_chunks (doc_id, chunk_index, content_hash) VALUES (?, ?, ?)",
+                [(record["doc_id"], i, h) for i, h in enumerate(chunk_hashes)],
+            )
+    
+    def touch(self, doc_id: str, mtime: float) -> None:
+        self._db.execute("UPDATE ingested_files SET mtime = ? WHERE doc_id = ?", (mtime, doc_id))
+    
+    def remove(self, doc_id: str) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM ingested_files WHERE doc_id = ?", (doc_id,))
+            conn.execute("DELETE FROM ingested_chunks WHERE doc_id = ?", (doc_id,))
+    
+    def list_files(self) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self._db.fetchall("SELECT * FROM ingested_files ORDER BY ingested_at")]
 
 
 class DocumentService:
@@ -293,14 +505,35 @@ class DocumentService:
     
     Provides document ingestion, vector storage, and semantic search
     for question answering with citations.
+    
+    Files are ingested as a stream: blocks are parsed, chunked and sent
+    to the vector store in batches on a small worker pool, and only
+    chunk IDs are kept in memory. A manifest of content hashes makes
+    re-ingesting an unchanged file a no-op and a changed file re-embed
+    only the chunks that differ.
+    
+    Search is hybrid by default: a BM25 index over the same chunks is
+    queried alongside the vector store and the two rankings are fused
+    with reciprocal-rank fusion, so exact identifiers are found without
+    asking for more results.
     """
     
+    SUPPORTED_EXTENSIONS = (".pdf", ".txt", ".md", ".docx", ".html", ".htm")
+    
     def __init__(
         self,
         persist_directory: str = "data/documents",
         collection_name: str = "jarvis_documents",
         chunk_size: int = 500,
         chunk_overlap: int = 50,
+        embed_batch_size: int = 64,
+        embed_workers: int = 2,
+        max_pending_batches: int = 4,
+        hybrid: bool = True,
+        rrf_k: int = 60,
+        candidate_multiplier: int = 4,
+        rerank: bool = False,
+        rerank_budget: float = 0.15,
     ):
         """
         Initialize document service.
@@ -310,15 +543,37 @@ class DocumentService:
             collection_name: ChromaDB collection name
             chunk_size: Chunk size for text splitting
             chunk_overlap: Overlap between chunks
+            embed_batch_size: Chunks per vector store write (embedding batch)
+            embed_workers: Threads embedding batches concurrently
+            max_pending_batches: Batches queued per file before parsing waits
+            hybrid: Fuse BM25 results with vector search
+            rrf_k: Reciprocal-rank fusion constant
+            candidate_multiplier: Candidates fetched per ranking, as a
+                multiple of top_k
+            rerank: Rerank fused candidates with a cross-encoder
+                (needs sentence-transformers)
+            rerank_budget: Seconds reranking may spend per search
         """
         self.persist_directory = Path(persist_directory)
         self.collection_name = collection_name
         self.chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
         self.parser = DocumentParser()
+        self.embed_batch_size = embed_batch_size
+        self.embed_workers = embed_workers
+        self.max_pending_batches = max_pending_batches
+        self.hybrid = hybrid
+        self.rrf_k = rrf_k
+        self.candidate_multiplier = candidate_multiplier
+        self.reranker = CrossEncoderReranker(latency_budget=rerank_budget) if rerank else None
         
         self._client = None
         self._collection = None
         self._documents: Dict[str, Document] = {}
+        self._manifest: Optional[IngestManifest] = None
+        self._sparse_index: Optional[BM25Index] = None
+        self._sparse_checked = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
     
     def _get_client(self):
         """Get or create ChromaDB client."""
@@ -344,6 +599,30 @@ class DocumentService:
             )
         return self._collection
     
+    def _get_manifest(self) -> IngestManifest:
+        """Get or create the ingestion manifest."""
+        if self._manifest is None:
+            self.persist_directory.mkdir(parents=True, exist_ok=True)
+            self._manifest = IngestManifest(self.persist_directory / "ingest_manifest.db")
+        return self._manifest
+    
+    def _get_sparse_index(self) -> BM25Index:
+        """Get or create the BM25 index."""
+        if self._sparse_index is None:
+            self.persist_directory.mkdir(parents=True, exist_ok=True)
+            self._sparse_index = BM25Index(self.persist_directory / "sparse_index.db")
+        return self._sparse_index
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the embedding worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.embed_workers,
+                    thread_name_prefix="doc-embed",
+                )
+            return self._executor
+    
     def is_available(self) -> bool:
         """Check if document service is available."""
         return CHROMADB_AVAILABLE
@@ -352,17 +631,199 @@ class DocumentService:
         """Generate unique ID from content."""
         return hashlib.md5(content.encode()).hexdigest()[:12]
     
+    @staticmethod
+    def _hash_file(path: Path, block_size: int = 1024 * 1024) -> str:
+        """SHA-256 of a file, read in blocks."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _document_from_record(self, record: Dict[str, Any]) -> Document:
+        return Document(
+            id=record["doc_id"],
+            name=record["name"],
+            source=record["source"],
+            doc_type=DocumentType(record["doc_type"]),
+            chunk_ids=[f"{record['doc_id']}_{i}" for i in range(record["chunk_count"])],
+            metadata={"content_hash": record["content_hash"]},
+            ingested_at=datetime.fromtimestamp(record["ingested_at"]),
+        )
+    
+    def _upsert_batch(self, batch: List[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """Embed and store one batch of (id, text, metadata) chunks."""
+        self._get_collection().upsert(
+            ids=[chunk_id for chunk_id, _, _ in batch],
+            documents=[text for _, text, _ in batch],
+            metadatas=[meta for _, _, meta in batch],
+        )
+        self._get_sparse_index().add(
+            (chunk_id, text, meta.get("document_id", "")) for chunk_id, text, meta in batch
+        )
+        return len(batch)
+    
+    def _delete_chunks(self, chunk_ids: List[str]) -> None:
+        """Remove chunks from the vector store and the BM25 index."""
+        self._get_collection().delete(ids=chunk_ids)
+        self._get_sparse_index().remove(chunk_ids)
+    
+    def rebuild_sparse_index(self, page_size: int = 500) -> int:
+        """
+        Rebuild the BM25 index from the chunks in the vector store.
+        
+        Returns:
+            Number of chunks indexed
+        """
+        collection = self._get_collection()
+        index = self._get_sparse_index()
+        index.clear()
+        
+        total = 0
+        offset = 0
+        while True:
+            page = collection.get(include=["documents", "metadatas"], limit=page_size, offset=offset)
+            ids = page.get("ids") or []
+            if not ids:
+                break
+            metadatas = page.get("metadatas") or [{}] * len(ids)
+            total += index.add(
+                (chunk_id, text or "", (meta or {}).get("document_id", ""))
+                for chunk_id, text, meta in zip(ids, page["documents"], metadatas)
+            )
+            offset += len(ids)
+        
+        logger.info(f"Rebuilt BM25 index: {total} chunks")
+        return total
+    
+    def _ensure_sparse_index(self) -> BM25Index:
+        """BM25 index, backfilled once from the vector store if it is empty."""
+        index = self._get_sparse_index()
+        if not self._sparse_checked:
+            self._sparse_checked = True
+            if len(index) == 0 and self._get_collection().count() > 0:
+                self.rebuild_sparse_index()
+        return index
+    
+    def _ingest_path(
+        self,
+        path: Path,
+        metadata: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+        progress: Optional[IngestProgress] = None,
+    ) -> Tuple[Optional[Document], bool]:
+        """
+        Stream one file into the vector store (blocking).
+        
+        Returns:
+            Tuple of (document, skipped). Document is None when the file
+            produced no content.
+        """
+        progress = progress or IngestProgress()
+        manifest = self._get_manifest()
+        source = str(path.resolve())
+        stat = path.stat()
+        record = manifest.get_file(source)
+        
+        # Unchanged size and mtime: skip without reading the file
+        if record and not force and record["size"] == stat.st_size and record["mtime"] == stat.st_mtime:
+            return self._document_from_record(record), True
+        
+        content_hash = self._hash_file(path)
+        progress.bytes_read += stat.st_size
+        if record and not force and record["content_hash"] == content_hash:
+            manifest.touch(record["doc_id"], stat.st_mtime)
+            return self._document_from_record(record), True
+        
+        blocks, doc_type = self.parser.iter_file(str(path))
+        doc_id = self._generate_id(source)
+        # Needed even when forced, to delete chunks past the new end
+        previous = manifest.get_chunk_hashes(doc_id)
+        base_metadata = {
+            "source": source,
+            "doc_type": doc_type.value,
+            "document_id": doc_id,
+            **(metadata or {}),
+        }
+        
+        executor = self._get_executor()
+        pending: deque[Future] = deque()
+        batch: List[Tuple[str, str, Dict[str, Any]]] = []
+        chunk_hashes: List[str] = []
+        
+        def flush() -> None:
+            nonlocal batch
+            if not batch:
+                return
+            # Bound memory: wait for the oldest batch before queueing more
+            while len(pending) >= self.max_pending_batches:
+                progress.chunks_embedded += pending.popleft().result()
+            pending.append(executor.submit(self._upsert_batch, batch))
+            batch = []
+        
+        try:
+            for i, text in enumerate(self.chunker.iter_chunks(blocks)):
+                chunk_hash = hashlib.sha1(text.encode()).hexdigest()
+                chunk_hashes.append(chunk_hash)
+                if not force and previous.get(i) == chunk_hash:
+                    progress.chunks_reused += 1
+                    continue
+                batch.append((f"{doc_id}_{i}", text, {**base_metadata, "chunk_index": i}))
+                if len(batch) >= self.embed_batch_size:
+                    flush()
+            flush()
+        finally:
+            # Let every queued batch settle before returning or raising
+            errors = []
+            while pending:
+                try:
+                    progress.chunks_embedded += pending.popleft().result()
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+        
+        stale = [f"{doc_id}_{i}" for i in previous if i >= len(chunk_hashes)]
+        if stale:
+            self._delete_chunks(stale)
+        
+        if not chunk_hashes:
+            if record:
+                manifest.remove(doc_id)
+            return None, False
+        
+        record = {
+            "doc_id": doc_id,
+            "source": source,
+            "name": path.name,
+            "doc_type": doc_type.value,
+            "content_hash": content_hash,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "chunk_count": len(chunk_hashes),
+            "ingested_at": time.time(),
+        }
+        manifest.save(record, chunk_hashes)
+        document = self._document_from_record(record)
+        document.metadata.update(metadata or {})
+        return document, False
+    
     async def ingest_file(
         self,
         file_path: str,
         metadata: Optional[Dict[str, Any]] = None,
+        force: bool = False,
     ) -> Optional[Document]:
         """
         Ingest a document file.
         
+        Unchanged files are not re-read; changed files only re-embed the
+        chunks whose text changed.
+        
         Args:
             file_path: Path to the document
             metadata: Optional metadata to attach
+            force: Re-embed every chunk even if unchanged
             
         Returns:
             Ingested Document or None on failure
@@ -373,70 +834,105 @@ class DocumentService:
                 logger.error(f"File not found: {file_path}")
                 return None
             
-            # Parse document
-            content, doc_type = self.parser.parse_file(str(path))
+            progress = IngestProgress(files_total=1)
+            document, skipped = await asyncio.to_thread(self._ingest_path, path, metadata, force, progress)
             
-            if not content.strip():
+            if document is None:
                 logger.warning(f"No content extracted from {file_path}")
                 return None
             
-            # Create document
-            doc_id = self._generate_id(str(path) + content[:100])
-            document = Document(
-                id=doc_id,
-                name=path.name,
-                source=str(path),
-                doc_type=doc_type,
-                content=content,
-                metadata=metadata or {},
-            )
-            
-            # Chunk content
-            chunk_texts = self.chunker.chunk_text(content)
-            
-            # Create chunks
-            chunks = []
-            for i, chunk_text in enumerate(chunk_texts):
-                chunk = DocumentChunk(
-                    id=f"{doc_id}_{i}",
-                    content=chunk_text,
-                    document_id=doc_id,
-                    document_name=document.name,
-                    chunk_index=i,
-                    metadata={
-                        "source": str(path),
-                        "doc_type": doc_type.value,
-                        **(metadata or {}),
-                    },
-                )
-                chunks.append(chunk)
-            
-            document.chunks = chunks
-            
-            # Add to vector store
-            collection = self._get_collection()
-            
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: collection.add(
-                    ids=[c.id for c in chunks],
-                    documents=[c.content for c in chunks],
-                    metadatas=[c.metadata for c in chunks],
+            self._documents[document.id] = document
+            if skipped:
+                logger.info(f"Document unchanged, skipped: {document.name}")
+            else:
+                logger.info(
+                    f"Ingested document: {document.name} ({document.chunk_count} chunks, "
+                    f"{progress.chunks_embedded} embedded, {progress.chunks_reused} reused)"
                 )
-            )
-            
-            # Store document reference
-            self._documents[doc_id] = document
-            
-            logger.info(f"Ingested document: {document.name} ({len(chunks)} chunks)")
             return document
             
         except Exception as e:
             logger.error(f"Failed to ingest {file_path}: {e}")
             return None
     
+    def _ingest_many(
+        self,
+        paths: List[Path],
+        metadata: Optional[Dict[str, Any]],
+        force: bool,
+        progress: IngestProgress,
+        on_progress: Optional[Callable[[IngestProgress], None]],
+    ) -> IngestProgress:
+        for path in paths:
+            progress.current_file = str(path)
+            try:
+                document, skipped = self._ingest_path(path, metadata, force, progress)
+                if document is not None:
+                    self._documents[document.id] = document
+                if skipped:
+                    progress.files_skipped += 1
+            except Exception as e:
+                progress.files_failed += 1
+                progress.errors.append(f"{path.name}: {e}")
+                logger.error(f"Failed to ingest {path}: {e}")
+            progress.files_done += 1
+            
+            if on_progress:
+                try:
+                    on_progress(progress)
+                except Exception as e:
+                    logger.debug(f"Ingest progress callback failed: {e}")
+        
+        progress.current_file = None
+        return progress
+    
+    async def ingest_directory(
+        self,
+        directory: str,
+        recursive: bool = True,
+        extensions: Optional[Iterable[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+        prune: bool = False,
+        on_progress: Optional[Callable[[IngestProgress], None]] = None,
+    ) -> IngestProgress:
+        """
+        Ingest every supported file under a directory.
+        
+        Args:
+            directory: Directory to walk
+            recursive: Include subdirectories
+            extensions: File extensions to include (default: SUPPORTED_EXTENSIONS)
+            metadata: Metadata attached to every chunk
+            force: Re-embed unchanged files too
+            prune: Remove previously ingested files under the directory
+                that no longer exist
+            on_progress: Called after each file with running totals
+                (from a worker thread)
+            
+        Returns:
+            Final IngestProgress
+        """
+        root = Path(directory)
+        if not root.is_dir():
+            raise NotADirectoryError(f"Not a directory: {directory}")
+        
+        suffixes = {e.lower() for e in (extensions or self.SUPPORTED_EXTENSIONS)}
+        pattern = "**/*" if recursive else "*"
+        paths = sorted(p for p in root.glob(pattern) if p.is_file() and p.suffix.lower() in suffixes)
+        
+        progress = IngestProgress(files_total=len(paths))
+        await asyncio.to_thread(self._ingest_many, paths, metadata, force, progress, on_progress)
+        
+        if prune:
+            prefix = str(root.resolve()) + os.sep
+            for record in self._get_manifest().list_files():
+                if record["source"].startswith(prefix) and not Path(record["source"]).exists():
+                    await self.delete_document(record["doc_id"])
+        
+        logger.info(f"Ingested {root}: {progress.format_summary()}")
+        return progress
+    
     async def ingest_text(
         self,
         text: str,
@@ -482,16 +978,10 @@ class DocumentService:
             
             document.chunks = chunks
             
-            # Add to vector store
-            collection = self._get_collection()
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: collection.add(
-                    ids=[c.id for c in chunks],
-                    documents=[c.content for c in chunks],
-                    metadatas=[c.metadata for c in chunks],
-                )
+            # Add to vector store and BM25 index
+            await asyncio.to_thread(
+                self._upsert_batch,
+                [(c.id, c.content, {**c.metadata, "document_id": doc_id}) for c in chunks],
             )
             
             self._documents[doc_id] = document
@@ -502,6 +992,61 @@ class DocumentService:
             logger.error(f"Failed to ingest text: {e}")
             return None
     
+    @staticmethod
+    def _make_chunk(chunk_id: str, content: str, metadata: Optional[Dict[str, Any]]) -> DocumentChunk:
+        metadata = metadata or {}
+        return DocumentChunk(
+            id=chunk_id,
+            content=content or "",
+            document_id=metadata.get("document_id", ""),
+            document_name=metadata.get("source", "Unknown").split("/")[-1],
+            chunk_index=int(chunk_id.split("_")[-1]) if "_" in chunk_id else 0,
+            metadata=metadata,
+        )
+    
+    def _dense_search(
+        self,
+        query: str,
+        n_results: int,
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> List[Tuple[str, str, Dict[str, Any], float]]:
+        """Vector search; returns (id, text, metadata, cosine distance) tuples."""
+        results = self._get_collection().query(
+            query_texts=[query],
+            n_results=n_results,
+            where=filter_metadata,
+        )
+        if not (results and results["ids"] and results["ids"][0]):
+            return []
+        
+        ids = results["ids"][0]
+        documents = results["documents"][0] if results["documents"] else [""] * len(ids)
+        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
+        distances = results["distances"][0] if results["distances"] else [0] * len(ids)
+        return list(zip(ids, documents, metadatas, distances))
+    
+    def _sparse_search(self, query: str, n_results: int) -> List[str]:
+        """BM25 search; returns chunk IDs, best first."""
+        return [chunk_id for chunk_id, _ in self._ensure_sparse_index().search(query, top_k=n_results)]
+    
+    def _fetch_chunks(
+        self,
+        chunk_ids: List[str],
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Text and metadata of chunks found only by BM25, with the filter applied."""
+        if not chunk_ids:
+            return {}
+        page = self._get_collection().get(
+            ids=chunk_ids,
+            where=filter_metadata,
+            include=["documents", "metadatas"],
+        )
+        ids = page.get("ids") or []
+        documents = page.get("documents") or [""] * len(ids)
+        metadatas = page.get("metadatas") or [{}] * len(ids)
+        return {chunk_id: (text, meta) for chunk_id, text, meta in zip(ids, documents, metadatas)}
+    
     async def search(
         self,
         query: str,
@@ -511,6 +1056,11 @@ class DocumentService:
         """
         Search for relevant document chunks.
         
+        With hybrid search, vector and BM25 candidates are fetched
+        concurrently and fused with reciprocal-rank fusion; the score is
+        the fused score scaled so 1.0 means ranked first by both. Without
+        it, the score is the cosine similarity.
+        
         Args:
             query: Search query
             top_k: Number of results to return
@@ -520,51 +1070,66 @@ class DocumentService:
             List of SearchResult objects
         """
         try:
-            collection = self._get_collection()
-            
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: collection.query(
-                    query_texts=[query],
-                    n_results=top_k,
-                    where=filter_metadata,
-                )
+            if not self.hybrid:
+                dense = await asyncio.to_thread(self._dense_search, query, top_k, filter_metadata)
+                return [
+                    SearchResult(chunk=self._make_chunk(chunk_id, text, meta), score=1 - distance, dense_rank=rank)
+                    for rank, (chunk_id, text, meta, distance) in enumerate(dense, 1)
+                ]
+            
+            n_candidates = top_k * self.candidate_multiplier
+            dense, sparse_ids = await asyncio.gather(
+                asyncio.to_thread(self._dense_search, query, n_candidates, filter_metadata),
+                asyncio.to_thread(self._sparse_search, query, n_candidates),
             )
             
-            search_results = []
-            
-            if results and results["ids"] and results["ids"][0]:
-                for i, chunk_id in enumerate(results["ids"][0]):
-                    # Find the chunk
-                    content = results["documents"][0][i] if results["documents"] else ""
-                    metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                    distance = results["distances"][0][i] if results["distances"] else 0
-                    
-                    # Convert distance to similarity score
-                    score = 1 - distance  # For cosine distance
-                    
-                    chunk = DocumentChunk(
-                        id=chunk_id,
-                        content=content,
-                        document_id=metadata.get("document_id", ""),
-                        document_name=metadata.get("source", "Unknown").split("/")[-1],
-                        chunk_index=int(chunk_id.split("_")[-1]) if "_" in chunk_id else 0,
-                        metadata=metadata,
-                    )
-                    
-                    search_results.append(SearchResult(chunk=chunk, score=score))
-            
-            return search_results
+            found = {chunk_id: (text, meta) for chunk_id, text, meta, _ in dense}
+            missing = [chunk_id for chunk_id in sparse_ids if chunk_id not in found]
+            if missing:
+                found.update(await asyncio.to_thread(self._fetch_chunks, missing, filter_metadata))
+            
+            dense_ids = [chunk_id for chunk_id, _, _, _ in dense]
+            sparse_ids = [chunk_id for chunk_id in sparse_ids if chunk_id in found]
+            dense_rank = {chunk_id: rank for rank, chunk_id in enumerate(dense_ids, 1)}
+            sparse_rank = {chunk_id: rank for rank, chunk_id in enumerate(sparse_ids, 1)}
+            best_possible = 2 / (self.rrf_k + 1)
+            
+            candidates = [
+                SearchResult(
+                    chunk=self._make_chunk(chunk_id, *found[chunk_id]),
+                    score=fused / best_possible,
+                    dense_rank=dense_rank.get(chunk_id),
+                    sparse_rank=sparse_rank.get(chunk_id),
+                )
+                for chunk_id, fused in reciprocal_rank_fusion([dense_ids, sparse_ids], k=self.rrf_k)[:n_candidates]
+            ]
+            
+            if self.reranker is not None and len(candidates) > 1:
+                candidates = await asyncio.to_thread(self._rerank, query, candidates)
+            
+            return candidates[:top_k]
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
     
+    def _rerank(self, query: str, candidates: List[SearchResult]) -> List[SearchResult]:
+        """Order candidates by cross-encoder score; unscored ones keep fused order."""
+        scored = self.reranker.rerank(query, [c.chunk.content for c in candidates])
+        if not scored:
+            return candidates
+        
+        reranked = []
+        for i, score in scored:
+            candidates[i].rerank_score = score
+            reranked.append(candidates[i])
+        return reranked + [c for c in candidates if c.rerank_score is None]
+    
     async def query_documents(
         self,
         question: str,
         top_k: int = 5,
+        max_tokens: Optional[int] = None,
     ) -> Tuple[str, List[SearchResult]]:
         """
         Query documents and return relevant context.
@@ -572,9 +1137,11 @@ class DocumentService:
         Args:
             question: User question
             top_k: Number of chunks to retrieve
+            max_tokens: Token budget for the context; lower-ranked chunks
+                are truncated or left out first
             
         Returns:
-            Tuple of (context string, search results)
+            Tuple of (context string, search results used in the context)
         """
         results = await self.search(question, top_k=top_k)
         
@@ -582,18 +1149,28 @@ class DocumentService:
             return "", []
         
         # Build context from results
-        context_parts = []
-        for i, result in enumerate(results, 1):
-            context_parts.append(
-                f"[Source {i}: {result.chunk.document_name}]\n{result.chunk.content}"
-            )
+        context_parts = [
+            f"[Source {i}: {result.chunk.document_name}]\n{result.chunk.content}"
+            for i, result in enumerate(results, 1)
+        ]
+        
+        if max_tokens is None:
+            return "\n\n---\n\n".join(context_parts), results
+        
+        builder = ContextBuilder(max_tokens, label="documents", separator="\n\n---\n\n")
+        for i, (result, part) in enumerate(zip(results, context_parts)):
+            builder.add(result.chunk.id, part, priority=-i, kind="docs")
+        context = builder.build()
         
-        context = "\n\n---\n\n".join(context_parts)
-        return context, results
+        included = {piece.name for piece in context.included}
+        return context.text, [r for r in results if r.chunk.id in included]
     
     def list_documents(self) -> List[Document]:
-        """List all ingested documents."""
-        return list(self._documents.values())
+        """List all ingested documents, including files from earlier sessions."""
+        documents = dict(self._documents)
+        for record in self._get_manifest().list_files():
+            documents.setdefault(record["doc_id"], self._document_from_record(record))
+        return list(documents.values())
     
     async def delete_document(self, doc_id: str) -> bool:
         """
@@ -606,22 +1183,20 @@ class DocumentService:
             True if deleted successfully
         """
         try:
-            if doc_id not in self._documents:
+            document = self._documents.get(doc_id)
+            if document is None:
+                document = next((d for d in self.list_documents() if d.id == doc_id), None)
+            if document is None:
                 return False
             
-            document = self._documents[doc_id]
-            chunk_ids = [c.id for c in document.chunks]
+            chunk_ids = document.get_chunk_ids()
             
-            # Delete from vector store
-            collection = self._get_collection()
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: collection.delete(ids=chunk_ids)
-            )
+            # Delete from vector store and BM25 index
+            await asyncio.to_thread(self._delete_chunks, chunk_ids)
             
-            # Remove from cache
-            del self._documents[doc_id]
+            # Remove from cache and manifest
+            self._documents.pop(doc_id, None)
+            self._get_manifest().remove(doc_id)
             
             logger.info(f"Deleted document: {document.name}")
             return True
@@ -629,6 +1204,13 @@ class DocumentService:
         except Exception as e:
             logger.error(f"Failed to delete document: {e}")
             return False
+    
+    def close(self) -> None:
+        """Stop the embedding worker pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
 
 
 # Singleton instance
@@ -682,6 +1264,34 @@ async def ingest_document(file_path: str) -> str:
         return f"Failed to ingest document: {e}"
 
 
+async def ingest_folder(directory_path: str) -> str:
+    """
+    Ingest every supported document in a folder (recursively).
+    
+    Args:
+        directory_path: Folder to ingest
+        
+    Returns:
+        Summary message
+    """
+    try:
+        service = get_document_service()
+        
+        if not service.is_available():
+            return "Document service not available. Install chromadb: pip install chromadb"
+        
+        progress = await service.ingest_directory(directory_path)
+        
+        lines = [f"✅ Ingested folder: **{directory_path}**", f"   {progress.format_summary()}"]
+        for error in progress.errors[:5]:
+            lines.append(f"   ⚠️ {error}")
+        return "\n".join(lines)
+        
+    except Exception as e:
+        logger.error(f"Failed to ingest folder: {e}")
+        return f"Failed to ingest folder: {e}"
+
+
 async def query_documents(question: str) -> str:
     """
     Ask a question about ingested documents.
@@ -808,6 +1418,21 @@ DOCUMENT_TOOLS = [
         },
         "function": ingest_document,
     },
+    {
+        "name": "ingest_folder",
+        "description": "Ingest all documents (PDF, TXT, DOCX, MD, HTML) in a folder. Unchanged files are skipped, so this can be re-run to pick up edits.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Full path to the folder"
+                }
+            },
+            "required": ["directory_path"]
+        },
+        "function": ingest_folder,
+    },
     {
         "name": "query_documents",
         "description": "Ask a question about ingested documents. Use this when the user asks about their documents or uploaded files.",
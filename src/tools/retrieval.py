@@ -0,0 +1,359 @@
+"""
+Hybrid Retrieval for the JARVIS Document Service.
+
+Dense (embedding) search misses exact identifiers such as course codes,
+error strings and names, so document search also keeps a sparse index
+and fuses both rankings:
+- BM25 index over the same chunks, persisted in SQLite and updated as
+  chunks are added or removed
+- Reciprocal-rank fusion (RRF) of the dense and sparse rankings
+- Optional cross-encoder reranking of the fused candidates within a
+  latency budget
+
+Usage:
+    index = BM25Index("data/documents/sparse_index.db")
+    index.add([("doc_0", "CS 61A midterm covers recursion", "doc")])
+    sparse = index.search("cs61a midterm", top_k=20)
+
+    fused = reciprocal_rank_fusion([dense_ids, [cid for cid, _ in sparse]])
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..core.database import get_database
+
+# Cross-encoder reranking (optional)
+try:
+    from sentence_transformers import CrossEncoder
+    CROSS_ENCODER_AVAILABLE = True
+except ImportError:
+    CROSS_ENCODER_AVAILABLE = False
+    logger.debug("sentence-transformers not installed; reranking disabled")
+
+
+# Words joined by . - _ : / # stay together ("cs-61a", "err_conn_refused")
+_TOKEN = re.compile(r"\w+(?:[.\-:/#]\w+)*")
+_TOKEN_PARTS = re.compile(r"[.\-:/#_]+")
+_ALPHA_DIGIT = re.compile(r"[^\W\d_]+|\d+")
+
+_STOPWORDS = frozenset("""
+    a an and are as at be but by for from has have he her his i if in into is it its
+    me my not of on or our she so than that the their them then there these they this
+    to was we were what when where which who will with you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into BM25 terms.
+
+    Compound identifiers are kept whole and also split into their parts,
+    and mixed letter/digit words are split too, so "CS-61A", "cs61a" and
+    "CS 61 A" share terms.
+    """
+    terms: List[str] = []
+    for match in _TOKEN.finditer(text.lower()):
+        token = match.group()
+        parts = [p for p in _TOKEN_PARTS.split(token) if p]
+        pieces = [piece for part in parts for piece in _ALPHA_DIGIT.findall(part)]
+
+        if len(pieces) > 1:
+            terms.append(token)
+            terms.extend(p for p in parts if len(parts) > 1)
+            terms.extend(pieces)
+        elif token not in _STOPWORDS:
+            terms.append(token)
+    return terms
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked ID lists with reciprocal-rank fusion.
+
+    Each list contributes weight / (k + rank) for every ID it contains.
+
+    Args:
+        rankings: ID lists, best first
+        k: Rank smoothing constant (60 is the usual choice)
+        weights: Per-ranking weights (default: 1.0 each)
+
+    Returns:
+        (id, fused score) pairs, best first
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = defaultdict(float)
+    for ranking, weight in zip(rankings, weights):
+        for rank, item_id in enumerate(ranking, 1):
+            scores[item_id] += weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class BM25Index:
+    """
+    Persistent BM25 index over document chunks.
+
+    Postings live in SQLite (term, chunk, term frequency) so the index
+    survives restarts and is updated per chunk rather than rebuilt.
+    Collection statistics (chunk count, average length) are cached and
+    refreshed after writes.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        k1: float = 1.5,
+        b: float = 0.75,
+        max_df_ratio: float = 0.5,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: SQLite file for the postings
+            k1: Term frequency saturation
+            b: Length normalization strength
+            max_df_ratio: Terms found in more than this share of chunks are
+                ignored in multi-term queries (they barely move the score)
+        """
+        self.k1 = k1
+        self.b = b
+        self.max_df_ratio = max_df_ratio
+        self._db = get_database(db_path)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS bm25_chunks (
+                chunk_id TEXT PRIMARY KEY,
+                document_id TEXT NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_bm25_chunks_document ON bm25_chunks(document_id);
+            CREATE TABLE IF NOT EXISTS bm25_postings (
+                term TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, chunk_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_bm25_postings_chunk ON bm25_postings(chunk_id);
+        """)
+        self._stats: Optional[Tuple[int, float]] = None
+        self._lock = threading.Lock()
+
+    def _collection_stats(self) -> Tuple[int, float]:
+        """(chunk count, average chunk length), cached until the next write."""
+        with self._lock:
+            if self._stats is None:
+                row = self._db.fetchone("SELECT COUNT(*) AS n, AVG(length) AS avg_len FROM bm25_chunks")
+                self._stats = (row["n"], row["avg_len"] or 0.0)
+            return self._stats
+
+    def _invalidate(self) -> None:
+        with self._lock:
+            self._stats = None
+
+    def __len__(self) -> int:
+        return self._collection_stats()[0]
+
+    def add(self, chunks: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Index (chunk_id, text, document_id) chunks, replacing earlier versions.
+
+        Returns:
+            Number of chunks indexed
+        """
+        count = 0
+        with self._db.transaction() as conn:
+            for chunk_id, text, document_id in chunks:
+                terms = Counter(tokenize(text))
+                conn.execute("DELETE FROM bm25_postings WHERE chunk_id = ?", (chunk_id,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO bm25_chunks (chunk_id, document_id, length) VALUES (?, ?, ?)",
+                    (chunk_id, document_id, sum(terms.values())),
+                )
+                conn.executemany(
+                    "INSERT INTO bm25_postings (term, chunk_id, tf) VALUES (?, ?, ?)",
+                    [(term, chunk_id, tf) for term, tf in terms.items()],
+                )
+                count += 1
+        self._invalidate()
+        return count
+
+    def remove(self, chunk_ids: Iterable[str]) -> None:
+        """Drop chunks from the index."""
+        params = [(chunk_id,) for chunk_id in chunk_ids]
+        if not params:
+            return
+        with self._db.transaction() as conn:
+            conn.executemany("DELETE FROM bm25_postings WHERE chunk_id = ?", params)
+            conn.executemany("DELETE FROM bm25_chunks WHERE chunk_id = ?", params)
+        self._invalidate()
+
+    def remove_document(self, document_id: str) -> None:
+        """Drop every chunk of a document."""
+        with self._db.transaction() as conn:
+            conn.execute(
+                "DELETE FROM bm25_postings WHERE chunk_id IN "
+                "(SELECT chunk_id FROM bm25_chunks WHERE document_id = ?)",
+                (document_id,),
+            )
+            conn.execute("DELETE FROM bm25_chunks WHERE document_id = ?", (document_id,))
+        self._invalidate()
+
+    def search(self, query: str, top_k: int = 20) -> List[Tuple[str, float]]:
+        """
+        Rank chunks against a query.
+
+        Returns:
+            (chunk_id, BM25 score) pairs, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        n, avg_len = self._collection_stats()
+        if not terms or n == 0:
+            return []
+
+        placeholders = ",".join("?" * len(terms))
+        df = {
+            row["term"]: row["df"]
+            for row in self._db.fetchall(
+                f"SELECT term, COUNT(*) AS df FROM bm25_postings WHERE term IN ({placeholders}) GROUP BY term",
+                terms,
+            )
+        }
+        if not df:
+            return []
+
+        # Skip near-ubiquitous terms unless nothing else matched
+        selective = [t for t in df if df[t] <= n * self.max_df_ratio] or list(df)
+        idf = {t: math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5)) for t in selective}
+
+        placeholders = ",".join("?" * len(selective))
+        rows = self._db.fetchall(
+            f"""
+            SELECT p.term, p.chunk_id, p.tf, c.length
+            FROM bm25_postings p JOIN bm25_chunks c ON c.chunk_id = p.chunk_id
+            WHERE p.term IN ({placeholders})
+            """,
+            selective,
+        )
+
+        scores: Dict[str, float] = defaultdict(float)
+        for row in rows:
+            tf = row["tf"]
+            norm = self.k1 * (1 - self.b + self.b * row["length"] / (avg_len or 1.0))
+            scores[row["chunk_id"]] += idf[row["term"]] * tf * (self.k1 + 1) / (tf + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+    def clear(self) -> None:
+        """Drop every posting."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM bm25_postings")
+            conn.execute("DELETE FROM bm25_chunks")
+        self._invalidate()
+
+
+class CrossEncoderReranker:
+    """
+    Cross-encoder reranking with a latency budget.
+
+    The model loads in the background on first use; until it is ready,
+    rerank() returns None and callers keep the fused order. Candidates
+    are scored in batches, best fused rank first, and scoring stops once
+    the next batch would overrun the budget.
+    """
+
+    DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        latency_budget: float = 0.15,
+        batch_size: int = 8,
+    ):
+        """
+        Initialize the reranker.
+
+        Args:
+            model_name: sentence-transformers cross-encoder model
+            latency_budget: Seconds a rerank call may spend scoring
+            batch_size: Pairs scored per model call
+        """
+        self.model_name = model_name
+        self.latency_budget = latency_budget
+        self.batch_size = batch_size
+        self._model = None
+        self._loading: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return CROSS_ENCODER_AVAILABLE
+
+    def _load(self) -> None:
+        try:
+            model = CrossEncoder(self.model_name)
+            with self._lock:
+                self._model = model
+            logger.info(f"Reranker loaded: {self.model_name}")
+        except Exception as e:
+            logger.warning(f"Failed to load reranker {self.model_name}: {e}")
+
+    def warmup(self) -> bool:
+        """Start loading the model if needed; True once it is ready."""
+        with self._lock:
+            if self._model is not None:
+                return True
+            if not CROSS_ENCODER_AVAILABLE:
+                return False
+            if self._loading is None:
+                self._loading = threading.Thread(target=self._load, name="reranker-load", daemon=True)
+                self._loading.start()
+        return False
+
+    def rerank(self, query: str, texts: Sequence[str]) -> Optional[List[Tuple[int, float]]]:
+        """
+        Score candidates against the query.
+
+        Args:
+            query: Search query
+            texts: Candidate texts, best fused rank first
+
+        Returns:
+            (candidate index, score) pairs, best first, covering the
+            candidates scored within the budget; None if the model is not
+            ready or scoring failed
+        """
+        if not texts or not self.warmup():
+            return None
+
+        start = time.perf_counter()
+        scored: List[Tuple[int, float]] = []
+        batch_time = 0.0
+        try:
+            for offset in range(0, len(texts), self.batch_size):
+                elapsed = time.perf_counter() - start
+                if scored and elapsed + batch_time > self.latency_budget:
+                    break
+                batch_start = time.perf_counter()
+                batch = texts[offset:offset + self.batch_size]
+                scores = self._model.predict([(query, text) for text in batch])
+                scored.extend((offset + i, float(s)) for i, s in enumerate(scores))
+                batch_time = time.perf_counter() - batch_start
+        except Exception as e:
+            logger.warning(f"Reranking failed: {e}")
+            return None
+
+        if len(scored) < len(texts):
+            logger.debug(f"Reranked {len(scored)}/{len(texts)} candidates within {self.latency_budget * 1000:.0f} ms")
+        return sorted(scored, key=lambda item: item[1], reverse=True)
@@ -23,10 +23,14 @@ try:
         AudioPreprocessor,
         TranscriptionResult,
         STTProvider,
+        SpeculativeTranscription,
+        BeamSizePolicy,
     )
 except ImportError as e:
     logger.warning(f"Enhanced STT not available: {e}")
     EnhancedSpeechToText = None
+    SpeculativeTranscription = None
+    BeamSizePolicy = None
     EnhancedSileroVAD = None
     AudioPreprocessor = None
     STTProvider = None
@@ -44,8 +48,39 @@ except ImportError as e:
     WakeWordConfig = None
     WakeWordDetection = None
 
+# Shared microphone capture
+try:
+    from .audio_bus import AudioCaptureBus, AudioSubscription
+except ImportError as e:
+    logger.warning(f"Audio capture bus not available: {e}")
+    AudioCaptureBus = None
+    AudioSubscription = None
+
 from .tts import TextToSpeech, InterruptibleTTS
 
+# Pipelined TTS playback
+try:
+    from .tts_pipeline import (
+        PipelinedSpeechEngine,
+        AudioOutputStream,
+        PCMRingBuffer,
+        SpeechItem,
+    )
+except ImportError as e:
+    logger.warning(f"Pipelined TTS not available: {e}")
+    PipelinedSpeechEngine = None
+    AudioOutputStream = None
+    PCMRingBuffer = None
+    SpeechItem = None
+
+# Synthesized speech cache
+try:
+    from .tts_cache import TTSAudioCache, get_tts_cache
+except ImportError as e:
+    logger.warning(f"TTS cache not available: {e}")
+    TTSAudioCache = None
+    get_tts_cache = None
+
 # Audio cues
 try:
     from .audio_cues import (
@@ -151,10 +186,20 @@ __all__ = [
     "ConversationState",
     "TranscriptionResult",
     "STTProvider",
+    "SpeculativeTranscription",
+    "BeamSizePolicy",
     "WakeWordConfig",
     "WakeWordDetection",
     "TextToSpeech",
     "InterruptibleTTS",
+    "AudioCaptureBus",
+    "AudioSubscription",
+    "PipelinedSpeechEngine",
+    "AudioOutputStream",
+    "PCMRingBuffer",
+    "SpeechItem",
+    "TTSAudioCache",
+    "get_tts_cache",
     # Audio cues
     "AudioCuePlayer",
     "AudioCueGenerator",
@@ -0,0 +1,334 @@
+"""
+Shared Audio Capture Bus for JARVIS.
+
+One always-on input stream owns the microphone and writes into a
+preallocated ring buffer; wake word detection, VAD, command recording
+and calibration read from it as independent consumers:
+- The audio callback is the only writer and never takes a lock on the
+  buffer; readers address samples by absolute index
+- Each consumer keeps its own cursor, so a slow consumer never blocks
+  the callback or the other consumers (it skips ahead on overrun)
+- Recent audio stays available, so a command recording can start from a
+  pre-roll before the point the wake word fired
+
+Usage:
+    bus = AudioCaptureBus(sample_rate=16000, buffer_seconds=30)
+    bus.start()
+
+    wake = bus.subscribe("wake_word")
+    chunk = wake.read(1280, timeout=0.5)
+
+    command = bus.subscribe("command", start=detection.sample_index, pre_roll=0.3)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    SOUNDDEVICE_AVAILABLE = False
+    sd = None
+
+from .streaming_stt import AudioRingBuffer
+
+
+class AudioSubscription:
+    """
+    A consumer's cursor into the capture bus.
+
+    Reads return consecutive audio from the cursor onward. If the
+    consumer falls more than the buffer length behind, the cursor jumps
+    to the oldest sample still held and the overrun is counted.
+    """
+
+    def __init__(self, bus: "AudioCaptureBus", name: str, start: int):
+        self.bus = bus
+        self.name = name
+        self.position = start
+        self.overruns = 0
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def available(self) -> int:
+        """Samples written past the cursor."""
+        return max(0, self.bus.total_written - self.position)
+
+    def _resync(self) -> None:
+        oldest = self.bus.oldest
+        if self.position < oldest:
+            self.overruns += 1
+            logger.debug(f"Audio consumer '{self.name}' overrun, skipped {oldest - self.position} samples")
+            self.position = oldest
+
+    def read(self, frames: int, timeout: Optional[float] = None) -> Optional["np.ndarray"]:
+        """
+        Read the next `frames` samples, waiting for them if needed.
+
+        Args:
+            frames: Number of samples to read
+            timeout: Seconds to wait (None waits until the bus stops)
+
+        Returns:
+            float32 samples, or None on timeout, when the bus stops or
+            when the subscription is closed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._closed:
+            self._resync()
+            end = self.position + frames
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self.bus.wait_for(end, remaining):
+                return None
+
+            chunk = self.bus.ring.read(self.position, end)
+            # The writer may have lapped the cursor while we were copying
+            if self.bus.oldest > self.position or len(chunk) < frames:
+                continue
+            self.position = end
+            return chunk
+        return None
+
+    def read_available(self, max_frames: Optional[int] = None) -> "np.ndarray":
+        """Read whatever has arrived since the last read without waiting."""
+        self._resync()
+        end = self.bus.total_written
+        if max_frames is not None:
+            end = min(end, self.position + max_frames)
+        chunk = self.bus.ring.read(self.position, end)
+        self.position += len(chunk)
+        return chunk
+
+    def seek(self, position: int) -> None:
+        """Move the cursor to an absolute sample index."""
+        self.position = max(self.bus.oldest, min(position, self.bus.total_written))
+
+    def close(self) -> None:
+        self._closed = True
+        self.bus._unsubscribe(self)
+
+
+class AudioCaptureBus:
+    """
+    Always-on microphone capture shared by all voice consumers.
+
+    The input stream is opened once and kept open; consumers subscribe
+    and read at their own pace instead of opening streams of their own.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        buffer_seconds: float = 30.0,
+        blocksize: int = 1280,
+        device: Optional[int] = None,
+    ):
+        """
+        Initialize the capture bus.
+
+        Args:
+            sample_rate: Capture sample rate (mono float32)
+            buffer_seconds: Audio history kept for pre-roll and slow consumers
+            blocksize: Frames per audio callback
+            device: Input device index (None for the default device)
+        """
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize
+        self.device = device
+        self.ring = AudioRingBuffer(int(sample_rate * buffer_seconds))
+
+        self._cond = threading.Condition()
+        self._epoch = 0  # Bumped by stop() to release blocked readers
+        self._stream = None
+        self._running = False
+        self._subscribers: List[AudioSubscription] = []
+        self._status_errors = 0
+
+    @property
+    def is_available(self) -> bool:
+        return SOUNDDEVICE_AVAILABLE and NUMPY_AVAILABLE
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def total_written(self) -> int:
+        """Absolute index one past the newest sample."""
+        return self.ring.total_written
+
+    @property
+    def oldest(self) -> int:
+        """Absolute index of the oldest sample still buffered."""
+        return self.ring.oldest
+
+    def seconds_to_samples(self, seconds: float) -> int:
+        return int(seconds * self.sample_rate)
+
+    def start(self) -> bool:
+        """
+        Open the input stream.
+
+        Returns:
+            True if the bus is capturing
+        """
+        if self._running:
+            return True
+        if not self.is_available:
+            logger.warning("Audio capture not available (sounddevice/numpy missing)")
+            return False
+
+        try:
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype=np.float32,
+                blocksize=self.blocksize,
+                device=self.device,
+                callback=self._audio_callback,
+            )
+            self._stream.start()
+        except Exception as e:
+            logger.error(f"Failed to open audio input: {e}")
+            self._stream = None
+            return False
+
+        self._running = True
+        logger.info(f"Audio capture started ({self.sample_rate} Hz, {self.ring.capacity / self.sample_rate:.0f}s buffer)")
+        return True
+
+    def stop(self) -> None:
+        """Close the input stream and release blocked readers."""
+        self._running = False
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing audio input: {e}")
+            self._stream = None
+
+        with self._cond:
+            self._epoch += 1
+            self._cond.notify_all()
+
+    def _audio_callback(self, indata, frames, time_info, status) -> None:
+        """sounddevice callback: append the block to the ring."""
+        if status:
+            self._status_errors += 1
+            logger.debug(f"Audio input status: {status}")
+        self.write(indata[:, 0])
+
+    def write(self, samples: "np.ndarray") -> None:
+        """
+        Append captured samples and wake waiting readers.
+
+        Only one thread may write (normally the audio callback).
+        """
+        self.ring.write(samples)
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait_for(self, index: int, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the sample before `index` has been captured.
+
+        Returns:
+            False on timeout or if the bus was stopped while waiting
+        """
+        if self.ring.total_written >= index:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            epoch = self._epoch
+            while self.ring.total_written < index:
+                if self._epoch != epoch:
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def subscribe(
+        self,
+        name: str,
+        start: Optional[int] = None,
+        pre_roll: float = 0.0,
+    ) -> AudioSubscription:
+        """
+        Add a consumer.
+
+        Args:
+            name: Consumer name (for stats and logs)
+            start: Absolute sample index to start from (default: now)
+            pre_roll: Seconds of buffered audio before `start` to include
+
+        Returns:
+            Subscription reading from the requested position
+        """
+        start = self.total_written if start is None else min(start, self.total_written)
+        start = max(self.oldest, start - self.seconds_to_samples(pre_roll))
+        subscription = AudioSubscription(self, name, start)
+        with self._cond:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: AudioSubscription) -> None:
+        with self._cond:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def read(self, start: int, end: Optional[int] = None) -> "np.ndarray":
+        """Copy buffered samples in [start, end) by absolute index."""
+        return self.ring.read(start, end)
+
+    def capture(self, duration: float, timeout: Optional[float] = None) -> Optional["np.ndarray"]:
+        """
+        Collect the next `duration` seconds of audio.
+
+        Returns:
+            float32 samples, or None if they did not arrive in time
+        """
+        subscription = self.subscribe("capture")
+        try:
+            return subscription.read(
+                self.seconds_to_samples(duration),
+                timeout=duration + 2.0 if timeout is None else timeout,
+            )
+        finally:
+            subscription.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Capture state and per-consumer lag."""
+        total = self.total_written
+        with self._cond:
+            consumers = {
+                s.name: {"lag_samples": total - s.position, "overruns": s.overruns}
+                for s in self._subscribers
+            }
+        return {
+            "running": self._running,
+            "sample_rate": self.sample_rate,
+            "buffered_seconds": len(self.ring) / self.sample_rate,
+            "captured_seconds": total / self.sample_rate,
+            "status_errors": self._status_errors,
+            "consumers": consumers,
+        }
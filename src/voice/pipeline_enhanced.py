@@ -7,6 +7,8 @@ Features:
 - Graceful TTS cutoff
 - Command queue management
 - State machine for voice interaction
+- One shared microphone stream with pre-roll for command recording
+- Speculative transcription while the command is being spoken
 """
 
 from __future__ import annotations
@@ -37,6 +39,7 @@ except ImportError:
     SOUNDDEVICE_AVAILABLE = False
     sd = None
 
+from .audio_bus import AudioCaptureBus, AudioSubscription
 from .wake_word_enhanced import EnhancedWakeWordDetector, WakeWordConfig, WakeWordDetection
 from .stt_enhanced import EnhancedSpeechToText, TranscriptionResult, EnhancedSileroVAD
 from .tts import TextToSpeech
@@ -109,9 +112,17 @@ class InterruptibleTTSPlayer:
         vad: Optional[EnhancedSileroVAD] = None,
         interrupt_threshold: float = 0.6,
         fadeout_duration: float = 0.1,
+        audio_bus: Optional[AudioCaptureBus] = None,
+        speech_engine: Optional[Any] = None,
+        runtime: Optional[Any] = None,
     ):
         self.tts = tts
         self.vad = vad or EnhancedSileroVAD(threshold=interrupt_threshold)
+        self.audio_bus = audio_bus
+        # Pipelined sentence-by-sentence playback (PipelinedSpeechEngine),
+        # driven on an AsyncRuntime loop
+        self.speech_engine = speech_engine
+        self.runtime = runtime
         self.interrupt_threshold = interrupt_threshold
         self.fadeout_duration = fadeout_duration
         
@@ -176,6 +187,15 @@ class InterruptibleTTSPlayer:
         """Playback loop with interruption checking."""
         self._playing = True
         
+        if self.speech_engine is not None:
+            try:
+                self._play_pipelined(text)
+            except Exception as e:
+                logger.error(f"Playback error: {e}")
+            finally:
+                self._playing = False
+            return
+        
         try:
             # Synthesize audio
             audio_data = self.tts.synthesize(text)
@@ -231,14 +251,76 @@ class InterruptibleTTSPlayer:
         finally:
             self._playing = False
     
+    def _play_pipelined(self, text: str) -> None:
+        """
+        Speak through the speech engine, one sentence at a time.
+        
+        The reply goes through StreamingResponseHandler, so the first
+        sentence plays while the following ones are still synthesizing.
+        """
+        from ..core.streaming import StreamingResponseHandler
+        
+        if self.runtime is None:
+            from ..core.async_runtime import AsyncRuntime
+            self.runtime = AsyncRuntime(name="tts-playback")
+        
+        handler = StreamingResponseHandler(speech_engine=self.speech_engine)
+        
+        async def speak() -> None:
+            async def reply():
+                yield text
+            async for _ in handler.process_stream(reply()):
+                pass
+        
+        future = self.runtime.submit(speak())
+        while not future.done():
+            if self._stop_event.wait(0.05):
+                # Engine state belongs to the runtime loop
+                self.runtime.loop.call_soon_threadsafe(handler.interrupt)
+                break
+        
+        if not self._interrupted:
+            future.result()
+            if self._on_complete:
+                self._on_complete()
+    
+    def _check_interrupt(self, audio: np.ndarray) -> bool:
+        """Interrupt playback if the chunk contains speech."""
+        is_speech, prob = self.vad.is_speech(audio, return_probability=True)
+        
+        if is_speech and prob > self.interrupt_threshold:
+            logger.info(f"Speech detected during TTS (prob: {prob:.2f}), interrupting")
+            self._interrupted = True
+            self._stop_event.set()
+            
+            if self._on_interrupt:
+                self._on_interrupt()
+            return True
+        return False
+    
     def _monitor_loop(self) -> None:
         """Monitor for speech to interrupt playback."""
-        if not SOUNDDEVICE_AVAILABLE:
-            return
-        
         chunk_size = 1024
         sample_rate = 16000
         
+        self.vad.reset_states()
+        
+        if self.audio_bus is not None and self.audio_bus.is_running:
+            subscription = self.audio_bus.subscribe("tts_monitor")
+            try:
+                while self._playing and not self._stop_event.is_set():
+                    audio = subscription.read(chunk_size, timeout=0.1)
+                    if audio is not None and self._check_interrupt(audio):
+                        break
+            except Exception as e:
+                logger.debug(f"Monitor error: {e}")
+            finally:
+                subscription.close()
+            return
+        
+        if not SOUNDDEVICE_AVAILABLE:
+            return
+        
         try:
             with sd.InputStream(
                 samplerate=sample_rate,
@@ -248,16 +330,7 @@ class InterruptibleTTSPlayer:
             ) as stream:
                 while self._playing and not self._stop_event.is_set():
                     audio, _ = stream.read(chunk_size)
-                    
-                    is_speech, prob = self.vad.is_speech(audio.flatten(), return_probability=True)
-                    
-                    if is_speech and prob > self.interrupt_threshold:
-                        logger.info(f"Speech detected during TTS (prob: {prob:.2f}), interrupting")
-                        self._interrupted = True
-                        self._stop_event.set()
-                        
-                        if self._on_interrupt:
-                            self._on_interrupt()
+                    if self._check_interrupt(audio.flatten()):
                         break
         
         except Exception as e:
@@ -301,6 +374,9 @@ class EnhancedVoicePipeline:
         tts_config: Optional[Dict[str, Any]] = None,
         conversation_timeout: float = 30.0,
         groq_api_key: Optional[str] = None,
+        capture_config: Optional[Dict[str, Any]] = None,
+        speech_engine: Optional[Any] = None,
+        runtime: Optional[Any] = None,
     ):
         """
         Initialize the enhanced voice pipeline.
@@ -311,10 +387,24 @@ class EnhancedVoicePipeline:
             tts_config: Text-to-speech configuration.
             conversation_timeout: Seconds before exiting conversation mode.
             groq_api_key: Groq API key for STT.
+            capture_config: Microphone capture configuration
+                (input_device, buffer_seconds, pre_roll seconds).
+            speech_engine: PipelinedSpeechEngine for spoken replies; each
+                sentence is synthesized while the previous one plays.
+            runtime: AsyncRuntime the speech engine runs on.
         """
         wake_word_config = wake_word_config or {}
         stt_config = stt_config or {}
         tts_config = tts_config or {}
+        capture_config = capture_config or {}
+        
+        # Shared microphone capture; every consumer reads from this bus
+        self.capture = AudioCaptureBus(
+            sample_rate=16000,
+            buffer_seconds=capture_config.get("buffer_seconds", 30.0),
+            device=capture_config.get("input_device", wake_word_config.get("input_device")),
+        )
+        self.pre_roll = capture_config.get("pre_roll", 0.3)
         
         # Initialize wake word detector
         self.wake_word = EnhancedWakeWordDetector(
@@ -326,6 +416,7 @@ class EnhancedVoicePipeline:
             )],
             sample_rate=16000,
             input_device=wake_word_config.get("input_device"),
+            audio_bus=self.capture,
         )
         
         # Initialize STT
@@ -337,16 +428,29 @@ class EnhancedVoicePipeline:
             enable_preprocessing=True,
             enable_vad=True,
         )
+        # Transcribe while the user is speaking; the final decode gets this budget
+        self.streaming_stt = stt_config.get("streaming", True)
+        self.stt_latency_budget = stt_config.get("latency_budget", 0.3)
         
         # Initialize TTS
         self.tts = TextToSpeech(
             engine=tts_config.get("engine", "edge_tts"),
             voice=tts_config.get("voice", "en-US-GuyNeural"),
             rate=tts_config.get("rate", 1.0),
+            cache=tts_config.get("cache"),
         )
         
+        # One VAD instance, reset per utterance, shared by recording and barge-in
+        self.vad = EnhancedSileroVAD(threshold=0.5)
+        
         # Initialize interruptible player
-        self.player = InterruptibleTTSPlayer(self.tts)
+        self.player = InterruptibleTTSPlayer(
+            self.tts,
+            vad=self.vad,
+            audio_bus=self.capture,
+            speech_engine=speech_engine,
+            runtime=runtime,
+        )
         
         # Conversation state
         self.conversation = ConversationState(timeout_seconds=conversation_timeout)
@@ -373,10 +477,14 @@ class EnhancedVoicePipeline:
         self._on_command: Optional[Callable[[VoiceCommand], str]] = None
         self._on_state_change: Optional[Callable[[PipelineState], None]] = None
         self._on_error: Optional[Callable[[Exception], None]] = None
+        self._on_partial_transcript: Optional[Callable[[str], None]] = None
         
         # Threading
         self._main_thread: Optional[threading.Thread] = None
         self._recording = False
+        
+        # Capture position where the next command recording starts
+        self._command_start: Optional[int] = None
     
     @property
     def state(self) -> PipelineState:
@@ -408,12 +516,14 @@ class EnhancedVoicePipeline:
         on_command: Optional[Callable[[VoiceCommand], str]] = None,
         on_state_change: Optional[Callable[[PipelineState], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        on_partial_transcript: Optional[Callable[[str], None]] = None,
     ) -> None:
         """Set pipeline callbacks."""
         self._on_wake_word = on_wake_word
         self._on_command = on_command
         self._on_state_change = on_state_change
         self._on_error = on_error
+        self._on_partial_transcript = on_partial_transcript
     
     def calibrate_microphone(self, duration: float = 1.0) -> bool:
         """
@@ -432,8 +542,17 @@ class EnhancedVoicePipeline:
         logger.info(f"Calibrating microphone for {duration}s...")
         
         try:
-            # Sample ambient noise
-            if SOUNDDEVICE_AVAILABLE and NUMPY_AVAILABLE:
+            # Sample ambient noise, from the shared stream when it is open
+            if self.capture.is_running:
+                audio = self.capture.capture(duration)
+                if audio is None:
+                    logger.warning("No audio captured for calibration")
+                    return False
+                
+                threshold = self._noise_calibrator.calibrate(audio.tolist())
+                logger.info(f"Microphone calibrated. Threshold: {threshold:.4f}")
+                return True
+            elif SOUNDDEVICE_AVAILABLE and NUMPY_AVAILABLE:
                 samples = int(16000 * duration)
                 audio = sd.rec(samples, samplerate=16000, channels=1, dtype=np.float32)
                 sd.wait()
@@ -458,6 +577,10 @@ class EnhancedVoicePipeline:
         # Stop any current playback
         self.player.stop()
         
+        # Record from just before the detection point so speech that
+        # follows the wake word without a pause is kept
+        self._command_start = detection.sample_index
+        
         # Enter conversation mode
         self.conversation.active = True
         self.conversation.started_at = time.time()
@@ -471,65 +594,86 @@ class EnhancedVoicePipeline:
         
         self._set_state(PipelineState.LISTENING_COMMAND)
     
-    def _record_command(self) -> Optional[np.ndarray]:
-        """Record audio for command."""
-        if not SOUNDDEVICE_AVAILABLE:
+    def _record_command(
+        self,
+        on_chunk: Optional[Callable[[np.ndarray, bool], None]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Record audio for command from the shared capture stream.
+        
+        Args:
+            on_chunk: Called with each chunk and its VAD decision as it
+                is recorded (used for streaming transcription).
+        """
+        if not self.capture.is_running:
             return None
         
         self._recording = True
-        sample_rate = 16000
-        max_duration = 10.0  # Maximum recording duration
-        silence_duration = 1.5  # Silence to end recording
+        chunk_size = 1024
+        max_samples = self.capture.seconds_to_samples(10.0)  # Maximum recording duration
+        silence_samples = self.capture.seconds_to_samples(1.5)  # Silence to end recording
         
-        audio_chunks = []
-        silence_start = None
-        vad = EnhancedSileroVAD(threshold=0.5)
+        # Start from the wake word (or now) minus the pre-roll
+        subscription: AudioSubscription = self.capture.subscribe(
+            "command", start=self._command_start, pre_roll=self.pre_roll,
+        )
+        self._command_start = None
+        start = subscription.position
+        silence_start: Optional[int] = None
+        self.vad.reset_states()
         
         try:
-            with sd.InputStream(
-                samplerate=sample_rate,
-                channels=1,
-                dtype=np.float32,
-                blocksize=1024,
-            ) as stream:
-                start_time = time.time()
+            while self._recording and subscription.position - start < max_samples:
+                audio = subscription.read(chunk_size, timeout=0.5)
+                if audio is None:
+                    if not self.capture.is_running:
+                        break
+                    continue
                 
-                while self._recording and (time.time() - start_time) < max_duration:
-                    audio, _ = stream.read(1024)
-                    audio = audio.flatten()
-                    audio_chunks.append(audio)
-                    
-                    # Check for speech
-                    is_speech, _ = vad.is_speech(audio, return_probability=True)
-                    
-                    if is_speech:
-                        silence_start = None
-                    else:
-                        if silence_start is None:
-                            silence_start = time.time()
-                        elif time.time() - silence_start > silence_duration:
-                            # End of speech
-                            break
+                # Check for speech
+                is_speech, _ = self.vad.is_speech(audio, return_probability=True)
+                if on_chunk:
+                    on_chunk(audio, bool(is_speech))
+                
+                if is_speech:
+                    silence_start = None
+                elif silence_start is None:
+                    silence_start = subscription.position
+                elif subscription.position - silence_start > silence_samples:
+                    # End of speech
+                    break
             
-            if audio_chunks:
-                return np.concatenate(audio_chunks)
-            return None
+            # The ring still holds the whole utterance; copy it out once
+            audio = self.capture.read(start, subscription.position)
+            return audio if len(audio) else None
         
         except Exception as e:
             logger.error(f"Recording error: {e}")
             return None
         
         finally:
+            subscription.close()
             self._recording = False
     
     def _process_command(self) -> None:
         """Record and process a voice command."""
         logger.info("Listening for command...")
         
+        # Start decoding as soon as speech arrives
+        stream = None
+        if self.streaming_stt and self.stt.supports_streaming:
+            stream = self.stt.start_stream(
+                sample_rate=16000,
+                latency_budget=self.stt_latency_budget,
+                on_partial=self._on_partial_transcript,
+            )
+        
         # Record audio
-        audio = self._record_command()
+        audio = self._record_command(on_chunk=stream.feed if stream else None)
         
         if audio is None or len(audio) < 16000 * 0.3:  # Less than 300ms
+            if stream:
+                stream.cancel()
             logger.debug("No audio recorded")
             if self.in_conversation:
                 self._set_state(PipelineState.CONVERSATION_MODE)
@@ -539,7 +683,20 @@ class EnhancedVoicePipeline:
         
         # Transcribe
         self._set_state(PipelineState.PROCESSING)
-        result = self.stt.transcribe(audio, 16000)
+        if stream:
+            result = stream.finish()
+            logger.debug(
+                f"Streaming STT: {stream.stats['decodes']} decodes, "
+                f"final ready {stream.stats['finish_ms']:.0f} ms after endpoint"
+            )
+        else:
+            # The recording was already endpointed by VAD
+            result = self.stt.transcribe(
+                audio,
+                16000,
+                pre_segmented=True,
+                latency_budget=self.stt_latency_budget,
+            )
         
         if result.is_empty:
             logger.debug("No speech transcribed")
@@ -680,6 +837,10 @@ class EnhancedVoicePipeline:
         self._running = True
         self._set_state(PipelineState.LISTENING_WAKE_WORD)
         
+        # Open the microphone once for all consumers
+        if not self.capture.start():
+            logger.warning("Microphone capture failed to start")
+        
         # Start wake word detection
         if self.wake_word.is_available:
             if not self.wake_word.start(self._on_wake_word_detected):
@@ -702,6 +863,7 @@ class EnhancedVoicePipeline:
         
         self.wake_word.stop()
         self.player.stop()
+        self.capture.stop()
         
         if self._main_thread:
             self._main_thread.join(timeout=2)
@@ -0,0 +1,417 @@
+"""
+Streaming Speech-to-Text Sessions for JARVIS.
+
+Incrementally transcribes a live PCM16 stream (e.g. mobile push-to-talk
+over WebSocket):
+- Preallocated ring buffer, one int16 -> float32 conversion per chunk
+- VAD-driven segmentation over the not-yet-finalized window
+- Partial transcripts while speaking, a final one per utterance
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from loguru import logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_PCM16_SCALE = np.float32(1.0 / 32768.0) if NUMPY_AVAILABLE else None
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity float32 ring buffer addressed by absolute sample index.
+
+    Writers append with write(); readers ask for any range that is
+    still inside the last `capacity` samples. Nothing is reallocated
+    after construction.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self._total = 0  # Samples ever written
+
+    @property
+    def total_written(self) -> int:
+        return self._total
+
+    @property
+    def oldest(self) -> int:
+        """Absolute index of the oldest sample still held."""
+        return max(0, self._total - self.capacity)
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    def write(self, samples: "np.ndarray") -> None:
+        """Append samples, overwriting the oldest data when full."""
+        n = len(samples)
+        if n == 0:
+            return
+        if n >= self.capacity:
+            samples = samples[-self.capacity:]
+            self._total += n - self.capacity
+            n = self.capacity
+
+        pos = self._total % self.capacity
+        first = min(n, self.capacity - pos)
+        self._data[pos:pos + first] = samples[:first]
+        if first < n:
+            self._data[:n - first] = samples[first:]
+        self._total += n
+
+    def write_pcm16(self, data: BytesLike) -> int:
+        """
+        Append little-endian PCM16 bytes.
+
+        The bytes are viewed in place and converted straight into the
+        ring, so the only copy is the int16 -> float32 conversion.
+
+        Returns:
+            Number of samples written.
+        """
+        usable = len(data) - (len(data) % 2)
+        if usable <= 0:
+            return 0
+        pcm = np.frombuffer(data, dtype="<i2", count=usable // 2)
+        n = len(pcm)
+        if n >= self.capacity:
+            pcm = pcm[-self.capacity:]
+            self._total += n - self.capacity
+
+        m = len(pcm)
+        pos = self._total % self.capacity
+        first = min(m, self.capacity - pos)
+        np.multiply(pcm[:first], _PCM16_SCALE, out=self._data[pos:pos + first], casting="unsafe")
+        if first < m:
+            np.multiply(pcm[first:], _PCM16_SCALE, out=self._data[:m - first], casting="unsafe")
+        self._total += m
+        return n
+
+    def read(self, start: int, end: Optional[int] = None) -> "np.ndarray":
+        """
+        Copy out samples in [start, end) by absolute index.
+
+        The range is clamped to what is still held.
+        """
+        end = self._total if end is None else min(end, self._total)
+        start = max(start, self.oldest)
+        if end <= start:
+            return np.zeros(0, dtype=np.float32)
+
+        a = start % self.capacity
+        b = end % self.capacity or self.capacity
+        if a < b:
+            return self._data[a:b].copy()
+        return np.concatenate((self._data[a:], self._data[:b]))
+
+    def clear(self) -> None:
+        self._total = 0
+
+
+@dataclass
+class TranscriptEvent:
+    """A partial or final transcript for one utterance."""
+    text: str
+    final: bool
+    segment: int
+    start: float  # Seconds from stream start
+    end: float
+    latency_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "transcript": self.text,
+            "final": self.final,
+            "segment": self.segment,
+            "start": round(self.start, 3),
+            "end": round(self.end, 3),
+            "latency_ms": round(self.latency_ms, 1),
+        }
+
+
+def energy_speech_segments(
+    audio: "np.ndarray",
+    sample_rate: int = 16000,
+    frame_ms: int = 30,
+    threshold: float = 0.01,
+    min_silence_ms: int = 500,
+    pad_ms: int = 200,
+) -> List[Tuple[int, int]]:
+    """
+    RMS-energy speech segmentation, used when Silero VAD is unavailable.
+
+    Returns:
+        List of (start_sample, end_sample) tuples, empty for silence.
+    """
+    frame = int(sample_rate * frame_ms / 1000)
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return []
+
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    voiced = np.sqrt(np.mean(frames * frames, axis=1)) > threshold
+
+    segments: List[Tuple[int, int]] = []
+    gap = max(1, min_silence_ms // frame_ms)
+    pad = int(sample_rate * pad_ms / 1000)
+    start = None
+    silent = 0
+
+    for i, v in enumerate(voiced):
+        if v:
+            if start is None:
+                start = i
+            silent = 0
+        elif start is not None:
+            silent += 1
+            if silent >= gap:
+                end = i - silent + 1
+                segments.append((max(0, start * frame - pad), min(len(audio), end * frame + pad)))
+                start = None
+
+    if start is not None:
+        end = n_frames - silent
+        segments.append((max(0, start * frame - pad), min(len(audio), end * frame + pad)))
+
+    return segments
+
+
+class StreamingSTTSession:
+    """
+    Per-connection streaming transcription session.
+
+    Audio is appended to a ring buffer. Every `vad_interval_ms` of new
+    audio, the window since the last final transcript is segmented with
+    VAD: utterances followed by enough silence are transcribed as final,
+    and the utterance still in progress gets a partial transcript at most
+    every `partial_interval_ms`. Segmentation and transcription run in
+    worker threads. Partials run as background tasks so a slow decode
+    never holds up `feed()`; a finished partial is returned by the next
+    `feed()` or `flush()`, and new partials are skipped while one is in
+    flight.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[["np.ndarray", int], Any],
+        vad: Optional[Any] = None,
+        sample_rate: int = 16000,
+        buffer_seconds: float = 30.0,
+        vad_interval_ms: int = 250,
+        partial_interval_ms: int = 600,
+        min_silence_ms: int = 600,
+        max_segment_seconds: float = 15.0,
+        min_segment_ms: int = 300,
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            transcribe: Callable (audio float32, sample_rate) returning a
+                string or an object with a `text` attribute.
+            vad: EnhancedSileroVAD-compatible detector. Falls back to
+                energy-based segmentation when missing or unavailable.
+            sample_rate: Stream sample rate (mono PCM16).
+            buffer_seconds: Ring buffer capacity.
+            vad_interval_ms: New audio between segmentation passes.
+            partial_interval_ms: Minimum spacing of partial transcripts.
+            min_silence_ms: Trailing silence that closes an utterance.
+            max_segment_seconds: Force a final transcript after this long.
+            min_segment_ms: Shorter utterances are not transcribed.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for streaming STT")
+
+        self._transcribe_fn = transcribe
+        self.vad = vad
+        self.sample_rate = sample_rate
+        self.buffer = AudioRingBuffer(int(sample_rate * buffer_seconds))
+
+        self._vad_interval = int(sample_rate * vad_interval_ms / 1000)
+        self._partial_interval = int(sample_rate * partial_interval_ms / 1000)
+        self._min_silence = int(sample_rate * min_silence_ms / 1000)
+        self._max_segment = int(sample_rate * max_segment_seconds)
+        self._min_segment = int(sample_rate * min_segment_ms / 1000)
+        # Keep a little audio before detected speech when trimming silence
+        self._keep = int(sample_rate * 0.3)
+
+        self._committed = 0     # Absolute index where unfinalized audio begins
+        self._last_vad = 0      # total_written at the last segmentation pass
+        self._last_partial = 0  # total_written at the last partial transcript
+        self._last_partial_text = ""
+        self._segment_index = 0
+        self._lock = asyncio.Lock()
+        self._partial_task: Optional[asyncio.Task] = None
+        self._ready: List[TranscriptEvent] = []  # Finished partials
+        self._epoch = 0  # Bumped when a final or reset makes partials stale
+
+        self.stats = {"chunks": 0, "samples": 0, "partials": 0, "finals": 0, "skipped_partials": 0}
+
+    @property
+    def _use_silero(self) -> bool:
+        return self.vad is not None and getattr(self.vad, "is_available", False)
+
+    def _segments(self, audio: "np.ndarray") -> List[Tuple[int, int]]:
+        if self._use_silero:
+            return self.vad.get_speech_segments(audio, fallback_to_full=False)
+        return energy_speech_segments(
+            audio,
+            sample_rate=self.sample_rate,
+            min_silence_ms=self._min_silence * 1000 // self.sample_rate,
+        )
+
+    def _run_transcribe(self, audio: "np.ndarray") -> str:
+        result = self._transcribe_fn(audio, self.sample_rate)
+        text = getattr(result, "text", result)
+        return (text or "").strip()
+
+    async def _transcribe(self, audio: "np.ndarray") -> Tuple[str, float]:
+        start = time.perf_counter()
+        try:
+            text = await asyncio.to_thread(self._run_transcribe, audio)
+        except Exception as e:
+            logger.error(f"Streaming transcription failed: {e}")
+            text = ""
+        return text, (time.perf_counter() - start) * 1000
+
+    async def _final(self, audio: "np.ndarray", start: int, end: int) -> Optional[TranscriptEvent]:
+        self._committed = end
+        self._epoch += 1
+        self._last_partial_text = ""
+        if end - start < self._min_segment:
+            return None
+
+        async with self._lock:
+            text, latency = await self._transcribe(audio)
+        if not text:
+            return None
+
+        event = TranscriptEvent(
+            text=text,
+            final=True,
+            segment=self._segment_index,
+            start=start / self.sample_rate,
+            end=end / self.sample_rate,
+            latency_ms=latency,
+        )
+        self._segment_index += 1
+        self.stats["finals"] += 1
+        return event
+
+    def _start_partial(self, audio: "np.ndarray", start: int, end: int) -> None:
+        if self._partial_task is not None and not self._partial_task.done():
+            self.stats["skipped_partials"] += 1
+            return
+
+        self._last_partial = self.buffer.total_written
+        self._partial_task = asyncio.ensure_future(self._partial(audio, start, end, self._epoch))
+
+    async def _partial(self, audio: "np.ndarray", start: int, end: int, epoch: int) -> None:
+        async with self._lock:
+            text, latency = await self._transcribe(audio)
+        if epoch != self._epoch or not text or text == self._last_partial_text:
+            return
+
+        self._last_partial_text = text
+        self.stats["partials"] += 1
+        self._ready.append(TranscriptEvent(
+            text=text,
+            final=False,
+            segment=self._segment_index,
+            start=start / self.sample_rate,
+            end=end / self.sample_rate,
+            latency_ms=latency,
+        ))
+
+    async def _process(self, flush: bool = False) -> List[TranscriptEvent]:
+        total = self.buffer.total_written
+        base = max(self._committed, self.buffer.oldest)
+        window = self.buffer.read(base, total)
+        events, self._ready = self._ready, []
+
+        # VAD over the whole open window is too slow for the event loop
+        segments = await asyncio.to_thread(self._segments, window) if len(window) else []
+        if not segments:
+            # Drop leading silence so the window stays short
+            self._committed = max(base, total - self._keep)
+            return events
+
+        for seg_start, seg_end in segments:
+            abs_start, abs_end = base + seg_start, base + seg_end
+            closed = flush or total - abs_end >= self._min_silence
+            too_long = abs_end - abs_start >= self._max_segment
+
+            if closed or too_long:
+                event = await self._final(window[seg_start:seg_end], abs_start, abs_end)
+            else:
+                if total - self._last_partial >= self._partial_interval:
+                    self._start_partial(window[seg_start:seg_end], abs_start, abs_end)
+                event = None
+
+            if event:
+                events.append(event)
+
+        return events
+
+    async def feed(self, data: BytesLike) -> List[TranscriptEvent]:
+        """
+        Append a PCM16 chunk and return any transcripts it produced.
+
+        Args:
+            data: Little-endian mono PCM16 at `sample_rate`.
+        """
+        n = self.buffer.write_pcm16(data)
+        self.stats["chunks"] += 1
+        self.stats["samples"] += n
+
+        if self.buffer.total_written - self._last_vad < self._vad_interval:
+            events, self._ready = self._ready, []
+            return events
+        self._last_vad = self.buffer.total_written
+        return await self._process()
+
+    async def flush(self) -> List[TranscriptEvent]:
+        """Finalize everything buffered (end of push-to-talk)."""
+        self._last_vad = self.buffer.total_written
+        return await self._process(flush=True)
+
+    def reset(self) -> None:
+        """Discard buffered audio and start a new stream."""
+        self.buffer.clear()
+        self._committed = 0
+        self._last_vad = 0
+        self._last_partial = 0
+        self._last_partial_text = ""
+        self._segment_index = 0
+        self._ready = []
+        self._epoch += 1
+
+    def close(self) -> None:
+        """Drop buffered audio and cancel any partial still in flight."""
+        self.reset()
+        if self._partial_task is not None and not self._partial_task.done():
+            self._partial_task.cancel()
+        self._partial_task = None
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "buffered_seconds": round(len(self.buffer) / self.sample_rate, 2),
+            "segments": self._segment_index,
+        }
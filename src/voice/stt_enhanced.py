@@ -5,6 +5,7 @@ Provides multiple STT backends with automatic fallback:
 - Faster-Whisper (Primary - local, GPU-accelerated)
 - Groq Whisper API (Fast cloud transcription)
 - Audio preprocessing with noise reduction
+- Speculative streaming transcription while the user is still speaking
 """
 
 from __future__ import annotations
@@ -12,8 +13,9 @@ from __future__ import annotations
 import asyncio
 import io
 import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -326,18 +328,24 @@ class EnhancedSileroVAD:
     def get_speech_segments(
         self,
         audio: np.ndarray,
+        fallback_to_full: bool = True,
     ) -> List[Tuple[int, int]]:
         """
         Get speech segments from audio.
         
         Args:
             audio: Full audio data.
+            fallback_to_full: Treat the whole audio as one segment when no
+                speech is found. Streaming callers pass False so silence
+                yields an empty list.
             
         Returns:
             List of (start_sample, end_sample) tuples.
         """
+        full = [(0, len(audio))] if fallback_to_full else []
+        
         if not self._load_model():
-            return [(0, len(audio))]
+            return full
         
         try:
             audio_tensor = torch.from_numpy(audio.astype(np.float32))
@@ -362,11 +370,63 @@ class EnhancedSileroVAD:
                 end = min(len(audio), ts['end'] + post_pad)
                 segments.append((start, end))
             
-            return segments if segments else [(0, len(audio))]
+            return segments if segments else full
         
         except Exception as e:
             logger.error(f"Failed to get speech segments: {e}")
-            return [(0, len(audio))]
+            return full
+
+
+class BeamSizePolicy:
+    """
+    Pick the widest beam whose expected decode time fits a latency budget.
+    
+    Decode time per second of audio is tracked per beam width as a moving
+    average. Widths that have not been measured yet are extrapolated from
+    the closest narrower measured width, assuming cost grows linearly with
+    the beam (pessimistic, so the budget holds until a real measurement
+    replaces the estimate).
+    """
+    
+    BEAM_SIZES = (5, 3, 2, 1)
+    
+    def __init__(self, alpha: float = 0.3, min_audio_seconds: float = 1.0):
+        """
+        Args:
+            alpha: Weight of the newest measurement in the moving average.
+            min_audio_seconds: Floor on audio length when normalizing, since
+                short clips still pay the fixed encoder cost.
+        """
+        self.alpha = alpha
+        self.min_audio_seconds = min_audio_seconds
+        self._rates: Dict[int, float] = {}  # beam -> seconds per audio second
+    
+    def record(self, beam_size: int, audio_seconds: float, elapsed: float) -> None:
+        rate = elapsed / max(audio_seconds, self.min_audio_seconds)
+        previous = self._rates.get(beam_size)
+        self._rates[beam_size] = rate if previous is None else previous + self.alpha * (rate - previous)
+    
+    def estimate(self, beam_size: int, audio_seconds: float) -> Optional[float]:
+        """Expected decode seconds, or None with no measurements yet."""
+        audio_seconds = max(audio_seconds, self.min_audio_seconds)
+        if beam_size in self._rates:
+            return self._rates[beam_size] * audio_seconds
+        narrower = [b for b in self._rates if b < beam_size]
+        if not narrower:
+            return None
+        base = max(narrower)
+        return self._rates[base] * beam_size / base * audio_seconds
+    
+    def choose(self, audio_seconds: float, budget: float) -> int:
+        """Widest beam expected to finish within `budget` seconds (at least 1)."""
+        for beam_size in self.BEAM_SIZES:
+            estimate = self.estimate(beam_size, audio_seconds)
+            if estimate is not None and estimate <= budget:
+                return beam_size
+        return 1
+    
+    def get_stats(self) -> Dict[int, float]:
+        return {beam: round(rate, 4) for beam, rate in sorted(self._rates.items())}
 
 
 class FasterWhisperSTT:
@@ -387,6 +447,7 @@ class FasterWhisperSTT:
         self.device = device
         self.compute_type = compute_type
         self.language = language
+        self.beam_policy = BeamSizePolicy()
         self._model = None
     
     @property
@@ -427,24 +488,48 @@ class FasterWhisperSTT:
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
+        beam_size: Optional[int] = None,
+        vad_filter: bool = True,
+        initial_prompt: Optional[str] = None,
+        language: Optional[str] = None,
+        latency_budget: Optional[float] = None,
     ) -> TranscriptionResult:
-        """Transcribe audio to text."""
+        """
+        Transcribe audio to text.
+        
+        Args:
+            audio: Audio data (16kHz, mono).
+            sample_rate: Audio sample rate.
+            beam_size: Beam width (default: chosen from latency_budget, else 5).
+            vad_filter: Run Whisper's own VAD; callers that already
+                segmented the audio pass False.
+            initial_prompt: Text preceding this audio (e.g. already
+                committed words of the same utterance).
+            language: Language override (default: the configured one).
+            latency_budget: Seconds the decode may take; picks the beam width.
+        """
         if not self._load_model():
             return TranscriptionResult(text="", provider="faster_whisper")
         
         start_time = time.time()
+        audio_seconds = len(audio) / sample_rate
+        if beam_size is None:
+            beam_size = self.beam_policy.choose(audio_seconds, latency_budget) if latency_budget else 5
         
         try:
             # Ensure correct format
             if audio.dtype != np.float32:
                 audio = audio.astype(np.float32)
             
+            language = language or self.language
+            
             # Transcribe
             segments, info = self._model.transcribe(
                 audio,
-                language=self.language if self.language != "auto" else None,
-                beam_size=5,
-                vad_filter=True,
+                language=language if language != "auto" else None,
+                beam_size=beam_size,
+                initial_prompt=initial_prompt,
+                vad_filter=vad_filter,
                 vad_parameters=dict(
                     min_speech_duration_ms=250,
                     min_silence_duration_ms=500,
@@ -470,7 +555,10 @@ class FasterWhisperSTT:
             detected_lang = info.language if hasattr(info, 'language') else self.language
             lang_prob = info.language_probability if hasattr(info, 'language_probability') else 1.0
             
-            logger.debug(f"Transcribed: lang={detected_lang}, prob={lang_prob:.2f}, text={text[:50]}...")
+            processing_time = time.time() - start_time
+            self.beam_policy.record(beam_size, audio_seconds, processing_time)
+            
+            logger.debug(f"Transcribed: lang={detected_lang}, prob={lang_prob:.2f}, beam={beam_size}, text={text[:50]}...")
             
             return TranscriptionResult(
                 text=text,
@@ -480,7 +568,7 @@ class FasterWhisperSTT:
                 duration=duration,
                 segments=segment_list,
                 provider="faster_whisper",
-                processing_time=time.time() - start_time,
+                processing_time=processing_time,
             )
         
         except Exception as e:
@@ -634,6 +722,8 @@ class EnhancedSpeechToText:
         audio: np.ndarray,
         sample_rate: int = 16000,
         provider: Optional[STTProvider] = None,
+        pre_segmented: bool = False,
+        latency_budget: Optional[float] = None,
     ) -> TranscriptionResult:
         """
         Transcribe audio to text.
@@ -642,6 +732,10 @@ class EnhancedSpeechToText:
             audio: Audio data as numpy array.
             sample_rate: Audio sample rate.
             provider: Specific provider to use (auto-selects if None).
+            pre_segmented: The caller already ran VAD over this audio, so
+                skip both the Silero pass and Whisper's VAD filter.
+            latency_budget: Seconds the local decode may take (picks the
+                beam width).
             
         Returns:
             TranscriptionResult with transcribed text.
@@ -651,7 +745,7 @@ class EnhancedSpeechToText:
             audio, sample_rate = self.preprocessor.process(audio, sample_rate)
         
         # Extract speech segments if VAD enabled
-        if self.vad and self.vad.is_available:
+        if self.vad and self.vad.is_available and not pre_segmented:
             segments = self.vad.get_speech_segments(audio)
             if segments:
                 # Concatenate speech segments
@@ -662,29 +756,91 @@ class EnhancedSpeechToText:
         if len(audio) < sample_rate * 0.3:  # Less than 300ms
             return TranscriptionResult(text="", provider="none")
         
+        return self.decode(
+            audio,
+            sample_rate,
+            provider=provider,
+            vad_filter=not pre_segmented,
+            latency_budget=latency_budget,
+        )
+    
+    def decode(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000,
+        provider: Optional[STTProvider] = None,
+        **options: Any,
+    ) -> TranscriptionResult:
+        """
+        Run the backends on audio as-is (no preprocessing or VAD).
+        
+        Args:
+            audio: Audio data as numpy array.
+            sample_rate: Audio sample rate.
+            provider: Specific provider to use (auto-selects if None).
+            **options: Faster-Whisper decode options (beam_size, vad_filter,
+                initial_prompt, language, latency_budget); other backends
+                ignore them.
+            
+        Returns:
+            TranscriptionResult with transcribed text.
+        """
         # Select provider
         if provider and provider in self._backends:
             backend = self._backends[provider]
             if backend.is_available:
-                return backend.transcribe(audio, sample_rate)
+                return self._run_backend(backend, audio, sample_rate, options)
         
         # Try primary provider first
         if self.primary_provider in self._backends:
             backend = self._backends[self.primary_provider]
             if backend.is_available:
-                result = backend.transcribe(audio, sample_rate)
+                result = self._run_backend(backend, audio, sample_rate, options)
                 if not result.is_empty:
                     return result
         
         # Fallback to other providers
         for provider_type, backend in self._backends.items():
             if provider_type != self.primary_provider and backend.is_available:
-                result = backend.transcribe(audio, sample_rate)
+                result = self._run_backend(backend, audio, sample_rate, options)
                 if not result.is_empty:
                     return result
         
         return TranscriptionResult(text="", provider="none")
     
+    @staticmethod
+    def _run_backend(backend: Any, audio: np.ndarray, sample_rate: int, options: Dict[str, Any]) -> TranscriptionResult:
+        if isinstance(backend, FasterWhisperSTT):
+            return backend.transcribe(audio, sample_rate, **options)
+        return backend.transcribe(audio, sample_rate)
+    
+    def start_stream(
+        self,
+        sample_rate: int = 16000,
+        latency_budget: float = 0.3,
+        on_partial: Optional[Callable[[str], None]] = None,
+        **kwargs: Any,
+    ) -> "SpeculativeTranscription":
+        """
+        Start transcribing an utterance while it is being recorded.
+        
+        Args:
+            sample_rate: Audio sample rate.
+            latency_budget: Seconds the final decode may take.
+            on_partial: Called with the running transcript after each decode.
+            **kwargs: Extra SpeculativeTranscription settings.
+            
+        Returns:
+            Session to feed() audio into and finish() at end of speech.
+        """
+        return SpeculativeTranscription(
+            self,
+            sample_rate=sample_rate,
+            latency_budget=latency_budget,
+            on_partial=on_partial,
+            **kwargs,
+        )
+    
     def transcribe_file(
         self,
         file_path: Path,
@@ -701,6 +857,265 @@ class EnhancedSpeechToText:
             logger.error(f"Failed to read audio file: {e}")
             return TranscriptionResult(text="", provider="none")
     
+    @property
+    def supports_streaming(self) -> bool:
+        """Speculative decoding needs the local backend (repeated cloud calls would be wasteful)."""
+        backend = self._backends.get(STTProvider.FASTER_WHISPER)
+        return backend is not None and backend.is_available
+    
     def get_available_providers(self) -> List[STTProvider]:
         """Get list of available STT providers."""
         return [p for p, b in self._backends.items() if b.is_available]
+
+
+class SpeculativeTranscription:
+    """
+    Transcribes one utterance while it is still being recorded.
+    
+    The caller feeds audio chunks together with its own VAD decision,
+    which is the only VAD pass (Whisper runs with vad_filter off). A
+    worker thread re-decodes the uncommitted tail of the utterance every
+    `decode_interval` seconds of new audio with a narrow beam. Whisper
+    segments that come out the same in two consecutive hypotheses and end
+    well before the newest audio are committed: their text is kept, their
+    audio is not decoded again, and the text becomes the prompt for the
+    rest of the utterance.
+    
+    At end of speech, finish() reuses the latest hypothesis if it already
+    covers all the speech; otherwise it decodes only the uncommitted tail
+    with a beam width sized to the latency budget.
+    """
+    
+    def __init__(
+        self,
+        stt: EnhancedSpeechToText,
+        sample_rate: int = 16000,
+        latency_budget: float = 0.3,
+        on_partial: Optional[Callable[[str], None]] = None,
+        decode_interval: float = 0.5,
+        partial_beam_size: int = 1,
+        max_seconds: float = 30.0,
+        min_decode_seconds: float = 0.3,
+        commit_margin: float = 1.0,
+        tail_padding: float = 0.2,
+    ):
+        """
+        Initialize the session and start its worker.
+        
+        Args:
+            stt: Speech-to-text service used for decoding.
+            sample_rate: Audio sample rate.
+            latency_budget: Seconds the final decode may take.
+            on_partial: Called from the worker with the running transcript.
+            decode_interval: New audio (seconds) between speculative decodes.
+            partial_beam_size: Beam width for speculative decodes.
+            max_seconds: Longest utterance kept; later audio is dropped.
+            min_decode_seconds: Shorter tails are not decoded.
+            commit_margin: Segments must end this many seconds before the
+                newest audio to be committed.
+            tail_padding: Audio kept after the last speech chunk.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for streaming STT")
+        
+        self._stt = stt
+        self.sample_rate = sample_rate
+        self.latency_budget = latency_budget
+        self.partial_beam_size = partial_beam_size
+        self._on_partial = on_partial
+        self._interval = int(decode_interval * sample_rate)
+        self._min_decode = int(min_decode_seconds * sample_rate)
+        self._commit_margin = commit_margin
+        self._tail_padding = int(tail_padding * sample_rate)
+        
+        # Preallocated utterance buffer; samples before _length never change
+        self._audio = np.zeros(int(max_seconds * sample_rate), dtype=np.float32)
+        self._length = 0
+        self._speech_end: Optional[int] = None  # End of the latest speech chunk
+        
+        self._offset = 0  # Start of uncommitted audio
+        self._committed: List[Dict[str, Any]] = []  # Segments, utterance-relative seconds
+        self._hypothesis: Optional[TranscriptionResult] = None  # Relative to _offset
+        self._hypothesis_end = 0
+        self._language: Optional[str] = None
+        
+        self._cond = threading.Condition()
+        self._closing = False
+        self.stats: Dict[str, Any] = {
+            "decodes": 0,
+            "committed_segments": 0,
+            "reused_hypothesis": False,
+            "final_decode_ms": 0.0,
+            "finish_ms": 0.0,
+        }
+        
+        self._worker = threading.Thread(target=self._run, name="stt-speculative", daemon=True)
+        self._worker.start()
+    
+    @property
+    def committed_text(self) -> str:
+        return " ".join(seg["text"].strip() for seg in self._committed).strip()
+    
+    @property
+    def text(self) -> str:
+        """Committed text followed by the current hypothesis."""
+        tail = self._hypothesis.text.strip() if self._hypothesis else ""
+        return " ".join(t for t in (self.committed_text, tail) if t)
+    
+    def feed(self, chunk: np.ndarray, is_speech: bool = True) -> None:
+        """
+        Append audio from the recorder.
+        
+        Args:
+            chunk: float32 samples at `sample_rate`.
+            is_speech: The recorder's VAD decision for this chunk.
+        """
+        n = min(len(chunk), len(self._audio) - self._length)
+        if n < len(chunk):
+            logger.debug("Speculative STT buffer full, dropping audio")
+        self._audio[self._length:self._length + n] = chunk[:n]
+        
+        with self._cond:
+            self._length += n
+            if is_speech:
+                self._speech_end = self._length
+            self._cond.notify()
+    
+    def _should_decode(self, last_end: int) -> bool:
+        if self._speech_end is None:
+            return False
+        if self._length - last_end < self._interval or self._length - self._offset < self._min_decode:
+            return False
+        # Nothing new was said since the last hypothesis
+        return not (self._hypothesis is not None and self._hypothesis_end >= self._speech_end)
+    
+    def _decode(self, start: int, end: int, **options: Any) -> TranscriptionResult:
+        self.stats["decodes"] += 1
+        return self._stt.decode(
+            self._audio[start:end],
+            self.sample_rate,
+            vad_filter=False,
+            initial_prompt=self.committed_text or None,
+            language=self._language,
+            **options,
+        )
+    
+    def _run(self) -> None:
+        """Worker: decode the growing tail and commit stable segments."""
+        last_end = 0
+        while True:
+            with self._cond:
+                while not self._closing and not self._should_decode(last_end):
+                    self._cond.wait(0.1)
+                if self._closing:
+                    return
+                offset, end = self._offset, self._length
+            
+            try:
+                result = self._decode(offset, end, beam_size=self.partial_beam_size)
+            except Exception as e:
+                logger.warning(f"Speculative decode failed: {e}")
+                return
+            last_end = end
+            
+            with self._cond:
+                self._update(result, offset, end)
+                text = self.text
+            
+            if self._on_partial and text:
+                try:
+                    self._on_partial(text)
+                except Exception as e:
+                    logger.error(f"Partial transcript callback error: {e}")
+    
+    def _update(self, result: TranscriptionResult, offset: int, end: int) -> None:
+        """Adopt a new hypothesis, committing segments it agrees on with the last one."""
+        # Keep a confidently detected language for the rest of the utterance
+        if result.text and not self._language and result.language_probability >= 0.8:
+            self._language = result.language
+        
+        segments = result.segments
+        previous = self._hypothesis.segments if self._hypothesis else []
+        commit_limit = (end - offset) / self.sample_rate - self._commit_margin
+        
+        # Stable prefix: same text as last time, not the newest segment
+        stable = 0
+        for i, seg in enumerate(segments[:-1]):
+            if i < len(previous) and previous[i]["text"].strip() == seg["text"].strip() and seg["end"] <= commit_limit:
+                stable = i + 1
+            else:
+                break
+        
+        if stable:
+            shift = offset / self.sample_rate
+            cut = segments[stable - 1]["end"]
+            self._committed.extend(
+                {**seg, "start": seg["start"] + shift, "end": seg["end"] + shift}
+                for seg in segments[:stable]
+            )
+            remaining = [
+                {**seg, "start": seg["start"] - cut, "end": seg["end"] - cut}
+                for seg in segments[stable:]
+            ]
+            result = replace(
+                result,
+                text=" ".join(seg["text"].strip() for seg in remaining),
+                segments=remaining,
+            )
+            self._offset = offset + int(cut * self.sample_rate)
+            self.stats["committed_segments"] += stable
+        
+        self._hypothesis = result
+        self._hypothesis_end = end
+    
+    def cancel(self) -> None:
+        """Stop the worker without a final decode."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._worker.join()
+    
+    def finish(self) -> TranscriptionResult:
+        """
+        End of speech: return the final transcript.
+        
+        Returns:
+            TranscriptionResult for the whole utterance.
+        """
+        start_time = time.perf_counter()
+        self.cancel()
+        
+        if self._speech_end is None:
+            return TranscriptionResult(text="", provider="none")
+        
+        end = min(self._length, self._speech_end + self._tail_padding)
+        offset = self._offset
+        
+        if self._hypothesis is not None and self._hypothesis_end >= self._speech_end:
+            tail = self._hypothesis
+            self.stats["reused_hypothesis"] = True
+        elif end - offset >= self._min_decode:
+            decode_start = time.perf_counter()
+            tail = self._decode(offset, end, latency_budget=self.latency_budget)
+            self.stats["final_decode_ms"] = (time.perf_counter() - decode_start) * 1000
+        else:
+            tail = self._hypothesis or TranscriptionResult(text="", provider="none")
+        
+        shift = offset / self.sample_rate
+        segments = self._committed + [
+            {**seg, "start": seg["start"] + shift, "end": seg["end"] + shift}
+            for seg in tail.segments
+        ]
+        text = " ".join(t for t in (self.committed_text, tail.text.strip()) if t)
+        self.stats["finish_ms"] = (time.perf_counter() - start_time) * 1000
+        
+        return TranscriptionResult(
+            text=text,
+            language=tail.language if tail.text else (self._language or tail.language),
+            confidence=tail.confidence,
+            language_probability=tail.language_probability,
+            duration=self._speech_end / self.sample_rate,
+            segments=segments,
+            provider=tail.provider,
+            processing_time=self.stats["finish_ms"] / 1000,
+        )
@@ -10,11 +10,9 @@ from __future__ import annotations
 
 import asyncio
 import io
-import os
-import tempfile
 import threading
 from pathlib import Path
-from typing import AsyncIterator, Iterator, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional, Tuple
 
 from loguru import logger
 
@@ -45,6 +43,23 @@ try:
 except ImportError:
     SOUNDFILE_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from .tts_cache import TTSAudioCache
+    from .tts_pipeline import PipelinedSpeechEngine
+
+
+def decode_audio(audio_data: bytes) -> Tuple["np.ndarray", int]:
+    """
+    Decode encoded audio (MP3, WAV, OGG) in memory.
+    
+    Returns:
+        Tuple of (float32 samples, sample_rate).
+    """
+    if not SOUNDFILE_AVAILABLE:
+        raise RuntimeError("soundfile is required to decode audio")
+    audio, sr = sf.read(io.BytesIO(audio_data), dtype="float32")
+    return audio, sr
+
 
 class EdgeTTS:
     """
@@ -86,6 +101,7 @@ class EdgeTTS:
         rate: str = "+0%",
         volume: str = "+0%",
         pitch: str = "+0Hz",
+        cache: Optional["TTSAudioCache"] = None,
     ):
         """
         Initialize Edge TTS.
@@ -95,11 +111,13 @@ class EdgeTTS:
             rate: Speech rate (e.g., "+10%", "-20%").
             volume: Volume adjustment.
             pitch: Pitch adjustment.
+            cache: Optional audio cache for repeated phrases.
         """
         self.voice = voice
         self.rate = rate
         self.volume = volume
         self.pitch = pitch
+        self.cache = cache
     
     @property
     def is_available(self) -> bool:
@@ -167,6 +185,15 @@ class EdgeTTS:
         Returns:
             Audio data as bytes (MP3 format).
         """
+        if self.cache is not None and self.cache.cacheable(text):
+            key = self.cache.make_key(text, self.voice, self.rate, self.pitch, self.volume)
+            return await self.cache.get_or_synthesize(
+                key, text, lambda: self._synthesize(text), voice=self.voice,
+            )
+        return await self._synthesize(text)
+    
+    async def _synthesize(self, text: str) -> bytes:
+        """Synthesize over the network, bypassing the cache."""
         if not EDGE_TTS_AVAILABLE:
             raise RuntimeError("Edge TTS not available")
         
@@ -178,12 +205,12 @@ class EdgeTTS:
             pitch=self.pitch,
         )
         
-        audio_data = b""
+        chunks = []
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
-                audio_data += chunk["data"]
+                chunks.append(chunk["data"])
         
-        return audio_data
+        return b"".join(chunks)
     
     async def synthesize_to_file(self, text: str, output_path: Path | str) -> bool:
         """
@@ -254,6 +281,7 @@ class TextToSpeech:
         rate: float = 1.0,
         volume: float = 1.0,
         output_device: Optional[int] = None,
+        cache: Optional["TTSAudioCache"] = None,
     ):
         """
         Initialize the TTS engine.
@@ -264,6 +292,7 @@ class TextToSpeech:
             rate: Speech rate multiplier (0.5-2.0).
             volume: Volume multiplier (0.0-1.0).
             output_device: Audio output device index.
+            cache: Optional audio cache for repeated phrases.
         """
         self.engine_name = engine
         self.voice = voice
@@ -281,9 +310,10 @@ class TextToSpeech:
                 voice=voice,
                 rate=rate_str,
                 volume=f"+{int((volume - 1.0) * 100)}%",
+                cache=cache,
             )
         else:
-            self._engine = EdgeTTS(voice=voice, rate=rate_str)
+            self._engine = EdgeTTS(voice=voice, rate=rate_str, cache=cache)
         
         # Playback state
         self._playing = False
@@ -384,36 +414,45 @@ class TextToSpeech:
         self._stop_event.clear()
         
         try:
-            # Save to temp file and read with soundfile
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                f.write(audio_data)
-                temp_path = f.name
+            audio, sr = decode_audio(audio_data)
             
-            try:
-                # Read audio file
-                audio, sr = sf.read(temp_path)
-                
-                # Apply volume
-                audio = audio * self.volume
-                
-                # Play
-                sd.play(audio, sr, device=self.output_device)
-                
-                # Wait for completion or stop
-                while sd.get_stream().active:
-                    if self._stop_event.is_set():
-                        sd.stop()
-                        break
-                    sd.sleep(100)
-            finally:
-                # Clean up temp file
-                os.unlink(temp_path)
+            # Apply volume
+            audio = audio * self.volume
+            
+            # Play
+            sd.play(audio, sr, device=self.output_device)
+            
+            # Wait for completion or stop
+            while sd.get_stream().active:
+                if self._stop_event.is_set():
+                    sd.stop()
+                    break
+                sd.sleep(100)
         
         except Exception as e:
             logger.error(f"Audio playback error: {e}")
         finally:
             self._playing = False
     
+    def create_speech_engine(self, prefetch: int = 2) -> "PipelinedSpeechEngine":
+        """
+        Create a pipelined engine for speaking a stream of sentences.
+        
+        Args:
+            prefetch: Sentences to synthesize ahead of playback.
+            
+        Returns:
+            PipelinedSpeechEngine using this engine's voice and output device.
+        """
+        from .tts_pipeline import PipelinedSpeechEngine
+        
+        return PipelinedSpeechEngine(
+            synthesize=self.asynthesize,
+            prefetch=prefetch,
+            volume=self.volume,
+            output_device=self.output_device,
+        )
+    
     def stop(self) -> None:
         """Stop current playback."""
         self._stop_event.set()
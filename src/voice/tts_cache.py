@@ -0,0 +1,272 @@
+"""
+Synthesized Speech Cache for JARVIS.
+
+JARVIS repeats itself a lot (confirmations, greetings, briefing
+openers), so synthesized audio is cached on disk, content-addressed by
+the text and every voice parameter that changes the audio:
+- One file per utterance, named by its SHA-256 key
+- SQLite index with hit counts and last use, LRU eviction by byte budget
+- The most-used phrases are loaded into memory on startup
+
+Usage:
+    cache = get_tts_cache()
+    key = cache.make_key(text, voice, rate, pitch, volume)
+    audio = cache.get(key)
+    if audio is None:
+        audio = await synthesize(text)
+        cache.put(key, text, audio, voice=voice)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache" / "tts"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different strings share an entry."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class TTSAudioCache:
+    """
+    On-disk cache of synthesized audio with an LRU size budget.
+
+    Audio is stored exactly as the engine returned it (MP3 for Edge TTS),
+    which is what both local playback and the API need. Only utterances
+    up to `max_text_length` characters are cached; long, one-off LLM
+    answers would only churn the cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str = DEFAULT_CACHE_DIR,
+        max_size_mb: float = 200.0,
+        warm_count: int = 50,
+        max_text_length: int = 200,
+        extension: str = "mp3",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for audio files and the index.
+            max_size_mb: Disk budget; least recently used entries are evicted.
+            warm_count: Most-used entries loaded into memory on startup.
+            max_text_length: Longer texts are not cached.
+            extension: File extension of stored audio.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.warm_count = warm_count
+        self.max_text_length = max_text_length
+        self.extension = extension
+
+        from ..core.database import get_database
+        self._db = get_database(self.cache_dir / "index.db")
+        self._init_database()
+
+        self._memory: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "memory_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        self.warm(warm_count)
+
+    def _init_database(self) -> None:
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS tts_cache (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                voice TEXT,
+                size INTEGER NOT NULL,
+                hits INTEGER DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tts_last_used ON tts_cache(last_used);
+            CREATE INDEX IF NOT EXISTS idx_tts_hits ON tts_cache(hits);
+        """)
+
+    @staticmethod
+    def make_key(
+        text: str,
+        voice: str,
+        rate: str = "+0%",
+        pitch: str = "+0Hz",
+        volume: str = "+0%",
+    ) -> str:
+        """Content address for an utterance and the voice settings that shape it."""
+        payload = "\x1f".join([normalize_text(text), voice, str(rate), str(pitch), str(volume)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cacheable(self, text: str) -> bool:
+        return 0 < len(normalize_text(text)) <= self.max_text_length
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.{self.extension}"
+
+    def _touch(self, key: str) -> None:
+        now = time.time()
+        self._db.submit_write(lambda conn: conn.execute(
+            "UPDATE tts_cache SET hits = hits + 1, last_used = ? WHERE key = ?",
+            (now, key),
+        ))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio, or None on a miss."""
+        data = self._memory.get(key)
+        if data is not None:
+            self.stats["hits"] += 1
+            self.stats["memory_hits"] += 1
+            self._touch(key)
+            return data
+
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        self._touch(key)
+        return data
+
+    def put(self, key: str, text: str, data: bytes, voice: str = "") -> None:
+        """Store audio and evict old entries if over budget."""
+        if not data:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+        now = time.time()
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO tts_cache (key, text, voice, size, hits, created_at, last_used)
+                VALUES (?, ?, ?, ?, 0, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET size = excluded.size, last_used = excluded.last_used
+                """,
+                (key, normalize_text(text), voice, len(data), now, now),
+            )
+        self.stats["stores"] += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the byte budget."""
+        with self._lock:
+            row = self._db.fetchone("SELECT COALESCE(SUM(size), 0) AS total FROM tts_cache")
+            excess = row["total"] - self.max_bytes
+            if excess <= 0:
+                return
+
+            victims = []
+            for row in self._db.fetchall("SELECT key, size FROM tts_cache ORDER BY last_used"):
+                if excess <= 0:
+                    break
+                victims.append(row["key"])
+                excess -= row["size"]
+
+            with self._db.transaction() as conn:
+                conn.executemany("DELETE FROM tts_cache WHERE key = ?", [(k,) for k in victims])
+            for key in victims:
+                self._memory.pop(key, None)
+                self._path(key).unlink(missing_ok=True)
+            self.stats["evictions"] += len(victims)
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """
+        Load the most-used entries into memory.
+
+        Returns:
+            Number of entries loaded.
+        """
+        count = self.warm_count if count is None else count
+        if count <= 0:
+            return 0
+
+        loaded = 0
+        rows = self._db.fetchall(
+            "SELECT key FROM tts_cache ORDER BY hits DESC, last_used DESC LIMIT ?",
+            (count,),
+        )
+        for row in rows:
+            try:
+                self._memory[row["key"]] = self._path(row["key"]).read_bytes()
+                loaded += 1
+            except OSError:
+                # File removed behind our back; forget the entry
+                self._db.execute("DELETE FROM tts_cache WHERE key = ?", (row["key"],))
+
+        if loaded:
+            logger.debug(f"TTS cache warmed with {loaded} phrases")
+        return loaded
+
+    async def get_or_synthesize(self, key: str, text: str, synthesize: Any, voice: str = "") -> bytes:
+        """
+        Return cached audio or await synthesize() and cache its result.
+
+        File reads, the index write and eviction run in a worker thread so
+        they never stall the event loop; in-memory hits are served inline.
+        """
+        if key in self._memory:
+            data = self.get(key)
+        else:
+            data = await asyncio.to_thread(self.get, key)
+        if data is None:
+            data = await synthesize()
+            await asyncio.to_thread(self.put, key, text, data, voice)
+        return data
+
+    def clear(self) -> None:
+        """Remove every cached utterance."""
+        with self._lock:
+            for row in self._db.fetchall("SELECT key FROM tts_cache"):
+                self._path(row["key"]).unlink(missing_ok=True)
+            self._db.execute("DELETE FROM tts_cache")
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        row = self._db.fetchone("SELECT COUNT(*) AS entries, COALESCE(SUM(size), 0) AS size FROM tts_cache")
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": row["entries"],
+            "size_mb": round(row["size"] / (1024 * 1024), 2),
+            "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
+            "in_memory": len(self._memory),
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+_cache: Optional[TTSAudioCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache(**kwargs: Any) -> TTSAudioCache:
+    """
+    Get the shared speech cache, creating it on first use.
+
+    Keyword arguments only apply when the cache is created.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTSAudioCache(**kwargs)
+        return _cache
@@ -0,0 +1,443 @@
+"""
+Pipelined Text-to-Speech Playback for JARVIS.
+
+Speaks a stream of sentences without per-sentence dead air:
+- Upcoming sentences are synthesized while the current one plays
+- Synthesized audio is decoded in memory (no temp files)
+- One long-lived output stream is fed from a PCM ring buffer, so
+  consecutive sentences play back to back
+- interrupt() silences output on the next audio block
+
+Usage:
+    engine = PipelinedSpeechEngine(synthesize=tts.asynthesize)
+    for sentence in sentences:
+        await engine.enqueue(sentence)
+    await engine.drain()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from loguru import logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    SOUNDDEVICE_AVAILABLE = False
+
+from .tts import decode_audio
+
+
+class PCMRingBuffer:
+    """
+    Thread-safe float32 FIFO between a producer and an audio callback.
+
+    write() blocks while the buffer is full; read_into() never blocks and
+    pads with silence on underrun. clear() drops everything buffered and
+    aborts writes in progress.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float32)
+        self._read = 0
+        self._count = 0
+        self._generation = 0
+        self._cond = threading.Condition()
+        self.drained_at: Optional[float] = None  # When buffered audio last ran out
+
+    @property
+    def buffered(self) -> int:
+        return self._count
+
+    def write(self, samples: "np.ndarray", timeout: Optional[float] = None) -> int:
+        """
+        Append samples, waiting for space as the reader consumes.
+
+        Returns:
+            Samples written; fewer than requested if cleared or timed out.
+        """
+        written = 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            generation = self._generation
+            while written < len(samples):
+                while self._count == self.capacity and self._generation == generation:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return written
+                    self._cond.wait(remaining)
+                if self._generation != generation:
+                    break
+
+                pos = (self._read + self._count) % self.capacity
+                n = min(len(samples) - written, self.capacity - self._count, self.capacity - pos)
+                self._data[pos:pos + n] = samples[written:written + n]
+                self._count += n
+                written += n
+            self._cond.notify_all()
+
+        return written
+
+    def read_into(self, out: "np.ndarray") -> int:
+        """Fill out with buffered samples, zero-padding the rest."""
+        with self._cond:
+            n = min(len(out), self._count)
+            first = min(n, self.capacity - self._read)
+            out[:first] = self._data[self._read:self._read + first]
+            if first < n:
+                out[first:n] = self._data[:n - first]
+            out[n:] = 0.0
+
+            self._read = (self._read + n) % self.capacity
+            self._count -= n
+            if n and self._count == 0:
+                self.drained_at = time.monotonic()
+            self._cond.notify_all()
+        return n
+
+    def wait_empty(self, timeout: Optional[float] = None) -> bool:
+        """Block until the reader has consumed everything."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._count == 0, timeout)
+
+    def clear(self) -> None:
+        with self._cond:
+            self._count = 0
+            self._generation += 1
+            self.drained_at = None
+            self._cond.notify_all()
+
+
+class AudioOutputStream:
+    """
+    Long-lived mono sounddevice output fed from a PCMRingBuffer.
+
+    The device stream is opened on the first write and kept open, so
+    sentences are not separated by stream setup and teardown.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        device: Optional[int] = None,
+        buffer_seconds: float = 30.0,
+        blocksize: int = 0,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for pipelined playback")
+        self.sample_rate = sample_rate
+        self.device = device
+        self.blocksize = blocksize
+        self.buffer = PCMRingBuffer(int(sample_rate * buffer_seconds))
+        self._stream = None
+
+    def _callback(self, outdata, frames, time_info, status) -> None:
+        self.buffer.read_into(outdata[:, 0])
+
+    def start(self) -> None:
+        if self._stream is not None:
+            return
+        if not SOUNDDEVICE_AVAILABLE:
+            raise RuntimeError("sounddevice is required for audio output")
+        self._stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype="float32",
+            device=self.device,
+            blocksize=self.blocksize,
+            latency="low",
+            callback=self._callback,
+        )
+        self._stream.start()
+
+    def write(self, samples: "np.ndarray") -> int:
+        """Queue samples for playback (blocks while the buffer is full)."""
+        self.start()
+        return self.buffer.write(samples)
+
+    @property
+    def buffered_seconds(self) -> float:
+        return self.buffer.buffered / self.sample_rate
+
+    @property
+    def drained_at(self) -> Optional[float]:
+        return self.buffer.drained_at
+
+    def wait_drained(self, timeout: Optional[float] = None) -> bool:
+        return self.buffer.wait_empty(timeout)
+
+    def clear(self) -> None:
+        """Drop queued audio; output goes silent on the next block."""
+        self.buffer.clear()
+
+    def close(self) -> None:
+        self.clear()
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing output stream: {e}")
+            self._stream = None
+
+
+def _to_mono(audio: "np.ndarray") -> "np.ndarray":
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    return audio.astype(np.float32, copy=False)
+
+
+def _resample(audio: "np.ndarray", src_rate: int, dst_rate: int) -> "np.ndarray":
+    """Linear-interpolation resample (speech only needs this much)."""
+    if src_rate == dst_rate or len(audio) == 0:
+        return audio
+    n = int(round(len(audio) * dst_rate / src_rate))
+    positions = np.linspace(0, len(audio) - 1, n, dtype=np.float64)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+@dataclass
+class SpeechItem:
+    """One sentence moving through the pipeline, with its timings."""
+    text: str
+    index: int
+    submitted_at: float
+    synth_ms: float = 0.0
+    gap_ms: float = 0.0
+    started_at: float = 0.0  # Wall time its audio reached the output buffer
+    duration: float = 0.0    # Seconds of audio
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "synth_ms": round(self.synth_ms, 1),
+            "gap_ms": round(self.gap_ms, 1),
+            "duration": round(self.duration, 3),
+            "error": self.error,
+        }
+
+
+class PipelinedSpeechEngine:
+    """
+    Speaks sentences in order while synthesizing ahead.
+
+    enqueue() starts synthesis immediately and returns once the sentence
+    is accepted; it waits only when `prefetch` sentences are already
+    synthesized or synthesizing ahead of playback. A single player task
+    decodes each result in a worker thread and writes it to the output
+    buffer, so the next sentence is usually ready before the current
+    one finishes.
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], Awaitable[bytes]],
+        output: Optional[Any] = None,
+        prefetch: int = 2,
+        decode: Callable[[bytes], Tuple["np.ndarray", int]] = decode_audio,
+        volume: float = 1.0,
+        sample_rate: int = 24000,
+        output_device: Optional[int] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            synthesize: Async callable returning encoded audio for a sentence.
+            output: AudioOutputStream-compatible sink (created lazily).
+            prefetch: Sentences synthesized ahead of the one playing.
+            decode: Callable turning encoded audio into (samples, rate).
+            volume: Gain applied to decoded audio.
+            sample_rate: Output rate when creating the default sink.
+            output_device: Output device when creating the default sink.
+        """
+        self._synthesize = synthesize
+        self._decode = decode
+        self._output = output
+        self.prefetch = max(1, prefetch)
+        self.volume = volume
+        self.sample_rate = sample_rate
+        self.output_device = output_device
+
+        self._ahead = 0  # Sentences synthesizing or ready, not yet playing
+        self._slot_freed: Optional[asyncio.Event] = None
+        self._pending: Optional[asyncio.Queue] = None
+        self._player: Optional[asyncio.Task] = None
+        self._tasks: List[asyncio.Task] = []
+        self._index = 0
+        self._generation = 0
+        self._outstanding = 0  # Enqueued but not yet handed to the output
+
+        self.items: List[SpeechItem] = []
+
+    @property
+    def output(self) -> Any:
+        if self._output is None:
+            self._output = AudioOutputStream(
+                sample_rate=self.sample_rate,
+                device=self.output_device,
+            )
+        return self._output
+
+    def _ensure_started(self) -> None:
+        if self._player is None or self._player.done():
+            self._ahead = 0
+            self._slot_freed = asyncio.Event()
+            self._pending = asyncio.Queue()
+            self._player = asyncio.create_task(self._play_loop(self._pending, self._generation))
+
+    async def _synth(self, item: SpeechItem) -> Optional["np.ndarray"]:
+        start = time.perf_counter()
+        try:
+            data = await self._synthesize(item.text)
+            audio, rate = await asyncio.to_thread(self._decode, data)
+            audio = _resample(_to_mono(np.asarray(audio)), rate, self.output.sample_rate)
+            if self.volume != 1.0:
+                audio = audio * np.float32(self.volume)
+            return audio
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            item.error = str(e)
+            logger.error(f"TTS synthesis failed: {e}")
+            return None
+        finally:
+            item.synth_ms = (time.perf_counter() - start) * 1000
+
+    async def enqueue(self, text: str) -> SpeechItem:
+        """
+        Submit a sentence for synthesis and in-order playback.
+
+        Returns:
+            SpeechItem whose timings fill in as it is played.
+        """
+        self._ensure_started()
+        generation = self._generation
+        slot_freed = self._slot_freed
+        while self._ahead >= self.prefetch and generation == self._generation:
+            slot_freed.clear()
+            await slot_freed.wait()
+        if generation != self._generation:
+            # Interrupted while waiting for a slot
+            return SpeechItem(text=text, index=-1, submitted_at=time.time(), error="interrupted")
+
+        item = SpeechItem(text=text, index=self._index, submitted_at=time.time())
+        self._index += 1
+        self._outstanding += 1
+        self._ahead += 1
+        task = asyncio.create_task(self._synth(item))
+        self._tasks.append(task)
+        self._pending.put_nowait((item, task))
+        return item
+
+    def _release_slot(self, generation: int) -> None:
+        if generation == self._generation:
+            self._ahead -= 1
+            self._slot_freed.set()
+
+    async def _play_loop(self, pending: asyncio.Queue, generation: int) -> None:
+        while True:
+            item, task = await pending.get()
+            holding_slot = True
+            try:
+                audio = await task
+                if audio is None or not len(audio):
+                    continue
+
+                output = self.output
+                drained_at = output.drained_at
+                if self.items and output.buffered_seconds == 0 and drained_at is not None:
+                    item.gap_ms = max(0.0, (time.monotonic() - drained_at) * 1000)
+                item.started_at = time.time()
+                item.duration = len(audio) / output.sample_rate
+                self.items.append(item)
+
+                # Free the slot before blocking on the buffer so the next
+                # sentence synthesizes while this one plays
+                self._release_slot(generation)
+                holding_slot = False
+                await asyncio.to_thread(output.write, audio)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                item.error = str(e)
+                logger.error(f"TTS playback failed: {e}")
+            finally:
+                if holding_slot:
+                    self._release_slot(generation)
+                if task in self._tasks:
+                    self._tasks.remove(task)
+                if generation == self._generation:
+                    self._outstanding -= 1
+                pending.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> List[SpeechItem]:
+        """
+        Wait until every enqueued sentence has finished playing.
+
+        Returns:
+            Items played since the last drain or interrupt.
+        """
+        if self._pending is not None:
+            await asyncio.wait_for(self._pending.join(), timeout)
+            if self._output is not None:
+                await asyncio.to_thread(self._output.wait_drained, timeout)
+        items, self.items = self.items, []
+        return items
+
+    def interrupt(self) -> None:
+        """Stop speaking now and drop everything queued."""
+        self._generation += 1
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._outstanding = 0
+        if self._player is not None:
+            self._player.cancel()
+            self._player = None
+        self._pending = None
+        if self._slot_freed is not None:
+            self._slot_freed.set()  # Wake enqueue() calls waiting for a slot
+        self._slot_freed = None
+        self._ahead = 0
+        if self._output is not None:
+            self._output.clear()
+        self.items = []
+
+    @property
+    def is_speaking(self) -> bool:
+        """True while sentences are queued or audio is still buffered."""
+        if self._outstanding:
+            return True
+        return self._output is not None and self._output.buffered_seconds > 0
+
+    async def aclose(self) -> None:
+        self.interrupt()
+        if self._output is not None and hasattr(self._output, "close"):
+            self._output.close()
+
+    def get_stats(self) -> dict:
+        return {
+            "prefetch": self.prefetch,
+            "queued": self._pending.qsize() if self._pending is not None else 0,
+            "synthesizing": sum(1 for t in self._tasks if not t.done()),
+            "buffered_seconds": round(self._output.buffered_seconds, 3) if self._output else 0.0,
+        }
@@ -21,6 +21,8 @@ from typing import Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from .audio_bus import AudioCaptureBus
+
 # Optional numpy import
 try:
     import numpy as np
@@ -52,6 +54,7 @@ class WakeWordDetection:
     confidence: float
     timestamp: float
     consecutive_count: int
+    sample_index: Optional[int] = None  # Capture bus position when detected
 
 
 @dataclass
@@ -91,6 +94,7 @@ class EnhancedWakeWordDetector:
         sample_rate: int = 16000,
         chunk_size: int = 1280,
         input_device: Optional[int] = None,
+        audio_bus: Optional[AudioCaptureBus] = None,
     ):
         """
         Initialize the enhanced wake word detector.
@@ -100,10 +104,13 @@ class EnhancedWakeWordDetector:
             sample_rate: Audio sample rate (must be 16000 for openWakeWord).
             chunk_size: Audio chunk size in samples.
             input_device: Input device index.
+            audio_bus: Shared capture bus to read from instead of opening
+                an input stream of its own.
         """
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.input_device = input_device
+        self.audio_bus = audio_bus
         
         # Default wake word if none provided
         if wake_words is None:
@@ -131,6 +138,8 @@ class EnhancedWakeWordDetector:
     
     @property
     def is_available(self) -> bool:
+        if self.audio_bus is not None:
+            return OPENWAKEWORD_AVAILABLE and self.audio_bus.is_available
         return OPENWAKEWORD_AVAILABLE and SOUNDDEVICE_AVAILABLE
     
     def _load_model(self) -> bool:
@@ -246,6 +255,28 @@ class EnhancedWakeWordDetector:
         
         self._audio_queue.put(indata.copy())
     
+    def _handle_chunk(self, audio_chunk: np.ndarray, sample_index: Optional[int] = None) -> None:
+        """Run detection on a chunk and notify the callback."""
+        detection = self._process_audio(audio_chunk)
+        
+        if detection and self._callback:
+            detection.sample_index = sample_index
+            logger.info(f"Wake word detected: {detection.wake_word} (confidence: {detection.confidence:.2f})")
+            self._callback(detection)
+    
+    def _bus_detection_loop(self) -> None:
+        """Detection loop reading from the shared capture bus."""
+        subscription = self.audio_bus.subscribe("wake_word")
+        logger.info("Wake word detection started (shared capture)")
+        
+        try:
+            while self._running:
+                audio_chunk = subscription.read(self.chunk_size, timeout=0.1)
+                if audio_chunk is not None:
+                    self._handle_chunk(audio_chunk, subscription.position)
+        finally:
+            subscription.close()
+    
     def _detection_loop(self) -> None:
         """Main detection loop."""
         if not self._load_model():
@@ -253,6 +284,10 @@ class EnhancedWakeWordDetector:
             return
         
         try:
+            if self.audio_bus is not None:
+                self._bus_detection_loop()
+                return
+            
             with sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=1,
@@ -266,13 +301,7 @@ class EnhancedWakeWordDetector:
                 while self._running:
                     try:
                         audio_chunk = self._audio_queue.get(timeout=0.1)
-                        audio_chunk = audio_chunk.flatten()
-                        
-                        detection = self._process_audio(audio_chunk)
-                        
-                        if detection and self._callback:
-                            logger.info(f"Wake word detected: {detection.wake_word} (confidence: {detection.confidence:.2f})")
-                            self._callback(detection)
+                        self._handle_chunk(audio_chunk.flatten())
                     
                     except queue.Empty:
                         continue
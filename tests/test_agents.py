@@ -127,15 +127,6 @@ class TestContextEngineer:
         assert "memory" in relevant
         assert "system" not in relevant
         assert "iot" not in relevant
-    
-    def test_conversation_truncation(self):
-        """Test long conversation truncation."""
-        from src.agents.supervisor_enhanced import ContextEngineer
-        
-        long_text = "x" * 10000
-        truncated = ContextEngineer._summarize_conversation(long_text)
-        
-        assert len(truncated) <= ContextEngineer.MAX_CONTEXT_LENGTH + 20  # Allow for suffix
 
 
 class TestIntentType:
@@ -193,5 +184,233 @@ class TestIntentClassification:
         assert classification.entities == {}
 
 
+class TestEmbeddingRouter:
+    """Tests for the local kNN router."""
+    
+    EXAMPLES = [
+        ("turn on the kitchen lights", "iot"),
+        ("turn off the bedroom lights", "iot"),
+        ("dim the living room lights", "iot"),
+        ("write a python function to sort a list", "coding"),
+        ("write a python script to parse csv files", "coding"),
+        ("fix the bug in my python code", "coding"),
+    ]
+    
+    @pytest.fixture
+    def router(self):
+        from src.agents.routing import EmbeddingRouter, HashingEmbedder
+        
+        router = EmbeddingRouter(embedder=HashingEmbedder(), threshold=0.5, audit_rate=0.0)
+        router.add_examples(self.EXAMPLES)
+        return router
+    
+    def test_routes_similar_task(self, router):
+        """Test a close paraphrase is routed confidently."""
+        decision = router.route("turn on the living room lights")
+        
+        assert decision.agent == "iot"
+        assert decision.confident
+        assert router.route("write a python function to reverse a list").agent == "coding"
+    
+    def test_unrelated_task_not_confident(self, router):
+        """Test unfamiliar tasks fall back to the LLM."""
+        decision = router.route("what is the capital of peru")
+        
+        assert not decision.confident
+    
+    def test_allowed_agents_filter(self, router):
+        """Test predictions are limited to the allowed agents."""
+        decision = router.route("turn on the kitchen lights", agents=["coding"])
+        
+        assert decision.agent in (None, "coding")
+    
+    def test_record_learns_and_tracks_agreement(self, router):
+        """Test LLM decisions become examples and agreement is tracked."""
+        prediction = router.route("turn on the hallway lights")
+        router.record("turn on the hallway lights", "iot", prediction)
+        router.record("schedule a meeting for monday", "communication")
+        
+        stats = router.get_stats()
+        assert stats["examples"] == len(self.EXAMPLES) + 2
+        assert stats["llm_routes"] == 2
+        assert stats["agreement"] == 1.0
+        assert router.route("schedule a meeting for tuesday").agent == "communication"
+    
+    def test_suggest_threshold(self, router):
+        """Test threshold suggestion from recorded agreement."""
+        from src.agents.routing import RouteDecision
+        
+        assert router.suggest_threshold(min_samples=20) is None
+        for i in range(30):
+            router.record(f"task {i}", "iot", RouteDecision("iot", 0.9, True), learn=False)
+            router.record(f"other {i}", "coding", RouteDecision("iot", 0.5, False), learn=False)
+        
+        assert router.suggest_threshold(target_agreement=0.95, min_samples=20) == 0.55
+    
+    def test_persistence(self, tmp_path):
+        """Test examples survive a restart."""
+        from src.agents.routing import EmbeddingRouter, HashingEmbedder
+        
+        db_path = tmp_path / "routing.db"
+        EmbeddingRouter(db_path=db_path, embedder=HashingEmbedder()).add_examples(self.EXAMPLES)
+        
+        reloaded = EmbeddingRouter(db_path=db_path, embedder=HashingEmbedder(), threshold=0.5)
+        assert len(reloaded) == len(self.EXAMPLES)
+        assert reloaded.route("dim the kitchen lights").agent == "iot"
+    
+    def test_supervisor_fast_path_skips_llm(self, router):
+        """Test a confident route bypasses the LLM routing call."""
+        from unittest.mock import MagicMock
+        from src.agents.supervisor_enhanced import EnhancedSupervisorAgent
+        
+        llm = MagicMock()
+        supervisor = EnhancedSupervisorAgent(llm_manager=llm, router=router)
+        state = {
+            "messages": [],
+            "task": "turn off the kitchen lights",
+            "intent": "",
+            "next_agent": "",
+            "agent_outputs": {},
+            "memory_context": "",
+            "iteration": 0,
+            "max_iterations": 10,
+            "final_response": "",
+            "completed": False,
+            "routing": "",
+        }
+        
+        routed = supervisor._supervisor_node(state)
+        assert routed["next_agent"] == "iot"
+        assert routed["routing"] == "fast"
+        
+        done = supervisor._supervisor_node({**routed, "agent_outputs": {"iot": "Lights off."}})
+        assert done["next_agent"] == "synthesize"
+        llm.generate.assert_not_called()
+
+
+class TestParallelSupervisor:
+    """Tests for plan-then-fan-out execution."""
+    
+    @staticmethod
+    def make_agent(reply, delay=0.0):
+        import asyncio
+        from types import SimpleNamespace
+        
+        class SleepyAgent:
+            async def process(self, state):
+                await asyncio.sleep(delay)
+                return SimpleNamespace(content=f"{reply}: {state.task}")
+        
+        return SleepyAgent()
+    
+    @staticmethod
+    def make_state(task, **extra):
+        state = {
+            "messages": [],
+            "task": task,
+            "intent": "",
+            "next_agent": "",
+            "agent_outputs": {},
+            "memory_context": "",
+            "iteration": 0,
+            "max_iterations": 10,
+            "final_response": "",
+            "completed": False,
+            "routing": "",
+            "plan": [],
+            "branch_timings": {},
+        }
+        state.update(extra)
+        return state
+    
+    def test_compound_detection(self):
+        """Test clauses for different agents are detected."""
+        from src.agents.supervisor_enhanced import IntentClassifier
+        
+        assert IntentClassifier.is_compound("what's the weather and turn on the lights")
+        assert IntentClassifier.is_compound("check my email then open spotify")
+        assert not IntentClassifier.is_compound("search for cats and dogs")
+        assert not IntentClassifier.is_compound("turn on the kitchen lights")
+    
+    def test_supervisor_emits_plan(self):
+        """Test a compound task is planned once into parallel subtasks."""
+        from unittest.mock import MagicMock
+        from types import SimpleNamespace
+        from src.agents.supervisor_enhanced import EnhancedSupervisorAgent
+        
+        llm = MagicMock()
+        llm.generate.return_value = SimpleNamespace(content=(
+            '{"subtasks": [{"agent": "research", "task": "Get the weather"}, '
+            '{"agent": "iot", "task": "Turn on the lights"}, '
+            '{"agent": "nonsense", "task": "Ignored"}]}'
+        ))
+        supervisor = EnhancedSupervisorAgent(llm_manager=llm)
+        
+        result = supervisor._supervisor_node(self.make_state("what's the weather and turn on the lights"))
+        
+        assert result["next_agent"] == "parallel"
+        assert result["routing"] == "parallel"
+        assert [step["agent"] for step in result["plan"]] == ["research", "iot"]
+        assert llm.generate.call_count == 1
+    
+    def test_branches_run_concurrently_with_timeouts(self):
+        """Test branches overlap and a slow branch times out alone."""
+        import time
+        from unittest.mock import MagicMock
+        from src.agents.supervisor_enhanced import EnhancedSupervisorAgent
+        
+        supervisor = EnhancedSupervisorAgent(
+            llm_manager=MagicMock(),
+            agents={
+                "research": self.make_agent("weather", delay=0.3),
+                "iot": self.make_agent("lights", delay=0.3),
+                "communication": self.make_agent("email", delay=2.0),
+            },
+            agent_timeouts={"communication": 0.5},
+        )
+        plan = [
+            {"agent": "research", "task": "Get the weather"},
+            {"agent": "iot", "task": "Turn on the lights"},
+            {"agent": "communication", "task": "Summarize my email"},
+            {"agent": "iot", "task": "Lock the door"},
+        ]
+        
+        start = time.perf_counter()
+        result = supervisor._parallel_node(self.make_state("compound", plan=plan))
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 1.2
+        timings = result["branch_timings"]
+        assert set(timings) == {"research", "iot", "communication", "iot_2"}
+        assert timings["research"]["status"] == "ok"
+        assert 0.25 <= timings["research"]["seconds"] < 1.0
+        assert timings["communication"]["status"] == "timeout"
+        assert result["agent_outputs"]["iot_2"] == "lights: Lock the door"
+        assert "Timed out" in result["agent_outputs"]["communication"]
+    
+    def test_synthesize_merges_branches(self):
+        """Test planned outputs are merged with their subtasks."""
+        from unittest.mock import MagicMock
+        from src.agents.supervisor_enhanced import EnhancedSupervisorAgent
+        
+        llm = MagicMock()
+        llm.generate.side_effect = RuntimeError("offline")
+        supervisor = EnhancedSupervisorAgent(llm_manager=llm)
+        state = self.make_state(
+            "compound",
+            agent_outputs={"research": "Sunny.", "iot": "Lights on."},
+            branch_timings={
+                "research": {"agent": "research", "task": "Get the weather", "status": "ok", "seconds": 0.1},
+                "iot": {"agent": "iot", "task": "Turn on the lights", "status": "ok", "seconds": 0.1},
+            },
+        )
+        
+        result = supervisor._synthesize_node(state)
+        
+        assert result["final_response"] == "Sunny.\n\nLights on."
+        prompt = llm.generate.call_args[0][0][1].content
+        assert "[research] (Get the weather): Sunny." in prompt
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -71,6 +71,153 @@ class TestSessionManager:
         assert not authorized
 
 
+class TestFaceEncodingIndex:
+    """Tests for the enrolled face encoding matrix."""
+    
+    def test_distances_match_bruteforce(self):
+        """Test vectorized distances equal per-row Euclidean distances."""
+        from src.auth.face_auth import FaceEncodingIndex
+        
+        rng = np.random.default_rng(0)
+        enrolled = rng.normal(size=(20, 128)).astype(np.float32)
+        probe = rng.normal(size=128).astype(np.float32)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index = FaceEncodingIndex(Path(tmpdir) / "enc.npy")
+            index.add(list(enrolled))
+            
+            expected = np.linalg.norm(enrolled - probe, axis=1)
+            assert np.allclose(index.distances(probe), expected, atol=1e-3)
+            assert index.best_match(enrolled[7])[0] == 7
+    
+    def test_persists_and_memory_maps(self):
+        """Test encodings reload from the .npy file as a memory map."""
+        from src.auth.face_auth import FaceEncodingIndex
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "enc.npy"
+            FaceEncodingIndex(path).add([np.ones(128), np.zeros(128)])
+            
+            reloaded = FaceEncodingIndex(path)
+            assert len(reloaded) == 2
+            assert isinstance(reloaded.load(), np.memmap)
+    
+    def test_add_and_clear_release_mapping(self):
+        """Test appending and clearing work while the file is mapped."""
+        from src.auth.face_auth import FaceEncodingIndex
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index = FaceEncodingIndex(Path(tmpdir) / "enc.npy")
+            index.add([np.ones(128)])
+            mapped = index.load()
+            assert isinstance(mapped, np.memmap)
+            
+            index.add([np.zeros(128)])
+            assert len(index) == 2
+            assert index.best_match(np.zeros(128)) == (1, 0.0)
+            
+            index.clear()
+            assert index._matrix is None
+            assert not index.path.exists()
+            assert len(index) == 0
+    
+    def test_migrates_pickled_encodings(self):
+        """Test a legacy pickle file is converted on first load."""
+        import pickle
+        from src.auth.face_auth import FaceEncodingIndex
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy = Path(tmpdir) / "user_encodings.pkl"
+            with open(legacy, "wb") as f:
+                pickle.dump([np.full(128, 0.5), np.full(128, -0.5)], f)
+            
+            index = FaceEncodingIndex(Path(tmpdir) / "user_encodings.npy", legacy_path=legacy)
+            
+            assert len(index) == 2
+            assert not legacy.exists()
+            assert index.path.exists()
+
+
+class TestFaceTracker:
+    """Tests for IoU face tracking."""
+    
+    def test_moving_face_keeps_track(self):
+        """Test a slightly moved box continues the same track."""
+        from src.auth.face_auth import FaceTracker
+        
+        tracker = FaceTracker()
+        [(first, new_first)] = tracker.update([(100, 200, 200, 100)])
+        [(second, new_second)] = tracker.update([(105, 205, 205, 105)])
+        
+        assert new_first and not new_second
+        assert first.track_id == second.track_id
+    
+    def test_new_face_and_expiry(self):
+        """Test a distant box starts a new track and stale tracks expire."""
+        from src.auth.face_auth import FaceTracker
+        
+        tracker = FaceTracker(max_missed=2)
+        tracker.update([(100, 200, 200, 100)])
+        [(other, is_new)] = tracker.update([(300, 500, 500, 300)])
+        
+        assert is_new
+        assert len(tracker.tracks) == 2
+        
+        tracker.update([])
+        tracker.update([])
+        tracker.update([])
+        assert tracker.tracks == {}
+
+
+class TestVerifyFrame:
+    """Tests for continuous verification re-encoding."""
+    
+    def _authenticator(self, tmpdir, boxes, verdicts):
+        pytest.importorskip("face_recognition")
+        from src.auth.face_auth import FaceAuthenticator
+        
+        auth = FaceAuthenticator(tmpdir, reverify_frames=3, match_reverify_frames=10)
+        auth._index.add([np.zeros(128)])
+        auth.encoded = 0
+        auth.detect_faces = lambda frame: [boxes.pop(0)]
+        
+        def encode(rgb_frame, location):
+            auth.encoded += 1
+            return np.zeros(128)
+        
+        auth._encode = encode
+        auth._match = lambda encoding: verdicts.pop(0)
+        return auth
+    
+    def test_matched_track_reverified_periodically(self):
+        """Test a matched track is re-encoded after match_reverify_frames."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        box = (100, 200, 200, 100)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auth = self._authenticator(tmpdir, [box] * 11, [(True, 0.9), (False, 0.1)])
+            
+            assert auth.verify_frame(frame) == (True, 0.9)
+            for _ in range(9):
+                assert auth.verify_frame(frame) == (True, 0.9)
+            assert auth.encoded == 1
+            
+            assert auth.verify_frame(frame) == (False, 0.1)
+            assert auth.encoded == 2
+    
+    def test_jumped_box_reverified(self):
+        """Test a matched track whose box jumps is re-encoded at once."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        boxes = [(100, 200, 200, 100), (100, 240, 200, 140)]
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auth = self._authenticator(tmpdir, boxes, [(True, 0.9), (False, 0.1)])
+            
+            assert auth.verify_frame(frame) == (True, 0.9)
+            assert auth.verify_frame(frame) == (False, 0.1)
+            assert auth.encoded == 2
+
+
 class TestConversationMemory:
     """Tests for conversation memory."""
     
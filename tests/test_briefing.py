@@ -0,0 +1,176 @@
+"""
+Unit tests for the daily briefing section gathering.
+
+Tests:
+- Sections fetched concurrently within their deadlines
+- Stale-while-revalidate fallback for slow or failing sections
+- Wake time learning and precompute scheduling
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+briefing_module = pytest.importorskip("academic.briefing")
+DailyBriefing = briefing_module.DailyBriefing
+
+
+class SlowWeather:
+    """Weather service with a controllable delay and failure."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.fail = False
+        self.temperature = 60
+        self.calls = 0
+
+    async def get_current(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("weather down")
+        return {"temperature": self.temperature, "condition": "Sunny"}
+
+
+class SlowCalendar:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def get_today_events(self):
+        await asyncio.sleep(self.delay)
+        return [{"time": "09:00", "title": "Lecture"}]
+
+
+class SlowEmail:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def get_unread_count(self):
+        await asyncio.sleep(self.delay)
+        return 3
+
+
+class TestSectionGathering:
+    """Tests for concurrent, deadline-bounded sections."""
+
+    def test_sections_fetched_concurrently(self):
+        """Test the briefing takes about as long as its slowest section."""
+        briefing = DailyBriefing(
+            weather_service=SlowWeather(0.2),
+            calendar_service=SlowCalendar(0.2),
+            email_service=SlowEmail(0.2),
+        )
+
+        async def run():
+            start = time.perf_counter()
+            text = await briefing.get_morning_briefing()
+            return text, time.perf_counter() - start
+
+        text, elapsed = asyncio.run(run())
+        assert "60°F, Sunny" in text
+        assert "09:00 - Lecture" in text
+        assert "3 unread emails" in text
+        assert elapsed < 0.5
+
+    def test_slow_section_serves_stale_value(self):
+        """Test a section missing its deadline renders its last good value."""
+        weather = SlowWeather()
+        briefing = DailyBriefing(weather_service=weather, cache_ttl=0)
+        briefing.SECTION_TIMEOUTS = {"weather": 0.05}
+
+        async def run():
+            first = await briefing.gather_sections(["weather"])
+            weather.delay = 0.2
+            weather.temperature = 70
+            second = await briefing.gather_sections(["weather"])
+            source = briefing.last_sources["weather"]
+            # The refresh keeps running and updates the cache
+            await asyncio.sleep(0.3)
+            return first, second, source
+
+        first, second, source = asyncio.run(run())
+        assert first["weather"] == "60°F, Sunny"
+        assert second["weather"] == "60°F, Sunny"
+        assert source == "stale"
+        assert briefing._sections["weather"].value == "70°F, Sunny"
+        assert briefing.stats["timeouts"] == 1
+
+    def test_failing_section_keeps_last_good_value(self):
+        """Test a failed fetch neither raises nor overwrites the cache."""
+        weather = SlowWeather()
+        briefing = DailyBriefing(weather_service=weather, cache_ttl=0)
+
+        async def run():
+            await briefing.gather_sections(["weather"])
+            weather.fail = True
+            return await briefing.gather_sections(["weather"])
+
+        assert asyncio.run(run())["weather"] == "60°F, Sunny"
+        assert briefing.stats["errors"] == 1
+
+    def test_default_without_cached_value(self):
+        """Test a section with no good value yet falls back to its default."""
+        briefing = DailyBriefing(email_service=SlowEmail(1.0))
+        briefing.SECTION_TIMEOUTS = {"emails": 0.05}
+
+        async def run():
+            return await briefing.gather_sections(["emails"])
+
+        assert asyncio.run(run()) == {"emails": 0}
+        assert briefing.last_sources["emails"] == "default"
+
+    def test_fresh_cache_skips_fetch(self):
+        weather = SlowWeather()
+        briefing = DailyBriefing(weather_service=weather, cache_ttl=60)
+
+        async def run():
+            await briefing.gather_sections(["weather"])
+            await briefing.gather_sections(["weather"])
+            await briefing.gather_sections(["weather"], force=True)
+
+        asyncio.run(run())
+        assert weather.calls == 2
+
+
+class TestPrecompute:
+    """Tests for wake time learning and precompute scheduling."""
+
+    def test_configured_wake_time(self):
+        briefing = DailyBriefing(wake_time="08:00", precompute_lead_minutes=10)
+
+        assert briefing.next_precompute_at(datetime(2026, 3, 2, 6, 0)) == datetime(2026, 3, 2, 7, 50)
+        assert briefing.next_precompute_at(datetime(2026, 3, 2, 9, 0)) == datetime(2026, 3, 3, 7, 50)
+
+    def test_learns_wake_time(self, tmp_path):
+        """Test the median morning request time replaces the configured one."""
+        history = tmp_path / "briefing_history.json"
+        briefing = DailyBriefing(wake_time="08:00", history_path=history)
+
+        for minute in (0, 10, 20):
+            briefing.record_wake(datetime(2026, 3, 2, 7, minute))
+        briefing.record_wake(datetime(2026, 3, 2, 22, 0))  # Not a morning briefing
+
+        assert briefing.usual_wake_time.strftime("%H:%M") == "07:10"
+        reloaded = DailyBriefing(history_path=history)
+        assert reloaded.usual_wake_time.strftime("%H:%M") == "07:10"
+
+    def test_precompute_warms_cache(self):
+        """Test a precomputed briefing is served from cache."""
+        weather = SlowWeather()
+        briefing = DailyBriefing(weather_service=weather)
+
+        async def run():
+            await briefing.precompute()
+            weather.delay = 1.0
+            start = time.perf_counter()
+            await briefing.get_morning_briefing()
+            return time.perf_counter() - start
+
+        assert asyncio.run(run()) < 0.5
+        assert briefing.last_sources["weather"] == "cached"
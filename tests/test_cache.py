@@ -23,6 +23,7 @@ from core.cache import (
     LRUCache,
     SQLiteCache,
     SemanticCache,
+    VectorIndex,
     ResponseTemplates,
     IntelligentCache,
     CacheConfig,
@@ -31,6 +32,7 @@ from core.cache import (
     CacheStats,
     get_cache,
     CATEGORY_TTL,
+    NUMPY_AVAILABLE,
 )
 
 
@@ -296,6 +298,83 @@ class TestSemanticCache:
         entry, similarity = result
         assert similarity > 0.8
         assert entry.value == "It's sunny and warm."
+    
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="Requires numpy")
+    def test_persistence_and_eviction(self):
+        """Test entries survive restart and LRU eviction is written through."""
+        vectors = {"q1": [1.0, 0.0], "q2": [0.0, 1.0], "q3": [0.7, 0.7]}
+        
+        def make_entry(key):
+            return CacheEntry(
+                key=key,
+                value=f"answer {key}",
+                category=CacheCategory.GENERAL,
+                created_at=time.time(),
+                expires_at=time.time() + 3600,
+            )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+            cache = SemanticCache(threshold=0.9, max_entries=2, db_path=db_path)
+            for key in ("q1", "q2", "q3"):
+                cache.add_embedding(key, make_entry(key), vectors[key])
+            
+            assert cache.size == 2
+            
+            restored = SemanticCache(threshold=0.9, max_entries=2, db_path=db_path)
+            with patch.object(restored, "_compute_embedding", return_value=[0.0, 1.0]):
+                result = restored.find_similar("q2")
+            
+            assert restored.size == 2
+            assert result is not None
+            assert result[0].value == "answer q2"
+            
+            with patch.object(restored, "_compute_embedding", return_value=[1.0, 0.0]):
+                assert restored.find_similar("q1") is None
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="Requires numpy")
+class TestVectorIndex:
+    """Tests for VectorIndex class."""
+    
+    def test_top_k_search(self):
+        """Test top-k results are ordered by similarity."""
+        index = VectorIndex(initial_capacity=2)
+        
+        index.add("x", [1.0, 0.0, 0.0])
+        index.add("xy", [1.0, 1.0, 0.0])
+        index.add("z", [0.0, 0.0, 1.0])
+        
+        results = index.search([1.0, 0.1, 0.0], k=2)
+        
+        assert [key for key, _ in results] == ["x", "xy"]
+        assert results[0][1] > results[1][1]
+        assert len(index) == 3
+    
+    def test_remove_recycles_row(self):
+        """Test removed rows are reused without growing storage."""
+        index = VectorIndex(initial_capacity=2)
+        
+        row_a = index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.remove("a")
+        row_c = index.add("c", [1.0, 1.0])
+        
+        assert row_c == row_a
+        assert "a" not in index
+        assert [key for key, _ in index.search([1.0, 0.0], k=5)] == ["c", "b"]
+    
+    def test_expired_rows_skipped(self):
+        """Test expired rows are filtered from search and removed by expire."""
+        index = VectorIndex()
+        now = time.time()
+        
+        index.add("old", [1.0, 0.0], expires_at=now - 1)
+        index.add("new", [0.9, 0.1], expires_at=now + 60)
+        
+        assert [key for key, _ in index.search([1.0, 0.0], k=2)] == ["new"]
+        assert index.expire() == ["old"]
+        assert len(index) == 1
 
 
 class TestIntelligentCache:
@@ -0,0 +1,157 @@
+"""
+Unit tests for contact resolution.
+
+Tests:
+- Phonetic keys for spoken names
+- Index agrees with the full-table scan it replaces
+- Index kept in sync with database writes
+"""
+
+import random
+import string
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from communication.contact_index import ContactIndex, phonetic_key
+from communication.contacts import Contact, ContactsDatabase, ContactsManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ContactsDatabase(tmp_path / "contacts.db")
+    db.add_contact("John Smith", phone="5551234567")
+    db.add_contact("Rahul Sharma", phone="5550000001", nickname="Papa", category="family")
+    db.add_contact("Catherine Lee", phone="5550000002")
+    db.add_contact("Joanna Park", phone="5550000003", favorite=True)
+    return db
+
+
+def full_scan(db, query, threshold):
+    """The scoring suggest_contact used before the index."""
+    query = query.lower()
+    results = []
+    for contact in db.list_contacts(limit=-1):
+        score = db._similarity(query, contact.name.lower())
+        if contact.nickname:
+            score = max(score, db._similarity(query, contact.nickname.lower()))
+        if score >= threshold:
+            results.append((contact.id, score))
+    return results
+
+
+class TestPhoneticKey:
+    """Tests for phonetic_key."""
+
+    @pytest.mark.parametrize("a, b", [
+        ("jon", "john"),
+        ("catherine", "kathryn"),
+        ("steven", "stephen"),
+        ("smith", "smyth"),
+        ("mohammed", "muhammad"),
+        ("knight", "night"),
+    ])
+    def test_sound_alike(self, a, b):
+        assert phonetic_key(a) == phonetic_key(b)
+
+    def test_different_names(self):
+        assert phonetic_key("john") != phonetic_key("james")
+        assert phonetic_key("") == ""
+
+
+class TestContactIndex:
+    """Tests for suggestions served from the index."""
+
+    def test_alias_resolves_nickname(self, db):
+        """Test "daddy" finds the contact nicknamed Papa."""
+        contact, score = db.suggest_contact("daddy")[0]
+        assert contact.name == "Rahul Sharma"
+        assert score == pytest.approx(0.85)
+
+    def test_phonetic_match(self, db):
+        """Test a spoken spelling variant is suggested."""
+        contact, score = db.suggest_contact("kathryn", threshold=0.6)[0]
+        assert contact.name == "Catherine Lee"
+        assert score >= ContactIndex.PHONETIC_SCORE
+
+    def test_agrees_with_full_scan(self, tmp_path):
+        """Test indexed suggestions never lose a full-scan match above 0.6."""
+        rng = random.Random(3)
+        db = ContactsDatabase(tmp_path / "many.db")
+        names = set()
+        while len(names) < 300:
+            names.add(" ".join(
+                "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 7))).title()
+                for _ in range(2)
+            ))
+        for name in sorted(names):
+            db.add_contact(name)
+
+        for name in rng.sample(sorted(names), 40):
+            query = name.split()[rng.randint(0, 1)][: rng.randint(2, 6)].lower()
+            expected = {cid for cid, score in full_scan(db, query, 0.6)}
+            found = {c.id for c, score in db._get_index().suggest(query, threshold=0.6, limit=len(names))}
+            assert expected <= found
+
+    def test_search_matches_like(self, db):
+        """Test substring search keeps LIKE semantics and ordering."""
+        names = [c.name for c in db.search_contacts("ann")]
+        assert names == ["Joanna Park"]
+        assert [c.name for c in db.search_contacts("a")] == [
+            "Joanna Park", "Catherine Lee", "Rahul Sharma",
+        ]
+        assert [c.name for c in db.search_contacts("sharma")] == ["Rahul Sharma"]
+
+    def test_index_follows_writes(self, db):
+        """Test adds, updates and deletes are visible without a rebuild."""
+        assert db.search_contacts("jonathan") == []
+        index = db._get_index()
+
+        db.add_contact("Jonathan Davis")
+        assert [c.name for c in db.search_contacts("jonathan")] == ["Jonathan Davis"]
+
+        contact = db.get_contact("Jonathan Davis")
+        db.update_contact(contact.id, nickname="JD Bro")
+        assert [c.name for c in db.search_contacts("jd bro")] == ["Jonathan Davis"]
+
+        db.delete_contact(name="jonathan davis")
+        assert db.search_contacts("jonathan") == []
+        assert contact.id not in index
+        assert db._get_index() is index
+
+    def test_lookup_time(self):
+        """Test suggestions over thousands of contacts stay fast."""
+        rng = random.Random(5)
+        db = ContactsDatabase.__new__(ContactsDatabase)  # Scoring only, no file
+        index = ContactIndex(similarity=db._similarity, aliases=db.RELATIONSHIP_ALIASES)
+        contacts = []
+        for i in range(5000):
+            name = " ".join(
+                "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8))).title()
+                for _ in range(2)
+            )
+            contacts.append(Contact(id=i + 1, name=name))
+        index.rebuild(contacts)
+
+        queries = [c.name.split()[0].lower()[:-1] for c in rng.sample(contacts, 200)]
+        start = time.perf_counter()
+        for query in queries:
+            index.suggest(query)
+        avg_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        assert avg_ms < 10
+
+
+class TestContactsManager:
+    """Tests for resolve_contact."""
+
+    def test_did_you_mean(self, tmp_path):
+        manager = ContactsManager(tmp_path / "contacts.db")
+        manager.add_contact("Jon Snow", phone="5551112222")
+
+        contact, message = manager.resolve_contact("john")
+        assert contact is None
+        assert "Did you mean 'Jon Snow'" in message
@@ -0,0 +1,141 @@
+"""
+Unit tests for token-budgeted context assembly.
+
+Tests:
+- Token counting and truncation
+- Priority-based budget allocation
+- Conversation message trimming
+- Prompt token accounting
+"""
+
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.context_budget import (
+    TRUNCATION_MARKER,
+    ContextBuilder,
+    PromptStats,
+    TokenCounter,
+    fit_messages,
+    get_prompt_stats,
+    record_prompt,
+)
+
+
+@pytest.fixture
+def counter():
+    return TokenCounter()
+
+
+def words(n, word="alpha"):
+    return " ".join(f"{word}{i}" for i in range(n))
+
+
+def test_count_is_cached_and_monotonic(counter):
+    short = counter.count("Turn on the kitchen lights.")
+    long = counter.count("Turn on the kitchen lights and set the thermostat to 72 degrees.")
+    assert 0 < short < long
+    counter.count("Turn on the kitchen lights.")
+    assert counter.count.cache_info().hits >= 1
+    assert counter.count("") == 0
+
+
+def test_truncate_head_and_tail(counter):
+    text = words(200)
+    head = counter.truncate(text, 50, keep="head")
+    tail = counter.truncate(text, 50, keep="tail")
+
+    assert counter.count(head) <= 50 and counter.count(tail) <= 50
+    assert head.startswith("alpha0 ") and head.endswith(TRUNCATION_MARKER)
+    assert tail.endswith("alpha199") and tail.startswith(TRUNCATION_MARKER)
+    assert counter.truncate("short text", 50) == "short text"
+
+
+def test_builder_keeps_high_priority_pieces_first(counter):
+    builder = ContextBuilder(120, label="test", counter=counter)
+    builder.add("history", words(300, "hist"), priority=1, kind="history", keep="tail")
+    builder.add("memories", "User prefers metric units.", priority=3, kind="memory")
+    builder.add("docs", words(40, "doc"), priority=2, kind="docs")
+    context = builder.build(record=False)
+
+    assert context.total_tokens <= 120
+    statuses = {p.name: p.status for p in context.pieces}
+    assert statuses["memories"] == "kept"
+    assert statuses["docs"] == "kept"
+    assert statuses["history"] == "truncated"
+    # Output keeps insertion order
+    assert context.text.index(TRUNCATION_MARKER) < context.text.index("User prefers")
+    assert context.get("history").endswith("hist299")
+
+
+def test_builder_uses_summary_then_drops(counter):
+    builder = ContextBuilder(40, label="test", counter=counter).reserve(10)
+    builder.add("task", "Summarize my inbox.", priority=10, truncatable=False)
+    builder.add("history", words(200), priority=5, summary="Earlier: talked about email.")
+    builder.add("extra", words(200, "x"), priority=1, min_tokens=32)
+    context = builder.build(record=False)
+
+    statuses = {p.name: p.status for p in context.pieces}
+    assert statuses == {"task": "kept", "history": "summarized", "extra": "dropped"}
+    assert context.dropped == ["extra"]
+    assert context.total_tokens + 10 <= 40
+
+
+def test_fit_messages_keeps_latest_and_summary(counter):
+    messages = [{"role": "system", "content": "Previous conversation summary:\nTalked about trips."}]
+    for i in range(20):
+        messages.append({"role": "user" if i % 2 == 0 else "assistant", "content": words(8, f"m{i}x")})
+
+    fitted = fit_messages(messages, 150, counter=counter)
+
+    assert fitted[-1] == messages[-1]
+    assert fitted[0]["role"] == "system"
+    assert counter.count_messages(fitted) <= 150
+    # Kept history is contiguous and in order
+    kept = [messages.index(m) for m in fitted[1:]]
+    assert kept == list(range(kept[0], 21))
+
+
+def test_fit_messages_truncates_oversized_latest(counter):
+    messages = [{"role": "user", "content": words(500)}]
+    fitted = fit_messages(messages, 100, counter=counter)
+    assert len(fitted) == 1
+    assert counter.count_messages(fitted) <= 100
+    assert fitted[0]["content"].endswith("alpha499")
+
+
+def test_prompt_stats():
+    stats = PromptStats()
+    stats.record("llm:groq", 100, latency_ms=200.0, first_token_ms=80.0)
+    stats.record("llm:groq", 300, by_kind={"history": 250}, truncated=1)
+    result = stats.get_stats()["llm:groq"]
+
+    assert result["requests"] == 2
+    assert result["avg_prompt_tokens"] == 200.0
+    assert result["max_prompt_tokens"] == 300
+    assert result["avg_first_token_ms"] == 80.0
+    assert result["avg_tokens_by_kind"] == {"history": 125.0}
+
+
+def test_record_prompt_counts_messages():
+    get_prompt_stats().reset()
+    tokens = record_prompt("test:record", [{"role": "user", "content": "hello there"}], latency_ms=12.0)
+    assert tokens > 0
+    assert get_prompt_stats().get_stats()["test:record"]["max_prompt_tokens"] == tokens
+
+
+def test_conversation_memory_budget():
+    from src.memory.conversation import ConversationMemory
+
+    memory = ConversationMemory(max_messages=50, window_size=50, max_context_tokens=120)
+    for i in range(30):
+        memory.add_message("user", words(15, f"turn{i}x"))
+
+    messages = memory.get_context_messages()
+    assert messages[-1]["content"].startswith("turn29x0")
+    assert TokenCounter().count_messages(messages) <= 120
+    assert len(memory.get_context_messages(max_tokens=10_000)) == 30
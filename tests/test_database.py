@@ -0,0 +1,133 @@
+"""
+Unit tests for the shared SQLite layer.
+
+Tests:
+- Pooled per-thread connections and PRAGMA setup
+- Nested transactions and rollback
+- Async writer thread batching
+- Shared registry
+"""
+
+import asyncio
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.database import Database, get_database, close_all_databases
+
+
+@pytest.fixture
+def db():
+    """Database in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(Path(tmpdir) / "test.db")
+        database.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)")
+        yield database
+        database.close()
+
+
+class TestDatabase:
+    """Tests for Database class."""
+    
+    def test_pragmas_applied(self, db):
+        """Test connections use WAL with synchronous=NORMAL."""
+        assert db.fetchone("PRAGMA journal_mode")[0] == "wal"
+        assert db.fetchone("PRAGMA synchronous")[0] == 1
+    
+    def test_connection_reused_per_thread(self, db):
+        """Test a thread keeps one connection and other threads get their own."""
+        assert db.connection() is db.connection()
+        
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.connection()))
+        thread.start()
+        thread.join()
+        
+        assert other[0] is not db.connection()
+        assert db.stats["connections"] == 2
+    
+    def test_thread_connection_closed_on_exit(self, db):
+        """Test a worker thread's connection is closed when the thread ends."""
+        opened = []
+        thread = threading.Thread(target=lambda: opened.append(db.connection()))
+        thread.start()
+        thread.join()
+        
+        assert db.get_stats()["open_connections"] == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+    
+    def test_transaction_rollback(self, db):
+        """Test an error rolls back the whole transaction."""
+        with pytest.raises(ValueError):
+            with db.transaction() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('a')")
+                raise ValueError("boom")
+        
+        assert db.fetchone("SELECT COUNT(*) FROM items")[0] == 0
+    
+    def test_nested_transaction_is_savepoint(self, db):
+        """Test a failing inner block only undoes its own writes."""
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('outer')")
+            with pytest.raises(sqlite3.IntegrityError):
+                with db.transaction() as inner:
+                    inner.execute("INSERT INTO items (name) VALUES ('inner')")
+                    inner.execute("INSERT INTO items (name) VALUES ('outer')")
+        
+        names = [row["name"] for row in db.fetchall("SELECT name FROM items")]
+        assert names == ["outer"]
+    
+    def test_legacy_commit_inside_transaction(self, db):
+        """Test stores that still call conn.commit() keep working."""
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            conn.commit()
+        
+        assert db.fetchone("SELECT COUNT(*) FROM items")[0] == 1
+    
+    @pytest.mark.asyncio
+    async def test_async_writes_batched(self, db):
+        """Test concurrent async writes commit in shared batches with isolated failures."""
+        results = await asyncio.gather(
+            *[db.aio.execute("INSERT INTO items (name) VALUES (?)", (f"n{i}",)) for i in range(50)],
+            db.aio.execute("INSERT INTO items (name) VALUES ('n0')"),
+            return_exceptions=True,
+        )
+        
+        assert results[:50] == [1] * 50
+        assert isinstance(results[50], sqlite3.IntegrityError)
+        assert (await db.aio.fetchone("SELECT COUNT(*) FROM items"))[0] == 50
+        assert db.stats["write_batches"] < 51
+
+
+class TestRegistry:
+    """Tests for get_database."""
+    
+    def test_same_path_shared(self):
+        """Test stores opening the same file share one Database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "shared.db"
+            
+            assert get_database(path) is get_database(str(path))
+            close_all_databases()
+    
+    def test_deleted_file_reopened(self):
+        """Test a database whose file was removed is reopened."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "gone.db"
+            first = get_database(path)
+            first.execute("CREATE TABLE t (x)")
+            path.unlink()
+            
+            second = get_database(path)
+            
+            assert second is not first
+            assert first.closed
+            close_all_databases()
@@ -0,0 +1,278 @@
+"""
+Unit tests for document ingestion.
+
+Tests:
+- Streamed chunking matches whole-text chunking
+- Unchanged files are skipped on re-ingestion
+- Changed files only re-embed the chunks that differ
+- Directory ingestion with progress and pruning
+- BM25 index, rank fusion and hybrid search
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.documents import DocumentService, TextChunker
+from src.tools.retrieval import BM25Index, CrossEncoderReranker, reciprocal_rank_fusion, tokenize
+
+
+class MemoryCollection:
+    """
+    Stands in for a ChromaDB collection; records upserted ids.
+
+    query() ranks by most recently written, so it never favours exact
+    term matches the way BM25 does.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.upserted = []
+
+    def upsert(self, ids, documents, metadatas):
+        self.upserted.extend(ids)
+        for chunk_id, text, meta in zip(ids, documents, metadatas):
+            self.items[chunk_id] = (text, meta)
+
+    def delete(self, ids):
+        for chunk_id in ids:
+            self.items.pop(chunk_id, None)
+
+    def count(self):
+        return len(self.items)
+
+    def _matches(self, meta, where):
+        return not where or all(meta.get(k) == v for k, v in where.items())
+
+    def query(self, query_texts, n_results, where=None):
+        ids = [cid for cid in reversed(list(self.items)) if self._matches(self.items[cid][1], where)][:n_results]
+        return {
+            "ids": [ids],
+            "documents": [[self.items[cid][0] for cid in ids]],
+            "metadatas": [[self.items[cid][1] for cid in ids]],
+            "distances": [[0.5 for _ in ids]],
+        }
+
+    def get(self, ids=None, where=None, include=None, limit=None, offset=0):
+        ids = [cid for cid in (ids or list(self.items)) if cid in self.items]
+        ids = [cid for cid in ids if self._matches(self.items[cid][1], where)]
+        ids = ids[offset:offset + limit] if limit else ids[offset:]
+        return {
+            "ids": ids,
+            "documents": [self.items[cid][0] for cid in ids],
+            "metadatas": [self.items[cid][1] for cid in ids],
+        }
+
+
+def make_text(n, tag="word"):
+    return " ".join(f"Sentence {i} has some {tag} content in it." for i in range(n))
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = DocumentService(persist_directory=str(tmp_path / "store"), chunk_size=200, embed_batch_size=4)
+    service._collection = MemoryCollection()
+    yield service
+    service.close()
+
+
+def test_streamed_chunks_match_whole_text():
+    chunker = TextChunker(chunk_size=200, chunk_overlap=20, min_chunk_size=10)
+    text = make_text(60)
+    words = text.split(" ")
+    blocks = [" ".join(words[i:i + 13]) for i in range(0, len(words), 13)]
+    assert list(chunker.iter_chunks(blocks)) == chunker.chunk_text(text)
+
+
+def test_long_text_without_breaks_is_bounded():
+    chunker = TextChunker(chunk_size=100, min_chunk_size=10, max_sentence_size=500)
+    sentences = list(chunker.iter_sentences(["x" * 300] * 10))
+    assert all(len(s) <= 800 for s in sentences)
+    assert sum(len(s) for s in sentences) >= 3000
+
+
+def test_unchanged_file_is_skipped(service, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text(make_text(40))
+
+    document = asyncio.run(service.ingest_file(str(path)))
+    assert document is not None and document.chunk_count > 1
+    assert document.content == ""
+    embedded = len(service._collection.upserted)
+    assert embedded == document.chunk_count
+
+    again = asyncio.run(service.ingest_file(str(path)))
+    assert again.id == document.id
+    assert len(service._collection.upserted) == embedded
+
+
+def test_changed_file_reembeds_only_changed_chunks(service, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text(make_text(40))
+    document = asyncio.run(service.ingest_file(str(path)))
+    service._collection.upserted.clear()
+
+    path.write_text(make_text(40) + " A brand new closing sentence.")
+    updated = asyncio.run(service.ingest_file(str(path)))
+
+    assert updated.id == document.id
+    assert 0 < len(service._collection.upserted) < updated.chunk_count
+    assert set(service._collection.items) == set(updated.get_chunk_ids())
+
+
+def test_shrunk_file_drops_stale_chunks(service, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text(make_text(40))
+    asyncio.run(service.ingest_file(str(path)))
+
+    path.write_text(make_text(10))
+    updated = asyncio.run(service.ingest_file(str(path)))
+    assert set(service._collection.items) == set(updated.get_chunk_ids())
+
+
+
+def test_forced_reingest_of_shrunk_file_drops_stale_chunks(service, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text(make_text(40))
+    asyncio.run(service.ingest_file(str(path)))
+    service._collection.upserted.clear()
+
+    path.write_text(make_text(10))
+    updated = asyncio.run(service.ingest_file(str(path), force=True))
+    assert len(service._collection.upserted) == updated.chunk_count
+    assert set(service._collection.items) == set(updated.get_chunk_ids())
+
+def test_ingest_directory(service, tmp_path):
+    root = tmp_path / "docs"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text(make_text(20, "alpha"))
+    (root / "b.md").write_text(make_text(20, "beta"))
+    (root / "sub" / "c.txt").write_text(make_text(20, "gamma"))
+    (root / "ignored.bin").write_bytes(b"\x00\x01")
+
+    seen = []
+    progress = asyncio.run(service.ingest_directory(str(root), on_progress=lambda p: seen.append(p.files_done)))
+    assert progress.files_total == 3
+    assert progress.files_done == 3
+    assert progress.files_failed == 0
+    assert progress.chunks_embedded > 0
+    assert seen == [1, 2, 3]
+    assert len(service.list_documents()) == 3
+
+    (root / "b.md").unlink()
+    progress = asyncio.run(service.ingest_directory(str(root), prune=True))
+    assert progress.files_skipped == 2
+    assert progress.chunks_embedded == 0
+    assert {d.name for d in service.list_documents()} == {"a.txt", "c.txt"}
+
+
+def test_manifest_survives_restart(service, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text(make_text(30))
+    asyncio.run(service.ingest_file(str(path)))
+
+    restarted = DocumentService(persist_directory=str(service.persist_directory), chunk_size=200)
+    restarted._collection = MemoryCollection()
+    try:
+        assert [d.name for d in restarted.list_documents()] == ["notes.txt"]
+        asyncio.run(restarted.ingest_file(str(path)))
+        assert restarted._collection.upserted == []
+    finally:
+        restarted.close()
+
+
+def test_tokenize_keeps_identifiers():
+    assert {"cs-61a", "cs", "61a", "61", "a"} <= set(tokenize("Notes for CS-61A"))
+    assert {"cs61a", "cs", "61", "a"} <= set(tokenize("cs61a"))
+    assert {"err_conn_refused", "err", "conn", "refused"} <= set(tokenize("ERR_CONN_REFUSED"))
+    assert "the" not in tokenize("the lecture")
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a"]], k=60)
+    assert [item_id for item_id, _ in fused] == ["a", "c", "b"]
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+
+def test_bm25_index_incremental_and_persistent(tmp_path):
+    index = BM25Index(tmp_path / "sparse.db")
+    index.add([
+        ("d1_0", "Recursion and tree traversal for CS-61A", "d1"),
+        ("d1_1", "Midterm logistics and room assignments", "d1"),
+        ("d2_0", "Linear algebra eigenvalues lecture notes", "d2"),
+    ])
+    assert len(index) == 3
+    assert index.search("cs61a recursion")[0][0] == "d1_0"
+
+    index.add([("d1_0", "Dynamic programming review", "d1")])
+    assert index.search("recursion") == []
+    assert index.search("dynamic programming")[0][0] == "d1_0"
+
+    index.remove_document("d1")
+    reopened = BM25Index(tmp_path / "sparse.db")
+    assert len(reopened) == 1
+    assert reopened.search("eigenvalues")[0][0] == "d2_0"
+
+
+def test_hybrid_search_finds_exact_identifier(service, tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "a_target.txt").write_text(
+        make_text(4) + " The build fails with ERR_CONN_REFUSED when the proxy is down."
+    )
+    for i in range(8):
+        (root / f"filler{i}.txt").write_text(make_text(6, f"filler{i}"))
+    asyncio.run(service.ingest_directory(str(root)))
+
+    service.hybrid = False
+    dense = asyncio.run(service.search("ERR_CONN_REFUSED", top_k=3))
+    assert all("ERR_CONN_REFUSED" not in r.chunk.content for r in dense)
+
+    service.hybrid = True
+    results = asyncio.run(service.search("ERR_CONN_REFUSED", top_k=3))
+    hit = next(r for r in results if "ERR_CONN_REFUSED" in r.chunk.content)
+    assert hit.sparse_rank == 1
+    assert hit.chunk.document_name == "a_target.txt"
+
+    filtered = asyncio.run(service.search(
+        "ERR_CONN_REFUSED", top_k=3, filter_metadata={"source": str((root / "filler0.txt").resolve())}
+    ))
+    assert filtered and all(r.chunk.document_name == "filler0.txt" for r in filtered)
+
+    document = next(d for d in service.list_documents() if d.name == "a_target.txt")
+    asyncio.run(service.delete_document(document.id))
+    results = asyncio.run(service.search("ERR_CONN_REFUSED", top_k=3))
+    assert all("ERR_CONN_REFUSED" not in r.chunk.content for r in results)
+
+
+def test_sparse_index_backfilled_from_vector_store(service, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text(make_text(10) + " Office hours are in Soda 405.")
+    asyncio.run(service.ingest_file(str(path)))
+    service._get_sparse_index().clear()
+
+    results = asyncio.run(service.search("soda 405", top_k=1))
+    assert "Soda 405" in results[0].chunk.content
+    assert len(service._get_sparse_index()) == service._collection.count()
+
+
+class SlowScorer:
+    """Cross-encoder stand-in: longer texts score higher, 20 ms per batch."""
+
+    def predict(self, pairs):
+        time.sleep(0.02)
+        return [len(text) for _, text in pairs]
+
+
+def test_reranker_respects_latency_budget():
+    reranker = CrossEncoderReranker(latency_budget=0.03, batch_size=2)
+    reranker._model = SlowScorer()
+
+    # The second batch would overrun the budget, so only the first is scored
+    scored = reranker.rerank("q", ["a", "bbb", "cc", "dddd", "e", "ffffff"])
+    assert [i for i, _ in scored] == [1, 0]
@@ -4,9 +4,11 @@ Integration tests for JARVIS Phase 3.
 Tests the unified application flow and module integration.
 """
 
+import asyncio
 import pytest
 import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -151,6 +153,36 @@ class TestJarvisUnified:
         assert result.features_enabled.get("LLM: Groq") == True
 
 
+class TestSpokenCallbacks:
+    """Tests for callbacks that speak from the background loop."""
+    
+    @pytest.mark.parametrize("callback, message", [
+        ("_on_research_progress", "Research complete: paper saved."),
+        ("_on_break_due", "Time for a break."),
+        ("_on_pomodoro_end", "Pomodoro finished."),
+    ])
+    def test_callback_speaks(self, callback, message):
+        """Test each callback speaks its message through TTS."""
+        pytest.importorskip("pydantic")  # src.core.config, via jarvis_unified
+        from src.core.async_runtime import AsyncRuntime
+        from src.jarvis_unified import JarvisUnified
+        
+        jarvis = JarvisUnified.__new__(JarvisUnified)
+        jarvis._runtime = AsyncRuntime(name="test-callbacks")
+        jarvis._tts = MagicMock()
+        try:
+            getattr(jarvis, callback)(message)
+            # The runtime runs submissions in order, so this waits for the speech
+            jarvis.run_async(asyncio.sleep(0), timeout=5)
+            for _ in range(50):
+                if jarvis._tts.speak.called:
+                    break
+                time.sleep(0.02)
+            jarvis._tts.speak.assert_called_once_with(message, blocking=True)
+        finally:
+            jarvis._runtime.stop()
+
+
 class TestStartupState:
     """Tests for startup state enum."""
     
@@ -0,0 +1,229 @@
+"""
+Unit tests for compiled intent dispatch.
+
+Tests:
+- Aho-Corasick phrase matching
+- Route priority and fall-through
+- Async handlers on the persistent runtime
+- Declared manager triggers
+- Manager HTTP clients bound to the runtime loop
+"""
+
+import asyncio
+import random
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.async_runtime import AsyncRuntime
+from src.core.intent_index import IntentDispatcher, PhraseIndex, collect_triggers
+
+
+@pytest.fixture
+def runtime():
+    rt = AsyncRuntime(name="test-runtime")
+    yield rt
+    rt.stop()
+
+
+class TestPhraseIndex:
+    """Tests for PhraseIndex."""
+
+    def test_matches_like_substring_search(self):
+        """Test the automaton agrees with `phrase in text` on random input."""
+        rng = random.Random(7)
+        alphabet = "ab c"
+        for _ in range(200):
+            phrases = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                       for _ in range(rng.randint(1, 10))]
+            index = PhraseIndex()
+            for i, phrase in enumerate(phrases):
+                index.add(phrase, 1 << i)
+
+            for _ in range(10):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+                expected = 0
+                for i, phrase in enumerate(phrases):
+                    if phrase in text:
+                        expected |= 1 << i
+                assert index.match(text) == expected
+
+    def test_overlapping_phrases(self):
+        """Test phrases that are suffixes of other phrases are reported."""
+        index = PhraseIndex()
+        index.add("what's due", 1)
+        index.add("due", 2)
+        index.add("s due", 4)
+
+        assert index.match("what's due today") == 7
+        assert index.match("overdue") == 2
+        assert index.match("nothing") == 0
+
+
+class TestIntentDispatcher:
+    """Tests for IntentDispatcher."""
+
+    def test_only_matching_routes_called(self):
+        """Test handlers without a matching trigger are never called."""
+        calls = []
+        dispatcher = IntentDispatcher()
+        dispatcher.register("music", lambda tl, t: calls.append("music") or "playing", phrases=["play"])
+        dispatcher.register("notes", lambda tl, t: calls.append("notes") or "noted", phrases=["note"])
+
+        assert dispatcher.dispatch("Play some jazz") == "playing"
+        assert dispatcher.dispatch("what is the capital of France") is None
+        assert calls == ["music"]
+
+    def test_priority_and_fall_through(self):
+        """Test earlier routes win and None falls through to the next candidate."""
+        dispatcher = IntentDispatcher()
+        dispatcher.register("first", lambda tl, t: None, phrases=["due"])
+        dispatcher.register("second", lambda tl, t: "second", phrases=["due"])
+        dispatcher.register("third", lambda tl, t: "third", phrases=["due"])
+
+        result = dispatcher.resolve("what's due")
+        assert result.response == "second"
+        assert result.route == "second"
+        assert result.candidates == ["first", "second", "third"]
+
+    def test_regex_patterns(self):
+        """Test regex triggers select routes phrases cannot describe."""
+        dispatcher = IntentDispatcher()
+        dispatcher.register("portfolio", lambda tl, t: "added", patterns=[r"add.*shares.*at"])
+
+        assert dispatcher.dispatch("Add 10 shares VTI at 220") == "added"
+        assert dispatcher.dispatch("add shares") is None
+
+    def test_handler_errors_fall_through(self):
+        """Test a failing handler is logged and the next route is tried."""
+        def broken(text_lower, text):
+            raise RuntimeError("boom")
+
+        dispatcher = IntentDispatcher()
+        dispatcher.register("broken", broken, phrases=["note"])
+        dispatcher.register("notes", lambda tl, t: "noted", phrases=["note"])
+
+        assert dispatcher.dispatch("take a note") == "noted"
+
+    def test_duplicate_route_rejected(self):
+        dispatcher = IntentDispatcher()
+        dispatcher.register("notes", lambda tl, t: None, phrases=["note"])
+        with pytest.raises(ValueError):
+            dispatcher.register("notes", lambda tl, t: None, phrases=["memo"])
+
+    def test_async_handlers_share_one_loop(self, runtime):
+        """Test coroutine handlers run on the runtime's persistent loop."""
+        loops = []
+        threads = []
+
+        async def handler(text_lower, text):
+            loops.append(asyncio.get_running_loop())
+            threads.append(threading.current_thread())
+            return f"done: {text_lower}"
+
+        dispatcher = IntentDispatcher(runtime=runtime)
+        dispatcher.register("academic", handler, phrases=["canvas"])
+
+        for _ in range(3):
+            assert dispatcher.dispatch("Check Canvas") == "done: check canvas"
+
+        assert len(set(map(id, loops))) == 1
+        assert threads[0] is not threading.current_thread()
+
+    def test_async_timeout_falls_through(self, runtime):
+        """Test a slow async handler times out and the next route answers."""
+        async def slow(text_lower, text):
+            await asyncio.sleep(5)
+            return "slow"
+
+        dispatcher = IntentDispatcher(runtime=runtime)
+        dispatcher.register("slow", slow, phrases=["paper"], timeout=0.05)
+        dispatcher.register("fast", lambda tl, t: "fast", phrases=["paper"])
+
+        assert dispatcher.dispatch("find a paper") == "fast"
+        assert runtime.get_stats()["timeouts"] == 1
+
+    def test_collect_triggers(self):
+        """Test declared triggers are flattened without duplicates."""
+        class Manager:
+            COMMAND_TRIGGERS = {"a": ("x", "y"), "b": ("y", "z")}
+            COMMAND_PATTERNS = {"c": (r"\d+ shares",)}
+
+        assert collect_triggers(Manager) == (["x", "y", "z"], [r"\d+ shares"])
+        assert collect_triggers(object()) == ([], [])
+
+
+class TestAsyncRuntime:
+    """Tests for AsyncRuntime."""
+
+    def test_submit_and_run(self, runtime):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert runtime.run(add(1, 2)) == 3
+        assert runtime.submit(add(2, 3)).result(timeout=1) == 5
+        assert runtime.is_running
+
+    def test_timeout_cancels(self, runtime):
+        cancelled = threading.Event()
+
+        async def forever():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(FutureTimeoutError):
+            runtime.run(forever(), timeout=0.05)
+        assert cancelled.wait(1)
+
+    def test_stop_and_restart(self, runtime):
+        async def value():
+            return 1
+
+        runtime.run(value())
+        runtime.stop()
+        assert not runtime.is_running
+        assert runtime.run(value()) == 1
+
+
+class TestManagerTriggers:
+    """Tests for triggers declared by feature managers."""
+
+    def test_finance_portfolio_pattern(self):
+        finance = pytest.importorskip("src.finance.manager")
+        manager = finance.FinanceManager.__new__(finance.FinanceManager)
+
+        assert manager._is_portfolio_command("add 10 shares vti at 220")
+        assert manager._is_portfolio_command("show my portfolio")
+        assert not manager._is_portfolio_command("what time is it")
+
+        phrases, patterns = collect_triggers(finance.FinanceManager)
+        dispatcher = IntentDispatcher()
+        dispatcher.register("finance", lambda tl, t: "finance", phrases=phrases, patterns=patterns)
+        assert dispatcher.dispatch("Add 10 shares VTI at 220") == "finance"
+
+
+class TestLoopBoundClients:
+    """Tests for manager HTTP clients on the persistent runtime."""
+
+    def test_client_reused_on_runtime_loop(self, runtime, tmp_path):
+        """Test the client survives across commands and is rebuilt for another loop."""
+        pytest.importorskip("httpx")
+        arxiv = pytest.importorskip("src.academic.arxiv_search")
+        client = arxiv.ArxivClient(db_path=tmp_path / "arxiv.db")
+
+        first = runtime.run(client._get_client())
+        assert runtime.run(client._get_client()) is first
+
+        other = asyncio.run(client._get_client())
+        assert other is not first
+
+        asyncio.run(client.close())
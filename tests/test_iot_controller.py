@@ -0,0 +1,264 @@
+"""
+Unit tests for the production IoT controller.
+
+Tests:
+- Per-device command workers (ordering, parallelism)
+- Opt-in coalescing of state-setting commands
+- Priority bumping and queue-full drop policy
+- Concurrent state sync (timeouts, jitter, failure isolation)
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.iot.controller_enhanced import CommandPriority, ProductionIoTController
+from src.iot.esp32_enhanced import CommandResult, DeviceState, DeviceType
+
+
+class FakeClient:
+    """Records commands and answers after an optional per-device delay."""
+
+    def __init__(self, delays=None, fail=None, errors=None):
+        self.calls = []
+        self.delays = delays or {}
+        self.fail = fail or set()
+        self.errors = errors or set()
+
+    async def send_command(self, device, endpoint, data=None, method="POST"):
+        await asyncio.sleep(self.delays.get(device.device_id, 0))
+        self.calls.append((device.device_id, endpoint, data, time.perf_counter()))
+        if device.device_id in self.errors:
+            raise ConnectionError("connection reset")
+        if device.device_id in self.fail:
+            return CommandResult(False, "unreachable")
+        return CommandResult(True, "ok")
+
+
+@pytest.fixture
+def make_controller(tmp_path):
+    def make(client=None, devices=("a", "b"), **kwargs):
+        controller = ProductionIoTController(
+            shared_secret="test-secret",
+            data_dir=tmp_path,
+            auto_discover=False,
+            retry_delay=0,
+            **kwargs,
+        )
+        for device_id in devices:
+            device = controller.add_device(device_id, "127.0.0.1", DeviceType.LIGHT_SWITCH)
+            device.state = DeviceState.ONLINE
+            device.last_seen = time.time()
+        controller._controller.client = client or FakeClient()
+        return controller
+    return make
+
+
+async def drain(controller, timeout=5.0):
+    """Start the workers, wait for the queue to empty and stop."""
+    controller.sync_all_devices = AsyncMock(return_value={})
+    await controller.start()
+    deadline = time.monotonic() + timeout
+    while controller.queued_count or controller._active_devices:
+        assert time.monotonic() < deadline, "queue did not drain"
+        await asyncio.sleep(0.01)
+    await controller.stop()
+
+
+class TestCommandWorkers:
+    """Tests for per-device command execution."""
+
+    @pytest.mark.asyncio
+    async def test_per_device_order_and_parallel_devices(self, make_controller):
+        """Test one device runs in order while devices run in parallel."""
+        client = FakeClient(delays={"a": 0.05, "b": 0.05})
+        controller = make_controller(client)
+        for i in range(3):
+            controller.queue_command("a", f"/step{i}", {"n": i})
+            controller.queue_command("b", f"/step{i}", {"n": i})
+
+        start = time.perf_counter()
+        await drain(controller)
+        elapsed = time.perf_counter() - start
+
+        for device_id in ("a", "b"):
+            assert [c[1] for c in client.calls if c[0] == device_id] == ["/step0", "/step1", "/step2"]
+        # Three sequential 50 ms commands per device, devices overlapping
+        assert elapsed < 0.3 - 0.05
+
+    @pytest.mark.asyncio
+    async def test_coalescing_is_opt_in(self, make_controller):
+        """Test commands on a shared endpoint are not merged by default."""
+        client = FakeClient()
+        controller = make_controller(client)
+        controller.queue_command("a", "/command", {"action": "reboot"})
+        controller.queue_command("a", "/command", {"action": "blink"})
+
+        await drain(controller)
+
+        assert [c[2] for c in client.calls] == [{"action": "reboot"}, {"action": "blink"}]
+        assert controller._command_stats["coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_state_commands(self, make_controller):
+        """Test on->off->on runs once and every caller gets the result."""
+        client = FakeClient()
+        controller = make_controller(client)
+        results = []
+        for state in ("on", "off", "on"):
+            controller.queue_command("a", "/light", {"state": state}, callback=results.append, coalesce=True)
+
+        await drain(controller)
+
+        assert [c[2] for c in client.calls] == [{"state": "on"}]
+        assert len(results) == 3 and all(r.success for r in results)
+        assert controller._command_stats["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_targets_apart(self, make_controller):
+        """Test commands for different LEDs on one endpoint are both sent."""
+        client = FakeClient()
+        controller = make_controller(client)
+        controller.queue_command("a", "/led", {"led": 1, "state": "on"}, coalesce=True)
+        controller.queue_command("a", "/led", {"led": 2, "state": "on"}, coalesce=True)
+        controller.queue_command("a", "/led", {"led": 1, "state": "off"}, coalesce=True)
+        controller.queue_command("a", "/light", {"state": "toggle"}, coalesce=True)
+        controller.queue_command("a", "/light", {"state": "toggle"}, coalesce=True)
+
+        await drain(controller)
+
+        assert [c[2] for c in client.calls] == [
+            {"led": 1, "state": "off"},
+            {"led": 2, "state": "on"},
+            {"state": "toggle"},
+            {"state": "toggle"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_bumps_priority(self, make_controller):
+        """Test a higher-priority update moves the pending command forward."""
+        client = FakeClient()
+        controller = make_controller(client)
+        controller.queue_command("a", "/light", {"state": "on"}, priority=CommandPriority.LOW, coalesce=True)
+        controller.queue_command("a", "/status-led", {"state": "on"})
+        controller.queue_command("a", "/light", {"state": "off"}, priority=CommandPriority.HIGH, coalesce=True)
+
+        await drain(controller)
+
+        assert [(c[1], c[2]) for c in client.calls] == [
+            ("/light", {"state": "off"}),
+            ("/status-led", {"state": "on"}),
+        ]
+
+
+class TestQueueLimits:
+    """Tests for the queue-full drop policy."""
+
+    def test_drop_lowest_priority_oldest(self, make_controller):
+        """Test a full queue drops its oldest lowest-priority command."""
+        controller = make_controller(max_queue_size=3)
+        results = {}
+
+        def record(name):
+            return lambda result: results.setdefault(name, result)
+
+        controller.queue_command("a", "/x", {"n": 1}, priority=CommandPriority.NORMAL, callback=record("normal"))
+        controller.queue_command("b", "/x", {"n": 2}, priority=CommandPriority.LOW, callback=record("low-old"))
+        controller.queue_command("a", "/x", {"n": 3}, priority=CommandPriority.LOW, callback=record("low-new"))
+        controller.queue_command("b", "/x", {"n": 4}, priority=CommandPriority.HIGH, callback=record("high"))
+
+        assert controller.queued_count == 3
+        assert list(results) == ["low-old"]
+        assert not results["low-old"].success
+        assert "queue full" in results["low-old"].message
+        assert controller._command_stats["dropped"] == 1
+
+    def test_dropped_command_leaves_coalesce_index(self, make_controller):
+        """Test a dropped command is no longer a coalescing target."""
+        controller = make_controller(max_queue_size=1)
+        controller.queue_command("a", "/light", {"state": "on"}, priority=CommandPriority.LOW, coalesce=True)
+        controller.queue_command("b", "/light", {"state": "on"}, priority=CommandPriority.HIGH)
+        controller.queue_command("a", "/light", {"state": "off"}, priority=CommandPriority.HIGH, coalesce=True)
+
+        assert controller._command_stats["coalesced"] == 0
+        assert controller._command_stats["dropped"] == 2
+        assert controller.queued_count == 1
+
+
+class TestStateSync:
+    """Tests for concurrent device state synchronization."""
+
+    @pytest.mark.asyncio
+    async def test_slow_device_times_out_alone(self, make_controller):
+        """Test one slow device hits its deadline without holding up the rest."""
+        client = FakeClient(delays={"a": 1.0})
+        controller = make_controller(client, devices=("a", "b", "c"), sync_timeout=0.1)
+
+        start = time.perf_counter()
+        results = await controller.sync_all_devices()
+        elapsed = time.perf_counter() - start
+
+        assert results == {"a": False, "b": True, "c": True}
+        assert elapsed < 0.5
+        assert controller._last_sync["timed_out"] == 1
+        assert controller._last_sync["succeeded"] == 2
+        assert controller.get_device("a").state == DeviceState.OFFLINE
+        assert controller.get_device("b").state == DeviceState.ONLINE
+
+    @pytest.mark.asyncio
+    async def test_failing_device_does_not_cancel_others(self, make_controller):
+        """Test an exception from one device leaves the other polls running."""
+        client = FakeClient(delays={"b": 0.05, "c": 0.05}, errors={"a"})
+        controller = make_controller(client, devices=("a", "b", "c"))
+
+        results = await controller.sync_all_devices()
+
+        assert results == {"a": False, "b": True, "c": True}
+        assert sorted(c[0] for c in client.calls) == ["a", "b", "c"]
+        assert controller._last_sync["timed_out"] == 0
+
+    @pytest.mark.asyncio
+    async def test_spread_staggers_polls(self, make_controller):
+        """Test spread delays poll starts within the requested window."""
+        client = FakeClient()
+        controller = make_controller(client, devices=[f"d{i}" for i in range(8)])
+
+        start = time.perf_counter()
+        results = await controller.sync_all_devices(spread=0.2)
+
+        assert all(results.values())
+        offsets = [c[3] - start for c in client.calls]
+        assert max(offsets) < 0.2 + 0.1
+        assert max(offsets) - min(offsets) > 0
+
+    @pytest.mark.asyncio
+    async def test_sync_interval_jitter_bounds(self, make_controller, monkeypatch):
+        """Test the loop sleeps within interval +/- sync_jitter."""
+        controller = make_controller(state_sync_interval=10.0, sync_jitter=0.2)
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, *args, **kwargs):
+            sleeps.append(delay)
+            await real_sleep(0)
+
+        async def sync(spread=0.0):
+            if len(sleeps) >= 200:
+                controller._processing = False
+            return {}
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        controller.sync_all_devices = sync
+        controller._processing = True
+        await controller._sync_loop()
+
+        assert len(sleeps) == 200
+        assert all(8.0 <= d <= 12.0 for d in sleeps)
+        # Jittered, not a fixed period
+        assert max(sleeps) - min(sleeps) > 1.0
@@ -0,0 +1,93 @@
+"""
+Unit tests for usage pattern detection.
+
+Tests:
+- Buffered, non-blocking query logging
+- Rolling hour x intent and transition aggregates
+- Time decay of query sequences
+- Rebuilding aggregates from an existing query log
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from learning.patterns import PatternDetector, PatternType
+
+
+@pytest.fixture
+def detector(tmp_path):
+    detector = PatternDetector(db_path=str(tmp_path / "patterns.db"))
+    yield detector
+    detector.close()
+
+
+def test_log_query_is_buffered_and_written(detector):
+    for _ in range(5):
+        detector.log_query("what's the weather", "weather")
+    assert detector.flush()
+
+    with sqlite3.connect(detector.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM query_log").fetchone()[0] == 5
+    stats = detector.get_stats()
+    assert stats["logged"] == 5 and stats["pending"] == 0 and stats["dropped"] == 0
+
+
+def test_patterns_from_rolling_aggregates(detector):
+    for _ in range(6):
+        detector.log_query("weather please", "weather")
+        detector.log_query("what's on my calendar", "calendar")
+
+    patterns = detector.analyze_patterns()
+    by_type = {}
+    for pattern in patterns:
+        by_type.setdefault(pattern.pattern_type, []).append(pattern)
+
+    topics = {p.triggers[0] for p in by_type[PatternType.TOPIC_PREFERENCE]}
+    assert topics == {"weather", "calendar"}
+    sequences = {tuple(p.metadata["sequence"]) for p in by_type[PatternType.QUERY_SEQUENCE]}
+    assert ("weather", "calendar") in sequences
+    assert detector.get_suggested_actions("weather") == ["calendar"]
+
+
+def test_transitions_decay(detector):
+    start = datetime(2026, 1, 5, 8, 0)
+    half_life = timedelta(seconds=detector.sequence_half_life)
+    with detector._lock:
+        detector._update_stats("u", "weather", start)
+        detector._update_stats("u", "calendar", start + timedelta(minutes=1))
+        detector._update_stats("u", "news", start + timedelta(minutes=1) + half_life)
+
+    transitions = detector._stats["u"].transitions
+    assert transitions[("weather", "calendar")] == pytest.approx(0.5)
+    assert transitions[("calendar", "news")] == 1.0
+    assert detector._stats["u"].hour_intent[(8, "weather")] == 1
+
+
+def test_aggregates_persist_and_rebuild(tmp_path):
+    db_path = tmp_path / "patterns.db"
+    first = PatternDetector(db_path=str(db_path))
+    for _ in range(4):
+        first.log_query("lights on", "iot")
+    first.close()
+
+    reloaded = PatternDetector(db_path=str(db_path))
+    reloaded.flush()
+    assert sum(reloaded._stats["default"].hour_intent.values()) == 4
+    reloaded.close()
+
+    # A log written before the aggregate tables existed is replayed once
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM pattern_state")
+        conn.execute("DELETE FROM hour_intent_counts")
+        conn.execute("DELETE FROM intent_transitions")
+    rebuilt = PatternDetector(db_path=str(db_path))
+    rebuilt.flush()
+    assert sum(rebuilt._stats["default"].hour_intent.values()) == 4
+    assert rebuilt._stats["default"].transitions[("iot", "iot")] == pytest.approx(3, rel=1e-3)
+    rebuilt.close()
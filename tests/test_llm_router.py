@@ -2,6 +2,7 @@
 Tests for the Intelligent LLM Router.
 """
 
+import asyncio
 import pytest
 import time
 from pathlib import Path
@@ -198,5 +199,129 @@ class TestIntelligentRouter:
             assert coding_order[0] == "mistral"
 
 
+class FakeLLMClient:
+    """Slow fake provider that counts calls."""
+    
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.generate_calls = 0
+        self.stream_calls = 0
+    
+    async def agenerate(self, messages, **kwargs):
+        from src.core.llm import LLMResponse, LLMProvider
+        
+        self.generate_calls += 1
+        await asyncio.sleep(self.delay)
+        return LLMResponse(content="good morning", provider=LLMProvider.GROQ, model="fake")
+    
+    async def astream(self, messages, **kwargs):
+        self.stream_calls += 1
+        for token in ["good", " morning", " sir"]:
+            await asyncio.sleep(self.delay)
+            yield token
+
+
+def make_router(client):
+    """Router with only the fake provider registered as groq."""
+    from src.core.llm_router import IntelligentLLMRouter, ProviderStatus
+    
+    router = IntelligentLLMRouter(enable_cache=False)
+    router.clients = {"groq": client}
+    router.provider_status = {"groq": ProviderStatus(name="groq", available=True)}
+    return router
+
+
+class TestSingleFlight:
+    """Tests for request coalescing in the router."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_generate_coalesced(self):
+        """Test identical concurrent requests make one provider call."""
+        from src.core.llm import Message
+        
+        client = FakeLLMClient()
+        router = make_router(client)
+        messages = [Message(role="user", content="morning briefing")]
+        
+        responses = await asyncio.gather(*[router.agenerate(messages) for _ in range(5)])
+        
+        assert client.generate_calls == 1
+        assert all(r.content == "good morning" for r in responses)
+        assert sum(1 for r in responses if r.metadata.get("coalesced")) == 4
+        
+        stats = router.get_status()["coalescing"]
+        assert stats["generate_coalesced"] == 4
+        assert stats["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_different_requests_not_coalesced(self):
+        """Test different messages or options get separate calls."""
+        from src.core.llm import Message
+        
+        client = FakeLLMClient()
+        router = make_router(client)
+        
+        await asyncio.gather(
+            router.agenerate([Message(role="user", content="a")]),
+            router.agenerate([Message(role="user", content="b")]),
+            router.agenerate([Message(role="user", content="a")], temperature=0.1),
+        )
+        
+        assert client.generate_calls == 3
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test the shared call survives one caller being cancelled."""
+        from src.core.llm import Message
+        
+        client = FakeLLMClient(delay=0.1)
+        router = make_router(client)
+        messages = [Message(role="user", content="status")]
+        
+        first = asyncio.ensure_future(router.agenerate(messages))
+        second = asyncio.ensure_future(router.agenerate(messages))
+        await asyncio.sleep(0.02)
+        first.cancel()
+        
+        assert (await second).content == "good morning"
+        assert client.generate_calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_late_stream_joiner_gets_replay(self):
+        """Test a late joiner receives already-emitted tokens then the tail."""
+        from src.core.llm import Message
+        
+        client = FakeLLMClient()
+        router = make_router(client)
+        messages = [Message(role="user", content="tell me a story")]
+        
+        async def consume(delay):
+            await asyncio.sleep(delay)
+            return [chunk async for chunk in router.astream(messages)]
+        
+        early, late = await asyncio.gather(consume(0), consume(0.08))
+        
+        assert early == late == ["good", " morning", " sir"]
+        assert client.stream_calls == 1
+        assert router.get_status()["coalescing"]["replayed_chunks"] >= 1
+
+    
+    @pytest.mark.asyncio
+    async def test_request_after_abandon_starts_new_stream(self):
+        """Test a request right after the last subscriber leaves is not joined to the cancelled stream."""
+        from src.core.llm import Message
+        
+        client = FakeLLMClient(delay=0.01)
+        router = make_router(client)
+        messages = [Message(role="user", content="tell me a story")]
+        
+        abandoned = router.astream(messages)
+        assert await abandoned.__anext__() == "good"
+        await abandoned.aclose()  # Cancels the shared stream
+        
+        # No loop turn in between, so the cancellation is still pending
+        assert [chunk async for chunk in router.astream(messages)] == ["good", " morning", " sir"]
+        assert client.stream_calls == 2
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,225 @@
+"""
+Unit tests for the news module.
+
+Tests:
+- HackerNewsAPI concurrent item fetching and item cache
+- NewsHTTPClient latency recording and loop changes
+- NewsSourceExecutor deadlines and streaming
+- NearDuplicateDetector
+"""
+
+import asyncio
+import pytest
+from pathlib import Path
+
+import httpx
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.news.apis import HackerNewsAPI, NewsHTTPClient
+from src.news.models import Article
+from src.news.pipeline import (
+    NewsSourceExecutor,
+    SourceTask,
+    NearDuplicateDetector,
+    dedupe_articles,
+    normalize_url,
+)
+
+
+class MockNewsHTTPClient(NewsHTTPClient):
+    """NewsHTTPClient backed by an httpx.MockTransport."""
+
+    def __init__(self, handler):
+        super().__init__()
+        self._handler = handler
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+
+
+def make_hn_handler(story_ids, requests, delay=0.0):
+    """Build a mock HN API handler that records requested paths."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("topstories.json"):
+            return httpx.Response(200, json=story_ids)
+
+        item_id = int(request.url.path.rsplit("/", 1)[-1].split(".")[0])
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json={
+            "id": item_id,
+            "type": "story",
+            "title": f"Story {item_id}",
+            "score": item_id,
+            "time": 1700000000,
+        })
+
+    return handler
+
+
+class TestHackerNewsAPI:
+    """Tests for HackerNewsAPI class."""
+
+    @pytest.mark.asyncio
+    async def test_top_stories_fetched_concurrently(self):
+        """Test items are fetched in parallel and returned in listing order."""
+        requests = []
+        http = MockNewsHTTPClient(make_hn_handler(list(range(1, 11)), requests, delay=0.05))
+        hn = HackerNewsAPI(http=http, max_concurrency=10)
+
+        start = asyncio.get_running_loop().time()
+        articles = await hn.get_top_stories(limit=10)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [a.title for a in articles] == [f"Story {i}" for i in range(1, 11)]
+        # Ten serial 50ms fetches would take at least 0.5s
+        assert elapsed < 0.3
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_item_cache_reused(self):
+        """Test a second refresh only refetches the listing."""
+        requests = []
+        http = MockNewsHTTPClient(make_hn_handler([1, 2, 3], requests))
+        hn = HackerNewsAPI(http=http, item_cache_ttl=60)
+
+        await hn.get_top_stories(limit=3)
+        requests.clear()
+        articles = await hn.get_top_stories(limit=3)
+
+        assert len(articles) == 3
+        assert requests == ["/v0/topstories.json"]
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_latency_recorded(self):
+        """Test per-source latency statistics are collected."""
+        http = MockNewsHTTPClient(make_hn_handler([1, 2], []))
+        hn = HackerNewsAPI(http=http)
+
+        await hn.get_top_stories(limit=2)
+        stats = http.get_latency_stats()
+
+        assert stats["hackernews"]["requests"] == 3
+        assert stats["hackernews"]["errors"] == 0
+        await http.aclose()
+
+
+class TestNewsHTTPClient:
+    """Tests for NewsHTTPClient class."""
+
+    def test_client_replaced_on_new_loop(self):
+        """Test the pooled client from a finished loop is closed when replaced."""
+        http = MockNewsHTTPClient(make_hn_handler([1], []))
+
+        first = asyncio.run(http._get_client())
+        second = asyncio.run(http._get_client())
+
+        assert second is not first
+        assert first.is_closed
+        assert not second.is_closed
+        asyncio.run(http.aclose())
+        assert second.is_closed
+
+
+class TestNewsSourceExecutor:
+    """Tests for NewsSourceExecutor class."""
+
+    @pytest.mark.asyncio
+    async def test_slow_source_hits_deadline(self):
+        """Test a slow source times out without delaying the others."""
+        async def fast():
+            return [Article(title="fast")]
+
+        async def slow():
+            await asyncio.sleep(5)
+            return [Article(title="slow")]
+
+        executor = NewsSourceExecutor(default_timeout=0.1)
+        results = [r async for r in executor.stream([
+            SourceTask("slow", slow),
+            SourceTask("fast", fast),
+        ])]
+
+        assert [r.name for r in results] == ["fast", "slow"]
+        assert results[0].articles[0].title == "fast"
+        assert results[1].timed_out
+        assert results[1].articles == []
+
+    @pytest.mark.asyncio
+    async def test_failing_source_isolated(self):
+        """Test an exception in one source is captured in its result."""
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return [Article(title="ok")]
+
+        executor = NewsSourceExecutor()
+        articles = await executor.gather([SourceTask("broken", broken), SourceTask("ok", ok)])
+
+        assert [a.title for a in articles] == ["ok"]
+        assert any(r.error == "boom" for r in executor.last_results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_keep_their_results(self):
+        """Test overlapping runs on one executor do not mix their articles."""
+        def source(title, delay):
+            async def fetch():
+                await asyncio.sleep(delay)
+                return [Article(title=title)]
+            return SourceTask(title, fetch)
+
+        executor = NewsSourceExecutor()
+        ai, tech = await asyncio.gather(
+            executor.gather([source("ai-1", 0.01), source("ai-2", 0.05)]),
+            executor.gather([source("tech-1", 0.02), source("tech-2", 0.03)]),
+        )
+
+        assert [a.title for a in ai] == ["ai-1", "ai-2"]
+        assert [a.title for a in tech] == ["tech-1", "tech-2"]
+        # The run that finished last is reported, whole
+        assert [r.name for r in executor.last_results] == ["ai-1", "ai-2"]
+
+
+class TestNearDuplicateDetector:
+    """Tests for NearDuplicateDetector class."""
+
+    def test_similar_titles_detected(self):
+        """Test reworded titles of the same story are duplicates."""
+        detector = NearDuplicateDetector()
+
+        detector.add("OpenAI releases GPT-5 with improved reasoning")
+        _, duplicate = detector.add("OpenAI releases GPT-5 with improved reasoning abilities")
+
+        assert duplicate
+
+    def test_distinct_titles_kept(self):
+        """Test unrelated titles are not merged."""
+        detector = NearDuplicateDetector()
+
+        detector.add("OpenAI releases GPT-5 with improved reasoning")
+        _, duplicate = detector.add("Python 3.13 removes the GIL in experimental build")
+
+        assert not duplicate
+
+    def test_same_url_is_duplicate(self):
+        """Test tracking parameters do not defeat URL matching."""
+        assert normalize_url("https://www.example.com/a/?utm_source=x") == "example.com/a"
+
+        detector = NearDuplicateDetector()
+        detector.add("Title one", "https://example.com/story")
+        _, duplicate = detector.add("Completely different", "http://www.example.com/story/?utm_medium=rss")
+
+        assert duplicate
+
+    def test_dedupe_keeps_highest_relevance(self):
+        """Test the higher-scored copy of a duplicate wins."""
+        low = Article(title="Nvidia announces new Blackwell GPUs", relevance_score=1)
+        high = Article(title="Nvidia announces new Blackwell GPUs!", relevance_score=5)
+
+        unique = dedupe_articles([low, high])
+
+        assert unique == [high]
@@ -325,6 +325,27 @@ class TestPerformanceIntegration:
             await integration.stop()
             assert integration._started is False
     
+    @pytest.mark.asyncio
+    async def test_semantic_settings_reach_cache(self):
+        """Test semantic cache settings are passed to the cache config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = IntegrationConfig(
+                cache_dir=Path(tmpdir),
+                dashboard_enabled=False,
+                semantic_cache_enabled=False,
+                semantic_ann_threshold=500,
+                semantic_persist=False,
+            )
+            integration = PerformanceIntegration(config)
+            
+            with patch("core.performance_integration.get_cache") as get_cache:
+                await integration.start()
+            await integration.stop()
+            
+            cache_config = get_cache.call_args.args[0]
+            assert cache_config.semantic_ann_threshold == 500
+            assert cache_config.semantic_persist is False
+    
     @pytest.mark.asyncio
     async def test_cached_agent_call(self):
         """Test cached agent call."""
@@ -13,8 +13,8 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def test_scholarly_search():
@@ -23,7 +23,7 @@ def test_scholarly_search():
     print("Scholarly Search API Tests")
     print("=" * 60)
     
-    from research.scholarly_search import (
+    from src.research.scholarly_search import (
         ScholarlySearch,
         SemanticScholarClient,
         OpenAlexClient,
@@ -98,14 +98,29 @@ def test_scholarly_search():
     asyncio.run(run_tests())
 
 
+def test_client_replaced_on_new_loop():
+    """Test a client created on a finished loop is closed when replaced."""
+    from src.research.scholarly_search import ArxivClient
+    
+    client = ArxivClient()
+    first = asyncio.run(client._get_client())
+    second = asyncio.run(client._get_client())
+    
+    assert second is not first
+    assert first.is_closed
+    assert not second.is_closed
+    asyncio.run(client.close())
+    assert second.is_closed
+
+
 def test_source_manager():
     """Test source collection and ranking."""
     print("\n" + "=" * 60)
     print("Source Manager Tests")
     print("=" * 60)
     
-    from research.source_manager import SourceManager, Source, SourceRanker
-    from research.scholarly_search import Paper, Author, SearchDatabase
+    from src.research.source_manager import SourceManager, Source, SourceRanker
+    from src.research.scholarly_search import Paper, Author, SearchDatabase
     
     # Create test papers
     papers = [
@@ -169,8 +184,8 @@ def test_citation_manager():
     print("Citation Manager Tests")
     print("=" * 60)
     
-    from research.citation_manager import CitationManager, CitationStyle
-    from research.source_manager import Source
+    from src.research.citation_manager import CitationManager, CitationStyle
+    from src.research.source_manager import Source
     
     # Create test source
     source = Source(
@@ -237,8 +252,8 @@ def test_outline_generator():
     print("Outline Generator Tests")
     print("=" * 60)
     
-    from research.outline_generator import OutlineGenerator, PaperType
-    from research.source_manager import Source
+    from src.research.outline_generator import OutlineGenerator, PaperType
+    from src.research.source_manager import Source
     
     # Create test sources
     sources = [
@@ -291,8 +306,8 @@ def test_project_store():
     print("=" * 60)
     
     import tempfile
-    from research.project_store import ProjectStore, ResearchProject, ProjectStatus
-    from research.source_manager import Source, SourceStatus
+    from src.research.project_store import ProjectStore, ResearchProject, ProjectStatus
+    from src.research.source_manager import Source, SourceStatus
     
     # Create temp database
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
@@ -358,7 +373,7 @@ def test_command_detection():
     print("Command Detection Tests")
     print("=" * 60)
     
-    from research.manager import ResearchManager
+    from src.research.manager import ResearchManager
     
     manager = ResearchManager()
     
@@ -439,6 +454,7 @@ def main():
     test_outline_generator()
     test_project_store()
     test_command_detection()
+    test_client_replaced_on_new_loop()
     
     # API tests (require network)
     print("\n" + "-" * 60)
@@ -118,6 +118,52 @@ class TestSentenceDetector:
         
         assert detector.buffer == ""
         assert len(detector.sentences) == 0
+    
+    def test_decimal_split_across_tokens(self):
+        """Test a period at the end of a token waits for the next token."""
+        detector = SentenceDetector(min_sentence_length=5)
+        
+        all_sentences = []
+        for token in ["The value is 3", ".", "14 exactly", ".", " Next one", "."]:
+            all_sentences.extend(detector.add_text(token))
+        
+        assert all_sentences == ["The value is 3.14 exactly."]
+        assert detector.flush() == "Next one."
+    
+    def test_clause_boundaries(self):
+        """Test commas split long text when clause splitting is enabled."""
+        detector = SentenceDetector(min_sentence_length=5, clause_min_length=20)
+        
+        sentences = detector.add_text(
+            "Short, not split. The weather today is sunny, with 1,000 clouds; maybe rain. "
+        )
+        
+        assert sentences == [
+            "Short, not split.",
+            "The weather today is sunny,",
+            "with 1,000 clouds; maybe rain.",
+        ]
+    
+    def test_clauses_disabled_by_default(self):
+        """Test commas are ignored without clause_min_length."""
+        detector = SentenceDetector(min_sentence_length=5)
+        
+        sentences = detector.add_text("The weather today is sunny, with some clouds. ")
+        assert sentences == ["The weather today is sunny, with some clouds."]
+    
+    def test_long_stream_without_boundary(self):
+        """Test a long boundary-free stream is buffered and flushed intact."""
+        detector = SentenceDetector(min_sentence_length=5)
+        tokens = [f"word{i} " for i in range(20000)]
+        
+        start = time.perf_counter()
+        for token in tokens:
+            assert detector.add_text(token) == []
+        elapsed = time.perf_counter() - start
+        
+        assert detector.flush() == "".join(tokens).strip()
+        # Rescanning the buffer on every token would take seconds
+        assert elapsed < 1.0
 
 
 class TestStreamMetrics:
@@ -2,6 +2,7 @@
 Tests for the enhanced voice pipeline.
 """
 
+import asyncio
 import pytest
 import sys
 from pathlib import Path
@@ -149,5 +150,620 @@ class TestTextToSpeech:
         assert InterruptibleTTS is not None
 
 
+def _pcm16(seconds: float, amplitude: float = 0.0) -> bytes:
+    """Build 16kHz PCM16 audio: a 220Hz tone, or silence for amplitude 0."""
+    import numpy as np
+    
+    t = np.arange(int(16000 * seconds)) / 16000
+    tone = amplitude * np.sin(2 * np.pi * 220 * t)
+    return (tone * 32767).astype("<i2").tobytes()
+
+
+class TestAudioRingBuffer:
+    """Tests for AudioRingBuffer."""
+    
+    def test_wraparound_read(self):
+        """Test reads across the wrap point return samples in order."""
+        import numpy as np
+        from src.voice.streaming_stt import AudioRingBuffer
+        
+        ring = AudioRingBuffer(capacity=10)
+        ring.write(np.arange(8, dtype=np.float32))
+        ring.write(np.arange(8, 14, dtype=np.float32))
+        
+        assert ring.total_written == 14
+        assert ring.oldest == 4
+        assert ring.read(0).tolist() == list(range(4, 14))
+        assert ring.read(6, 12).tolist() == list(range(6, 12))
+    
+    def test_pcm16_conversion(self):
+        """Test PCM16 bytes are scaled to float32 in [-1, 1)."""
+        import numpy as np
+        from src.voice.streaming_stt import AudioRingBuffer
+        
+        ring = AudioRingBuffer(capacity=16)
+        written = ring.write_pcm16(np.array([0, 16384, -32768], dtype="<i2").tobytes() + b"\x01")
+        
+        assert written == 3
+        assert ring.read(0).tolist() == [0.0, 0.5, -1.0]
+
+
+class TestAudioCaptureBus:
+    """Tests for the shared microphone capture bus."""
+    
+    def test_consumers_read_independently(self):
+        """Test each subscription has its own cursor and pre-roll reaches back."""
+        import numpy as np
+        from src.voice.audio_bus import AudioCaptureBus
+        
+        bus = AudioCaptureBus(sample_rate=100, buffer_seconds=1.0)
+        bus.write(np.arange(50, dtype=np.float32))
+        
+        live = bus.subscribe("live")
+        command = bus.subscribe("command", start=40, pre_roll=0.1)
+        bus.write(np.arange(50, 60, dtype=np.float32))
+        
+        assert live.read(10, timeout=0).tolist() == list(range(50, 60))
+        assert command.read(20, timeout=0).tolist() == list(range(30, 50))
+        assert command.read(20, timeout=0) is None
+        assert set(bus.get_stats()["consumers"]) == {"live", "command"}
+        
+        # Falling behind the buffer skips to the oldest held sample
+        bus.write(np.arange(60, 200, dtype=np.float32))
+        assert live.read(10, timeout=0).tolist() == list(range(100, 110))
+        assert live.overruns == 1
+    
+    def test_blocking_read_and_stop(self):
+        """Test readers wake on new audio and are released by stop()."""
+        import threading
+        import numpy as np
+        from src.voice.audio_bus import AudioCaptureBus
+        
+        bus = AudioCaptureBus(sample_rate=100, buffer_seconds=1.0)
+        subscription = bus.subscribe("reader")
+        timer = threading.Timer(0.05, bus.write, args=(np.ones(10, dtype=np.float32),))
+        timer.start()
+        
+        assert subscription.read(10, timeout=2.0).tolist() == [1.0] * 10
+        
+        threading.Timer(0.05, bus.stop).start()
+        assert subscription.read(10, timeout=2.0) is None
+    
+    def test_record_command_keeps_pre_roll(self):
+        """Test command recording starts before the wake word detection point."""
+        import threading
+        import numpy as np
+        from src.voice.audio_bus import AudioCaptureBus
+        from src.voice.pipeline_enhanced import EnhancedVoicePipeline
+        
+        class EnergyVAD:
+            def reset_states(self):
+                pass
+            
+            def is_speech(self, chunk, return_probability=False):
+                energy = float(np.abs(chunk).mean())
+                return energy > 0.1, energy
+        
+        bus = AudioCaptureBus(sample_rate=16000, buffer_seconds=15.0)
+        bus._running = True
+        # Speech that starts right as the wake word fires
+        bus.write(np.zeros(16000, dtype=np.float32))
+        bus.write(np.full(4000, 0.5, dtype=np.float32))
+        
+        pipeline = EnhancedVoicePipeline.__new__(EnhancedVoicePipeline)
+        pipeline.capture = bus
+        pipeline.vad = EnergyVAD()
+        pipeline.pre_roll = 0.125
+        pipeline._recording = False
+        pipeline._command_start = 16000 + 2000
+        
+        def feed():
+            for _ in range(30):
+                bus.write(np.zeros(1024, dtype=np.float32))
+        
+        threading.Timer(0.05, feed).start()
+        audio = pipeline._record_command()
+        
+        # Recording begins 0.125 s before the detection point, at the speech onset
+        assert audio is not None
+        assert np.allclose(audio[:4000], 0.5)
+        assert len(audio) > 4000 + 16000 * 1.5
+        assert pipeline._command_start is None
+        assert bus.get_stats()["consumers"] == {}
+
+
+class BlockDecoder:
+    """
+    Stand-in for EnhancedSpeechToText.decode.
+    
+    Every 0.5 s block of constant value k/100 decodes to the word "wk";
+    silence decodes to nothing. Each second of audio is one segment.
+    """
+    
+    def __init__(self):
+        self.calls = []
+    
+    def decode(self, audio, sample_rate=16000, **options):
+        import numpy as np
+        from src.voice.stt_enhanced import TranscriptionResult
+        
+        self.calls.append((len(audio), options))
+        block = sample_rate // 2
+        segments = []
+        for start in range(0, len(audio) - block + 1, 2 * block):
+            words = []
+            for b in range(start, min(start + 2 * block, len(audio) - block + 1), block):
+                value = int(round(float(np.mean(audio[b:b + block])) * 100))
+                if value:
+                    words.append(f"w{value}")
+            if words:
+                end = min(start + 2 * block, len(audio))
+                segments.append({"start": start / sample_rate, "end": end / sample_rate, "text": " ".join(words)})
+        return TranscriptionResult(
+            text=" ".join(seg["text"] for seg in segments),
+            language="en",
+            segments=segments,
+            provider="fake",
+        )
+
+
+def speech_blocks(count, sample_rate=16000):
+    """0.5 s blocks with values 0.01, 0.02, ... (decoded as w1, w2, ...)."""
+    import numpy as np
+    return np.concatenate([np.full(sample_rate // 2, (i + 1) / 100, dtype=np.float32) for i in range(count)])
+
+
+class TestSpeculativeTranscription:
+    """Tests for streaming transcription during recording."""
+    
+    def _feed(self, session, audio, is_speech, chunk=1024, pause=0.0):
+        import time
+        for i in range(0, len(audio), chunk):
+            session.feed(audio[i:i + chunk], is_speech)
+            if pause:
+                time.sleep(pause)
+    
+    def test_commits_prefix_and_reuses_hypothesis(self):
+        """Test stable segments are committed and the final text needs no extra decode."""
+        import time
+        import numpy as np
+        from src.voice.stt_enhanced import SpeculativeTranscription
+        
+        decoder = BlockDecoder()
+        partials = []
+        session = SpeculativeTranscription(decoder, decode_interval=0.5, on_partial=partials.append)
+        
+        self._feed(session, speech_blocks(8), True, pause=0.003)
+        self._feed(session, np.zeros(16000, dtype=np.float32), False, pause=0.003)
+        deadline = time.time() + 2.0
+        while session._hypothesis_end < session._speech_end and time.time() < deadline:
+            time.sleep(0.01)
+        
+        result = session.finish()
+        
+        assert result.text == " ".join(f"w{i}" for i in range(1, 9))
+        assert session.stats["reused_hypothesis"]
+        assert session.stats["committed_segments"] > 0
+        assert partials
+        # Committed audio is not decoded again
+        assert min(length for length, _ in decoder.calls[-2:]) < 16000 * 4
+        assert all(options["vad_filter"] is False for _, options in decoder.calls)
+        assert result.segments[-1]["end"] == pytest.approx(4.0, abs=0.1)
+    
+    def test_final_decode_uses_latency_budget(self):
+        """Test the tail is decoded at finish with the latency budget when no hypothesis covers it."""
+        from src.voice.stt_enhanced import SpeculativeTranscription
+        
+        decoder = BlockDecoder()
+        session = SpeculativeTranscription(decoder, latency_budget=0.25, decode_interval=1000)
+        session.feed(speech_blocks(3), True)
+        
+        result = session.finish()
+        
+        assert result.text == "w1 w2 w3"
+        assert not session.stats["reused_hypothesis"]
+        assert len(decoder.calls) == 1
+        assert decoder.calls[0][1]["latency_budget"] == 0.25
+    
+    def test_silence_is_not_decoded(self):
+        """Test audio the recorder never marked as speech is not transcribed."""
+        import numpy as np
+        from src.voice.stt_enhanced import SpeculativeTranscription
+        
+        decoder = BlockDecoder()
+        session = SpeculativeTranscription(decoder, decode_interval=0.1)
+        self._feed(session, np.full(32000, 0.05, dtype=np.float32), False)
+        
+        assert session.finish().is_empty
+        assert decoder.calls == []
+    
+    def test_beam_size_policy(self):
+        """Test the widest beam expected to fit the budget is chosen."""
+        from src.voice.stt_enhanced import BeamSizePolicy
+        
+        policy = BeamSizePolicy(alpha=1.0)
+        assert policy.choose(2.0, 0.3) == 1
+        
+        policy.record(1, 2.0, 0.1)  # 0.05 s per audio second at beam 1
+        assert policy.choose(2.0, 0.31) == 3
+        assert policy.choose(2.0, 1.0) == 5
+        
+        policy.record(3, 2.0, 0.8)  # Beam 3 measured slower than extrapolated
+        assert policy.choose(2.0, 0.31) == 2
+
+
+class TestStreamingSTTSession:
+    """Tests for StreamingSTTSession with energy-based segmentation."""
+    
+    @pytest.mark.asyncio
+    async def test_partial_then_final(self):
+        """Test partials while speaking and one final after silence."""
+        from src.voice.streaming_stt import StreamingSTTSession
+        
+        calls = []
+        
+        def transcribe(audio, sample_rate):
+            calls.append(len(audio))
+            return f"heard {len(calls)}"
+        
+        session = StreamingSTTSession(transcribe=transcribe, partial_interval_ms=400)
+        events = []
+        
+        speech = _pcm16(1.2, amplitude=0.3)
+        silence = _pcm16(1.2)
+        for stream in (speech, silence):
+            for i in range(0, len(stream), 3200):  # 100ms chunks
+                events.extend(await session.feed(stream[i:i + 3200]))
+                await asyncio.sleep(0.01)  # Frames arrive over the network
+        
+        partials = [e for e in events if not e.final]
+        finals = [e for e in events if e.final]
+        
+        assert partials
+        assert len(finals) == 1
+        assert finals[0].segment == 0
+        assert 1.0 < finals[0].end - finals[0].start < 1.8
+    
+    @pytest.mark.asyncio
+    async def test_slow_partial_does_not_block_feed(self):
+        """Test feed() returns while a partial decode is still running."""
+        import threading
+        from src.voice.streaming_stt import StreamingSTTSession
+        
+        release = threading.Event()
+        
+        def transcribe(audio, sample_rate):
+            release.wait(5)
+            return "turn on"
+        
+        session = StreamingSTTSession(transcribe=transcribe, partial_interval_ms=200)
+        speech = _pcm16(1.0, amplitude=0.3)
+        for i in range(0, len(speech), 3200):
+            assert await asyncio.wait_for(session.feed(speech[i:i + 3200]), 0.5) == []
+            await asyncio.sleep(0.01)
+        
+        assert session.stats["skipped_partials"] > 0
+        release.set()
+        await asyncio.sleep(0.1)
+        events = await session.feed(_pcm16(0.1, amplitude=0.3))
+        assert [(e.text, e.final) for e in events] == [("turn on", False)]
+    
+    @pytest.mark.asyncio
+    async def test_close_cancels_partial(self):
+        """Test close() cancels an in-flight partial and discards its result."""
+        import threading
+        from src.voice.streaming_stt import StreamingSTTSession
+        
+        release = threading.Event()
+        
+        def transcribe(audio, sample_rate):
+            release.wait(5)
+            return "turn on"
+        
+        session = StreamingSTTSession(transcribe=transcribe, partial_interval_ms=200)
+        speech = _pcm16(1.0, amplitude=0.3)
+        for i in range(0, len(speech), 3200):
+            await session.feed(speech[i:i + 3200])
+            await asyncio.sleep(0.01)
+        task = session._partial_task
+        assert task is not None and not task.done()
+        
+        session.close()
+        release.set()
+        await asyncio.sleep(0.05)
+        
+        assert task.cancelled()
+        assert session._ready == []
+    
+    @pytest.mark.asyncio
+    async def test_silence_not_transcribed(self):
+        """Test silence never reaches the transcriber."""
+        from src.voice.streaming_stt import StreamingSTTSession
+        
+        session = StreamingSTTSession(transcribe=lambda audio, sr: pytest.fail("transcribed silence"))
+        
+        assert await session.feed(_pcm16(2.0)) == []
+        assert await session.flush() == []
+    
+    @pytest.mark.asyncio
+    async def test_flush_finalizes_open_utterance(self):
+        """Test flush emits a final transcript for speech still in progress."""
+        from src.voice.streaming_stt import StreamingSTTSession
+        
+        session = StreamingSTTSession(transcribe=lambda audio, sr: "turn on the lights")
+        await session.feed(_pcm16(0.8, amplitude=0.3))
+        events = await session.flush()
+        
+        assert [e.text for e in events if e.final] == ["turn on the lights"]
+
+
+def _playing_output(sample_rate: int = 1000):
+    """AudioOutputStream whose device is a thread consuming in real time."""
+    import threading
+    import time
+    import numpy as np
+    from src.voice.tts_pipeline import AudioOutputStream
+    
+    class ThreadOutput(AudioOutputStream):
+        def __init__(self):
+            super().__init__(sample_rate=sample_rate, buffer_seconds=5)
+            self.played = []
+            self._stop = threading.Event()
+            self._thread = None
+        
+        def start(self):
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        
+        def _run(self):
+            block = np.zeros((10, 1), dtype=np.float32)
+            while not self._stop.is_set():
+                self._callback(block, 10, None, None)
+                self.played.extend(v for v in block[:, 0].tolist() if v)
+                time.sleep(0.01)
+        
+        def close(self):
+            self._stop.set()
+            super().close()
+    
+    return ThreadOutput()
+
+
+def _fake_decode(data: bytes):
+    """Decode b"<value>" into 100 samples of that value at 1kHz."""
+    import numpy as np
+    return np.full(100, float(data.decode()), dtype=np.float32), 1000
+
+
+class TestPCMRingBuffer:
+    """Tests for PCMRingBuffer."""
+    
+    def test_fifo_wraparound_and_underrun(self):
+        """Test samples come out in order and underruns are zero-padded."""
+        import numpy as np
+        from src.voice.tts_pipeline import PCMRingBuffer
+        
+        ring = PCMRingBuffer(capacity=8)
+        out = np.zeros(5, dtype=np.float32)
+        ring.write(np.arange(1, 6, dtype=np.float32))
+        ring.read_into(out)
+        ring.write(np.arange(6, 12, dtype=np.float32))
+        
+        assert ring.read_into(out) == 5
+        assert out.tolist() == [6, 7, 8, 9, 10]
+        assert ring.read_into(out) == 1
+        assert out.tolist() == [11, 0, 0, 0, 0]
+        assert ring.drained_at is not None
+    
+    def test_clear_aborts_blocked_write(self):
+        """Test clear() releases a writer waiting for space."""
+        import threading
+        import numpy as np
+        from src.voice.tts_pipeline import PCMRingBuffer
+        
+        ring = PCMRingBuffer(capacity=4)
+        result = []
+        writer = threading.Thread(target=lambda: result.append(ring.write(np.ones(10, dtype=np.float32))))
+        writer.start()
+        writer.join(timeout=0.1)
+        ring.clear()
+        writer.join(timeout=1.0)
+        
+        assert result == [4]
+        assert ring.buffered == 0
+
+
+class TestPipelinedSpeechEngine:
+    """Tests for PipelinedSpeechEngine with a simulated output device."""
+    
+    @pytest.mark.asyncio
+    async def test_synthesis_overlaps_playback(self):
+        """Test sentences play in order and synthesis runs ahead."""
+        import asyncio
+        import time
+        from src.voice.tts_pipeline import PipelinedSpeechEngine
+        
+        async def synthesize(text):
+            await asyncio.sleep(0.1)
+            return text.encode()
+        
+        output = _playing_output()
+        engine = PipelinedSpeechEngine(synthesize, output=output, prefetch=2, decode=_fake_decode)
+        
+        start = time.perf_counter()
+        for value in ("1", "2", "3", "4"):
+            await engine.enqueue(value)
+        items = await engine.drain(timeout=5)
+        elapsed = time.perf_counter() - start
+        output.close()
+        
+        # Serial synthesis + playback would take 4 * (0.1 + 0.1) = 0.8s
+        assert elapsed < 0.7
+        assert [i.text for i in items] == ["1", "2", "3", "4"]
+        assert sorted(set(output.played), key=output.played.index) == [1.0, 2.0, 3.0, 4.0]
+        assert all(i.synth_ms >= 90 for i in items)
+    
+    @pytest.mark.asyncio
+    async def test_interrupt_stops_playback(self):
+        """Test interrupt drops buffered audio and pending synthesis."""
+        import asyncio
+        from src.voice.tts_pipeline import PipelinedSpeechEngine
+        
+        synthesized = []
+        
+        async def synthesize(text):
+            synthesized.append(text)
+            await asyncio.sleep(0.05)
+            return text.encode()
+        
+        output = _playing_output()
+        engine = PipelinedSpeechEngine(synthesize, output=output, prefetch=1, decode=_fake_decode)
+        for value in ("1", "2", "3"):
+            asyncio.ensure_future(engine.enqueue(value))
+        await asyncio.sleep(0.08)
+        
+        engine.interrupt()
+        await asyncio.sleep(0.05)
+        output.close()
+        
+        assert output.buffer.buffered == 0
+        assert not engine.is_speaking
+        assert "3" not in synthesized
+    
+    @pytest.mark.asyncio
+    async def test_streaming_handler_records_speech_metrics(self):
+        """Test StreamingResponseHandler reports synth latency and gaps."""
+        from src.core.streaming import StreamingResponseHandler
+        from src.voice.tts_pipeline import PipelinedSpeechEngine
+        
+        async def synthesize(text):
+            return b"0.5"
+        
+        output = _playing_output()
+        engine = PipelinedSpeechEngine(synthesize, output=output, decode=_fake_decode)
+        handler = StreamingResponseHandler(min_sentence_length=5, speech_engine=engine)
+        
+        async def stream():
+            for token in ["First sentence.", " Second sentence.", " Third one."]:
+                yield token
+        
+        async for _ in handler.process_stream(stream()):
+            pass
+        output.close()
+        
+        metrics = handler.get_metrics()
+        assert len(handler.metrics.synth_latencies_ms) == 3
+        assert len(handler.metrics.sentence_gaps_ms) == 2
+        assert metrics["time_to_first_audio_ms"] > 0
+
+    
+    def test_player_speaks_through_engine(self):
+        """Test the voice player enqueues each sentence on the speech engine."""
+        from src.core.async_runtime import AsyncRuntime
+        from src.voice.pipeline_enhanced import InterruptibleTTSPlayer
+        
+        class RecordingEngine:
+            def __init__(self):
+                self.enqueued = []
+            
+            async def enqueue(self, text):
+                self.enqueued.append(text)
+            
+            async def drain(self, timeout=None):
+                return []
+            
+            def interrupt(self):
+                pass
+        
+        tts = MagicMock()
+        engine = RecordingEngine()
+        runtime = AsyncRuntime(name="test-tts")
+        vad = Mock(is_available=False)
+        completed = []
+        player = InterruptibleTTSPlayer(tts, vad=vad, speech_engine=engine, runtime=runtime)
+        try:
+            player.speak(
+                "First sentence here. Second sentence here.",
+                on_complete=lambda: completed.append(True),
+                blocking=True,
+            )
+        finally:
+            runtime.stop()
+        
+        assert engine.enqueued == ["First sentence here.", "Second sentence here."]
+        assert completed == [True]
+        tts.synthesize.assert_not_called()
+
+class TestTTSAudioCache:
+    """Tests for the synthesized speech cache."""
+    
+    def test_key_covers_voice_settings(self):
+        """Test whitespace is normalized but voice settings are not."""
+        from src.voice.tts_cache import TTSAudioCache
+        
+        key = TTSAudioCache.make_key("Hello  there.", "en-US-GuyNeural")
+        
+        assert key == TTSAudioCache.make_key(" Hello there. ", "en-US-GuyNeural")
+        assert key != TTSAudioCache.make_key("Hello there.", "en-GB-RyanNeural")
+        assert key != TTSAudioCache.make_key("Hello there.", "en-US-GuyNeural", rate="+10%")
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used entry is evicted over budget."""
+        from src.voice.tts_cache import TTSAudioCache
+        
+        cache = TTSAudioCache(cache_dir=tmp_path, max_size_mb=2.5 / 1024, warm_count=0)
+        cache.put("a" * 64, "first", b"x" * 1024)
+        cache.put("b" * 64, "second", b"x" * 1024)
+        cache.get("a" * 64)
+        cache._db.submit_write(lambda conn: None).result(timeout=5)  # Flush the hit update
+        cache.put("c" * 64, "third", b"x" * 1024)
+        
+        assert cache.get("a" * 64) is not None
+        assert cache.get("b" * 64) is None
+        assert cache.get("c" * 64) is not None
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_warm_loads_most_used(self, tmp_path):
+        """Test a new cache instance preloads the most-hit phrases."""
+        from src.voice.tts_cache import TTSAudioCache
+        
+        cache = TTSAudioCache(cache_dir=tmp_path, warm_count=0)
+        cache.put("a" * 64, "rare", b"rare")
+        cache.put("b" * 64, "common", b"common")
+        for _ in range(3):
+            cache.get("b" * 64)
+        cache._db.submit_write(lambda conn: None).result(timeout=5)
+        
+        warmed = TTSAudioCache(cache_dir=tmp_path, warm_count=1)
+        
+        assert list(warmed._memory) == ["b" * 64]
+        assert warmed.get("b" * 64) == b"common"
+        assert warmed.stats["memory_hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_edge_tts_uses_cache(self, tmp_path):
+        """Test repeated phrases are synthesized once; long text bypasses the cache."""
+        from src.voice.tts import EdgeTTS
+        from src.voice.tts_cache import TTSAudioCache
+        
+        calls = []
+        
+        async def fake_synthesize(text):
+            calls.append(text)
+            return b"mp3:" + text.encode()
+        
+        tts = EdgeTTS(cache=TTSAudioCache(cache_dir=tmp_path, max_text_length=20))
+        tts._synthesize = fake_synthesize
+        
+        first = await tts.synthesize("Done.")
+        second = await tts.synthesize("Done.")
+        for _ in range(2):
+            await tts.synthesize("Here is a long answer that is never repeated.")
+        
+        assert first == second == b"mp3:Done."
+        assert calls == ["Done."] + ["Here is a long answer that is never repeated."] * 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
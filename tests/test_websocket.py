@@ -0,0 +1,124 @@
+"""
+Unit tests for the WebSocket outbound queue.
+
+Tests:
+- Drop-oldest policy when the queue is full
+- Closing slow consumers
+- Graceful close draining and rejecting new frames
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("fastapi")
+
+from src.api.websocket import OutboundQueue
+
+
+class FakeWebSocket:
+    """Records sent frames and close codes."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed_with = None
+
+    async def send_text(self, frame):
+        await asyncio.sleep(self.delay)
+        self.sent.append(frame)
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+
+class TestOutboundQueue:
+    """Tests for OutboundQueue."""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """Test a full queue drops its oldest frames and keeps the newest."""
+        websocket = FakeWebSocket()
+        queue = OutboundQueue(websocket, max_size=3)
+
+        assert all(queue.put(f"m{i}") for i in range(5))
+        assert queue.depth == 3
+        assert queue.dropped == 2
+
+        queue.start()
+        queue.close()
+        await asyncio.wait_for(queue._task, 1)
+
+        assert websocket.sent == ["m2", "m3", "m4"]
+        assert websocket.closed_with is None
+
+    @pytest.mark.asyncio
+    async def test_stale_overflow_closes_connection(self):
+        """Test overflowing while the oldest frame is stale closes with 1013."""
+        websocket = FakeWebSocket()
+        queue = OutboundQueue(websocket, max_size=2, send_timeout=0.01)
+        queue.put("a")
+        queue.put("b")
+        await asyncio.sleep(0.02)
+
+        assert queue.put("c") is False
+        assert queue.closed
+        assert queue.depth == 0
+        await asyncio.sleep(0)
+        assert websocket.closed_with == 1013
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_closes_connection(self):
+        """Test a stalled send closes the connection instead of blocking."""
+        websocket = FakeWebSocket(delay=1.0)
+        queue = OutboundQueue(websocket, send_timeout=0.05)
+        queue.start()
+        queue.put("a")
+        queue.put("b")
+
+        await asyncio.wait_for(queue._task, 1)
+        await asyncio.sleep(0)
+
+        assert queue.closed
+        assert websocket.sent == []
+        assert websocket.closed_with == 1013
+
+    @pytest.mark.asyncio
+    async def test_close_drains_and_rejects(self):
+        """Test close() flushes queued frames and refuses new ones."""
+        websocket = FakeWebSocket(delay=0.01)
+        queue = OutboundQueue(websocket)
+        queue.start()
+        for i in range(3):
+            queue.put(f"m{i}")
+
+        queue.close()
+        assert queue.put("late") is False
+        await asyncio.wait_for(queue._task, 1)
+
+        assert websocket.sent == ["m0", "m1", "m2"]
+        assert queue.sent == 3
+        assert websocket.closed_with is None
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_sender(self):
+        """Test stop() ends the sender without waiting for the backlog."""
+        websocket = FakeWebSocket(delay=0.5)
+        queue = OutboundQueue(websocket)
+        queue.start()
+        queue.put("a")
+        queue.put("b")
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(queue.stop(), 1)
+
+        assert queue._task.done()
+        assert websocket.sent == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])